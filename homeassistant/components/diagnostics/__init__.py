@@ -26,6 +26,7 @@ from homeassistant.helpers.json import (
     ExtendedJSONEncoder,
     find_paths_unserializable_data,
 )
+from homeassistant.helpers.poll_scheduler import async_get_config_entry_polls
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import (
@@ -215,6 +216,8 @@ async def _async_get_json_file_response(
         "setup_times": async_get_domain_setup_times(hass, domain),
         "data": data,
     }
+    if polls := async_get_config_entry_polls(hass, d_id):
+        payload["polling"] = polls
     if data_issues is not None:
         payload["issues"] = data_issues
     try:
@@ -3,12 +3,8 @@
 from __future__ import annotations
 
 from collections import Counter, deque
-from copy import copy
-from dataclasses import dataclass
 from datetime import datetime, timedelta
-from functools import partial
 import logging
-from numbers import Number
 import statistics
 from typing import Any, cast
 
@@ -16,7 +12,7 @@ import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.components.input_number import DOMAIN as INPUT_NUMBER_DOMAIN
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import history
 from homeassistant.components.sensor import (
     ATTR_STATE_CLASS,
     DOMAIN as SENSOR_DOMAIN,
@@ -284,30 +280,73 @@ class SensorFilter(SensorEntity):
 
         self._attr_available = True
 
-        temp_state = _State(new_state.last_updated, new_state.state)
+        if (filtered := self._filter_value(new_state)) is None:
+            return
+
+        self._apply_filtered_state(new_state, filtered)
+
+        if update_ha:
+            self.async_write_ha_state()
+
+    @callback
+    def _update_filter_sensor_states(self, states: list[State]) -> None:
+        """Process a burst of device states in one pass.
 
+        Unlike _update_filter_sensor_state the sensor is only updated
+        with the last state that went through all the filters and the
+        state is not written to the state machine.
+        """
+        last: tuple[State, float | str] | None = None
+        for new_state in states:
+            if new_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+                continue
+            if (filtered := self._filter_value(new_state)) is None:
+                continue
+            last = (new_state, filtered)
+            if self._attr_native_unit_of_measurement != (
+                unit := new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            ):
+                for filt in self._filters:
+                    filt.reset()
+                self._attr_native_unit_of_measurement = unit
+        if last is not None:
+            self._attr_available = True
+            self._apply_filtered_state(*last)
+
+    def _filter_value(self, new_state: State) -> float | str | None:
+        """Pass the value of a state through all the filters.
+
+        Returns None if a filter skipped the value or it is not a number.
+        """
+        value = _state_value(new_state.state)
+        timestamp = new_state.last_updated_timestamp
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         try:
             for filt in self._filters:
-                filtered_state = filt.filter_state(copy(temp_state))
-                _LOGGER.debug(
-                    "%s(%s=%s) -> %s",
-                    filt.name,
-                    self._entity,
-                    temp_state.state,
-                    "skip" if filt.skip_processing else filtered_state.state,
-                )
+                filtered = filt.filter_value(timestamp, value)
+                if debug:
+                    _LOGGER.debug(
+                        "%s(%s=%s) -> %s",
+                        filt.name,
+                        self._entity,
+                        value,
+                        "skip" if filt.skip_processing else filtered,
+                    )
                 if filt.skip_processing:
-                    return
-                temp_state = filtered_state
+                    return None
+                value = filtered
         except ValueError:
             _LOGGER.error(
                 "Could not convert state: %s (%s) to number",
                 new_state.state,
                 type(new_state.state),
             )
-            return
+            return None
+        return value
 
-        self._state = temp_state.state
+    def _apply_filtered_state(self, new_state: State, filtered: float | str) -> None:
+        """Update the sensor with the filtered value of a state."""
+        self._state = filtered
 
         self._attr_icon = new_state.attributes.get(ATTR_ICON, ICON)
         self._attr_device_class = new_state.attributes.get(ATTR_DEVICE_CLASS)
@@ -322,9 +361,6 @@ class SensorFilter(SensorEntity):
                 ATTR_UNIT_OF_MEASUREMENT
             )
 
-        if update_ha:
-            self.async_write_ha_state()
-
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
 
@@ -347,35 +383,25 @@ class SensorFilter(SensorEntity):
                     largest_window_time = val
 
             # Retrieve the largest window_size of each type
+            # While Home Assistant starts these queries are shared
+            # with the other helpers loading their history
             if largest_window_items > 0:
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.get_last_state_changes,
-                        self.hass,
-                        largest_window_items,
-                        entity_id=self._entity,
+                history_list.extend(
+                    await history.async_get_last_state_changes(
+                        self.hass, largest_window_items, self._entity
                     )
                 )
-                if self._entity in filter_history:
-                    history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
                 start = dt_util.utcnow() - largest_window_time
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
-                    )
+                history_list.extend(
+                    [
+                        state
+                        for state in await history.async_state_changes_during_period(
+                            self.hass, start, entity_id=self._entity
+                        )
+                        if state not in history_list
+                    ]
                 )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
 
             # Sort the window states
             history_list = sorted(history_list, key=lambda s: s.last_updated)
@@ -385,9 +411,7 @@ class SensorFilter(SensorEntity):
             )
 
             # Replay history through the filter chain
-            for state in history_list:
-                if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]:
-                    self._update_filter_sensor_state(state, False)
+            self._update_filter_sensor_states(history_list)
 
         @callback
         def _async_hass_started(hass: HomeAssistant) -> None:
@@ -409,49 +433,21 @@ class SensorFilter(SensorEntity):
         return self._state
 
 
-class FilterState:
-    """State abstraction for filter usage."""
-
-    state: str | float | int
-
-    def __init__(self, state: _State) -> None:
-        """Initialize with HA State object."""
-        self.timestamp = state.last_updated
-        try:
-            self.state = float(state.state)
-        except ValueError:
-            self.state = state.state
-
-    def set_precision(self, precision: int | None) -> None:
-        """Set precision of Number based states."""
-        if precision is not None and isinstance(self.state, Number):
-            value = round(float(self.state), precision)
-            self.state = int(value) if precision == 0 else value
-
-    def __str__(self) -> str:
-        """Return state as the string representation of FilterState."""
-        return str(self.state)
+def _state_value(state: str | float) -> float | str:
+    """Return the state as a float or the string if it is not a number."""
+    try:
+        return float(state)
+    except ValueError:
+        return cast(str, state)
 
-    def __repr__(self) -> str:
-        """Return timestamp and state as the representation of FilterState."""
-        return f"{self.timestamp} : {self.state}"
 
+class Filter:
+    """Filter skeleton.
 
-@dataclass
-class _State:
-    """Simplified State class.
-
-    The standard State class only accepts string in `state`,
-    and we are only interested in two properties.
+    Numbers are passed through the filters as floats and anything
+    else as strings, filters only keep the samples they read.
     """
 
-    last_updated: datetime
-    state: str | float | int
-
-
-class Filter:
-    """Filter skeleton."""
-
     def __init__(
         self,
         name: str,
@@ -466,17 +462,14 @@ class Filter:
         :param entity: used for debugging only
         """
         if isinstance(window_size, int):
-            self.states: deque[FilterState] = deque(maxlen=window_size)
             self.window_unit = WINDOW_SIZE_UNIT_NUMBER_EVENTS
         else:
-            self.states = deque(maxlen=0)
             self.window_unit = WINDOW_SIZE_UNIT_TIME
         self.filter_precision = precision
         self._name = name
         self._entity = entity
         self._skip_processing = False
         self._window_size = window_size
-        self._store_raw = False
         self._only_numbers = True
 
     @property
@@ -496,26 +489,32 @@ class Filter:
 
     def reset(self) -> None:
         """Reset filter."""
-        self.states.clear()
 
-    def _filter_state(self, new_state: FilterState) -> FilterState:
+    def _filter_value(self, timestamp: float, value: float | str) -> float | str:
         """Implement filter."""
         raise NotImplementedError
 
-    def filter_state(self, new_state: _State) -> _State:
-        """Implement a common interface for filters."""
-        fstate = FilterState(new_state)
-        if self._only_numbers and not isinstance(fstate.state, Number):
-            raise ValueError(f"State <{fstate.state}> is not a Number")
-
-        filtered = self._filter_state(fstate)
-        filtered.set_precision(self.filter_precision)
+    def filter_value(self, timestamp: float, value: float | str) -> float | str:
+        """Filter a value received at timestamp."""
+        if isinstance(value, str):
+            if self._only_numbers:
+                raise ValueError(f"State <{value}> is not a Number")
+            return self._filter_value(timestamp, value)
 
-        if self._store_raw:
-            self.states.append(copy(FilterState(new_state)))
-        else:
-            self.states.append(copy(filtered))
-        new_state.state = filtered.state
+        filtered = self._filter_value(timestamp, float(value))
+        if (precision := self.filter_precision) is not None and not isinstance(
+            filtered, str
+        ):
+            filtered = round(filtered, precision)
+            if precision == 0:
+                return int(filtered)
+        return filtered
+
+    def filter_state(self, new_state: State) -> State:
+        """Filter a state, the state is updated with the filtered value."""
+        new_state.state = self.filter_value(  # type: ignore[assignment]
+            new_state.last_updated.timestamp(), _state_value(new_state.state)
+        )
         return new_state
 
 
@@ -547,11 +546,11 @@ class RangeFilter(Filter, SensorEntity):
         self._upper_bound = upper_bound
         self._stats_internal: Counter = Counter()
 
-    def _filter_state(self, new_state: FilterState) -> FilterState:
+    def _filter_value(self, timestamp: float, value: float | str) -> float | str:
         """Implement the range filter."""
 
         # We can cast safely here thanks to self._only_numbers = True
-        new_state_value = cast(float, new_state.state)
+        new_state_value = cast(float, value)
 
         if self._upper_bound is not None and new_state_value > self._upper_bound:
             self._stats_internal["erasures_up"] += 1
@@ -560,22 +559,22 @@ class RangeFilter(Filter, SensorEntity):
                 "Upper outlier nr. %s in %s: %s",
                 self._stats_internal["erasures_up"],
                 self._entity,
-                new_state,
+                new_state_value,
             )
-            new_state.state = self._upper_bound
+            return self._upper_bound
 
-        elif self._lower_bound is not None and new_state_value < self._lower_bound:
+        if self._lower_bound is not None and new_state_value < self._lower_bound:
             self._stats_internal["erasures_low"] += 1
 
             _LOGGER.debug(
                 "Lower outlier nr. %s in %s: %s",
                 self._stats_internal["erasures_low"],
                 self._entity,
-                new_state,
+                new_state_value,
             )
-            new_state.state = self._lower_bound
+            return self._lower_bound
 
-        return new_state
+        return new_state_value
 
 
 @FILTERS.register(FILTER_NAME_OUTLIER)
@@ -602,19 +601,24 @@ class OutlierFilter(Filter, SensorEntity):
         )
         self._radius = radius
         self._stats_internal: Counter = Counter()
-        self._store_raw = True
+        self._window: deque[float] = deque(maxlen=window_size)
+
+    def reset(self) -> None:
+        """Reset filter."""
+        self._window.clear()
 
-    def _filter_state(self, new_state: FilterState) -> FilterState:
+    def _filter_value(self, timestamp: float, value: float | str) -> float | str:
         """Implement the outlier filter."""
 
         # We can cast safely here thanks to self._only_numbers = True
-        previous_state_values = [cast(float, s.state) for s in self.states]
-        new_state_value = cast(float, new_state.state)
+        new_state_value = cast(float, value)
+        filtered = new_state_value
 
-        median = statistics.median(previous_state_values) if self.states else 0
+        # The median is only needed once the window is full
         if (
-            len(self.states) == self.states.maxlen
-            and abs(new_state_value - median) > self._radius
+            len(self._window) == self._window.maxlen
+            and abs(new_state_value - (median := statistics.median(self._window)))
+            > self._radius
         ):
             self._stats_internal["erasures"] += 1
 
@@ -622,10 +626,12 @@ class OutlierFilter(Filter, SensorEntity):
                 "Outlier nr. %s in %s: %s",
                 self._stats_internal["erasures"],
                 self._entity,
-                new_state,
+                new_state_value,
             )
-            new_state.state = median
-        return new_state
+            filtered = median
+        # The raw values are kept so a step change is followed
+        self._window.append(new_state_value)
+        return filtered
 
 
 @FILTERS.register(FILTER_NAME_LOWPASS)
@@ -645,21 +651,29 @@ class LowPassFilter(Filter, SensorEntity):
             FILTER_NAME_LOWPASS, window_size, precision=precision, entity=entity
         )
         self._time_constant = time_constant
+        self._prev_value: float | None = None
+
+    def reset(self) -> None:
+        """Reset filter."""
+        self._prev_value = None
+
+    def filter_value(self, timestamp: float, value: float | str) -> float | str:
+        """Filter a value and keep the filtered value for the next one."""
+        filtered = super().filter_value(timestamp, value)
+        self._prev_value = cast(float, filtered)
+        return filtered
 
-    def _filter_state(self, new_state: FilterState) -> FilterState:
+    def _filter_value(self, timestamp: float, value: float | str) -> float | str:
         """Implement the low pass filter."""
 
-        if not self.states:
-            return new_state
+        # We can cast safely here thanks to self._only_numbers = True
+        new_state_value = cast(float, value)
+        if (prev_state_value := self._prev_value) is None:
+            return new_state_value
 
         new_weight = 1.0 / self._time_constant
         prev_weight = 1.0 - new_weight
-        # We can cast safely here thanks to self._only_numbers = True
-        prev_state_value = cast(float, self.states[-1].state)
-        new_state_value = cast(float, new_state.state)
-        new_state.state = prev_weight * prev_state_value + new_weight * new_state_value
-
-        return new_state
+        return prev_weight * prev_state_value + new_weight * new_state_value
 
 
 @FILTERS.register(FILTER_NAME_TIME_SMA)
@@ -684,37 +698,33 @@ class TimeSMAFilter(Filter, SensorEntity):
         super().__init__(
             FILTER_NAME_TIME_SMA, window_size, precision=precision, entity=entity
         )
-        self._time_window = window_size
-        self.last_leak: FilterState | None = None
-        self.queue = deque[FilterState]()
+        self._time_window = window_size.total_seconds()
+        self._last_leak: float | None = None
+        self._window: deque[tuple[float, float]] = deque()
 
-    def _leak(self, left_boundary: datetime) -> None:
+    def _leak(self, left_boundary: float) -> None:
         """Remove timeouted elements."""
-        while self.queue:
-            if self.queue[0].timestamp + self._time_window <= left_boundary:
-                self.last_leak = self.queue.popleft()
-            else:
-                return
+        window = self._window
+        while window and window[0][0] + self._time_window <= left_boundary:
+            self._last_leak = window.popleft()[1]
 
-    def _filter_state(self, new_state: FilterState) -> FilterState:
+    def _filter_value(self, timestamp: float, value: float | str) -> float | str:
         """Implement the Simple Moving Average filter."""
 
-        self._leak(new_state.timestamp)
-        self.queue.append(copy(new_state))
-
-        moving_sum: float = 0
-        start = new_state.timestamp - self._time_window
-        prev_state = self.last_leak if self.last_leak is not None else self.queue[0]
-        for state in self.queue:
-            # We can cast safely here thanks to self._only_numbers = True
-            prev_state_value = cast(float, prev_state.state)
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state_value
-            start = state.timestamp
-            prev_state = state
+        self._leak(timestamp)
+        # We can cast safely here thanks to self._only_numbers = True
+        self._window.append((timestamp, cast(float, value)))
 
-        new_state.state = moving_sum / self._time_window.total_seconds()
-
-        return new_state
+        # Each value is weighted by the time until the next value,
+        # the first value by the time since the start of the window
+        moving_sum = 0.0
+        start = timestamp - self._time_window
+        prev_value = self._window[0][1] if self._last_leak is None else self._last_leak
+        for sample_timestamp, sample_value in self._window:
+            moving_sum += (sample_timestamp - start) * prev_value
+            start = sample_timestamp
+            prev_value = sample_value
+        return moving_sum / self._time_window
 
 
 @FILTERS.register(FILTER_NAME_THROTTLE)
@@ -732,16 +742,22 @@ class ThrottleFilter(Filter, SensorEntity):
             FILTER_NAME_THROTTLE, window_size, precision=precision, entity=entity
         )
         self._only_numbers = False
+        self._count = 0
+
+    def reset(self) -> None:
+        """Reset filter."""
+        self._count = 0
 
-    def _filter_state(self, new_state: FilterState) -> FilterState:
+    def _filter_value(self, timestamp: float, value: float | str) -> float | str:
         """Implement the throttle filter."""
-        if not self.states or len(self.states) == self.states.maxlen:
-            self.states.clear()
+        if not self._count or self._count >= cast(int, self._window_size):
+            self._count = 0
             self._skip_processing = False
         else:
             self._skip_processing = True
+        self._count += 1
 
-        return new_state
+        return value
 
 
 @FILTERS.register(FILTER_NAME_TIME_THROTTLE)
@@ -758,17 +774,17 @@ class TimeThrottleFilter(Filter, SensorEntity):
         super().__init__(
             FILTER_NAME_TIME_THROTTLE, window_size, precision=precision, entity=entity
         )
-        self._time_window = window_size
-        self._last_emitted_at: datetime | None = None
+        self._time_window = window_size.total_seconds()
+        self._last_emitted_at: float | None = None
         self._only_numbers = False
 
-    def _filter_state(self, new_state: FilterState) -> FilterState:
+    def _filter_value(self, timestamp: float, value: float | str) -> float | str:
         """Implement the filter."""
-        window_start = new_state.timestamp - self._time_window
-        if not self._last_emitted_at or self._last_emitted_at <= window_start:
-            self._last_emitted_at = new_state.timestamp
+        window_start = timestamp - self._time_window
+        if self._last_emitted_at is None or self._last_emitted_at <= window_start:
+            self._last_emitted_at = timestamp
             self._skip_processing = False
         else:
             self._skip_processing = True
 
-        return new_state
+        return value
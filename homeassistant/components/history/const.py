@@ -5,3 +5,10 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Historical states of long periods are fetched and sent in
+# windows of this many hours, oldest first
+STREAM_CHUNK_HOURS = 24
+# Number of messages that may still be queued to the client
+# before the states of the next window are fetched
+STREAM_MAX_PENDING_MESSAGES = 4
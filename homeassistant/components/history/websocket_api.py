@@ -38,7 +38,12 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import create_eager_task
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    MAX_PENDING_HISTORY_STATES,
+    STREAM_CHUNK_HOURS,
+    STREAM_MAX_PENDING_MESSAGES,
+)
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -62,35 +67,57 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _serialize_entity_states(
+    entity_states: Iterable[tuple[str, list[State | dict[str, Any]]]],
+) -> tuple[float, bytes]:
+    """Serialize the states of each entity as soon as they are read.
+
+    Only the states of one entity are held as dicts at a time. Returns
+    the newest last_updated timestamp and the json object of the states
+    by entity_id.
+    """
+    last_time_ts = 0.0
+    payloads: list[bytes] = []
+    for entity_id, state_list in entity_states:
+        if (
+            state_last_time := cast(
+                float,
+                cast(dict[str, Any], state_list[-1])[COMPRESSED_STATE_LAST_UPDATED],
+            )
+        ) > last_time_ts:
+            last_time_ts = state_last_time
+        payloads.append(b"".join((json_bytes(entity_id), b":", json_bytes(state_list))))
+    return last_time_ts, b"".join((b"{", b",".join(payloads), b"}"))
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
     start_time: dt,
     end_time: dt | None,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    resolution: float | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
+    _, states = _serialize_entity_states(
+        history.iter_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+            resolution,
         )
     )
+    return messages.construct_result_message(msg_id, states)
 
 
 @websocket_api.websocket_command(
@@ -103,6 +130,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("resolution"): vol.All(vol.Coerce(float), vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -172,21 +200,24 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("resolution"),
         )
     )
 
 
-def _generate_stream_message(
-    states: dict[str, list[dict[str, Any]]],
-    start_day: dt,
-    end_day: dt,
-) -> dict[str, Any]:
+def _generate_stream_message(states: bytes, start_day: dt, end_day: dt) -> bytes:
     """Generate a history stream message response."""
-    return {
-        "states": states,
-        "start_time": start_day.timestamp(),
-        "end_time": end_day.timestamp(),
-    }
+    return b"".join(
+        (
+            b'{"states":',
+            states,
+            b',"start_time":',
+            json_bytes(start_day.timestamp()),
+            b',"end_time":',
+            json_bytes(end_day.timestamp()),
+            b"}",
+        )
+    )
 
 
 @callback
@@ -197,7 +228,7 @@ def _async_send_empty_response(
     connection.send_result(msg_id)
     stream_end_time = end_time or dt_util.utcnow()
     connection.send_message(
-        _generate_websocket_response(msg_id, start_time, stream_end_time, {})
+        _generate_websocket_response(msg_id, start_time, stream_end_time, b"{}")
     )
 
 
@@ -205,13 +236,11 @@ def _generate_websocket_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    states: dict[str, list[dict[str, Any]]],
+    states: bytes,
 ) -> bytes:
     """Generate a websocket response."""
-    return json_bytes(
-        messages.event_message(
-            msg_id, _generate_stream_message(states, start_time, end_time)
-        )
+    return messages.construct_event_message(
+        msg_id, _generate_stream_message(states, start_time, end_time)
     )
 
 
@@ -220,52 +249,39 @@ def _generate_historical_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
-    send_empty: bool,
-) -> tuple[float, dt | None, bytes | None]:
+    resolution: float | None,
+    message_start_time: dt,
+) -> tuple[float, bytes | None]:
     """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
+    last_time_ts, states = _serialize_entity_states(
+        history.iter_significant_states(
             hass,
             start_time,
             end_time,
             entity_ids,
-            None,
             include_start_time_state,
             significant_changes_only,
             minimal_response,
             no_attributes,
             True,
-        ),
+            resolution,
+        )
     )
-    last_time_ts = 0.0
-    for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
-
     if last_time_ts == 0:
-        # If we did not send any states ever, we need to send an empty response
-        # so the websocket client knows it should render/process/consume the
-        # data.
-        if not send_empty:
-            return last_time_ts, None, None
-        last_time_dt = end_time
-    else:
-        last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
-
+        return last_time_ts, None
     return (
         last_time_ts,
-        last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
+        _generate_websocket_response(
+            msg_id,
+            message_start_time,
+            dt_util.utc_from_timestamp(last_time_ts),
+            states,
+        ),
     )
 
 
@@ -275,31 +291,73 @@ async def _async_send_historical_states(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    resolution: float | None,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    Long periods are split into windows of STREAM_CHUNK_HOURS which are
+    sent as successive messages, oldest first. The next window is only
+    fetched once the client has read all but STREAM_MAX_PENDING_MESSAGES
+    of the queued messages so a slow client does not make us buffer the
+    whole period. Periods read from the downsampled tiers are small
+    and are sent at once.
+
+    This function returns the time of the most recent state we sent to
+    the websocket.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    chunk = timedelta(hours=STREAM_CHUNK_HOURS)
+    last_time_ts = 0.0
+    window_start = start_time
+    query_start = start_time
+    while True:
+        window_end = end_time if resolution else min(window_start + chunk, end_time)
+        window_last_time_ts, payload = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            query_start,
+            window_end,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            resolution,
+            window_start,
+        )
+        if payload:
+            last_time_ts = window_last_time_ts
+            connection.send_message(payload)
+        if window_end >= end_time:
+            break
+        # We don't want the start time state again and the start
+        # of the query is exclusive, move it back by a microsecond
+        # so we do not miss states at the start of the window
+        include_start_time_state = False
+        window_start = window_end
+        query_start = window_end - timedelta(microseconds=1)
+        await connection.async_wait_for_drain(STREAM_MAX_PENDING_MESSAGES)
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while sending historical states
+            break
+
+    if last_time_ts == 0:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        if send_empty:
+            connection.send_message(
+                _generate_websocket_response(msg_id, start_time, end_time, b"{}")
+            )
+        return None
+    return dt_util.utc_from_timestamp(last_time_ts)
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -409,6 +467,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("resolution"): vol.All(vol.Coerce(float), vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -448,6 +507,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    resolution: float | None = msg.get("resolution")
 
     if end_time and end_time <= utc_now:
         if (
@@ -473,6 +533,7 @@ async def ws_stream(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            resolution,
             True,
         )
         return
@@ -537,6 +598,7 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        resolution,
         True,
     )
 
@@ -583,5 +645,6 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        resolution,
         send_empty=not last_event_time,
     )
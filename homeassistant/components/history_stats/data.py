@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 import datetime
 import logging
 import math
 
-from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.components.recorder import history
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant
 from homeassistant.helpers.template import Template
 from homeassistant.util import dt as dt_util
 
@@ -28,12 +29,118 @@ class HistoryStatsState:
     period: tuple[datetime.datetime, datetime.datetime]
 
 
-@dataclass
-class HistoryState:
-    """A minimal state to avoid holding on to State objects."""
+class HistoryIntervals:
+    """The state changes of the current period as intervals.
+
+    Along with the timestamp of each change it keeps running totals of
+    the seconds spent in a matching state and of the changes into a
+    matching state, so the totals up to any point are found with a
+    binary search. Pruning only moves the head of the lists, they are
+    compacted once most of them is unused.
+    """
+
+    __slots__ = (
+        "_entity_states",
+        "_head",
+        "_match_counts",
+        "_matches",
+        "_seconds",
+        "_timestamps",
+    )
+
+    def __init__(self, entity_states: set[str]) -> None:
+        """Initialize the intervals."""
+        self._entity_states = entity_states
+        self._head = 0
+        self._timestamps: list[float] = []
+        self._matches: list[bool] = []
+        self._seconds: list[float] = []
+        self._match_counts: list[int] = []
+
+    def clear(self) -> None:
+        """Remove all the state changes."""
+        self._head = 0
+        self._timestamps.clear()
+        self._matches.clear()
+        self._seconds.clear()
+        self._match_counts.clear()
+
+    def append(self, state: str, last_changed: float) -> None:
+        """Append a state change."""
+        matches = state in self._entity_states
+        if not self._timestamps:
+            self._timestamps.append(last_changed)
+            self._matches.append(matches)
+            self._seconds.append(0.0)
+            self._match_counts.append(int(matches))
+            return
+        previous_timestamp = self._timestamps[-1]
+        previous_matches = self._matches[-1]
+        # Keep the timestamps sorted for the binary search
+        last_changed = max(last_changed, previous_timestamp)
+        self._timestamps.append(last_changed)
+        self._matches.append(matches)
+        self._seconds.append(
+            self._seconds[-1] + last_changed - previous_timestamp
+            if previous_matches
+            else self._seconds[-1]
+        )
+        self._match_counts.append(
+            self._match_counts[-1] + 1
+            if matches and not previous_matches
+            else self._match_counts[-1]
+        )
+
+    def prune(self, start_timestamp: float) -> None:
+        """Remove the state changes before the last one before the start."""
+        head = bisect_left(self._timestamps, start_timestamp, self._head) - 1
+        if head <= self._head:
+            return
+        self._head = head
+        if head > len(self._timestamps) // 2:
+            del self._timestamps[:head]
+            del self._matches[:head]
+            del self._seconds[:head]
+            del self._match_counts[:head]
+            self._head = 0
+
+    def compute(
+        self, now_timestamp: float, start_timestamp: float, end_timestamp: float
+    ) -> tuple[float, int]:
+        """Return the seconds matched and the changes into a matching state.
 
-    state: str
-    last_changed: float
+        The state changes after the end or in the future are not counted,
+        the state at the head counts from the start of the period.
+        """
+        timestamps = self._timestamps
+        head = self._head
+        measure_end = min(end_timestamp, now_timestamp)
+        last = bisect_left(timestamps, math.floor(measure_end) + 1, head) - 1
+        if last < len(timestamps) - 1 and math.floor(timestamps[last + 1]) <= (
+            end_timestamp
+        ):
+            # Shouldn't count states that are in the future
+            _LOGGER.debug(
+                "Skipping future timestamp %s (now %s)",
+                timestamps[last + 1],
+                now_timestamp,
+            )
+        if last < head:
+            return 0.0, 0
+
+        matches = self._matches
+        head_start = max(start_timestamp, timestamps[head])
+        elapsed = self._seconds[last] - self._seconds[head]
+        if matches[head] and last > head:
+            # The head may have changed before the start of the period
+            elapsed -= head_start - timestamps[head]
+        if matches[last]:
+            # Count time elapsed between last history state and end of measure
+            elapsed += measure_end - max(head_start, timestamps[last])
+        match_count = (
+            self._match_counts[last] - self._match_counts[head] + matches[head]
+        )
+        return elapsed, match_count
 
 
 class HistoryStats:
@@ -54,9 +161,9 @@ class HistoryStats:
         self.entity_id = entity_id
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
-        self._history_current_period: list[HistoryState] = []
         self._has_recorder_data = False
         self._entity_states = set(entity_states)
+        self._history_current_period = HistoryIntervals(self._entity_states)
         self._duration = duration
         self._start = start
         self._end = end
@@ -102,7 +209,7 @@ class HistoryStats:
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
+            self._history_current_period.clear()
             self._has_recorder_data = False
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
@@ -130,7 +237,7 @@ class HistoryStats:
             )
             end_changed = current_period_end_timestamp != previous_period_end_timestamp
             if start_changed:
-                self._prune_history_cache(current_period_start_timestamp)
+                self._history_current_period.prune(current_period_start_timestamp)
 
             new_data = False
             if event and (new_state := event.data["new_state"]) is not None:
@@ -138,7 +245,7 @@ class HistoryStats:
                     new_state.last_changed
                 ):
                     self._history_current_period.append(
-                        HistoryState(new_state.state, new_state.last_changed_timestamp)
+                        new_state.state, new_state.last_changed_timestamp
                     )
                     new_data = True
             if (
@@ -160,9 +267,7 @@ class HistoryStats:
                         new_state.last_changed
                     ):
                         self._history_current_period.append(
-                            HistoryState(
-                                new_state.state, new_state.last_changed_timestamp
-                            )
+                            new_state.state, new_state.last_changed_timestamp
                         )
 
             self._has_recorder_data = True
@@ -170,7 +275,7 @@ class HistoryStats:
         if self._query_count == 0:
             self._pending_events.clear()
 
-        seconds_matched, match_count = self._async_compute_seconds_and_changes(
+        seconds_matched, match_count = self._history_current_period.compute(
             now_timestamp,
             current_period_start_timestamp,
             current_period_end_timestamp,
@@ -183,94 +288,25 @@ class HistoryStats:
         current_period_start_timestamp: float,
         current_period_end_timestamp: float,
     ) -> None:
-        """Update history data for the current period from the database."""
+        """Update history data for the current period from the database.
+
+        While Home Assistant starts the query is shared with the other
+        helpers loading their history for the same period.
+        """
         self._query_count += 1
         try:
-            instance = get_instance(self.hass)
-            states = await instance.async_add_executor_job(
-                self._state_changes_during_period,
-                current_period_start_timestamp,
-                current_period_end_timestamp,
+            states = await history.async_state_changes_during_period(
+                self.hass,
+                dt_util.utc_from_timestamp(current_period_start_timestamp),
+                dt_util.utc_from_timestamp(current_period_end_timestamp),
+                self.entity_id,
+                include_start_time_state=True,
+                no_attributes=True,
             )
         finally:
             self._query_count -= 1
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
-
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
-            self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
-            no_attributes=True,
-        ).get(self.entity_id, [])
-
-    def _async_compute_seconds_and_changes(
-        self, now_timestamp: float, start_timestamp: float, end_timestamp: float
-    ) -> tuple[float, int]:
-        """Compute the seconds matched and changes from the history list and first state."""
-        # state_changes_during_period is called with include_start_time_state=True
-        # which is the default and always provides the state at the start
-        # of the period
-        previous_state_matches = False
-        last_state_change_timestamp = 0.0
-        elapsed = 0.0
-        match_count = 0
-
-        # Make calculations
-        for history_state in self._history_current_period:
-            current_state_matches = history_state.state in self._entity_states
-            state_change_timestamp = history_state.last_changed
-
-            if math.floor(state_change_timestamp) > end_timestamp:
-                break
-
-            if math.floor(state_change_timestamp) > now_timestamp:
-                # Shouldn't count states that are in the future
-                _LOGGER.debug(
-                    "Skipping future timestamp %s (now %s)",
-                    state_change_timestamp,
-                    now_timestamp,
-                )
-                break
-
-            if previous_state_matches:
-                elapsed += state_change_timestamp - last_state_change_timestamp
-            elif current_state_matches:
-                match_count += 1
-
-            previous_state_matches = current_state_matches
-            last_state_change_timestamp = max(start_timestamp, state_change_timestamp)
-
-        # Count time elapsed between last history state and end of measure
-        if previous_state_matches:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_state_change_timestamp
-
-        # Save value in seconds
-        seconds_matched = elapsed
-        return seconds_matched, match_count
-
-    def _prune_history_cache(self, start_timestamp: float) -> None:
-        """Remove unnecessary old data from the history state cache from previous runs.
-
-        Update the timestamp of the last record from before the start to the current start time.
-        """
-        trim_count = 0
-        for i, history_state in enumerate(self._history_current_period):
-            if history_state.last_changed >= start_timestamp:
-                break
-            history_state.last_changed = start_timestamp
-            if i > 0:
-                trim_count += 1
-        if trim_count:  # Don't slice if no data was removed
-            self._history_current_period = self._history_current_period[trim_count:]
+        self._history_current_period.clear()
+        for state in states:
+            self._history_current_period.append(
+                state.state, state.last_changed.timestamp()
+            )
@@ -52,6 +52,7 @@ from homeassistant.helpers.entityfilter import (
 )
 from homeassistant.helpers.typing import ConfigType
 
+from .buffer import EventBuffer
 from .const import (
     API_VERSION_2,
     BATCH_BUFFER_SIZE,
@@ -91,8 +92,10 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    MAX_QUEUE_SIZE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
+    QUEUE_FULL_MESSAGE,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
     RESUMED_MESSAGE,
@@ -105,6 +108,7 @@ from .const import (
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .line_protocol import LineProtocolEncoder
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -324,6 +328,20 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
     return event_to_json
 
 
+def _generate_event_to_line(conf: dict) -> Callable[[Event], str | None]:
+    """Build event to line protocol converter."""
+    event_to_json = _generate_event_to_json(conf)
+    encode = LineProtocolEncoder(conf.get(CONF_PRECISION)).encode
+
+    def event_to_line(event: Event) -> str | None:
+        """Convert event into a line of the line protocol."""
+        if (json := event_to_json(event)) is None:
+            return None
+        return encode(json)
+
+    return event_to_line
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
@@ -351,6 +369,7 @@ def get_influx_connection(  # noqa: C901
         kwargs[CONF_VERIFY_SSL] = conf[CONF_VERIFY_SSL]
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
+        kwargs["enable_gzip"] = True
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
@@ -432,12 +451,14 @@ def get_influx_connection(  # noqa: C901
     if CONF_SSL in conf:
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
+    kwargs["gzip"] = True
+
     influx = InfluxDBClient(**kwargs)
 
     def write_v1(json):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(json, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -494,9 +515,15 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_json = _generate_event_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        EventBuffer(MAX_QUEUE_SIZE),
+    )
     instance.start()
 
     def shutdown(event):
@@ -513,16 +540,18 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_json, max_tries, event_buffer):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
-        self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
-            queue.SimpleQueue()
-        )
+        self.queue = event_buffer
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
         self.write_errors = 0
+        self.dropped_events = 0
+        self.write_latency: float | None = None
+        self.write_error: str | None = None
+        self.written = False
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
@@ -545,11 +574,16 @@ class InfluxThread(threading.Thread):
         json = []
 
         dropped = 0
+        deadline = 0.0
 
         with suppress(queue.Empty):
             while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
-                item = self.queue.get(timeout=timeout)
+                if count == 0:
+                    item = self.queue.get()
+                    # The batch is written at most a batch timeout after it started
+                    deadline = time.monotonic() + self.batch_timeout()
+                else:
+                    item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
                 count += 1
 
                 if item is None:
@@ -568,6 +602,9 @@ class InfluxThread(threading.Thread):
 
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
+        if queue_full_dropped := self.queue.pop_dropped():
+            self.dropped_events += queue_full_dropped
+            _LOGGER.warning(QUEUE_FULL_MESSAGE, queue_full_dropped)
 
         return count, json
 
@@ -575,16 +612,23 @@ class InfluxThread(threading.Thread):
         """Write preprocessed events to influxdb, with retry."""
         for retry in range(self.max_tries + 1):
             try:
+                start = time.monotonic()
                 self.influx.write(json)
+                self.write_latency = time.monotonic() - start
+                self.write_error = None
+                self.written = True
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
                     self.write_errors = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+                _LOGGER.debug(
+                    WROTE_MESSAGE, len(json), self.write_latency, self.queue.depth
+                )
                 break
             except ValueError as err:
                 _LOGGER.error(err)
+                self.write_error = str(err)
                 break
             except ConnectionError as err:
                 if retry < self.max_tries:
@@ -593,6 +637,7 @@ class InfluxThread(threading.Thread):
                     if not self.write_errors:
                         _LOGGER.error(err)
                     self.write_errors += len(json)
+                    self.write_error = str(err)
 
     def run(self):
         """Process incoming events."""
@@ -0,0 +1,71 @@
+"""Bounded buffer of the events waiting to be written to InfluxDB."""
+
+from __future__ import annotations
+
+from collections import deque
+import queue
+import threading
+
+from homeassistant.core import Event
+
+type BufferItem = threading.Event | tuple[float, Event] | None
+
+
+class EventBuffer:
+    """First in, first out buffer holding a bounded number of events.
+
+    When an event is added to a full buffer the oldest event is dropped.
+    Items other than events are never dropped and do not count towards
+    the size.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the buffer."""
+        self._items: deque[BufferItem] = deque()
+        self._maxsize = maxsize
+        self._events = 0
+        self._dropped = 0
+        self._not_empty = threading.Condition(threading.Lock())
+
+    @property
+    def depth(self) -> int:
+        """Return the number of buffered events."""
+        return self._events
+
+    def pop_dropped(self) -> int:
+        """Return the number of events dropped since the last call."""
+        with self._not_empty:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+
+    def put(self, item: BufferItem) -> None:
+        """Add an item, dropping the oldest event if the buffer is full."""
+        with self._not_empty:
+            if type(item) is tuple:
+                if self._events >= self._maxsize:
+                    self._drop_oldest()
+                self._events += 1
+            self._items.append(item)
+            self._not_empty.notify()
+
+    def get(self, timeout: float | None = None) -> BufferItem:
+        """Remove and return the first item.
+
+        Raises queue.Empty if no item was added within the timeout.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._items, timeout):
+                raise queue.Empty
+            item = self._items.popleft()
+            if type(item) is tuple:
+                self._events -= 1
+            return item
+
+    def _drop_oldest(self) -> None:
+        """Drop the oldest event."""
+        for index, item in enumerate(self._items):
+            if type(item) is tuple:
+                del self._items[index]
+                break
+        self._events -= 1
+        self._dropped += 1
@@ -0,0 +1,87 @@
+"""Encode points to the InfluxDB line protocol."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from functools import lru_cache
+import math
+from typing import Any
+
+from .const import (
+    INFLUX_CONF_FIELDS,
+    INFLUX_CONF_MEASUREMENT,
+    INFLUX_CONF_TAGS,
+    INFLUX_CONF_TIME,
+)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# Microseconds in a unit of the write precision, nanoseconds are the default
+PRECISION_MICROSECONDS = {"s": 1_000_000, "ms": 1_000, "us": 1}
+
+_KEY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", " ": "\\ ", ",": "\\,", "=": "\\=", "\n": "\\n"}
+)
+_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+
+@lru_cache(maxsize=4096)
+def _escape_key(key: str) -> str:
+    """Escape a measurement, a tag key or value, or a field key."""
+    return key.translate(_KEY_ESCAPES)
+
+
+def _encode_field_value(value: Any) -> str | None:
+    """Encode a field value, return None if it can't be written."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        # Infinity and NaN are not valid floats in InfluxDB
+        return repr(value) if math.isfinite(value) else None
+    if value is None:
+        return None
+    return f'"{str(value).translate(_STRING_ESCAPES)}"'
+
+
+class LineProtocolEncoder:
+    """Encode the points built for the JSON writes as lines.
+
+    The lines are equal to the ones the clients build from the points,
+    without their generic handling of the values.
+    """
+
+    def __init__(self, precision: str | None) -> None:
+        """Initialize the encoder."""
+        self._microseconds = PRECISION_MICROSECONDS.get(precision or "ns")
+
+    def encode_timestamp(self, time: datetime) -> int:
+        """Return the timestamp in the write precision."""
+        delta = time - EPOCH
+        microseconds = (
+            delta.days * 86_400 + delta.seconds
+        ) * 1_000_000 + delta.microseconds
+        if self._microseconds is None:
+            return microseconds * 1000
+        return microseconds // self._microseconds
+
+    def encode(self, point: dict[str, Any]) -> str | None:
+        """Return the line of a point, None if it has no field to write."""
+        fields = ",".join(
+            f"{_escape_key(key)}={encoded}"
+            for key, value in point[INFLUX_CONF_FIELDS].items()
+            if key and (encoded := _encode_field_value(value)) is not None
+        )
+        if not fields:
+            return None
+
+        line = _escape_key(str(point[INFLUX_CONF_MEASUREMENT]))
+        tags: dict[str, Any] = point[INFLUX_CONF_TAGS]
+        # Sorted tags take load off the server
+        for key in sorted(tags):
+            value = tags[key]
+            if key and value is not None and (value := str(value)):
+                line += f",{_escape_key(key)}={_escape_key(value)}"
+
+        return f"{line} {fields} {self.encode_timestamp(point[INFLUX_CONF_TIME])}"
@@ -0,0 +1,44 @@
+"""Provide info to system health."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    if (instance := hass.data.get(DOMAIN)) is None:
+        return {"last_write": {"type": "failed", "error": "not connected"}}
+
+    if instance.write_error is not None:
+        last_write: str | dict[str, str] | None = {
+            "type": "failed",
+            "error": instance.write_error,
+        }
+    elif instance.written:
+        last_write = "ok"
+    else:
+        last_write = None
+
+    write_latency = instance.write_latency
+    return {
+        "last_write": last_write,
+        "queue_depth": instance.queue.depth,
+        "dropped_events": instance.dropped_events,
+        "write_latency": (
+            f"{write_latency * 1000:.0f} ms" if write_latency is not None else None
+        ),
+    }
@@ -6,6 +6,7 @@ from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, NamedTuple, cast, final
 
+from lru import LRU
 from propcache.api import cached_property
 from sqlalchemy.engine.row import Row
 
@@ -41,7 +42,7 @@ class LazyEventPartialState:
     def __init__(
         self,
         row: Row | EventAsRow,
-        event_data_cache: dict[str, dict[str, Any]],
+        event_data_cache: LRU[str, dict[str, Any]],
     ) -> None:
         """Init the lazy event."""
         self.row = row
@@ -9,10 +9,14 @@ import logging
 import time
 from typing import TYPE_CHECKING, Any
 
+from lru import LRU
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
 
 from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.const import (
+    STATES_META_CONTINUOUS_SCHEMA_VERSION,
+)
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
     bytes_to_uuid_hex_or_none,
@@ -84,12 +88,19 @@ from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# Rows read from the database at a time
+LOGBOOK_YIELD_ROWS = 2048
+# Events and event data kept to describe rows which are read again
+EVENT_CACHE_MAX_SIZE = 4096
+
 
 @dataclass(slots=True)
 class LogbookRun:
     """A logbook run which may be a long running event stream or single request."""
 
-    context_lookup: dict[bytes | None, Row | EventAsRow | None]
+    # The context rows are kept for the whole run, a row may refer to the
+    # context of any row read before it
+    context_lookup: dict[bytes, Row | EventAsRow]
     external_events: dict[
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
@@ -127,9 +138,9 @@ class EventProcessor:
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
         self.logbook_run = LogbookRun(
-            context_lookup={None: None},
+            context_lookup={},
             external_events=logbook_config.external_events,
-            event_cache=EventCache({}),
+            event_cache=EventCache(LRU(EVENT_CACHE_MAX_SIZE)),
             entity_name_cache=EntityNameCache(self.hass),
             include_entity_name=include_entity_name,
             timestamp=timestamp,
@@ -156,6 +167,18 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        return list(self.iter_events(start_day, end_day))
+
+    def iter_events(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> Generator[dict[str, Any]]:
+        """Generate the events for a period of time.
+
+        The rows are streamed from the database and humanified as they are
+        read, so the memory used does not depend on the length of the period.
+        """
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -179,9 +202,20 @@ class EventProcessor:
                 self.device_ids,
                 self.filters,
                 self.context_id,
+                instance.schema_version >= STATES_META_CONTINUOUS_SCHEMA_VERSION,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            yield from _humanify(
+                self.hass,
+                execute_stmt_lambda_element(
+                    session,
+                    stmt,
+                    yield_per=LOGBOOK_YIELD_ROWS,
+                    orm_rows=False,
+                    stream=True,
+                ),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
             )
 
     def humanify(
@@ -223,7 +257,11 @@ def _humanify(
     # Process rows
     for row in rows:
         context_id_bin = row[CONTEXT_ID_BIN_POS]
-        if memoize_new_contexts and context_id_bin not in context_lookup:
+        if (
+            memoize_new_contexts
+            and context_id_bin is not None
+            and context_id_bin not in context_lookup
+        ):
             context_lookup[context_id_bin] = row
         if row[CONTEXT_ONLY_POS]:
             continue
@@ -419,10 +457,12 @@ class EntityNameCache:
 class EventCache:
     """Cache LazyEventPartialState by row."""
 
-    def __init__(self, event_data_cache: dict[str, dict[str, Any]]) -> None:
+    def __init__(self, event_data_cache: LRU[str, dict[str, Any]]) -> None:
         """Init the cache."""
         self._event_data_cache = event_data_cache
-        self.event_cache: dict[Row | EventAsRow, LazyEventPartialState] = {}
+        self.event_cache: LRU[Row | EventAsRow, LazyEventPartialState] = LRU(
+            EVENT_CACHE_MAX_SIZE
+        )
 
     def get(self, row: EventAsRow | Row) -> LazyEventPartialState:
         """Get the event from the row."""
@@ -437,5 +477,5 @@ class EventCache:
 
     def clear(self) -> None:
         """Clear the event cache."""
-        self._event_data_cache = {}
-        self.event_cache = {}
+        self._event_data_cache.clear()
+        self.event_cache.clear()
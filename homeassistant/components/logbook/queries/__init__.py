@@ -12,6 +12,7 @@ from homeassistant.components.recorder.models import ulid_to_bytes_or_none
 from homeassistant.helpers.json import json_dumps
 
 from .all import all_stmt
+from .common import not_continuous_entity_matcher
 from .devices import devices_stmt
 from .entities import entities_stmt
 from .entities_and_devices import entities_devices_stmt
@@ -26,10 +27,15 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    has_continuous: bool = False,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
+    """Generate the logbook statement for a logbook request.
+
+    Set has_continuous if the states meta have the continuous flag.
+    """
     start_day = start_day_dt.timestamp()
     end_day = end_day_dt.timestamp()
+    not_continuous = not_continuous_entity_matcher(has_continuous)
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
@@ -39,6 +45,7 @@ def statement_for_request(
             end_day,
             event_type_ids,
             filters,
+            not_continuous,
             context_id_bin,
         )
 
@@ -56,6 +63,7 @@ def statement_for_request(
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
             [json_dumps(device_id) for device_id in device_ids],
+            not_continuous,
         )
 
     # entities: logbook sends everything for the timeframe for the entities
@@ -66,6 +74,7 @@ def statement_for_request(
             event_type_ids,
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
+            not_continuous,
         )
 
     # devices: logbook sends everything for the timeframe for the devices
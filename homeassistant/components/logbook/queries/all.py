@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from sqlalchemy import lambda_stmt
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -21,6 +22,7 @@ def all_stmt(
     end_day: float,
     event_type_ids: tuple[int, ...],
     filters: Filters | None,
+    not_continuous: ColumnElement[bool],
     context_id_bin: bytes | None = None,
 ) -> StatementLambdaElement:
     """Generate a logbook query for all entities."""
@@ -29,26 +31,34 @@ def all_stmt(
     )
     if context_id_bin is not None:
         stmt += lambda s: s.where(Events.context_id_bin == context_id_bin).union_all(
-            _states_query_for_context_id(start_day, end_day, context_id_bin),
+            _states_query_for_context_id(
+                start_day, end_day, not_continuous, context_id_bin
+            ),
         )
     elif filters and filters.has_config:
         stmt = stmt.add_criteria(
             lambda q: q.filter(filters.events_entity_filter()).union_all(
-                _states_query_for_all(start_day, end_day).where(
+                _states_query_for_all(start_day, end_day, not_continuous).where(
                     filters.states_metadata_entity_filter()
                 )
             ),
             track_on=[filters],
         )
     else:
-        stmt += lambda s: s.union_all(_states_query_for_all(start_day, end_day))
+        stmt += lambda s: s.union_all(
+            _states_query_for_all(start_day, end_day, not_continuous)
+        )
 
     stmt += lambda s: s.order_by(Events.time_fired_ts)
     return stmt
 
 
-def _states_query_for_all(start_day: float, end_day: float) -> Select:
-    return apply_states_filters(_apply_all_hints(select_states()), start_day, end_day)
+def _states_query_for_all(
+    start_day: float, end_day: float, not_continuous: ColumnElement[bool]
+) -> Select:
+    return apply_states_filters(
+        _apply_all_hints(select_states()), start_day, end_day, not_continuous
+    )
 
 
 def _apply_all_hints(sel: Select) -> Select:
@@ -61,8 +71,11 @@ def _apply_all_hints(sel: Select) -> Select:
 
 
 def _states_query_for_context_id(
-    start_day: float, end_day: float, context_id_bin: bytes
+    start_day: float,
+    end_day: float,
+    not_continuous: ColumnElement[bool],
+    context_id_bin: bytes,
 ) -> Select:
-    return apply_states_filters(select_states(), start_day, end_day).where(
-        States.context_id_bin == context_id_bin
-    )
+    return apply_states_filters(
+        select_states(), start_day, end_day, not_continuous
+    ).where(States.context_id_bin == context_id_bin)
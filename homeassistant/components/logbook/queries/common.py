@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import Final
 
 import sqlalchemy
@@ -10,6 +11,10 @@ from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
 from sqlalchemy.sql.expression import literal
 from sqlalchemy.sql.selectable import Select
 
+from homeassistant.components.recorder.const import (
+    ALWAYS_CONTINUOUS_DOMAINS,
+    CONDITIONALLY_CONTINUOUS_DOMAINS,
+)
 from homeassistant.components.recorder.db_schema import (
     EVENTS_CONTEXT_ID_BIN_INDEX,
     OLD_FORMAT_ATTRS_JSON,
@@ -26,8 +31,6 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import like_domain_matchers
 
-from ..const import ALWAYS_CONTINUOUS_DOMAINS, CONDITIONALLY_CONTINUOUS_DOMAINS
-
 # Domains that are continuous if there is a UOM set on the entity
 CONDITIONALLY_CONTINUOUS_ENTITY_ID_LIKE = like_domain_matchers(
     CONDITIONALLY_CONTINUOUS_DOMAINS
@@ -164,11 +167,16 @@ def select_states() -> Select:
     )
 
 
-def apply_states_filters(sel: Select, start_day: float, end_day: float) -> Select:
+def apply_states_filters(
+    sel: Select,
+    start_day: float,
+    end_day: float,
+    not_continuous: ColumnElement[bool],
+) -> Select:
     """Filter states by time range.
 
     Filters states that do not have an old state or new state (added / removed)
-    Filters states that are in a continuous domain with a UOM.
+    Filters states of continuous entities, not_continuous matches the others.
     Filters states that do not have matching last_updated_ts and last_changed_ts.
     """
     return (
@@ -177,7 +185,7 @@ def apply_states_filters(sel: Select, start_day: float, end_day: float) -> Selec
         )
         .outerjoin(OLD_STATE, (States.old_state_id == OLD_STATE.state_id))
         .where(_missing_state_matcher())
-        .where(_not_continuous_entity_matcher())
+        .where(not_continuous)
         .where(
             (States.last_updated_ts == States.last_changed_ts)
             | States.last_changed_ts.is_(None)
@@ -200,8 +208,27 @@ def _missing_state_matcher() -> ColumnElement[bool]:
     )
 
 
-def _not_continuous_entity_matcher() -> ColumnElement[bool]:
-    """Match non continuous entities."""
+@cache
+def not_continuous_entity_matcher(has_continuous: bool) -> ColumnElement[bool]:
+    """Match non continuous entities.
+
+    When the states meta have the continuous flag, the entities are matched
+    with it. The flag is unknown for entities which have not been written
+    since it was added, those are still matched with their entity_id and
+    attributes.
+    """
+    if not has_continuous:
+        return _not_continuous_entity_like_matcher()
+    return sqlalchemy.or_(
+        StatesMeta.continuous == 0,
+        sqlalchemy.and_(
+            StatesMeta.continuous.is_(None), _not_continuous_entity_like_matcher()
+        ).self_group(),
+    )
+
+
+def _not_continuous_entity_like_matcher() -> ColumnElement[bool]:
+    """Match non continuous entities with their entity_id and attributes."""
     return sqlalchemy.or_(
         # First exclude domains that may be continuous
         _not_possible_continuous_domain_matcher(),
@@ -65,6 +65,7 @@ def _apply_entities_devices_context_union(
     states_metadata_ids: Collection[int],
     json_quoted_entity_ids: list[str],
     json_quoted_device_ids: list[str],
+    not_continuous: ColumnElement[bool],
 ) -> CompoundSelect:
     devices_entities_cte: CTE = _select_entities_device_id_context_ids_sub_query(
         start_day,
@@ -80,7 +81,9 @@ def _apply_entities_devices_context_union(
     # in the python code anyways since they will have context_only
     # set on them the impact is minimal.
     return sel.union_all(
-        states_select_for_entity_ids(start_day, end_day, states_metadata_ids),
+        states_select_for_entity_ids(
+            start_day, end_day, states_metadata_ids, not_continuous
+        ),
         apply_events_context_hints(
             select_events_context_only()
             .select_from(devices_entities_cte)
@@ -108,6 +111,7 @@ def entities_devices_stmt(
     states_metadata_ids: Collection[int],
     json_quoted_entity_ids: list[str],
     json_quoted_device_ids: list[str],
+    not_continuous: ColumnElement[bool],
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
     return lambda_stmt(
@@ -123,6 +127,7 @@ def entities_devices_stmt(
             states_metadata_ids,
             json_quoted_entity_ids,
             json_quoted_device_ids,
+            not_continuous,
         ).order_by(Events.time_fired_ts)
     )
 
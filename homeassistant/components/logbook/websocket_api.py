@@ -33,8 +33,14 @@ MAX_PENDING_LOGBOOK_EVENTS = 2048
 EVENT_COALESCE_TIME = 0.35
 # minimum size that we will split the query
 BIG_QUERY_HOURS = 25
-# how many hours to deliver in the first chunk when we split the query
+# how many hours to deliver in each chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# how many messages may still be queued to the client before
+# we select the next chunk of a split query
+STREAM_MAX_PENDING_MESSAGES = 4
+# how many hours of events are read by each executor job, every
+# window is delivered in its own message
+STREAM_WINDOW_HOURS = 1
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,10 +93,12 @@ async def _async_send_historical_events(
     """Select historical data from the database and deliver it to the websocket.
 
     If the query is considered a big query we will split the request into
-    two chunks so that they get the recent events first and the select
-    that is expected to take a long time comes in after to ensure
+    chunks of BIG_QUERY_RECENT_HOURS so that they get the recent events
+    first and the older chunks come in after, newest first, to ensure
     they are not stuck at a loading screen and can start looking at
-    the data right away.
+    the data right away. The next chunk is only selected once the client
+    has read all but STREAM_MAX_PENDING_MESSAGES of the queued messages
+    so a slow client does not make us buffer the whole period.
 
     This function returns the time of the most recent event we sent to the
     websocket.
@@ -102,75 +110,118 @@ async def _async_send_historical_events(
     )
 
     if not is_big_query:
-        message, last_event_time = await _async_get_ws_stream_events(
+        return await _async_send_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
             event_processor,
             partial,
+            force_send,
         )
-        # If there is no last_event_time, there are no historical
-        # results, but we still send an empty message
-        # if its the last one (not partial) so
-        # consumers of the api know their request was
-        # answered but there were no results
-        if last_event_time or not partial or force_send:
-            connection.send_message(message)
-        return last_event_time
 
     # This is a big query so we deliver
-    # the first three hours and then
-    # we fetch the old data
+    # the most recent day and then
+    # we fetch the old data day by day
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
-    recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
+    recent_query_last_event_time = await _async_send_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
         event_processor,
         partial=True,
+        send_empty=False,
     )
-    if recent_query_last_event_time:
-        connection.send_message(recent_message)
 
-    older_message, older_query_last_event_time = await _async_get_ws_stream_events(
-        hass,
-        msg_id,
-        start_time,
-        recent_query_start,
-        event_processor,
-        partial,
-    )
-    # If there is no last_event_time, there are no historical
-    # results, but we still send an empty message
-    # if its the last one (not partial) so
-    # consumers of the api know their request was
-    # answered but there were no results
-    if older_query_last_event_time or not partial or force_send:
-        connection.send_message(older_message)
+    older_query_last_event_time: dt | None = None
+    chunk_end = recent_query_start
+    while chunk_end > start_time:
+        await connection.async_wait_for_drain(STREAM_MAX_PENDING_MESSAGES)
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while sending historical events
+            break
+        chunk_start = max(
+            chunk_end - timedelta(hours=BIG_QUERY_RECENT_HOURS), start_time
+        )
+        is_last_chunk = chunk_start == start_time
+        # The end of the select is exclusive, move it forward by
+        # a microsecond so we do not miss events at the end of the chunk
+        chunk_last_event_time = await _async_send_ws_stream_events(
+            hass,
+            connection,
+            msg_id,
+            chunk_start,
+            chunk_end + timedelta(microseconds=1),
+            event_processor,
+            partial if is_last_chunk else True,
+            is_last_chunk and force_send,
+        )
+        older_query_last_event_time = (
+            older_query_last_event_time or chunk_last_event_time
+        )
+        chunk_end = chunk_start
 
     # Returns the time of the newest event
     return recent_query_last_event_time or older_query_last_event_time
 
 
-async def _async_get_ws_stream_events(
+async def _async_send_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
     event_processor: EventProcessor,
     partial: bool,
-) -> tuple[bytes, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
-        _ws_stream_get_events,
-        msg_id,
-        start_time,
-        end_time,
-        event_processor,
-        partial,
-    )
+    send_empty: bool,
+) -> dt | None:
+    """Select the events of a period and deliver them to the websocket.
+
+    The period is read in windows of STREAM_WINDOW_HOURS, oldest first,
+    each by its own executor job. The next window is only read once the
+    client has read all but STREAM_MAX_PENDING_MESSAGES of the queued
+    messages so a slow client does not make us buffer the whole period.
+
+    Windows without events are not sent. If there are no events at the
+    end of the period, we still send an empty message if its the last one
+    (not partial) or send_empty, so consumers of the api know their request
+    was answered.
+
+    This function returns the time of the most recent event we sent to the
+    websocket.
+    """
+    instance = get_instance(hass)
+    window = timedelta(hours=STREAM_WINDOW_HOURS)
+    last_event_time: dt | None = None
+    window_start = start_time
+    while True:
+        window_end = min(window_start + window, end_time)
+        is_last_window = window_end == end_time
+        message, window_last_event_time = await instance.async_add_executor_job(
+            _ws_stream_get_events,
+            msg_id,
+            window_start,
+            # The end of the select is exclusive, move it forward by a
+            # microsecond so we do not miss events at the end of the window
+            window_end if is_last_window else window_end + timedelta(microseconds=1),
+            event_processor,
+            partial or not is_last_window,
+        )
+        if window_last_event_time:
+            last_event_time = window_last_event_time
+            connection.send_message(message)
+        elif is_last_window and (not partial or send_empty):
+            connection.send_message(message)
+        if is_last_window:
+            return last_event_time
+        window_start = window_end
+        await connection.async_wait_for_drain(STREAM_MAX_PENDING_MESSAGES)
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while sending historical events
+            return last_event_time
 
 
 def _generate_stream_message(
@@ -435,11 +486,23 @@ def _ws_formatted_get_events(
     end_time: dt,
     event_processor: EventProcessor,
 ) -> bytes:
-    """Fetch events and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id, event_processor.get_events(start_time, end_time)
-        )
+    """Fetch events and convert them to json in the executor.
+
+    Each event is converted to json as soon as it is read so
+    the events are not all held in memory.
+    """
+    return messages.construct_result_message(
+        msg_id,
+        b"".join(
+            (
+                b"[",
+                b",".join(
+                    json_bytes(event)
+                    for event in event_processor.iter_events(start_time, end_time)
+                ),
+                b"]",
+            )
+        ),
     )
 
 
@@ -83,7 +83,12 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
-from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
+from .util import (
+    EnsureJobAfterCooldown,
+    TopicTrie,
+    get_file_path,
+    mqtt_config_entry_enabled,
+)
 
 if TYPE_CHECKING:
     # Only import for paho-mqtt type checking here, imports are done locally
@@ -117,6 +122,14 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# Retained messages replayed by the broker after (re)subscribing can arrive
+# in large bursts. Processing them may use at most RETAINED_MESSAGES_BUDGET
+# seconds of every RETAINED_MESSAGES_TICK seconds, after which reading from
+# the socket is paused until the tick ends. Retained messages received less
+# than RETAINED_MESSAGES_TICK seconds apart belong to the same burst.
+RETAINED_MESSAGES_BUDGET = 0.005
+RETAINED_MESSAGES_TICK = 0.025
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt._WebsocketWrapper | Any  # noqa: SLF001
 
 type SubscribePayloadType = str | bytes | bytearray  # Only bytes if encoding is None
@@ -266,7 +279,6 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -393,9 +405,8 @@ class MQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        # To ensure the wildcard subscriptions order is preserved, we use a dict
-        # with `None` values instead of a set.
-        self._wildcard_subscriptions: dict[Subscription, None] = {}
+        # The trie preserves the order the wildcard subscriptions were added
+        self._wildcard_subscriptions: TopicTrie[Subscription] = TopicTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -421,6 +432,18 @@ class MQTT:
             UNSUBSCRIBE_COOLDOWN, self._async_perform_unsubscribes
         )
         self._pending_unsubscribes: set[str] = set()  # topic
+        # Topics not resubscribed at the broker after a reconnect
+        # because a wildcard subscription covers them
+        self._covered_subscriptions: dict[str, str] = {}  # topic, wildcard topic
+        self._resubscribe_started: float | None = None
+        self._resubscribe_duration: float | None = None
+        # Retained messages in the current or last burst
+        self._retained_burst_size = 0
+        self._last_retained_message = 0.0
+        self._retained_budget_used = 0.0
+        self._retained_tick_end = 0.0
+        self._resume_reading: asyncio.TimerHandle | None = None
+        self._reader_sock: SocketType | None = None
         self._cleanup_on_unload.extend(
             (
                 async_at_started(hass, self._async_ha_started),
@@ -518,6 +541,29 @@ class MQTT:
         if (status := client.loop_read(MAX_PACKETS_TO_READ)) != 0:
             self._async_handle_callback_exception(status)
 
+    @callback
+    def _async_pause_reading(self) -> None:
+        """Pause reading from the socket until the retained messages tick ends."""
+        if (sock := self._reader_sock) is None:
+            return
+        _LOGGER.debug(
+            "%s: Retained messages budget exceeded, pausing reading",
+            self.config_entry.title,
+        )
+        self.loop.remove_reader(sock)
+        self._resume_reading = self.loop.call_at(
+            self._retained_tick_end, self._async_resume_reading, sock
+        )
+
+    @callback
+    def _async_resume_reading(self, sock: SocketType) -> None:
+        """Resume reading from the socket."""
+        self._resume_reading = None
+        if self._reader_sock is sock:
+            self.loop.add_reader(
+                sock, partial(self._async_reader_callback, self._mqttc)
+            )
+
     @callback
     def _async_start_misc_periodic(self) -> None:
         """Start the misc periodic."""
@@ -584,6 +630,7 @@ class MQTT:
         if fileno > -1:
             self._increase_socket_buffer_size(sock)
             self.loop.add_reader(sock, partial(self._async_reader_callback, client))
+            self._reader_sock = sock
         if not self._misc_timer:
             self._async_start_misc_periodic()
         # Try to consume the buffer right away so it doesn't fill up
@@ -602,6 +649,10 @@ class MQTT:
         self._async_connection_result(False)
         if fileno > -1:
             self.loop.remove_reader(sock)
+        self._reader_sock = None
+        if self._resume_reading:
+            self._resume_reading.cancel()
+            self._resume_reading = None
         if self._misc_timer:
             self._misc_timer.cancel()
             self._misc_timer = None
@@ -642,8 +693,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions or topic in self._wildcard_subscriptions
         )
 
     async def async_publish(
@@ -784,7 +835,7 @@ class MQTT:
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
-            self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscriptions.add(subscription.topic, subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -802,7 +853,7 @@ class MQTT:
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
             else:
-                del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscriptions.remove(topic, subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -820,6 +871,9 @@ class MQTT:
             if (max_qos := self._max_qos[topic]) < qos:
                 self._max_qos[topic] = (max_qos := qos)
             self._pending_subscriptions[topic] = max_qos
+            # Subscribe at the broker even if covered by a wildcard
+            # subscription to ensure retained messages are replayed
+            self._covered_subscriptions.pop(topic, None)
             # Cancel any pending unsubscribe since we are subscribing now
             if topic in self._pending_unsubscribes:
                 self._pending_unsubscribes.remove(topic)
@@ -873,9 +927,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -911,9 +964,25 @@ class MQTT:
         if topic in self._pending_subscriptions:
             # Avoid any pending subscription to be executed
             del self._pending_subscriptions[topic]
+        if topic in self._covered_subscriptions:
+            # The topic was never subscribed at the broker
+            del self._covered_subscriptions[topic]
+            return
 
         self._pending_unsubscribes.add(topic)
         self._unsubscribe_debouncer.async_schedule()
+        if self._covered_subscriptions:
+            self._async_uncover_subscriptions(topic)
+
+    @callback
+    def _async_uncover_subscriptions(self, wildcard_topic: str) -> None:
+        """Subscribe topics no longer covered by a wildcard subscription."""
+        if uncovered := [
+            (topic, self._max_qos[topic])
+            for topic, covered_by in self._covered_subscriptions.items()
+            if covered_by == wildcard_topic
+        ]:
+            self._async_queue_subscriptions(uncovered)
 
     async def _async_perform_subscriptions(self) -> None:
         """Perform MQTT client subscriptions."""
@@ -964,6 +1033,15 @@ class MQTT:
 
             await self._async_wait_for_mid_or_raise(mid, result)
 
+        if self._resubscribe_started is not None and not self._pending_subscriptions:
+            self._resubscribe_duration = time.monotonic() - self._resubscribe_started
+            self._resubscribe_started = None
+            _LOGGER.debug(
+                "Resubscribed in %.3f seconds, %s topics covered by wildcards",
+                self._resubscribe_duration,
+                len(self._covered_subscriptions),
+            )
+
     async def _async_perform_unsubscribes(self) -> None:
         """Perform pending MQTT client unsubscribes."""
         if not self._pending_unsubscribes:
@@ -1068,31 +1146,47 @@ class MQTT:
         """
         self._max_qos.clear()
         self._retained_topics.clear()
+        self._covered_subscriptions.clear()
+        self._resubscribe_started = time.monotonic()
         # Group subscriptions to only re-subscribe once for each topic.
         keyfunc = attrgetter("topic")
-        self._async_queue_subscriptions(
-            [
-                # Re-subscribe with the highest requested qos
-                (topic, max(subscription.qos for subscription in subs))
-                for topic, subs in groupby(
-                    sorted(self.subscriptions, key=keyfunc), keyfunc
-                )
-            ],
-            queue_only=True,
-        )
+        subscriptions = {
+            # Re-subscribe with the highest requested qos
+            topic: max(subscription.qos for subscription in subs)
+            for topic, subs in groupby(sorted(self.subscriptions, key=keyfunc), keyfunc)
+        }
+        # Skip topics covered by a wildcard subscription with at least the same
+        # qos, the broker replays their retained messages for the wildcard.
+        wildcard_qos: dict[str, int] = {}
+        for subscription in self._wildcard_subscriptions:
+            if (topic := subscription.topic) not in wildcard_qos:
+                wildcard_qos[topic] = subscriptions[topic]
+        for topic in self._simple_subscriptions:
+            qos = subscriptions[topic]
+            for wildcard in self._wildcard_subscriptions.match(topic):
+                if wildcard_qos[wildcard.topic] >= qos:
+                    self._covered_subscriptions[topic] = wildcard.topic
+                    self._max_qos[topic] = qos
+                    del subscriptions[topic]
+                    break
+        self._async_queue_subscriptions(subscriptions.items(), queue_only=True)
+
+    @callback
+    def async_resubscribe_diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics of the last resubscribe."""
+        return {
+            "resubscribe_duration": self._resubscribe_duration,
+            "covered_subscriptions": len(self._covered_subscriptions),
+            "retained_burst_size": self._retained_burst_size,
+        }
 
     @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions.match(topic))
         return subscriptions
 
     @callback
@@ -1123,6 +1217,15 @@ class MQTT:
         )
         subscriptions = self._matching_subscriptions(topic)
         msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
+        if msg.retain:
+            start = self.loop.time()
+            if start - self._last_retained_message > RETAINED_MESSAGES_TICK:
+                self._retained_burst_size = 0
+            self._retained_burst_size += 1
+            self._last_retained_message = start
+            if start >= self._retained_tick_end:
+                self._retained_tick_end = start + RETAINED_MESSAGES_TICK
+                self._retained_budget_used = 0.0
 
         for subscription in subscriptions:
             if msg.retain:
@@ -1176,6 +1279,13 @@ class MQTT:
             else:
                 self.hass.async_run_hass_job(job, receive_msg)
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
+        if msg.retain:
+            self._retained_budget_used += self.loop.time() - start
+            if (
+                self._retained_budget_used >= RETAINED_MESSAGES_BUDGET
+                and self._resume_reading is None
+            ):
+                self._async_pause_reading()
 
     @callback
     def _async_mqtt_on_publish(
@@ -1314,12 +1424,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    from paho.mqtt.matcher import MQTTMatcher  # noqa: PLC0415
-
-    matcher = MQTTMatcher()  # type: ignore[no-untyped-call]
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)  # type: ignore[no-untyped-call]
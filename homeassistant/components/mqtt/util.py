@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterator
 from functools import lru_cache
 import logging
+from operator import itemgetter
 import os
 from pathlib import Path
 import tempfile
@@ -145,6 +146,112 @@ class EnsureJobAfterCooldown:
             _LOGGER.exception("Error cleaning up task")
 
 
+class _TopicTrieNode[_T]:
+    """A node in a topic trie, representing one level of a topic filter."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        # Values are mapped to their insertion sequence number
+        self.values: dict[_T, int] = {}
+
+
+class TopicTrie[_T]:
+    """Match MQTT topics against topic filters with wildcards.
+
+    Topic filters are stored level by level, with `+` and `#` as regular
+    children of a level. Looking up a topic only follows the branches that
+    can match, so the cost depends on the depth of the topic and not on the
+    number of topic filters stored.
+
+    Matches are returned in the order the values were added.
+    """
+
+    __slots__ = ("_root", "_sequence", "_values")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._values: dict[_T, int] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the trie."""
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate over the values in insertion order."""
+        return iter(self._values)
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if there are values stored for the exact topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        self._sequence += 1
+        node.values[value] = self._sequence
+        self._values[value] = self._sequence
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not stored for the topic filter.
+        """
+        node = self._root
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.values[value]
+        del self._values[value]
+        # Prune the branch if it no longer leads to any values
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values with a topic filter matching the topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Topics starting with $ are not matched by a
+        # wildcard at the first level [MQTT-4.7.2-1]
+        normal = not topic.startswith("$")
+        matches: list[tuple[_T, int]] = []
+        stack: list[tuple[_TopicTrieNode[_T], int]] = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            wildcard_allowed = normal or index > 0
+            # `#` also matches the parent level, `a/#` matches `a`
+            if wildcard_allowed and (multi_level := children.get("#")) is not None:
+                matches.extend(multi_level.values.items())
+            if index == depth:
+                matches.extend(node.values.items())
+                continue
+            if (child := children.get(levels[index])) is not None:
+                stack.append((child, index + 1))
+            if wildcard_allowed and (single_level := children.get("+")) is not None:
+                stack.append((single_level, index + 1))
+        if len(matches) > 1:
+            matches.sort(key=itemgetter(1))
+        return [value for value, _ in matches]
+
+
 def platforms_from_config(config: list[ConfigType]) -> set[Platform | str]:
     """Return the platforms to be set up."""
     return {key for platform in config for key in platform}
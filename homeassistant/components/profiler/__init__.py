@@ -40,6 +40,7 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_LOG_EVENT_LISTENER_STATISTICS = "log_event_listener_statistics"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +64,7 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_LOG_EVENT_LISTENER_STATISTICS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -94,6 +96,10 @@ async def async_setup_entry(  # noqa: C901
         async with lock:
             await _async_generate_memory_profile(hass, call)
 
+    async def _async_run_event_listener_statistics(call: ServiceCall) -> None:
+        async with lock:
+            await _async_log_event_listener_statistics(hass, call)
+
     async def _async_start_log_objects(call: ServiceCall) -> None:
         if LOG_INTERVAL_SUB in domain_data:
             raise HomeAssistantError("Object logging already started")
@@ -293,6 +299,16 @@ async def async_setup_entry(  # noqa: C901
         ),
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_EVENT_LISTENER_STATISTICS,
+        _async_run_event_listener_statistics,
+        schema=vol.Schema(
+            {vol.Optional(CONF_SECONDS, default=60.0): vol.Coerce(float)}
+        ),
+    )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -432,6 +448,44 @@ async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     )
 
 
+async def _async_log_event_listener_statistics(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Collect the event listener statistics for a while and log them."""
+    start_time = int(time.time() * 1000000)
+    persistent_notification.async_create(
+        hass,
+        (
+            "Event listener statistics collection has started. This notification"
+            " will be updated when it is complete."
+        ),
+        title="Event listener statistics started",
+        notification_id=f"profiler_{start_time}",
+    )
+    hass.bus.async_enable_listener_statistics()
+    try:
+        await asyncio.sleep(float(call.data[CONF_SECONDS]))
+        statistics = hass.bus.async_listener_statistics()
+    finally:
+        hass.bus.async_disable_listener_statistics()
+
+    for event_type, event_statistics in sorted(
+        statistics.items(), key=lambda item: item[1]["dispatch_time"], reverse=True
+    ):
+        _LOGGER.critical(
+            "Event listener statistics for %s: %s", event_type, event_statistics
+        )
+    persistent_notification.async_create(
+        hass,
+        (
+            "Event listener statistics have been logged. See [the"
+            " logs](/config/logs) to review the statistics."
+        ),
+        title="Event listener statistics complete",
+        notification_id=f"profiler_{start_time}",
+    )
+
+
 async def _async_generate_memory_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -9,9 +9,10 @@ import logging
 import string
 from typing import Any, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
 from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.openmetrics import exposition as openmetrics
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -77,9 +78,12 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import ExpositionCache
+
 _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text"
 IGNORED_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN})
 
 
@@ -126,8 +130,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -148,6 +150,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         override_metric,
         default_metric,
     )
+    hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH], metrics))
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
@@ -214,11 +217,20 @@ class PrometheusMetrics:
         self._metrics_by_entity_id: dict[str, set[MetricNameWithLabelValues]] = (
             defaultdict(set)
         )
+        self._metric_children: dict[MetricNameWithLabelValues, MetricWrapperBase] = {}
         self._climate_units = climate_units
+        # Derived from the state and the entity registry entry, they are
+        # dropped when the entity is removed or its registry entry changes
+        self._labels_by_entity_id: dict[str, tuple[str | None, dict[str, Any]]] = {}
+        self._sensor_metrics_by_entity_id: dict[
+            str, tuple[str | None, str | None, str | None, str]
+        ] = {}
+        self._exposition = ExpositionCache()
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
         """Handle new messages from the bus."""
         if (state := event.data.get("new_state")) is None:
+            self._forget_entity(event.data["entity_id"])
             return
 
         if not self._filter(state.entity_id):
@@ -273,6 +285,15 @@ class PrometheusMetrics:
             if hasattr(self, handler) and state.state:
                 getattr(self, handler)(state)
 
+    def render(self, openmetrics_format: bool, compress: bool) -> bytes:
+        """Render the exposition of the default registry and the metrics."""
+        return self._exposition.render(
+            list(self._metrics.values()),
+            prometheus_client.REGISTRY,
+            openmetrics_format,
+            compress,
+        )
+
     def handle_entity_registry_updated(
         self, event: Event[EventEntityRegistryUpdatedData]
     ) -> None:
@@ -283,6 +304,8 @@ class PrometheusMetrics:
         entity_id = event.data.get("entity_id")
         _LOGGER.debug("Handling entity update for %s", entity_id)
 
+        self._forget_entity(entity_id)
+
         metrics_entity_id: str | None = None
 
         if event.data["action"] == "remove":
@@ -290,6 +313,8 @@ class PrometheusMetrics:
         elif event.data["action"] == "update":
             changes = event.data["changes"]
 
+            if "old_entity_id" in event.data:
+                self._forget_entity(event.data["old_entity_id"])
             if "entity_id" in changes:
                 metrics_entity_id = changes["entity_id"]
             elif "disabled_by" in changes:
@@ -298,6 +323,12 @@ class PrometheusMetrics:
         if metrics_entity_id:
             self._remove_labelsets(metrics_entity_id)
 
+    def _forget_entity(self, entity_id: str) -> None:
+        """Drop the labels and metric names derived for an entity."""
+        self._labels_by_entity_id.pop(entity_id, None)
+        self._sensor_metrics_by_entity_id.pop(entity_id, None)
+        self._exposition.forget_entities((entity_id,))
+
     def _remove_labelsets(
         self,
         entity_id: str,
@@ -321,9 +352,12 @@ class PrometheusMetrics:
             )
             removed_metrics.add(metric)
             self._metrics[metric_name].remove(*label_values)
+            self._metric_children.pop(metric, None)
         metric_set -= removed_metrics
         if not metric_set:
             del self._metrics_by_entity_id[entity_id]
+        # The label strings are rendered again with the new labels
+        self._exposition.forget_entities((entity_id,))
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
@@ -346,23 +380,30 @@ class PrometheusMetrics:
         documentation: str,
         labels: dict[str, str],
     ) -> _MetricBaseT:
+        name_with_label_values = MetricNameWithLabelValues(
+            metric_name, tuple(labels.values())
+        )
+        if (child := self._metric_children.get(name_with_label_values)) is not None:
+            return cast(_MetricBaseT, child)
         try:
             metric = cast(_MetricBaseT, self._metrics[metric_name])
         except KeyError:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric_name}"
             )
+            # The metrics are not registered, they are rendered
+            # by the exposition cache after the default registry
             self._metrics[metric_name] = factory(
                 full_metric_name,
                 documentation,
                 labels.keys(),
-                registry=prometheus_client.REGISTRY,
+                registry=None,
             )
             metric = cast(_MetricBaseT, self._metrics[metric_name])
-        self._metrics_by_entity_id[labels["entity"]].add(
-            MetricNameWithLabelValues(metric_name, tuple(labels.values()))
-        )
-        return metric.labels(**labels)
+        self._metrics_by_entity_id[labels["entity"]].add(name_with_label_values)
+        child = metric.labels(**labels)
+        self._metric_children[name_with_label_values] = child
+        return child
 
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
@@ -383,18 +424,24 @@ class PrometheusMetrics:
             value = None
         return value
 
-    @staticmethod
     def _labels(
+        self,
         state: State,
         extra_labels: dict[str, str] | None = None,
     ) -> dict[str, Any]:
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        cached = self._labels_by_entity_id.get(state.entity_id)
+        if cached is not None and cached[0] == friendly_name:
+            labels = cached[1]
+        else:
+            labels = {
+                "entity": state.entity_id,
+                "domain": state.domain,
+                "friendly_name": friendly_name,
+            }
+            self._labels_by_entity_id[state.entity_id] = (friendly_name, labels)
         if extra_labels is None:
-            extra_labels = {}
-        labels = {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
-        }
+            return labels
         if not labels.keys().isdisjoint(extra_labels.keys()):
             conflicting_keys = labels.keys() & extra_labels.keys()
             raise ValueError(
@@ -667,19 +714,36 @@ class PrometheusMetrics:
                     self._labels(state, {"mode": mode}),
                 ).set(float(mode == current_mode))
 
-    def _handle_sensor(self, state: State) -> None:
-        unit = self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+    def _sensor_metric(self, state: State) -> tuple[str | None, str]:
+        """Return the metric name and documentation of a sensor."""
+        unit_of_measurement = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        device_class = state.attributes.get(ATTR_DEVICE_CLASS)
+        if (
+            cached := self._sensor_metrics_by_entity_id.get(state.entity_id)
+        ) is not None and cached[:2] == (unit_of_measurement, device_class):
+            return cached[2], cached[3]
 
+        unit = self._unit_string(unit_of_measurement)
         for metric_handler in self._sensor_metric_handlers:
             metric = metric_handler(state, unit)
             if metric is not None:
                 break
 
-        if metric is not None and (value := self.state_as_number(state)) is not None:
-            documentation = "State of the sensor"
-            if unit:
-                documentation = f"Sensor data measured in {unit}"
+        documentation = "State of the sensor"
+        if unit:
+            documentation = f"Sensor data measured in {unit}"
+        self._sensor_metrics_by_entity_id[state.entity_id] = (
+            unit_of_measurement,
+            device_class,
+            metric,
+            documentation,
+        )
+        return metric, documentation
 
+    def _handle_sensor(self, state: State) -> None:
+        metric, documentation = self._sensor_metric(state)
+
+        if metric is not None and (value := self.state_as_number(state)) is not None:
             if (
                 state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
                 == UnitOfTemperature.FAHRENHEIT
@@ -860,19 +924,34 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, metrics: PrometheusMetrics) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._metrics = metrics
 
     async def get(self, request: web.Request) -> web.Response:
-        """Handle request for Prometheus metrics."""
+        """Handle request for Prometheus metrics.
+
+        The OpenMetrics format and gzip encoding are used when the
+        scraper accepts them.
+        """
         _LOGGER.debug("Received Prometheus metrics request")
 
         hass = request.app[KEY_HASS]
+        openmetrics_format = any(
+            accepted.split(";")[0].strip() == OPENMETRICS_CONTENT_TYPE
+            for accepted in request.headers.get(hdrs.ACCEPT, "").split(",")
+        )
+        compress = "gzip" in request.headers.get(hdrs.ACCEPT_ENCODING, "")
         body = await hass.async_add_executor_job(
-            prometheus_client.generate_latest, prometheus_client.REGISTRY
+            self._metrics.render, openmetrics_format, compress
         )
+        headers = {hdrs.CONTENT_ENCODING: "gzip"} if compress else {}
+        if openmetrics_format:
+            headers[hdrs.CONTENT_TYPE] = openmetrics.CONTENT_TYPE_LATEST
+            return web.Response(body=body, headers=headers)
         return web.Response(
             body=body,
             content_type=CONTENT_TYPE_TEXT_PLAIN,
+            headers=headers,
         )
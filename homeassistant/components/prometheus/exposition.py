@@ -0,0 +1,148 @@
+"""Exposition of the Home Assistant metrics for Prometheus."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import gzip
+import threading
+
+import prometheus_client
+from prometheus_client import CollectorRegistry
+from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.openmetrics import exposition as openmetrics
+from prometheus_client.samples import Sample
+from prometheus_client.utils import floatToGoString
+
+GZIP_COMPRESS_LEVEL = 6
+
+_OPENMETRICS_EOF = b"# EOF\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+class ExpositionCache:
+    """Render the metric families, reusing the label strings of their samples.
+
+    The sample values are read from the metrics on every render, only the
+    label strings are cached per entity until the entity is forgotten,
+    which happens when its labels change. Rendering is expected to run in
+    the executor, entities can be forgotten from any thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._forgotten: set[str] = set()
+        self._forgotten_lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._headers: dict[tuple[str, bool], str] = {}
+        self._label_strings: dict[str, dict[tuple[str, tuple[str, ...]], str]] = {}
+
+    def forget_entities(self, entity_ids: Iterable[str]) -> None:
+        """Drop the label strings of entities."""
+        with self._forgotten_lock:
+            self._forgotten.update(entity_ids)
+
+    def render(
+        self,
+        families: Iterable[MetricWrapperBase],
+        registry: CollectorRegistry,
+        openmetrics_format: bool,
+        compress: bool,
+    ) -> bytes:
+        """Render the collectors of the registry followed by the families."""
+        encoder: Callable[[CollectorRegistry], bytes] = (
+            openmetrics.generate_latest
+            if openmetrics_format
+            else prometheus_client.generate_latest
+        )
+        with self._render_lock:
+            with self._forgotten_lock:
+                forgotten, self._forgotten = self._forgotten, set()
+            for entity_id in forgotten:
+                self._label_strings.pop(entity_id, None)
+
+            output = [
+                "".join(self._render_family(family, openmetrics_format))
+                for family in families
+            ]
+        body = b"".join(
+            (
+                encoder(registry).removesuffix(_OPENMETRICS_EOF),
+                "".join(output).encode(),
+                _OPENMETRICS_EOF if openmetrics_format else b"",
+            )
+        )
+        if compress:
+            return gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL, mtime=0)
+        return body
+
+    def _render_family(
+        self, family: MetricWrapperBase, openmetrics_format: bool
+    ) -> list[str]:
+        """Render a metric family like the encoder of the format would."""
+        output: list[str] = []
+        for metric in family.collect():
+            output.append(
+                self._header(
+                    metric.name, metric.type, metric.documentation, openmetrics_format
+                )
+            )
+            created: list[str] = []
+            created_name = f"{metric.name}_created"
+            for sample in metric.samples:
+                line = f"{self._label_string(sample)} {floatToGoString(sample.value)}\n"
+                # The text format moves the created samples to a gauge at the end
+                if not openmetrics_format and sample.name == created_name:
+                    created.append(line)
+                else:
+                    output.append(line)
+            if created:
+                output.append(
+                    self._header(
+                        created_name, "gauge", metric.documentation, openmetrics_format
+                    )
+                )
+                output.extend(created)
+        return output
+
+    def _header(
+        self, name: str, metric_type: str, documentation: str, openmetrics_format: bool
+    ) -> str:
+        """Return the HELP and TYPE lines of a metric."""
+        key = (f"{name} {metric_type}", openmetrics_format)
+        if (header := self._headers.get(key)) is not None:
+            return header
+        documentation = documentation.replace("\\", r"\\").replace("\n", r"\n")
+        if openmetrics_format:
+            documentation = documentation.replace('"', r"\"")
+        elif metric_type == "counter":
+            name = f"{name}_total"
+        header = self._headers[key] = (
+            f"# HELP {name} {documentation}\n# TYPE {name} {metric_type}\n"
+        )
+        return header
+
+    def _label_string(self, sample: Sample) -> str:
+        """Return the name and labels of a sample."""
+        labels = sample.labels
+        entity_id = labels.get("entity", "")
+        if (entity_label_strings := self._label_strings.get(entity_id)) is None:
+            entity_label_strings = self._label_strings[entity_id] = {}
+        key = (sample.name, tuple(labels.values()))
+        if (label_string := entity_label_strings.get(key)) is not None:
+            return label_string
+        if labels:
+            label_string = "{}{{{}}}".format(
+                sample.name,
+                ",".join(
+                    f'{name}="{_escape(value)}"'
+                    for name, value in sorted(labels.items())
+                ),
+            )
+        else:
+            label_string = sample.name
+        entity_label_strings[key] = label_string
+        return label_string
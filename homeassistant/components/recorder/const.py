@@ -27,6 +27,10 @@ DOMAIN = "recorder"
 
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
+SIGNAL_PURGE_PROGRESS = "recorder_purge_progress"
+PURGE_STORAGE_KEY = "recorder.purge"
+PURGE_STORAGE_VERSION = 1
+
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
@@ -36,12 +40,24 @@ MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 # https://github.com/home-assistant/core/issues/132865#issuecomment-2543160459
 MAX_IDS_FOR_INDEXED_GROUP_BY = 999
 
+# The bucket lengths in seconds of the downsampled states tiers, each tier
+# is compiled from the one before it
+DOWNSAMPLE_RESOLUTIONS = (60, 900)
+# History requests spanning less than this many seconds always read raw states
+DOWNSAMPLE_MIN_SPAN = 6 * 3600
+
 # The maximum number of rows (events) we purge in one delete statement
 
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
 
+# Domains of entities which are always continuous, and of entities which are
+# continuous if they have a unit of measurement. The domains are hard coded
+# to avoid importing the integrations.
+ALWAYS_CONTINUOUS_DOMAINS = {"counter", "proximity"}
+CONDITIONALLY_CONTINUOUS_DOMAINS = {"sensor"}
+
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
 ATTR_KEEP_DAYS = "keep_days"
@@ -55,6 +71,7 @@ EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
 CIRCULAR_MEAN_SCHEMA_VERSION = 49
+STATES_META_CONTINUOUS_SCHEMA_VERSION = 51
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 LEGACY_STATES_EVENT_FOREIGN_KEYS_FIXED_SCHEMA_VERSION = 43
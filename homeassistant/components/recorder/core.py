@@ -16,7 +16,15 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache.api import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    Table,
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -38,6 +46,7 @@ from homeassistant.core import (
     HomeAssistant,
     callback,
 )
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import (
     async_track_time_change,
     async_track_time_interval,
@@ -45,6 +54,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.recorder import DATA_RECORDER
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
@@ -63,7 +73,11 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    PURGE_STORAGE_KEY,
+    PURGE_STORAGE_VERSION,
+    SIGNAL_PURGE_PROGRESS,
     SQLITE_URL_PREFIX,
+    STATES_META_CONTINUOUS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -87,12 +101,14 @@ from .models import (
     UnsupportedDialect,
 )
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress, ReferenceCounts
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
-from .table_managers.states_meta import StatesMetaManager
+from .table_managers.states_downsampled import StatesDownsampledManager
+from .table_managers.states_meta import StatesMetaManager, is_continuous_state
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
     AdjustLRUSizeTask,
@@ -102,6 +118,7 @@ from .tasks import (
     CommitTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
+    DownsampleStatesTask,
     ImportStatisticsTask,
     KeepAliveTask,
     PerodicCleanupTask,
@@ -151,6 +168,17 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 # Pool size must accommodate Recorder thread + All db executors
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
+# States and events are written with multi-row INSERTs when bulk writes
+# are active, the primary keys are assigned by the database
+_STATES_TABLE = cast(Table, States.__table__)
+_EVENTS_TABLE = cast(Table, Events.__table__)
+_STATES_COLUMNS = tuple(
+    column.key for column in _STATES_TABLE.columns if not column.primary_key
+)
+_EVENTS_COLUMNS = tuple(
+    column.key for column in _EVENTS_TABLE.columns if not column.primary_key
+)
+
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
@@ -162,6 +190,7 @@ class Recorder(threading.Thread):
         hass: HomeAssistant,
         auto_purge: bool,
         auto_repack: bool,
+        bulk_writes: bool,
         keep_days: int,
         commit_interval: int,
         uri: str,
@@ -209,6 +238,16 @@ class Recorder(threading.Thread):
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
 
+        # When bulk writes are active, states and events bypass the
+        # session and are written with multi-row INSERTs at commit time.
+        # They are opt-in, and only used when the database can return the
+        # ids of the inserted rows in order and the schema is up to date.
+        self.bulk_writes = bulk_writes
+        self._bulk_writes_supported = False
+        self._bulk_writes_active = False
+        self._bulk_pending_states: list[States] = []
+        self._bulk_pending_events: list[Events] = []
+
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
         self.event_data_manager = EventDataManager(self)
@@ -216,6 +255,19 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.states_downsampled_manager = StatesDownsampledManager()
+        # Set while a DownsampleStatesTask is queued or running
+        self.downsample_task_queued = False
+
+        # The purge progress is persisted so an unfinished purge is
+        # resumed after a restart
+        self.purge_progress = PurgeProgress()
+        self.async_purge_progress_data = self.purge_progress.as_dict()
+        self.attributes_reference_counts = ReferenceCounts()
+        self.data_reference_counts = ReferenceCounts()
+        self._purge_store: Store[dict[str, Any]] = Store(
+            hass, PURGE_STORAGE_VERSION, PURGE_STORAGE_KEY
+        )
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -507,6 +559,34 @@ class Recorder(threading.Thread):
         """
         self._async_setup_periodic_tasks()
         self.async_recorder_ready.set()
+        self.hass.async_create_task(
+            self._async_resume_purge(), "recorder resume purge", eager_start=True
+        )
+
+    async def _async_resume_purge(self) -> None:
+        """Queue a purge that did not finish before the last shutdown."""
+        if not (data := await self._purge_store.async_load()):
+            return
+        progress = PurgeProgress.from_dict(data)
+        if not progress.in_progress or progress.purge_before is None:
+            return
+        _LOGGER.debug(
+            "Resuming purge before %s started at %s",
+            progress.purge_before,
+            progress.started,
+        )
+        self.async_purge_progress_data = data
+        self.purge_progress = progress
+        self.queue_task(
+            PurgeTask(progress.purge_before, progress.repack, progress.apply_filter)
+        )
+
+    @callback
+    def async_purge_progress_updated(self, data: dict[str, Any]) -> None:
+        """Persist and publish the progress of a purge run."""
+        self.async_purge_progress_data = data
+        self._purge_store.async_delay_save(lambda: data, 1)
+        async_dispatcher_send(self.hass, SIGNAL_PURGE_PROGRESS, data)
 
     @callback
     def async_nightly_tasks(self, now: datetime) -> None:
@@ -526,6 +606,9 @@ class Recorder(threading.Thread):
         """Run tasks every five minutes."""
         self.queue_task(ADJUST_LRU_SIZE_TASK)
         self.async_periodic_statistics()
+        if not self.downsample_task_queued:
+            self.downsample_task_queued = True
+            self.queue_task(DownsampleStatesTask(now))
 
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
@@ -703,6 +786,30 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_state_to_session(self, session: Session, dbstate: States) -> None:
+        """Add a state to the session or the pending bulk writes."""
+        if self._bulk_writes_active:
+            self._event_session_has_pending_writes = True
+            self._bulk_pending_states.append(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
+
+    def _add_event_to_session(self, session: Session, dbevent: Events) -> None:
+        """Add an event to the session or the pending bulk writes."""
+        if self._bulk_writes_active:
+            self._event_session_has_pending_writes = True
+            self._bulk_pending_events.append(dbevent)
+        else:
+            self._add_to_session(session, dbevent)
+
+    def _update_bulk_writes_active(self) -> None:
+        """Decide if the next commit interval uses bulk writes."""
+        self._bulk_writes_active = (
+            self.bulk_writes
+            and self._bulk_writes_supported
+            and self.schema_version == SCHEMA_VERSION
+        )
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -1069,7 +1176,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_session(session, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1087,6 +1194,7 @@ class Recorder(threading.Thread):
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
             dbevent.data_id = data_id
+            self.data_reference_counts.add_reference(data_id)
         else:
             # No matching attributes found, save them in the DB
             dbevent_data = EventData(shared_data=shared_data, hash=hash_)
@@ -1094,7 +1202,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1135,11 +1243,23 @@ class Recorder(threading.Thread):
         ):
             return
 
+        # Keep track of the entities the logbook does not show
+        continuous: bool | None = None
+        if (
+            new_state := event.data["new_state"]
+        ) is not None and self.schema_version >= STATES_META_CONTINUOUS_SCHEMA_VERSION:
+            continuous = is_continuous_state(new_state)
+
         # Map the entity_id to the StatesMeta table
         if pending_states_meta := states_meta_manager.get_pending(entity_id):
             dbstate.states_meta_rel = pending_states_meta
+            if continuous is not None:
+                pending_states_meta.continuous = int(continuous)
+                states_meta_manager.set_continuous(entity_id, None, continuous)
         elif metadata_id := states_meta_manager.get(entity_id, session, True):
             dbstate.metadata_id = metadata_id
+            if continuous is not None:
+                states_meta_manager.set_continuous(entity_id, metadata_id, continuous)
         elif states_meta_manager.active and entity_removed:
             # If the entity was removed, we don't need to add it to the
             # StatesMeta table or record it in the pending commit
@@ -1148,6 +1268,9 @@ class Recorder(threading.Thread):
             return
         else:
             states_meta = StatesMeta(entity_id=entity_id)
+            if continuous is not None:
+                states_meta.continuous = int(continuous)
+                states_meta_manager.set_continuous(entity_id, None, continuous)
             states_meta_manager.add_pending(states_meta)
             self._add_to_session(session, states_meta)
             dbstate.states_meta_rel = states_meta
@@ -1169,6 +1292,7 @@ class Recorder(threading.Thread):
             )
         ):
             dbstate.attributes_id = attributes_id
+            self.attributes_reference_counts.add_reference(attributes_id)
         else:
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
@@ -1176,7 +1300,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_state_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1224,6 +1348,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._bulk_pending_states or self._bulk_pending_events:
+            self._bulk_insert_pending(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1239,6 +1366,17 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if (
+            pending_continuous := self.states_meta_manager.get_pending_continuous()
+        ) and self.schema_version >= STATES_META_CONTINUOUS_SCHEMA_VERSION:
+            with session.no_autoflush:
+                session.execute(
+                    update(StatesMeta),
+                    [
+                        {"metadata_id": metadata_id, "continuous": int(continuous)}
+                        for metadata_id, continuous in pending_continuous.items()
+                    ],
+                )
         session.commit()
 
         self._event_session_has_pending_writes = False
@@ -1251,6 +1389,7 @@ class Recorder(threading.Thread):
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        self._update_bulk_writes_active()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1259,6 +1398,66 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _bulk_insert_pending(self, session: Session) -> None:
+        """Write the pending states and events with multi-row INSERTs.
+
+        The event types, event data, states meta and state attributes
+        they reference are still added to the session, so the session is
+        flushed first to assign their ids.
+        """
+        session.flush()
+
+        if events := self._bulk_pending_events:
+            event_rows: list[dict[str, Any]] = []
+            for dbevent in events:
+                data = dbevent.__dict__
+                row = {key: data.get(key) for key in _EVENTS_COLUMNS}
+                if (event_types := data.get("event_type_rel")) is not None:
+                    row["event_type_id"] = event_types.event_type_id
+                if (event_data := data.get("event_data_rel")) is not None:
+                    row["data_id"] = event_data.data_id
+                event_rows.append(row)
+            session.execute(insert(_EVENTS_TABLE), event_rows)
+            events.clear()
+
+        if not (states := self._bulk_pending_states):
+            return
+
+        state_rows: list[dict[str, Any]] = []
+        # States linked to an older state of the same entity that
+        # is written by the same INSERT
+        chained_states: list[tuple[States, States]] = []
+        for dbstate in states:
+            data = dbstate.__dict__
+            row = {key: data.get(key) for key in _STATES_COLUMNS}
+            if (states_meta := data.get("states_meta_rel")) is not None:
+                row["metadata_id"] = states_meta.metadata_id
+            if (state_attributes := data.get("state_attributes")) is not None:
+                row["attributes_id"] = state_attributes.attributes_id
+            if (old_state := data.get("old_state")) is not None:
+                chained_states.append((dbstate, old_state))
+            state_rows.append(row)
+
+        result = session.execute(
+            insert(_STATES_TABLE).returning(
+                _STATES_TABLE.c.state_id, sort_by_parameter_order=True
+            ),
+            state_rows,
+        )
+        for dbstate, state_id in zip(states, result.scalars(), strict=True):
+            dbstate.state_id = state_id
+        states.clear()
+
+        # An old state that was never written, because its attributes
+        # could not be serialized, has no state_id and is not linked
+        if old_state_ids := [
+            {"state_id": dbstate.state_id, "old_state_id": old_state.state_id}
+            for dbstate, old_state in chained_states
+            if old_state.state_id is not None
+        ]:
+            with session.no_autoflush:
+                session.execute(update(States), old_state_ids)
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1267,12 +1466,17 @@ class Recorder(threading.Thread):
             self._close_connection()
         move_away_broken_database(dburl_to_path(self.db_url))
         self.recorder_runs_manager.reset()
+        self.states_downsampled_manager.reset()
         self._setup_recorder()
         if setup_run:
             self._setup_run()
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._bulk_pending_states.clear()
+        self._bulk_pending_events.clear()
+        self.attributes_reference_counts.clear()
+        self.data_reference_counts.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1298,6 +1502,7 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        self._update_bulk_writes_active()
 
     def _send_keep_alive(self) -> None:
         """Send a keep alive to keep the db connection open."""
@@ -1447,6 +1652,10 @@ class Recorder(threading.Thread):
 
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
+        # The dialect knows what the server supports after the first connect
+        self._bulk_writes_supported = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
@@ -1463,6 +1672,7 @@ class Recorder(threading.Thread):
             end_incomplete_runs(session, self.recorder_runs_manager.recording_start)
             self.recorder_runs_manager.start(session)
             self.states_manager.load_from_db(session)
+            self.states_downsampled_manager.load_from_db(session)
 
         self._open_event_session()
 
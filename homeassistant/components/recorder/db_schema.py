@@ -78,7 +78,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 50
+SCHEMA_VERSION = 51
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -88,6 +88,7 @@ TABLE_EVENT_TYPES = "event_types"
 TABLE_STATES = "states"
 TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_STATES_META = "states_meta"
+TABLE_STATES_DOWNSAMPLED = "states_downsampled"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
@@ -113,6 +114,7 @@ ALL_TABLES = [
     TABLE_SCHEMA_CHANGES,
     TABLE_MIGRATION_CHANGES,
     TABLE_STATES_META,
+    TABLE_STATES_DOWNSAMPLED,
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
@@ -697,12 +699,57 @@ class StatesMeta(Base):
     entity_id: Mapped[str | None] = mapped_column(
         String(MAX_LENGTH_STATE_ENTITY_ID), index=True, unique=True
     )
+    # 1 if the entity is continuous, 0 if not and NULL if it is not known
+    continuous: Mapped[int | None] = mapped_column(SmallInteger, index=True)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
         return (
             "<recorder.StatesMeta("
-            f"id={self.metadata_id}, entity_id='{self.entity_id}'"
+            f"id={self.metadata_id}, entity_id='{self.entity_id}', "
+            f"continuous={self.continuous}"
+            ")>"
+        )
+
+
+class StatesDownsampled(Base):
+    """Pre-aggregated buckets of states used for long history ranges.
+
+    A bucket keeps the last state and the min and max of the numeric states
+    of its time range, the attributes of the states are not kept.
+    """
+
+    __table_args__ = (
+        # Used for fetching the buckets of an entity in a time range
+        Index(
+            "ix_states_downsampled_resolution_metadata_id_start_ts",
+            "resolution",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATES_DOWNSAMPLED
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    metadata_id: Mapped[int | None] = mapped_column(
+        ID_TYPE,
+        ForeignKey(f"{TABLE_STATES_META}.metadata_id", ondelete="CASCADE"),
+    )
+    resolution: Mapped[int | None] = mapped_column(Integer)
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
+    state: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_STATE))
+    last_updated_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.StatesDownsampled("
+            f"id={self.id}, metadata_id={self.metadata_id}, "
+            f"resolution={self.resolution}, start_ts={self.start_ts}, "
+            f"state='{self.state}', min={self.min}, max={self.max}"
             ")>"
         )
 
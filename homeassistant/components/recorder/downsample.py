@@ -0,0 +1,267 @@
+"""Compile downsampled tiers of the states table for long history ranges."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from itertools import groupby
+import logging
+import math
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import and_, func, insert, lambda_stmt, select
+from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.sql.selectable import Select
+
+from .const import DOWNSAMPLE_RESOLUTIONS
+from .db_schema import States, StatesDownsampled
+from .queries import find_oldest_state
+from .util import execute_stmt_lambda_element, retryable_database_job, session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds of source rows compiled into each tier per run, this
+# must be a multiple of all the resolutions
+COMPILE_SPAN = DOWNSAMPLE_RESOLUTIONS[-1]
+
+
+def _states_in_range_stmt(start_ts: float, end_ts: float) -> StatementLambdaElement:
+    """Return a statement that returns the states in a time range."""
+    return lambda_stmt(
+        lambda: select(
+            States.metadata_id,
+            States.last_updated_ts,
+            States.state,
+            States.last_updated_ts,
+        )
+        .filter(States.last_updated_ts >= start_ts)
+        .filter(States.last_updated_ts < end_ts)
+        .filter(States.metadata_id.is_not(None))
+        .order_by(States.metadata_id, States.last_updated_ts)
+    )
+
+
+def _buckets_in_range_stmt(
+    resolution: int, start_ts: float, end_ts: float
+) -> StatementLambdaElement:
+    """Return a statement that returns the buckets of a tier in a time range."""
+    return lambda_stmt(
+        lambda: select(
+            StatesDownsampled.metadata_id,
+            StatesDownsampled.start_ts,
+            StatesDownsampled.state,
+            StatesDownsampled.last_updated_ts,
+            StatesDownsampled.min,
+            StatesDownsampled.max,
+        )
+        .filter(StatesDownsampled.resolution == resolution)
+        .filter(StatesDownsampled.start_ts >= start_ts)
+        .filter(StatesDownsampled.start_ts < end_ts)
+        .order_by(StatesDownsampled.metadata_id, StatesDownsampled.start_ts)
+    )
+
+
+def _last_buckets_before_stmt(
+    resolution: int, metadata_ids: list[int], before_ts: float
+) -> Select:
+    """Return a statement that returns the state of the last bucket of entities.
+
+    Only buckets of the tier starting before before_ts are considered.
+    """
+    last_buckets = (
+        select(
+            StatesDownsampled.metadata_id,
+            func.max(StatesDownsampled.start_ts).label("max_start_ts"),
+        )
+        .filter(StatesDownsampled.resolution == resolution)
+        .filter(StatesDownsampled.metadata_id.in_(metadata_ids))
+        .filter(StatesDownsampled.start_ts < before_ts)
+        .group_by(StatesDownsampled.metadata_id)
+        .subquery()
+    )
+    return select(StatesDownsampled.metadata_id, StatesDownsampled.state).join(
+        last_buckets,
+        and_(
+            StatesDownsampled.resolution == resolution,
+            StatesDownsampled.metadata_id == last_buckets.c.metadata_id,
+            StatesDownsampled.start_ts == last_buckets.c.max_start_ts,
+        ),
+    )
+
+
+def _oldest_bucket_stmt(resolution: int) -> StatementLambdaElement:
+    """Return a statement that returns the start of the oldest bucket of a tier."""
+    return lambda_stmt(
+        lambda: select(func.min(StatesDownsampled.start_ts)).filter(
+            StatesDownsampled.resolution == resolution
+        )
+    )
+
+
+def _float_or_none(state: str | None) -> float | None:
+    """Return the state as a finite float or None."""
+    if state is None:
+        return None
+    try:
+        value = float(state)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _aggregate_buckets(
+    rows: Iterable[Row],
+    resolution: int,
+    from_states: bool,
+    carried_in: dict[int, str | None],
+) -> list[dict[str, Any]]:
+    """Aggregate rows sorted by metadata_id and time into buckets.
+
+    Each row is (metadata_id, time, state, last_updated_ts, min, max) where
+    min and max are only present when aggregating the buckets of a tier.
+
+    The state carried in from before a bucket is held until the first row
+    of the bucket, so it seeds min and max unless that row starts the
+    bucket. carried_in has the states carried in to the first bucket of
+    the entities.
+    """
+    buckets: list[dict[str, Any]] = []
+    for metadata_id, group in groupby(rows, itemgetter(0)):
+        bucket: dict[str, Any] | None = None
+        previous_state = carried_in.get(metadata_id)
+        for row in group:
+            start_ts = row[1] // resolution * resolution
+            if bucket is None or bucket["start_ts"] != start_ts:
+                if bucket is not None:
+                    previous_state = bucket["state"]
+                bucket = {
+                    "metadata_id": metadata_id,
+                    "resolution": resolution,
+                    "start_ts": start_ts,
+                    "min": None,
+                    "max": None,
+                }
+                if (
+                    row[1] > start_ts
+                    and (previous_value := _float_or_none(previous_state)) is not None
+                ):
+                    bucket["min"] = bucket["max"] = previous_value
+                buckets.append(bucket)
+            bucket["state"] = row[2]
+            bucket["last_updated_ts"] = row[3]
+            if from_states:
+                row_min = row_max = _float_or_none(row[2])
+            else:
+                row_min, row_max = row[4], row[5]
+            if row_min is None:
+                continue
+            if bucket["min"] is None:
+                bucket["min"] = row_min
+                bucket["max"] = row_max
+                continue
+            bucket["min"] = min(bucket["min"], row_min)
+            bucket["max"] = max(bucket["max"], row_max)
+    return buckets
+
+
+def _compile_tier(
+    session: Session,
+    resolution: int,
+    source_resolution: int | None,
+    start_ts: float | None,
+    until_ts: float,
+) -> float | None:
+    """Compile the closed buckets of a tier from the states or the previous tier.
+
+    Returns the timestamp the tier has been compiled up to.
+    """
+    limit_ts = until_ts // resolution * resolution
+    if start_ts is None:
+        # The tier is empty, start with the oldest source row
+        if source_resolution is None:
+            result = execute_stmt_lambda_element(session, find_oldest_state())
+            oldest_ts = result[0].last_updated_ts if result else None
+        else:
+            oldest_ts = session.execute(_oldest_bucket_stmt(source_resolution)).scalar()
+        if oldest_ts is None:
+            return None
+        start_ts = oldest_ts // resolution * resolution
+    end_ts = min(start_ts + COMPILE_SPAN, limit_ts)
+    if end_ts <= start_ts:
+        return start_ts
+    if source_resolution is None:
+        rows = execute_stmt_lambda_element(
+            session, _states_in_range_stmt(start_ts, end_ts), orm_rows=False
+        )
+    else:
+        rows = execute_stmt_lambda_element(
+            session,
+            _buckets_in_range_stmt(source_resolution, start_ts, end_ts),
+            orm_rows=False,
+        )
+    rows = list(rows)
+    # The last bucket of the tier before the range has the carried in states
+    carried_in: dict[int, str | None] = {}
+    if rows:
+        metadata_ids = list({row[0] for row in rows})
+        carried_in = dict(
+            session.execute(
+                _last_buckets_before_stmt(resolution, metadata_ids, start_ts)
+            )
+            .tuples()
+            .all()
+        )
+    if buckets := _aggregate_buckets(
+        rows, resolution, source_resolution is None, carried_in
+    ):
+        session.execute(insert(StatesDownsampled), buckets)
+    _LOGGER.debug(
+        "Compiled %s buckets of %ss for %s-%s",
+        len(buckets),
+        resolution,
+        start_ts,
+        end_ts,
+    )
+    return end_ts
+
+
+@retryable_database_job("compile downsampled states")
+def compile_downsampled_states(instance: Recorder, end: datetime) -> bool:
+    """Compile the buckets of the downsampled states tiers that closed before end.
+
+    Each call compiles at most COMPILE_SPAN seconds per tier, returns
+    True when all tiers have caught up with end.
+    """
+    manager = instance.states_downsampled_manager
+    compiled_until: dict[int, float] = {}
+    caught_up = True
+    with session_scope(session=instance.get_session()) as session:
+        if any(
+            manager.compiled_until(resolution) is None
+            for resolution in DOWNSAMPLE_RESOLUTIONS
+        ):
+            manager.load_from_db(session)
+        until_ts = end.timestamp()
+        source_resolution: int | None = None
+        for resolution in DOWNSAMPLE_RESOLUTIONS:
+            tier_until_ts = _compile_tier(
+                session,
+                resolution,
+                source_resolution,
+                manager.compiled_until(resolution),
+                until_ts,
+            )
+            if tier_until_ts is None:
+                break
+            compiled_until[resolution] = tier_until_ts
+            caught_up &= tier_until_ts >= until_ts // resolution * resolution
+            source_resolution = resolution
+            until_ts = tier_until_ts
+    manager.update(compiled_until)
+    return caught_up
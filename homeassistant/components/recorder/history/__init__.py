@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
 from sqlalchemy.orm.session import Session
 
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.helpers.recorder import get_instance
 
 from ..filters import Filters
@@ -15,23 +16,44 @@ from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
+    get_last_state_changes_for_entities as _modern_get_last_state_changes_for_entities,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
+    iter_significant_states as _modern_iter_significant_states,
     state_changes_during_period as _modern_state_changes_during_period,
+    state_changes_during_period_for_entities as _modern_state_changes_during_period_for_entities,
 )
+from .preload import async_get_preloader
 
 # These are the APIs of this package
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "async_get_last_state_changes",
+    "async_state_changes_during_period",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_last_state_changes_for_entities",
     "get_significant_states",
     "get_significant_states_with_session",
+    "iter_significant_states",
     "state_changes_during_period",
+    "state_changes_during_period_for_entities",
 ]
 
 
+def _preload_history(hass: HomeAssistant) -> bool:
+    """Return if history requests should be batched by the preloader.
+
+    Only the requests of helpers loading their state while Home Assistant
+    starts are batched, the legacy schema is always read entity by entity.
+    """
+    return (
+        hass.state in (CoreState.not_running, CoreState.starting)
+        and get_instance(hass).states_meta_manager.active
+    )
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -80,6 +102,45 @@ def get_last_state_changes(
     return _target(hass, number_of_states, entity_id)
 
 
+def get_last_state_changes_for_entities(
+    hass: HomeAssistant, number_of_states: int, entity_ids: list[str]
+) -> dict[str, list[State]]:
+    """Return the last number_of_states of each entity."""
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # noqa: PLC0415
+            get_last_state_changes as _legacy_get_last_state_changes,
+        )
+
+        states: dict[str, list[State]] = {}
+        for entity_id in entity_ids:
+            states.update(
+                _legacy_get_last_state_changes(hass, number_of_states, entity_id)
+            )
+        return states
+    return _modern_get_last_state_changes_for_entities(
+        hass, number_of_states, entity_ids
+    )
+
+
+async def async_get_last_state_changes(
+    hass: HomeAssistant, number_of_states: int, entity_id: str
+) -> list[State]:
+    """Return the last number_of_states of an entity.
+
+    While Home Assistant starts the requests of all entities
+    are collected and read with one query.
+    """
+    if _preload_history(hass):
+        return await async_get_preloader(hass).async_get_last_state_changes(
+            number_of_states, entity_id
+        )
+    return (
+        await get_instance(hass).async_add_executor_job(
+            get_last_state_changes, hass, number_of_states, entity_id
+        )
+    ).get(entity_id.lower(), [])
+
+
 def get_significant_states(
     hass: HomeAssistant,
     start_time: datetime,
@@ -91,17 +152,31 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    resolution: float | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    resolution is only used with the modern schema, the legacy
+    schema has no downsampled tiers.
+    """
     if not get_instance(hass).states_meta_manager.active:
         from .legacy import (  # noqa: PLC0415
             get_significant_states as _legacy_get_significant_states,
         )
 
-        _target = _legacy_get_significant_states
-    else:
-        _target = _modern_get_significant_states
-    return _target(
+        return _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    return _modern_get_significant_states(
         hass,
         start_time,
         end_time,
@@ -112,6 +187,7 @@ def get_significant_states(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        resolution,
     )
 
 
@@ -127,17 +203,32 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    resolution: float | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    resolution is only used with the modern schema, the legacy
+    schema has no downsampled tiers.
+    """
     if not get_instance(hass).states_meta_manager.active:
         from .legacy import (  # noqa: PLC0415
             get_significant_states_with_session as _legacy_get_significant_states_with_session,
         )
 
-        _target = _legacy_get_significant_states_with_session
-    else:
-        _target = _modern_get_significant_states_with_session
-    return _target(
+        return _legacy_get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    return _modern_get_significant_states_with_session(
         hass,
         session,
         start_time,
@@ -149,6 +240,57 @@ def get_significant_states_with_session(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        resolution,
+    )
+
+
+def iter_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    resolution: float | None = None,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states of each entity during a time period.
+
+    The legacy schema is not streamed, its states are read at once
+    and yielded per entity.
+    """
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # noqa: PLC0415
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        return iter(
+            _legacy_get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                compressed_state_format,
+            ).items()
+        )
+    return _modern_iter_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+        resolution,
     )
 
 
@@ -181,3 +323,84 @@ def state_changes_during_period(
         limit,
         include_start_time_state,
     )
+
+
+def state_changes_during_period_for_entities(
+    hass: HomeAssistant,
+    start_times: dict[str, datetime],
+    end_time: datetime | None = None,
+    no_attributes: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, list[State]]:
+    """Return the states that changed after the start time of each entity."""
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # noqa: PLC0415
+            state_changes_during_period as _legacy_state_changes_during_period,
+        )
+
+        states: dict[str, list[State]] = {}
+        for entity_id, start_time in start_times.items():
+            states.update(
+                _legacy_state_changes_during_period(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_id,
+                    no_attributes,
+                    False,
+                    limit,
+                    include_start_time_state,
+                )
+            )
+        return states
+    return _modern_state_changes_during_period_for_entities(
+        hass,
+        start_times,
+        end_time,
+        no_attributes,
+        limit,
+        include_start_time_state,
+    )
+
+
+async def async_state_changes_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_id: str | None = None,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> list[State]:
+    """Return the states of an entity that changed during a time period.
+
+    While Home Assistant starts the requests of all entities are
+    collected and read with one query per time period.
+    """
+    if not entity_id:
+        raise ValueError("entity_id must be provided")
+    if _preload_history(hass):
+        return await async_get_preloader(hass).async_state_changes_during_period(
+            start_time,
+            end_time,
+            entity_id,
+            no_attributes,
+            descending,
+            limit,
+            include_start_time_state,
+        )
+    return (
+        await get_instance(hass).async_add_executor_job(
+            state_changes_during_period,
+            hass,
+            start_time,
+            end_time,
+            entity_id,
+            no_attributes,
+            descending,
+            limit,
+            include_start_time_state,
+        )
+    ).get(entity_id.lower(), [])
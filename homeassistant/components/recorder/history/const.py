@@ -2,6 +2,8 @@
 
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
+MIN_KEY = "min"
+MAX_KEY = "max"
 
 SIGNIFICANT_DOMAINS = {
     "climate",
@@ -19,3 +21,6 @@ NEED_ATTRIBUTE_DOMAINS = {
     "thermostat",
     "water_heater",
 }
+
+# Seconds to collect startup history requests before running them as one query
+PRELOAD_DELAY = 0.1
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
-from datetime import datetime
+from datetime import datetime, timedelta
 from itertools import groupby
+import math
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any, cast
 
@@ -17,6 +18,7 @@ from sqlalchemy import (
     func,
     lambda_stmt,
     literal,
+    or_,
     select,
     union_all,
 )
@@ -29,11 +31,17 @@ from homeassistant.helpers.recorder import get_instance
 from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
-from ..const import LAST_REPORTED_SCHEMA_VERSION, MAX_IDS_FOR_INDEXED_GROUP_BY
+from ..const import (
+    DOWNSAMPLE_MIN_SPAN,
+    DOWNSAMPLE_RESOLUTIONS,
+    LAST_REPORTED_SCHEMA_VERSION,
+    MAX_IDS_FOR_INDEXED_GROUP_BY,
+)
 from ..db_schema import (
     SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
     StateAttributes,
     States,
+    StatesDownsampled,
     StatesMeta,
 )
 from ..filters import Filters
@@ -46,6 +54,8 @@ from ..models import (
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
+    MAX_KEY,
+    MIN_KEY,
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
     STATE_KEY,
@@ -123,6 +133,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    resolution: float | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -138,6 +149,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            resolution,
         )
 
 
@@ -191,6 +203,7 @@ def _significant_states_stmt(
                 no_attributes,
                 include_last_changed,
                 slow_dependent_subquery,
+                False,
             ).subquery(),
             no_attributes,
             include_last_changed,
@@ -220,6 +233,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    resolution: float | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -231,11 +245,92 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    resolution is an optional number of seconds per data point the caller
+    can display. Long ranges of numeric entities are then read from the
+    coarsest downsampled tier that still satisfies it.
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    return _entity_states_to_dict(
+        entity_ids,
+        _iter_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            resolution,
+            False,
+        ),
+    )
+
+
+def iter_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    resolution: float | None = None,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states of each entity during UTC period start_time - end_time.
+
+    Unlike get_significant_states the rows are read with a server side
+    cursor and the states of an entity are yielded as soon as all of its
+    rows have arrived, so the caller can serialize and drop them before
+    the states of the next entity are built. Entities without states
+    are not yielded.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        yield from _iter_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            resolution,
+            True,
+        )
+
+
+def _iter_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+    resolution: float | None,
+    yield_rows: bool,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states of each entity in metadata_id order.
+
+    If yield_rows is set, long time windows are read with yield_per
+    instead of fetching all rows at once.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -244,7 +339,29 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return
+    if (
+        resolution
+        and (
+            downsampled := _get_downsampled_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                entity_id_to_metadata_id,
+                resolution,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                compressed_state_format,
+            )
+        )
+        is not None
+    ):
+        yield from downsampled.items()
+        return
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -261,7 +378,6 @@ def get_significant_states_with_session(
     start_time_ts = start_time.timestamp()
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
-    rows: list[Row] = []
     if TYPE_CHECKING:
         assert instance.database_engine is not None
     slow_dependent_subquery = instance.database_engine.optimizer.slow_dependent_subquery
@@ -288,26 +404,194 @@ def get_significant_states_with_session(
             oldest_ts,
             slow_dependent_subquery,
         )
-        row_chunk = cast(
-            list[Row],
-            execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        # The chunks do not share metadata_ids so the states of
+        # an entity are always complete at the end of a group
+        yield from _iter_sorted_states(
+            execute_stmt_lambda_element(
+                session,
+                stmt,
+                start_time if yield_rows else None,
+                end_time,
+                orm_rows=False,
+            ),
+            start_time_ts if include_start_time_state else None,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes,
         )
-        if rows:
-            rows += row_chunk
-        else:
-            # If we have no rows yet, we can just assign the chunk
-            # as this is the common case since its rare that
-            # we exceed the MAX_IDS_FOR_INDEXED_GROUP_BY limit
-            rows = row_chunk
-    return _sorted_states_to_dict(
-        rows,
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
-        entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+
+
+def _downsampled_states_stmt(
+    resolution: int, metadata_ids: list[int], start_ts: float, end_ts: float
+) -> StatementLambdaElement:
+    """Return the buckets of a downsampled tier in a time range."""
+    return lambda_stmt(
+        lambda: select(
+            StatesDownsampled.metadata_id,
+            StatesDownsampled.state,
+            StatesDownsampled.last_updated_ts,
+            StatesDownsampled.min,
+            StatesDownsampled.max,
+        )
+        .filter(StatesDownsampled.resolution == resolution)
+        .filter(StatesDownsampled.metadata_id.in_(metadata_ids))
+        .filter(StatesDownsampled.start_ts >= start_ts)
+        .filter(StatesDownsampled.start_ts < end_ts)
+        .order_by(StatesDownsampled.metadata_id, StatesDownsampled.start_ts)
+    )
+
+
+def _downsampled_row_to_state(
+    row: Row, compressed_state_format: bool
+) -> dict[str, Any]:
+    """Convert a downsampled bucket to a minimal state."""
+    if compressed_state_format:
+        state: dict[str, Any] = {
+            COMPRESSED_STATE_STATE: row[1],
+            COMPRESSED_STATE_LAST_UPDATED: row[2],
+        }
+    else:
+        state = {
+            STATE_KEY: row[1],
+            LAST_CHANGED_KEY: dt_util.utc_from_timestamp(row[2]).isoformat(),
+        }
+    if row[3] is not None:
+        state[MIN_KEY] = row[3]
+        state[MAX_KEY] = row[4]
+    return state
+
+
+def _get_downsampled_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    resolution: float,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+) -> dict[str, list[State | dict[str, Any]]] | None:
+    """Return significant states reading the bulk of the range from a tier.
+
+    Numeric entities get the raw states before the first and after the last
+    compiled bucket and one minimal state with min and max per bucket in
+    between. The states of the buckets have no attributes, even when
+    attributes were requested. All other entities are read from the
+    states table.
+
+    Returns None if no downsampled tier can serve the request.
+    """
+    start_ts = start_time.timestamp()
+    end_ts = (end_time or dt_util.utcnow()).timestamp()
+    if end_ts - start_ts < DOWNSAMPLE_MIN_SPAN or not (
+        tiers := [tier for tier in DOWNSAMPLE_RESOLUTIONS if tier <= resolution]
+    ):
+        return None
+    tier = tiers[-1]
+    if (
+        compiled_until := get_instance(hass).states_downsampled_manager.compiled_until(
+            tier
+        )
+    ) is None:
+        return None
+    head_end_ts = math.ceil(start_ts / tier) * tier
+    tier_end_ts = min(compiled_until, end_ts // tier * tier)
+    if tier_end_ts <= head_end_ts:
+        return None
+    buckets: dict[int, list[Row]] = {
+        metadata_id: list(group)
+        for metadata_id, group in groupby(
+            execute_stmt_lambda_element(
+                session,
+                _downsampled_states_stmt(
+                    tier,
+                    extract_metadata_ids(entity_id_to_metadata_id),
+                    head_end_ts,
+                    tier_end_ts,
+                ),
+                orm_rows=False,
+            ),
+            itemgetter(0),
+        )
+    }
+    # Only numeric entities are downsampled, the buckets
+    # of other entities would hide short state changes
+    downsampled_entity_ids = [
+        entity_id
+        for entity_id in entity_ids
+        if (metadata_id := entity_id_to_metadata_id.get(entity_id)) in buckets
+        and any(row[3] is not None for row in buckets[metadata_id])
+    ]
+    if not downsampled_entity_ids:
+        return None
+    downsampled_entity_ids_set = set(downsampled_entity_ids)
+
+    def _get_raw_states(
+        raw_entity_ids: list[str],
+        raw_start_time: datetime,
+        raw_end_time: datetime | None,
+        raw_include_start_time_state: bool,
+    ) -> dict[str, list[State | dict[str, Any]]]:
+        if not raw_entity_ids:
+            return {}
+        return get_significant_states_with_session(
+            hass,
+            session,
+            raw_start_time,
+            raw_end_time,
+            raw_entity_ids,
+            None,
+            raw_include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+
+    raw_states = _get_raw_states(
+        [
+            entity_id
+            for entity_id in entity_ids
+            if entity_id not in downsampled_entity_ids_set
+        ],
+        start_time,
+        end_time,
+        include_start_time_state,
+    )
+    head_states = _get_raw_states(
+        downsampled_entity_ids,
+        start_time,
+        dt_util.utc_from_timestamp(head_end_ts),
+        include_start_time_state,
     )
+    # Step back so states exactly at the end of the last bucket are included
+    tail_states = _get_raw_states(
+        downsampled_entity_ids,
+        dt_util.utc_from_timestamp(tier_end_ts) - timedelta(microseconds=1),
+        end_time,
+        False,
+    )
+    result: dict[str, list[State | dict[str, Any]]] = {}
+    for entity_id in entity_ids:
+        if entity_id in raw_states:
+            result[entity_id] = raw_states[entity_id]
+            continue
+        if entity_id not in downsampled_entity_ids_set:
+            continue
+        ent_results = head_states.get(entity_id, [])
+        ent_results.extend(
+            _downsampled_row_to_state(row, compressed_state_format)
+            for row in buckets[cast(int, entity_id_to_metadata_id[entity_id])]
+        )
+        ent_results.extend(tail_states.get(entity_id, []))
+        result[entity_id] = ent_results
+    return result
 
 
 def _generate_significant_states_with_session_stmt(
@@ -514,6 +798,176 @@ def state_changes_during_period(
         )
 
 
+def _state_changes_during_period_for_entities_stmt(
+    start_ts_by_metadata_id: dict[int, float],
+    end_time_ts: float | None,
+    no_attributes: bool,
+    limit: int | None,
+    include_start_time_state: bool,
+    run_start_ts: float | None,
+    include_last_reported: bool,
+    slow_dependent_subquery: bool,
+) -> Select | CompoundSelect:
+    """Return the state changes of each entity after its own start time.
+
+    The start time state can only be included when all the
+    entities share the same start time.
+    """
+    metadata_ids = list(start_ts_by_metadata_id)
+    start_times_ts = set(start_ts_by_metadata_id.values())
+    stmt = _stmt_and_join_attributes(
+        no_attributes, False, include_last_reported
+    ).filter(
+        (States.last_changed_ts == States.last_updated_ts)
+        | States.last_changed_ts.is_(None)
+    )
+    if len(start_times_ts) == 1:
+        start_time_ts = next(iter(start_times_ts))
+        stmt = stmt.filter(
+            States.metadata_id.in_(metadata_ids),
+            States.last_updated_ts > start_time_ts,
+        )
+    else:
+        stmt = stmt.filter(
+            or_(
+                *(
+                    (States.metadata_id == metadata_id)
+                    & (States.last_updated_ts > entity_start_time_ts)
+                    for metadata_id, entity_start_time_ts in (
+                        start_ts_by_metadata_id.items()
+                    )
+                )
+            )
+        )
+    if end_time_ts:
+        stmt = stmt.filter(States.last_updated_ts < end_time_ts)
+    if not no_attributes:
+        stmt = stmt.outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+    if limit:
+        # Number the rows of each entity to keep the oldest
+        # limit rows, the same rows the single entity query returns
+        numbered_subquery = stmt.add_columns(
+            func.row_number()
+            .over(partition_by=States.metadata_id, order_by=States.last_updated_ts)
+            .label("row_number")
+        ).subquery()
+        stmt = _select_from_subquery(
+            numbered_subquery, no_attributes, False, include_last_reported
+        ).filter(numbered_subquery.c.row_number <= limit)
+    if not include_start_time_state or not run_start_ts:
+        return stmt.order_by(
+            stmt.selected_columns.metadata_id, stmt.selected_columns.last_updated_ts
+        )
+    unioned_subquery = union_all(
+        _select_from_subquery(
+            _get_start_time_state_stmt(
+                start_time_ts,
+                metadata_ids[0] if len(metadata_ids) == 1 else None,
+                metadata_ids,
+                no_attributes,
+                False,
+                slow_dependent_subquery,
+                include_last_reported,
+            ).subquery(),
+            no_attributes,
+            False,
+            include_last_reported,
+        ),
+        _select_from_subquery(
+            stmt.subquery(), no_attributes, False, include_last_reported
+        ),
+    ).subquery()
+    return _select_from_subquery(
+        unioned_subquery, no_attributes, False, include_last_reported
+    ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
+
+
+def state_changes_during_period_for_entities(
+    hass: HomeAssistant,
+    start_times: dict[str, datetime],
+    end_time: datetime | None = None,
+    no_attributes: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, list[State]]:
+    """Return the state changes of many entities with one query per chunk.
+
+    This is state_changes_during_period for a start time per entity,
+    the states of each entity are in ascending order and limit applies
+    to each entity. The start time state can only be included when all
+    the entities share the same start time.
+    """
+    if not start_times:
+        raise ValueError("start_times must be provided")
+    if include_start_time_state and len(set(start_times.values())) > 1:
+        raise ValueError("include_start_time_state requires a single start time")
+    start_times = {
+        entity_id.lower(): start_time for entity_id, start_time in start_times.items()
+    }
+    entity_ids = list(start_times)
+    instance = get_instance(hass)
+    has_last_reported = instance.schema_version >= LAST_REPORTED_SCHEMA_VERSION
+
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+                entity_ids, session, False
+            )
+        ) or not extract_metadata_ids(entity_id_to_metadata_id):
+            return {}
+        start_time = min(start_times.values())
+        oldest_ts: float | None = None
+        if include_start_time_state and not (
+            oldest_ts := _get_oldest_possible_ts(hass, start_time)
+        ):
+            include_start_time_state = False
+        start_ts_by_metadata_id = [
+            (metadata_id, start_times[entity_id].timestamp())
+            for entity_id, metadata_id in entity_id_to_metadata_id.items()
+            if metadata_id is not None
+        ]
+        end_time_ts = datetime_to_timestamp_or_none(end_time)
+        if TYPE_CHECKING:
+            assert instance.database_engine is not None
+        slow_dependent_subquery = (
+            instance.database_engine.optimizer.slow_dependent_subquery
+        )
+        entity_states: list[tuple[str, list[State | dict[str, Any]]]] = []
+        # The chunks do not share metadata_ids so the states
+        # of an entity are always complete within a chunk
+        for chunk in chunked_or_all(
+            start_ts_by_metadata_id, MAX_IDS_FOR_INDEXED_GROUP_BY
+        ):
+            stmt = _state_changes_during_period_for_entities_stmt(
+                dict(chunk),
+                end_time_ts,
+                no_attributes,
+                limit,
+                include_start_time_state,
+                oldest_ts,
+                has_last_reported,
+                slow_dependent_subquery,
+            )
+            entity_states.extend(
+                _iter_sorted_states(
+                    execute_stmt_lambda_element(
+                        session, stmt, None, end_time, orm_rows=False
+                    ),
+                    start_time.timestamp() if include_start_time_state else None,
+                    entity_ids,
+                    entity_id_to_metadata_id,
+                    False,
+                    False,
+                    no_attributes,
+                )
+            )
+        return cast(
+            dict[str, list[State]], _entity_states_to_dict(entity_ids, entity_states)
+        )
+
+
 def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
     return (
         _stmt_and_join_attributes(False, False, False)
@@ -612,11 +1066,82 @@ def get_last_state_changes(
         )
 
 
+def _get_last_state_changes_for_entities_stmt(
+    number_of_states: int, metadata_ids: list[int], include_last_reported: bool
+) -> Select:
+    """Return the last number_of_states rows of each entity."""
+    numbered_subquery = (
+        _stmt_and_join_attributes(False, False, include_last_reported)
+        .add_columns(
+            func.row_number()
+            .over(
+                partition_by=States.metadata_id,
+                order_by=(States.last_updated_ts.desc(), States.state_id.desc()),
+            )
+            .label("row_number")
+        )
+        .filter(States.metadata_id.in_(metadata_ids))
+        .outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+        .subquery()
+    )
+    return (
+        _select_from_subquery(numbered_subquery, False, False, include_last_reported)
+        .filter(numbered_subquery.c.row_number <= number_of_states)
+        .order_by(numbered_subquery.c.metadata_id, numbered_subquery.c.last_updated_ts)
+    )
+
+
+def get_last_state_changes_for_entities(
+    hass: HomeAssistant, number_of_states: int, entity_ids: list[str]
+) -> dict[str, list[State]]:
+    """Return the last number_of_states of many entities with one query per chunk.
+
+    The states of each entity are in ascending order.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    entity_ids = [entity_id.lower() for entity_id in entity_ids]
+    instance = get_instance(hass)
+    has_last_reported = instance.schema_version >= LAST_REPORTED_SCHEMA_VERSION
+
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+                entity_ids, session, False
+            )
+        ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+            return {}
+        entity_states: list[tuple[str, list[State | dict[str, Any]]]] = []
+        for metadata_ids_chunk in chunked_or_all(
+            metadata_ids, MAX_IDS_FOR_INDEXED_GROUP_BY
+        ):
+            stmt = _get_last_state_changes_for_entities_stmt(
+                number_of_states, list(metadata_ids_chunk), has_last_reported
+            )
+            entity_states.extend(
+                _iter_sorted_states(
+                    execute_stmt_lambda_element(session, stmt, orm_rows=False),
+                    None,
+                    entity_ids,
+                    entity_id_to_metadata_id,
+                    False,
+                    False,
+                    False,
+                )
+            )
+        return cast(
+            dict[str, list[State]], _entity_states_to_dict(entity_ids, entity_states)
+        )
+
+
 def _get_start_time_state_for_entities_stmt_dependent_sub_query(
     epoch_time: float,
     metadata_ids: list[int],
     no_attributes: bool,
     include_last_changed: bool,
+    include_last_reported: bool,
 ) -> Select:
     """Baked query to get states for specific entities."""
     # Engine has a fast dependent subquery optimizer
@@ -631,7 +1156,7 @@ def _get_start_time_state_for_entities_stmt_dependent_sub_query(
         _stmt_and_join_attributes_for_start_state(
             no_attributes=no_attributes,
             include_last_changed=include_last_changed,
-            include_last_reported=False,
+            include_last_reported=include_last_reported,
         )
         .select_from(StatesMeta)
         .join(
@@ -666,6 +1191,7 @@ def _get_start_time_state_for_entities_stmt_group_by(
     metadata_ids: list[int],
     no_attributes: bool,
     include_last_changed: bool,
+    include_last_reported: bool,
 ) -> Select:
     """Baked query to get states for specific entities."""
     # Simple group-by for MySQL, must use less
@@ -688,7 +1214,7 @@ def _get_start_time_state_for_entities_stmt_group_by(
         _stmt_and_join_attributes_for_start_state(
             no_attributes=no_attributes,
             include_last_changed=include_last_changed,
-            include_last_reported=False,
+            include_last_reported=include_last_reported,
         )
         .join(
             most_recent_states_for_entities_by_date,
@@ -731,6 +1257,7 @@ def _get_start_time_state_stmt(
     no_attributes: bool,
     include_last_changed: bool,
     slow_dependent_subquery: bool,
+    include_last_reported: bool,
 ) -> Select:
     """Return the states at a specific point in time."""
     if single_metadata_id:
@@ -741,7 +1268,7 @@ def _get_start_time_state_stmt(
             single_metadata_id,
             no_attributes,
             include_last_changed,
-            False,
+            include_last_reported,
         )
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
@@ -751,6 +1278,7 @@ def _get_start_time_state_stmt(
             metadata_ids,
             no_attributes,
             include_last_changed,
+            include_last_reported,
         )
 
     return _get_start_time_state_for_entities_stmt_dependent_sub_query(
@@ -758,6 +1286,7 @@ def _get_start_time_state_stmt(
         metadata_ids,
         no_attributes,
         include_last_changed,
+        include_last_reported,
     )
 
 
@@ -809,6 +1338,59 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
+    return _entity_states_to_dict(
+        entity_ids,
+        _iter_sorted_states(
+            states,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes,
+        ),
+        descending,
+    )
+
+
+def _entity_states_to_dict(
+    entity_ids: list[str],
+    entity_states: Iterable[tuple[str, list[State | dict[str, Any]]]],
+    descending: bool = False,
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Collect the states of each entity into a dict ordered by entity_ids."""
+    # Set all entity IDs to empty lists in result set to maintain the order
+    result: dict[str, list[State | dict[str, Any]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    for entity_id, states in entity_states:
+        if ent_results := result[entity_id]:
+            ent_results.extend(states)
+        else:
+            result[entity_id] = states
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _iter_sorted_states(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield the states of each entity from SQL results.
+
+    States must be sorted by entity_id and last_updated, the
+    states of an entity are yielded as soon as its group of rows ends.
+    """
     field_map = _FIELD_MAP
     state_class: Callable[
         [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
@@ -823,10 +1405,6 @@ def _sorted_states_to_dict(
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
-    # Set all entity IDs to empty lists in result set to maintain the order
-    result: dict[str, list[State | dict[str, Any]]] = {
-        entity_id: [] for entity_id in entity_ids
-    }
     metadata_id_to_entity_id: dict[int, str] = {}
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
@@ -849,25 +1427,23 @@ def _sorted_states_to_dict(
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
         ):
-            ent_results.extend(
-                [
-                    state_class(
-                        db_state,
-                        attr_cache,
-                        start_time_ts,
-                        entity_id,
-                        db_state[state_idx],
-                        db_state[last_updated_ts_idx],
-                        False,
-                    )
-                    for db_state in group
-                ]
-            )
+            if ent_results := [
+                state_class(
+                    db_state,
+                    attr_cache,
+                    start_time_ts,
+                    entity_id,
+                    db_state[state_idx],
+                    db_state[last_updated_ts_idx],
+                    False,
+                )
+                for db_state in group
+            ]:
+                yield entity_id, ent_results
             continue
 
         prev_state: str | None = None
@@ -875,21 +1451,20 @@ def _sorted_states_to_dict(
         # State for the first and last response. All the states
         # in-between only provide the "state" and the
         # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
-                state_class(
-                    first_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    prev_state,
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
-                )
+        if (first_state := next(group, None)) is None:
+            continue
+        prev_state = first_state[state_idx]
+        ent_results = [
+            state_class(
+                first_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                prev_state,
+                first_state[last_updated_ts_idx],
+                no_attributes,
             )
+        ]
 
         #
         # minimal_response only makes sense with last_updated == last_updated
@@ -910,6 +1485,7 @@ def _sorted_states_to_dict(
                     if (state := row[state_idx]) != prev_state
                 ]
             )
+            yield entity_id, ent_results
             continue
 
         # Non-compressed state format returns an ISO formatted string
@@ -926,10 +1502,4 @@ def _sorted_states_to_dict(
                 if (state := row[state_idx]) != prev_state
             ]
         )
-
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
-
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+        yield entity_id, ent_results
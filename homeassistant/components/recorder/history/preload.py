@@ -0,0 +1,184 @@
+"""Batch the history queries of helpers loading their state at startup."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.recorder import get_instance
+from homeassistant.helpers.singleton import singleton
+
+from .const import PRELOAD_DELAY
+from .modern import (
+    get_last_state_changes_for_entities,
+    state_changes_during_period_for_entities,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HISTORY_PRELOADER = "recorder_history_preloader"
+
+type _StateChangesKey = tuple[datetime | None, datetime | None, bool, int | None, bool]
+
+
+@dataclass(slots=True)
+class _StateChangesBatch:
+    """State changes requests answered by the same query."""
+
+    start_times: dict[str, datetime] = field(default_factory=dict)
+    futures: dict[str, list[asyncio.Future[list[State]]]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _LastStateChangesBatch:
+    """Last state changes requests answered by the same query."""
+
+    futures: dict[str, list[asyncio.Future[list[State]]]] = field(default_factory=dict)
+
+
+class HistoryPreloader:
+    """Collect history requests and run them as multi entity queries.
+
+    Requests that arrive within PRELOAD_DELAY of each other are
+    grouped by their query parameters, every group is read with
+    one query and the states are handed back to each requester.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the preloader."""
+        self._hass = hass
+        self._state_changes: dict[_StateChangesKey, list[_StateChangesBatch]] = {}
+        self._last_state_changes: dict[int, _LastStateChangesBatch] = {}
+        self._cancel_flush: CALLBACK_TYPE | None = None
+
+    async def async_state_changes_during_period(
+        self,
+        start_time: datetime,
+        end_time: datetime | None,
+        entity_id: str,
+        no_attributes: bool,
+        descending: bool,
+        limit: int | None,
+        include_start_time_state: bool,
+    ) -> list[State]:
+        """Return the state changes of an entity once its batch is read."""
+        entity_id = entity_id.lower()
+        # The start time state is only read for a single start time
+        # so those requests are grouped by their start time as well
+        key: _StateChangesKey = (
+            start_time if include_start_time_state else None,
+            end_time,
+            no_attributes,
+            limit,
+            include_start_time_state,
+        )
+        batches = self._state_changes.setdefault(key, [])
+        for batch in batches:
+            if batch.start_times.setdefault(entity_id, start_time) == start_time:
+                break
+        else:
+            batch = _StateChangesBatch({entity_id: start_time})
+            batches.append(batch)
+        future: asyncio.Future[list[State]] = self._hass.loop.create_future()
+        batch.futures.setdefault(entity_id, []).append(future)
+        self._async_schedule_flush()
+        states = await future
+        if descending:
+            states.reverse()
+        return states
+
+    async def async_get_last_state_changes(
+        self, number_of_states: int, entity_id: str
+    ) -> list[State]:
+        """Return the last state changes of an entity once its batch is read."""
+        batch = self._last_state_changes.setdefault(
+            number_of_states, _LastStateChangesBatch()
+        )
+        future: asyncio.Future[list[State]] = self._hass.loop.create_future()
+        batch.futures.setdefault(entity_id.lower(), []).append(future)
+        self._async_schedule_flush()
+        return await future
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Schedule the pending requests to be read."""
+        if self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self._hass, PRELOAD_DELAY, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        """Read the pending requests with one query per batch."""
+        self._cancel_flush = None
+        state_changes, self._state_changes = self._state_changes, {}
+        last_state_changes, self._last_state_changes = self._last_state_changes, {}
+        for (
+            _,
+            end_time,
+            no_attributes,
+            limit,
+            include_start_time_state,
+        ), batches in state_changes.items():
+            for batch in batches:
+                self._hass.async_create_background_task(
+                    self._async_read_batch(
+                        batch.futures,
+                        state_changes_during_period_for_entities,
+                        self._hass,
+                        batch.start_times,
+                        end_time,
+                        no_attributes,
+                        limit,
+                        include_start_time_state,
+                    ),
+                    "recorder history preload",
+                )
+        for number_of_states, last_batch in last_state_changes.items():
+            self._hass.async_create_background_task(
+                self._async_read_batch(
+                    last_batch.futures,
+                    get_last_state_changes_for_entities,
+                    self._hass,
+                    number_of_states,
+                    list(last_batch.futures),
+                ),
+                "recorder history preload",
+            )
+
+    async def _async_read_batch(
+        self,
+        futures: dict[str, list[asyncio.Future[list[State]]]],
+        target: Callable[..., dict[str, list[State]]],
+        *args: Any,
+    ) -> None:
+        """Run a batch query in the recorder executor and answer its requests."""
+        _LOGGER.debug("Preloading the history of %s entities", len(futures))
+        try:
+            states = await get_instance(self._hass).async_add_executor_job(
+                target, *args
+            )
+        except Exception as err:  # noqa: BLE001
+            for entity_futures in futures.values():
+                for future in entity_futures:
+                    if not future.done():
+                        future.set_exception(err)
+            return
+        for entity_id, entity_futures in futures.items():
+            entity_states = states.get(entity_id, [])
+            for future in entity_futures:
+                if not future.done():
+                    # Every requester gets its own list to change
+                    future.set_result(list(entity_states))
+
+
+@singleton(DATA_HISTORY_PRELOADER)
+def async_get_preloader(hass: HomeAssistant) -> HistoryPreloader:
+    """Get the history preloader."""
+    return HistoryPreloader(hass)
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Any, TypedDict, cast, final
 from uuid import UUID
 
 import sqlalchemy
-from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text, update
+from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, insert, text, update
 from sqlalchemy.engine import CursorResult, Engine
 from sqlalchemy.exc import (
     DatabaseError,
@@ -50,6 +50,8 @@ from .auto_repairs.statistics.schema import (
     validate_db_schema as statistics_validate_db_schema,
 )
 from .const import (
+    ALWAYS_CONTINUOUS_DOMAINS,
+    CONDITIONALLY_CONTINUOUS_DOMAINS,
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_FOREIGN_KEYS_FIXED_SCHEMA_VERSION,
@@ -75,12 +77,14 @@ from .db_schema import (
     MigrationChanges,
     SchemaChanges,
     States,
+    StatesDownsampled,
     StatesMeta,
     Statistics,
     StatisticsMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
+from .filters import like_domain_matchers
 from .models import StatisticMeanType, process_timestamp
 from .models.time import datetime_to_timestamp_or_none
 from .queries import (
@@ -2037,6 +2041,50 @@ class _SchemaVersion50Migrator(_SchemaVersionMigrator, target_version=50):
             connection.execute(text("UPDATE statistics_meta SET has_mean=NULL"))
 
 
+class _SchemaVersion51Migrator(_SchemaVersionMigrator, target_version=51):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        _add_columns(
+            self.session_maker,
+            "states_meta",
+            [f"continuous {self.column_types.small_int_type}"],
+        )
+        _create_index(
+            self.instance,
+            self.session_maker,
+            "states_meta",
+            "ix_states_meta_continuous",
+        )
+        # Entities in the conditionally continuous domains are left unknown
+        # until the recorder sees their attributes
+        always_continuous = [
+            StatesMeta.entity_id.like(entity_domain)
+            for entity_domain in like_domain_matchers(ALWAYS_CONTINUOUS_DOMAINS)
+        ]
+        never_continuous = [
+            ~StatesMeta.entity_id.like(entity_domain)
+            for entity_domain in like_domain_matchers(
+                ALWAYS_CONTINUOUS_DOMAINS | CONDITIONALLY_CONTINUOUS_DOMAINS
+            )
+        ]
+        with session_scope(session=self.session_maker()) as session:
+            session.execute(
+                update(StatesMeta)
+                .where(sqlalchemy.or_(*always_continuous))
+                .values(continuous=1)
+            )
+            session.execute(
+                update(StatesMeta)
+                .where(sqlalchemy.and_(*never_continuous))
+                .values(continuous=0)
+            )
+        # The states_downsampled table was added with this version. It is
+        # usually created with the other missing tables when the recorder
+        # connects, create it if missing so this version implies the table
+        with session_scope(session=self.session_maker()) as session:
+            StatesDownsampled.__table__.create(session.connection(), checkfirst=True)
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2872,21 +2920,14 @@ class EntityIDMigration(BaseMigrationWithQuery, BaseOffLineMigration):
                     for entity_id, metadata_id in entity_id_to_metadata_id.items()
                     if metadata_id is None
                 }:
-                    missing_states_metadata = [
-                        StatesMeta(entity_id=entity_id)
-                        for entity_id in missing_entity_ids
-                    ]
-                    session.add_all(missing_states_metadata)
-                    session.flush()  # Assign ids
-                    for db_states_metadata in missing_states_metadata:
-                        # We cannot add the assigned ids to the event_type_manager
-                        # because the commit could get rolled back
-                        assert db_states_metadata.entity_id is not None, (
-                            "entity_id should never be None"
-                        )
-                        entity_id_to_metadata_id[db_states_metadata.entity_id] = (
-                            db_states_metadata.metadata_id
-                        )
+                    # The rows are inserted with only the entity_id since the
+                    # columns added by later schema versions do not exist yet.
+                    # We cannot add the assigned ids to the states_meta_manager
+                    # because the commit could get rolled back
+                    for entity_id in missing_entity_ids:
+                        entity_id_to_metadata_id[entity_id] = session.execute(
+                            insert(StatesMeta).values(entity_id=entity_id)
+                        ).inserted_primary_key[0]
 
                 session.execute(
                     update(States),
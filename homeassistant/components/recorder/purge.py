@@ -2,23 +2,40 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Collection, Iterable
+from dataclasses import dataclass
 from datetime import datetime
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
-from .db_schema import Events, States, StatesMeta
+from .db_schema import (
+    TABLE_EVENT_DATA,
+    TABLE_EVENTS,
+    TABLE_STATE_ATTRIBUTES,
+    TABLE_STATES,
+    Events,
+    States,
+    StatesMeta,
+    StatisticsShortTerm,
+)
 from .models import DatabaseEngine
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
+    count_attributes_ids_references,
+    count_data_ids_references,
     data_ids_exist_in_events,
     data_ids_exist_in_events_with_fast_in_distinct,
+    delete_downsampled_states_for_metadata_ids,
+    delete_downsampled_states_rows,
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
@@ -29,6 +46,7 @@ from .queries import (
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    find_downsampled_states_to_purge,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -41,6 +59,7 @@ from .queries import (
     find_statistics_runs_to_purge,
 )
 from .repack import repack_database
+from .statistics import get_statistics_query_cache
 from .util import retryable_database_job, session_scope
 
 if TYPE_CHECKING:
@@ -52,6 +71,160 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# Seconds a purge run may spend deleting batches before it hands the
+# recorder queue back to the events waiting to be recorded
+PURGE_TIME_BUDGET = 3
+
+# The maximum number of attributes_ids or data_ids to keep reference
+# counts for, ids over the limit are counted again when they are purged
+REFERENCE_COUNTS_MAX_SIZE = 100000
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of the running or the last finished purge."""
+
+    purge_before: datetime | None = None
+    repack: bool = False
+    apply_filter: bool = False
+    started: datetime | None = None
+    finished: datetime | None = None
+    runs: int = 0
+    states: int = 0
+    events: int = 0
+    state_attributes: int = 0
+    event_data: int = 0
+    last_run_duration: float = 0.0
+
+    @property
+    def in_progress(self) -> bool:
+        """Return if a purge was started and has not finished."""
+        return self.started is not None and self.finished is None
+
+    @property
+    def purged_tables(self) -> list[str]:
+        """Return the tables rows were purged from."""
+        return [
+            table
+            for table, purged_rows in (
+                (TABLE_STATES, self.states),
+                (TABLE_STATE_ATTRIBUTES, self.state_attributes),
+                (TABLE_EVENTS, self.events),
+                (TABLE_EVENT_DATA, self.event_data),
+            )
+            if purged_rows
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict that can be stored or sent over the websocket."""
+        return {
+            "purge_before": _isoformat_or_none(self.purge_before),
+            "repack": self.repack,
+            "apply_filter": self.apply_filter,
+            "started": _isoformat_or_none(self.started),
+            "finished": _isoformat_or_none(self.finished),
+            "runs": self.runs,
+            "states": self.states,
+            "events": self.events,
+            "state_attributes": self.state_attributes,
+            "event_data": self.event_data,
+            "last_run_duration": self.last_run_duration,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PurgeProgress:
+        """Restore the progress from a dict created by as_dict."""
+        return cls(
+            purge_before=_parse_datetime_or_none(data["purge_before"]),
+            repack=data["repack"],
+            apply_filter=data["apply_filter"],
+            started=_parse_datetime_or_none(data["started"]),
+            finished=_parse_datetime_or_none(data["finished"]),
+            runs=data["runs"],
+            states=data["states"],
+            events=data["events"],
+            state_attributes=data["state_attributes"],
+            event_data=data["event_data"],
+            last_run_duration=data["last_run_duration"],
+        )
+
+
+def _isoformat_or_none(value: datetime | None) -> str | None:
+    """Return the isoformat of a datetime or None."""
+    return None if value is None else value.isoformat()
+
+
+def _parse_datetime_or_none(value: str | None) -> datetime | None:
+    """Parse a datetime created by _isoformat_or_none."""
+    return None if value is None else dt_util.parse_datetime(value)
+
+
+class ReferenceCounts:
+    """Count the rows referencing shared attributes or event data ids.
+
+    Ids are counted with one query the first time rows referencing them
+    are purged. Later purges only decrement the count, which avoids
+    checking every candidate id for remaining rows on each run. The
+    recorder increments the count of tracked ids it links new rows to.
+
+    This class is not thread-safe and must be used from the recorder thread.
+    """
+
+    __slots__ = ("_counts", "_max_size")
+
+    def __init__(self, max_size: int = REFERENCE_COUNTS_MAX_SIZE) -> None:
+        """Initialize the reference counts."""
+        self._counts: dict[int, int] = {}
+        self._max_size = max_size
+
+    def __len__(self) -> int:
+        """Return the number of tracked ids."""
+        return len(self._counts)
+
+    def add_reference(self, id_: int) -> None:
+        """Count a new row referencing an id."""
+        if id_ in self._counts:
+            self._counts[id_] += 1
+
+    def release(
+        self,
+        released: Counter[int],
+        count_references: Callable[[Collection[int]], dict[int, int]],
+    ) -> set[int]:
+        """Release the references of purged rows and return the unused ids.
+
+        count_references must return the number of remaining rows referencing
+        each id, it is only called for ids that are not tracked yet.
+        """
+        counts = self._counts
+        unused: set[int] = set()
+        untracked: list[int] = []
+        for id_, count in released.items():
+            if (current := counts.get(id_)) is None:
+                untracked.append(id_)
+            elif current > count:
+                counts[id_] = current - count
+            else:
+                del counts[id_]
+                unused.add(id_)
+        if not untracked:
+            return unused
+        remaining = count_references(untracked)
+        for id_ in untracked:
+            if not (count := remaining.get(id_)):
+                unused.add(id_)
+            elif len(counts) < self._max_size:
+                counts[id_] = count
+        return unused
+
+    def clear(self) -> None:
+        """Forget all counts.
+
+        Must be called when rows are deleted without releasing their
+        references or when a purge was rolled back.
+        """
+        self._counts.clear()
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -70,6 +243,47 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    progress = instance.purge_progress
+    if not progress.in_progress or progress.purge_before != purge_before:
+        progress = instance.purge_progress = PurgeProgress(
+            purge_before, repack, apply_filter, started=dt_util.utcnow()
+        )
+    run_start = time.monotonic()
+    try:
+        finished = _purge_old_data(
+            instance,
+            progress,
+            purge_before,
+            repack,
+            apply_filter,
+            events_batch_size,
+            states_batch_size,
+            run_start + PURGE_TIME_BUDGET,
+        )
+    except BaseException:
+        # The purged rows may have been rolled back
+        instance.attributes_reference_counts.clear()
+        instance.data_reference_counts.clear()
+        raise
+    progress.runs += 1
+    progress.last_run_duration = time.monotonic() - run_start
+    if finished:
+        progress.finished = dt_util.utcnow()
+    instance.hass.add_job(instance.async_purge_progress_updated, progress.as_dict())
+    return finished
+
+
+def _purge_old_data(
+    instance: Recorder,
+    progress: PurgeProgress,
+    purge_before: datetime,
+    repack: bool,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+    deadline: float,
+) -> bool:
+    """Purge events and states older than purge_before until the deadline."""
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
@@ -86,10 +300,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, progress, states_batch_size, purge_before, deadline
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, progress, events_batch_size, purge_before, deadline
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -103,8 +317,21 @@ def purge_old_data(
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+            get_statistics_query_cache(instance.hass).invalidate_on_commit(
+                session, None, StatisticsShortTerm, None
+            )
+
+        if downsampled_states := _select_downsampled_states_to_purge(
+            session, purge_before, instance.max_bind_vars
+        ):
+            _purge_downsampled_states(session, downsampled_states)
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
+        if (
+            has_more_to_purge
+            or statistics_runs
+            or short_term_statistics
+            or downsampled_states
+        ):
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
@@ -146,6 +373,9 @@ def _purge_legacy_format(
     ) = _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
         session, purge_before, instance.max_bind_vars
     )
+    # The legacy rows do not release their references
+    instance.attributes_reference_counts.clear()
+    instance.data_reference_counts.clear()
     _purge_state_ids(instance, session, state_ids)
     _purge_unused_attributes_ids(instance, session, attributes_ids)
     _purge_event_ids(session, event_ids)
@@ -177,21 +407,21 @@ def _purge_legacy_format(
 def _purge_states_and_attributes_ids(
     instance: Recorder,
     session: Session,
+    progress: PurgeProgress,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
     Returns true if there are more states to purge.
     """
-    database_engine = instance.database_engine
-    assert database_engine is not None
     has_remaining_state_ids_to_purge = True
     # There are more states relative to attributes_ids so
     # we purge enough state_ids to try to generate a full
     # size batch of attributes_ids that will be around the size
     # max_bind_vars
-    attributes_ids_batch: set[int] = set()
+    released_attributes_ids: Counter[int] = Counter()
     max_bind_vars = instance.max_bind_vars
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
@@ -201,9 +431,22 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
-        attributes_ids_batch = attributes_ids_batch | attributes_ids
+        progress.states += len(state_ids)
+        released_attributes_ids.update(attributes_ids)
+        if time.monotonic() >= deadline:
+            _LOGGER.debug("Purge time budget used up while purging states")
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    if released_attributes_ids and (
+        unused_attributes_ids := instance.attributes_reference_counts.release(
+            released_attributes_ids,
+            lambda ids: _count_references(
+                instance, session, count_attributes_ids_references, ids
+            ),
+        )
+    ):
+        _purge_batch_attributes_ids(instance, session, unused_attributes_ids)
+        progress.state_attributes += len(unused_attributes_ids)
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -214,8 +457,10 @@ def _purge_states_and_attributes_ids(
 def _purge_events_and_data_ids(
     instance: Recorder,
     session: Session,
+    progress: PurgeProgress,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -226,7 +471,7 @@ def _purge_events_and_data_ids(
     # we purge enough event_ids to try to generate a full
     # size batch of data_ids that will be around the size
     # max_bind_vars
-    data_ids_batch: set[int] = set()
+    released_data_ids: Counter[int] = Counter()
     max_bind_vars = instance.max_bind_vars
     for _ in range(events_batch_size):
         event_ids, data_ids = _select_event_data_ids_to_purge(
@@ -236,9 +481,22 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
-        data_ids_batch = data_ids_batch | data_ids
+        progress.events += len(event_ids)
+        released_data_ids.update(data_ids)
+        if time.monotonic() >= deadline:
+            _LOGGER.debug("Purge time budget used up while purging events")
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    if released_data_ids and (
+        unused_data_ids := instance.data_reference_counts.release(
+            released_data_ids,
+            lambda ids: _count_references(
+                instance, session, count_data_ids_references, ids
+            ),
+        )
+    ):
+        _purge_batch_data_ids(instance, session, unused_data_ids)
+        progress.event_data += len(unused_data_ids)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -246,18 +504,32 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _count_references(
+    instance: Recorder,
+    session: Session,
+    query: Callable[[Iterable[int]], StatementLambdaElement],
+    ids: Collection[int],
+) -> dict[int, int]:
+    """Count the rows that still reference each of the ids."""
+    return {
+        id_: count
+        for ids_chunk in chunked_or_all(ids, instance.max_bind_vars)
+        for id_, count in session.execute(query(ids_chunk)).all()
+    }
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int]]:
-    """Return sets of state and attribute ids to purge."""
+) -> tuple[set[int], Counter[int]]:
+    """Return the state ids and how often each attribute id is used by them."""
     state_ids = set()
-    attributes_ids = set()
+    attributes_ids: Counter[int] = Counter()
     for state_id, attributes_id in session.execute(
         find_states_to_purge(purge_before.timestamp(), max_bind_vars)
     ).all():
         state_ids.add(state_id)
         if attributes_id:
-            attributes_ids.add(attributes_id)
+            attributes_ids[attributes_id] += 1
     _LOGGER.debug(
         "Selected %s state ids and %s attributes_ids to remove",
         len(state_ids),
@@ -268,16 +540,16 @@ def _select_state_attributes_ids_to_purge(
 
 def _select_event_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int]]:
-    """Return sets of event and data ids to purge."""
+) -> tuple[set[int], Counter[int]]:
+    """Return the event ids and how often each data id is used by them."""
     event_ids = set()
-    data_ids = set()
+    data_ids: Counter[int] = Counter()
     for event_id, data_id in session.execute(
         find_events_to_purge(purge_before.timestamp(), max_bind_vars)
     ).all():
         event_ids.add(event_id)
         if data_id:
-            data_ids.add(data_id)
+            data_ids[data_id] += 1
     _LOGGER.debug(
         "Selected %s event ids and %s data_ids to remove", len(event_ids), len(data_ids)
     )
@@ -399,6 +671,17 @@ def _select_short_term_statistics_to_purge(
     return [statistic_id for (statistic_id,) in statistics]
 
 
+def _select_downsampled_states_to_purge(
+    session: Session, purge_before: datetime, max_bind_vars: int
+) -> list[int]:
+    """Return a list of downsampled states buckets to purge."""
+    buckets = session.execute(
+        find_downsampled_states_to_purge(purge_before, max_bind_vars)
+    ).all()
+    _LOGGER.debug("Selected %s downsampled states to remove", len(buckets))
+    return [bucket_id for (bucket_id,) in buckets]
+
+
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -515,6 +798,12 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
+def _purge_downsampled_states(session: Session, downsampled_states: list[int]) -> None:
+    """Delete by id."""
+    deleted_rows = session.execute(delete_downsampled_states_rows(downsampled_states))
+    _LOGGER.debug("Deleted %s downsampled states", deleted_rows)
+
+
 def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
@@ -642,12 +931,19 @@ def _purge_filtered_states(
         .all()
     )
     if not to_purge:
+        session.execute(
+            delete_downsampled_states_for_metadata_ids(
+                metadata_ids_to_purge, purge_before_timestamp
+            )
+        )
         return True
     state_ids, attributes_ids, event_ids = zip(*to_purge, strict=False)
     filtered_event_ids = {id_ for id_ in event_ids if id_ is not None}
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
+    # The filtered rows do not release their references
+    instance.attributes_reference_counts.clear()
     _purge_state_ids(instance, session, set(state_ids))
     # These are legacy events that are linked to a state that are no longer
     # created but since we did not remove them when we stopped adding new ones
@@ -689,6 +985,9 @@ def _purge_filtered_events(
     _LOGGER.debug(
         "Selected %s event_ids to remove that should be filtered", len(event_ids_set)
     )
+    # The filtered rows do not release their references
+    instance.attributes_reference_counts.clear()
+    instance.data_reference_counts.clear()
     if (
         instance.use_legacy_events_index
         and (
@@ -17,6 +17,7 @@ from .db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesDownsampled,
     StatesMeta,
     Statistics,
     StatisticsRuns,
@@ -120,6 +121,28 @@ def attributes_ids_exist_in_states(
     )
 
 
+def count_attributes_ids_references(
+    attributes_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Count the states referencing each of the attributes ids."""
+    return lambda_stmt(
+        lambda: select(States.attributes_id, func.count())
+        .filter(States.attributes_id.in_(attributes_ids))
+        .group_by(States.attributes_id)
+    )
+
+
+def count_data_ids_references(
+    data_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Count the events referencing each of the data ids."""
+    return lambda_stmt(
+        lambda: select(Events.data_id, func.count())
+        .filter(Events.data_id.in_(data_ids))
+        .group_by(Events.data_id)
+    )
+
+
 def data_ids_exist_in_events_with_fast_in_distinct(
     data_ids: Iterable[int],
 ) -> StatementLambdaElement:
@@ -223,6 +246,27 @@ def delete_statistics_short_term_rows(
     )
 
 
+def delete_downsampled_states_rows(ids: Iterable[int]) -> StatementLambdaElement:
+    """Delete states_downsampled rows."""
+    return lambda_stmt(
+        lambda: delete(StatesDownsampled)
+        .where(StatesDownsampled.id.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_downsampled_states_for_metadata_ids(
+    metadata_ids: Iterable[int], purge_before: float
+) -> StatementLambdaElement:
+    """Delete states_downsampled rows of entities purged by a filter."""
+    return lambda_stmt(
+        lambda: delete(StatesDownsampled)
+        .where(StatesDownsampled.metadata_id.in_(metadata_ids))
+        .where(StatesDownsampled.start_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_rows(
     event_ids: Iterable[int],
 ) -> StatementLambdaElement:
@@ -290,6 +334,27 @@ def find_short_term_statistics_to_purge(
     )
 
 
+def find_downsampled_states_to_purge(
+    purge_before: datetime, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find downsampled states buckets to purge."""
+    purge_before_ts = purge_before.timestamp()
+    return lambda_stmt(
+        lambda: select(StatesDownsampled.id)
+        .filter(StatesDownsampled.start_ts < purge_before_ts)
+        .limit(max_bind_vars)
+    )
+
+
+def find_downsampled_states_compiled_until() -> StatementLambdaElement:
+    """Find the start of the newest bucket of each downsampled states tier."""
+    return lambda_stmt(
+        lambda: select(
+            StatesDownsampled.resolution, func.max(StatesDownsampled.start_ts)
+        ).group_by(StatesDownsampled.resolution)
+    )
+
+
 def find_statistics_runs_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 import logging
 from typing import TYPE_CHECKING
 
@@ -46,3 +47,18 @@ def repack_database(instance: Recorder) -> None:
             conn.execute(text(f"OPTIMIZE TABLE {','.join(ALL_TABLES)}"))
             conn.commit()
         return
+
+
+def vacuum_purged_tables(instance: Recorder, tables: Iterable[str]) -> None:
+    """Vacuum the tables rows were purged from.
+
+    PostgreSQL marks the purged rows as reusable, so the tables and their
+    indexes do not bloat until autovacuum catches up with them.
+    """
+    assert instance.engine is not None
+    _LOGGER.debug("Vacuuming purged tables of SQL DB")
+    with instance.engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as conn:
+        conn.execute(text(f"VACUUM (ANALYZE) {','.join(tables)}"))
+        conn.commit()
@@ -12,15 +12,18 @@ import logging
 import math
 from operator import itemgetter
 import re
+import threading
 from time import time as time_time
 from typing import TYPE_CHECKING, Any, Literal, Required, TypedDict, cast
 
+from lru import LRU
 from sqlalchemy import (
     Label,
     Select,
     and_,
     bindparam,
     case,
+    event,
     func,
     lambda_stmt,
     select,
@@ -232,6 +235,12 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_QUERY_CACHE = "recorder_statistics_query_cache"
+
+# Results of statistics_during_period for closed periods kept in memory
+STATISTICS_QUERY_CACHE_SIZE = 128
+
+_PENDING_QUERY_CACHE_INVALIDATIONS = "statistics_query_cache_invalidations"
 
 
 def mean(values: list[float]) -> float | None:
@@ -295,6 +304,136 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+type _PendingInvalidation = tuple[
+    set[int] | None, type[StatisticsBase] | None, float | None
+]
+
+
+@dataclasses.dataclass(slots=True)
+class _StatisticsQueryCacheEntry:
+    """A cached result of statistics_during_period."""
+
+    result: dict[str, list[StatisticsRow]]
+    metadata_ids: set[int]
+    table: type[StatisticsBase]
+    end_ts: float
+
+
+class StatisticsQueryCache:
+    """Cache for the results of statistics_during_period for closed periods.
+
+    An entry is invalidated when a committed transaction has modified the
+    statistics of one of its metadata ids before the end of its period.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: LRU[tuple[Any, ...], _StatisticsQueryCacheEntry] = LRU(
+            STATISTICS_QUERY_CACHE_SIZE
+        )
+        # Results are read in the executor and invalidated in the recorder thread
+        self._lock = threading.Lock()
+        # Incremented by every invalidation, results read before an
+        # invalidation are not added to the cache
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Return the share of the lookups which were cache hits."""
+        if lookups := self.hits + self.misses:
+            return self.hits / lookups
+        return None
+
+    def get(self, key: tuple[Any, ...]) -> dict[str, list[StatisticsRow]] | None:
+        """Return a copy of a cached result."""
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _copy_statistics_result(entry.result)
+
+    def set(
+        self,
+        key: tuple[Any, ...],
+        generation: int,
+        result: dict[str, list[StatisticsRow]],
+        metadata_ids: set[int],
+        table: type[StatisticsBase],
+        end_ts: float,
+    ) -> None:
+        """Cache a copy of a result read after the given generation."""
+        entry = _StatisticsQueryCacheEntry(
+            _copy_statistics_result(result), metadata_ids, table, end_ts
+        )
+        with self._lock:
+            if generation == self.generation:
+                self._entries[key] = entry
+
+    def invalidate(
+        self,
+        metadata_ids: set[int] | None,
+        table: type[StatisticsBase] | None,
+        start_ts: float | None,
+    ) -> None:
+        """Invalidate the entries of modified statistics.
+
+        The statistics of the metadata ids in the table were modified from
+        start_ts, None matches all metadata ids, tables or times.
+        """
+        with self._lock:
+            self.generation += 1
+            for key, entry in self._entries.items():
+                if (
+                    (table is None or entry.table is table)
+                    and (start_ts is None or start_ts < entry.end_ts)
+                    and (
+                        metadata_ids is None
+                        or not entry.metadata_ids.isdisjoint(metadata_ids)
+                    )
+                ):
+                    del self._entries[key]
+
+    def invalidate_on_commit(
+        self,
+        session: Session,
+        metadata_ids: set[int] | None,
+        table: type[StatisticsBase] | None,
+        start_ts: float | None,
+    ) -> None:
+        """Invalidate the entries of modified statistics when the session commits.
+
+        Results read before the commit still see the old statistics.
+        """
+        pending: list[_PendingInvalidation] | None
+        if (pending := session.info.get(_PENDING_QUERY_CACHE_INVALIDATIONS)) is None:
+            pending = session.info[_PENDING_QUERY_CACHE_INVALIDATIONS] = []
+            event.listen(session, "after_commit", self._invalidate_pending)
+        pending.append((metadata_ids, table, start_ts))
+
+    def _invalidate_pending(self, session: Session) -> None:
+        """Invalidate the entries of the statistics modified by a commit."""
+        pending: list[_PendingInvalidation] = session.info[
+            _PENDING_QUERY_CACHE_INVALIDATIONS
+        ]
+        invalidations = pending.copy()
+        pending.clear()
+        for metadata_ids, table, start_ts in invalidations:
+            self.invalidate(metadata_ids, table, start_ts)
+
+
+def _copy_statistics_result(
+    result: dict[str, list[StatisticsRow]],
+) -> dict[str, list[StatisticsRow]]:
+    """Copy a result of statistics_during_period, callers modify the rows."""
+    return {
+        statistic_id: [row.copy() for row in rows]
+        for statistic_id, rows in result.items()
+    }
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -686,6 +825,7 @@ def _compile_statistics(
 
     new_short_term_stats: list[StatisticsBase] = []
     updated_metadata_ids: set[int] = set()
+    modified_metadata_ids: set[int] = set()
     now_timestamp = time_time()
     # Insert collected statistics in the database
     for stats in platform_stats:
@@ -694,6 +834,7 @@ def _compile_statistics(
         )
         if modified_statistic_id is not None:
             modified_statistic_ids.add(modified_statistic_id)
+            modified_metadata_ids.add(metadata_id)
         updated_metadata_ids.add(metadata_id)
         if new_stat := _insert_statistics(
             session, StatisticsShortTerm, metadata_id, stats["stat"], now_timestamp
@@ -711,9 +852,20 @@ def _compile_statistics(
                 continue
             platform_update_issues(instance.hass, session)
 
+    query_cache = get_statistics_query_cache(instance.hass)
+    if modified_metadata_ids:
+        query_cache.invalidate_on_commit(session, modified_metadata_ids, None, None)
+    if updated_metadata_ids:
+        query_cache.invalidate_on_commit(
+            session, updated_metadata_ids, StatisticsShortTerm, start.timestamp()
+        )
+
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        query_cache.invalidate_on_commit(
+            session, None, Statistics, start.replace(minute=0).timestamp()
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -861,6 +1013,9 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+        get_statistics_query_cache(instance.hass).invalidate_on_commit(
+            session, None, None, None
+        )
 
 
 def update_statistics_metadata(
@@ -876,6 +1031,9 @@ def update_statistics_metadata(
             statistics_meta_manager.update_unit_of_measurement(
                 session, statistic_id, new_unit_of_measurement
             )
+            get_statistics_query_cache(instance.hass).invalidate_on_commit(
+                session, None, None, None
+            )
     if new_statistic_id is not UNDEFINED and new_statistic_id is not None:
         with session_scope(
             session=instance.get_session(),
@@ -886,6 +1044,9 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+            get_statistics_query_cache(instance.hass).invalidate_on_commit(
+                session, None, None, None
+            )
 
 
 async def async_list_statistic_ids(
@@ -1870,11 +2031,16 @@ def _statistics_during_period_with_session(
 
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
+    The results of closed periods are cached until their statistics change.
     """
     if statistic_ids is not None and not isinstance(statistic_ids, set):
         # This is for backwards compatibility to avoid a breaking change
         # for custom integrations that call this method.
         statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
+    query_cache = get_statistics_query_cache(hass)
+    # Read before the statistics, so a result is not cached if its statistics
+    # are modified while they are read
+    cache_generation = query_cache.generation
     # Fetch metadata for the given (or all) statistic_ids
     metadata = get_instance(hass).statistics_meta_manager.get_many(
         session, statistic_ids=statistic_ids
@@ -1923,6 +2089,21 @@ def _statistics_during_period_with_session(
         if end_time is not None:
             end_time = _find_month_end_time(dt_util.as_local(end_time))
 
+    cache_key: tuple[Any, ...] | None = None
+    # Results are invalidated by metadata id, so results of statistic ids
+    # without metadata are not cached
+    if (
+        statistic_ids is not None
+        and end_time is not None
+        and end_time <= dt_util.utcnow()
+        and statistic_ids <= metadata.keys()
+    ):
+        cache_key = _statistics_query_cache_key(
+            hass, statistic_ids, period, start_time, end_time, units, _types
+        )
+        if (cached_result := query_cache.get(cache_key)) is not None:
+            return cached_result
+
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
@@ -1967,10 +2148,53 @@ def _statistics_during_period_with_session(
         for row in stats_rows:
             row.pop("mean_weight", None)
 
+    if cache_key is not None:
+        assert end_time is not None
+        query_cache.set(
+            cache_key,
+            cache_generation,
+            result,
+            {metadata_id for metadata_id, _ in metadata.values()},
+            table,
+            end_time.timestamp(),
+        )
+
     # Return statistics combined with metadata
     return result
 
 
+def _statistics_query_cache_key(
+    hass: HomeAssistant,
+    statistic_ids: set[str],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    start_time: datetime,
+    end_time: datetime,
+    units: dict[str, str] | None,
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> tuple[Any, ...]:
+    """Return the key of a result in the statistics query cache.
+
+    The results are converted to the unit of the state unless other units are
+    requested, and the periods are aligned to the local time zone.
+    """
+    state_units = tuple(
+        state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if (state := hass.states.get(statistic_id))
+        else None
+        for statistic_id in sorted(statistic_ids)
+    )
+    return (
+        frozenset(statistic_ids),
+        period,
+        start_time,
+        end_time,
+        frozenset(units.items()) if units else None,
+        frozenset(types),
+        state_units,
+        str(dt_util.get_default_time_zone()),
+    )
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -2581,16 +2805,27 @@ def _import_statistics_with_session(
     old_metadata_dict = statistics_meta_manager.get_many(
         session, statistic_ids={metadata["statistic_id"]}
     )
-    _, metadata_id = statistics_meta_manager.update_or_add(
+    modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
     now_timestamp = time_time()
+    first_start: datetime | None = None
     for stat in statistics:
+        if first_start is None or stat["start"] < first_start:
+            first_start = stat["start"]
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat, now_timestamp)
 
+    query_cache = get_statistics_query_cache(instance.hass)
+    if modified_statistic_id is not None:
+        query_cache.invalidate_on_commit(session, {metadata_id}, None, None)
+    elif first_start is not None:
+        query_cache.invalidate_on_commit(
+            session, {metadata_id}, table, first_start.timestamp()
+        )
+
     if table != StatisticsShortTerm:
         return True
 
@@ -2612,6 +2847,12 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_QUERY_CACHE)
+def get_statistics_query_cache(hass: HomeAssistant) -> StatisticsQueryCache:
+    """Get the statistics query cache."""
+    return StatisticsQueryCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2720,6 +2961,12 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+        get_statistics_query_cache(instance.hass).invalidate_on_commit(
+            session,
+            {metadata[statistic_id][0]},
+            None,
+            start_time.replace(minute=0).timestamp(),
+        )
 
     return True
 
@@ -2788,6 +3035,9 @@ def change_statistics_unit(
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+        get_statistics_query_cache(instance.hass).invalidate_on_commit(
+            session, {metadata_id}, None, None
+        )
 
 
 @callback
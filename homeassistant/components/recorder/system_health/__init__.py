@@ -7,10 +7,12 @@ from urllib.parse import urlparse
 
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
 
 from .. import get_instance
 from ..const import SupportedDialect
 from ..core import Recorder
+from ..statistics import get_statistics_query_cache
 from ..util import session_scope
 from .mysql import db_size_bytes as mysql_db_size_bytes
 from .postgresql import db_size_bytes as postgresql_db_size_bytes
@@ -55,6 +57,30 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_purge_info(instance: Recorder) -> dict[str, Any]:
+    """Get the progress of the running or last finished purge."""
+    progress = instance.async_purge_progress_data
+    if progress["started"] is None:
+        return {}
+    if progress["finished"] is None:
+        return {
+            "purge_progress": (
+                f"{progress['states']} states and {progress['events']} events"
+                f" purged in {progress['runs']} runs"
+            )
+        }
+    return {"last_purge": dt_util.parse_datetime(progress["finished"])}
+
+
+@callback
+def _async_get_statistics_cache_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get the hit rate of the statistics query cache."""
+    if (hit_rate := get_statistics_query_cache(hass).hit_rate) is None:
+        return {}
+    return {"statistics_cache_hit_rate": f"{hit_rate:.0%}"}
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -72,4 +98,10 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return (
+        db_runs
+        | db_stats
+        | db_engine_info
+        | _async_get_purge_info(instance)
+        | _async_get_statistics_cache_info(hass)
+    )
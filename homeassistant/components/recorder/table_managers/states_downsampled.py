@@ -0,0 +1,51 @@
+"""Support managing StatesDownsampled."""
+
+from __future__ import annotations
+
+from sqlalchemy.orm.session import Session
+
+from ..queries import find_downsampled_states_compiled_until
+from ..util import execute_stmt_lambda_element
+
+
+class StatesDownsampledManager:
+    """Track how far the downsampled states tiers have been compiled."""
+
+    def __init__(self) -> None:
+        """Initialize the downsampled states manager."""
+        self._compiled_until: dict[int, float] = {}
+
+    def compiled_until(self, resolution: int) -> float | None:
+        """Return the timestamp the tier has been compiled up to.
+
+        All buckets of the tier starting before this timestamp are complete.
+        """
+        return self._compiled_until.get(resolution)
+
+    def update(self, compiled_until: dict[int, float]) -> None:
+        """Update the compiled timestamps after the buckets were committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._compiled_until.update(compiled_until)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._compiled_until.clear()
+
+    def load_from_db(self, session: Session) -> None:
+        """Load the compiled timestamps from the newest bucket of each tier.
+
+        Must run in the recorder thread.
+        """
+        self._compiled_until = {
+            resolution: start_ts + resolution
+            for resolution, start_ts in execute_stmt_lambda_element(
+                session, find_downsampled_states_compiled_until()
+            )
+        }
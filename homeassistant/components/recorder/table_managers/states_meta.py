@@ -5,11 +5,14 @@ from __future__ import annotations
 from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
-from homeassistant.core import Event, EventStateChangedData
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import Event, EventStateChangedData, State
 from homeassistant.util.collection import chunked_or_all
 
+from ..const import ALWAYS_CONTINUOUS_DOMAINS, CONDITIONALLY_CONTINUOUS_DOMAINS
 from ..db_schema import StatesMeta
 from ..queries import find_all_states_metadata_ids, find_states_metadata_ids
 from ..util import execute_stmt_lambda_element
@@ -21,6 +24,15 @@ if TYPE_CHECKING:
 CACHE_SIZE = 8192
 
 
+def is_continuous_state(state: State) -> bool:
+    """Return if the state belongs to a continuous entity."""
+    domain = state.domain
+    return domain in ALWAYS_CONTINUOUS_DOMAINS or (
+        domain in CONDITIONALLY_CONTINUOUS_DOMAINS
+        and ATTR_UNIT_OF_MEASUREMENT in state.attributes
+    )
+
+
 class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
     """Manage the StatesMeta table."""
 
@@ -29,6 +41,11 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the states meta manager."""
         self._did_first_load = False
+        # The continuous flags which are stored in the database
+        self._continuous: LRU[str, bool] = LRU(CACHE_SIZE)
+        # The continuous flags to store at the next commit and the metadata_ids
+        # of the entities, which are None for new entities
+        self._pending_continuous: dict[str, tuple[int | None, bool]] = {}
         super().__init__(recorder, CACHE_SIZE)
 
     def load(
@@ -131,6 +148,32 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         entity_id: str = db_states_meta.entity_id
         self._pending[entity_id] = db_states_meta
 
+    def set_continuous(
+        self, entity_id: str, metadata_id: int | None, continuous: bool
+    ) -> None:
+        """Set if an entity is continuous, it is stored at the next commit.
+
+        The metadata_id is None for a pending StatesMeta, which is inserted
+        with the flag.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self._continuous.get(entity_id) is not continuous:
+            self._pending_continuous[entity_id] = (metadata_id, continuous)
+
+    def get_pending_continuous(self) -> dict[int, bool]:
+        """Get the continuous flags to update by metadata_id.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return {
+            metadata_id: continuous
+            for metadata_id, continuous in self._pending_continuous.values()
+            if metadata_id is not None
+        }
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the metadata_ids of the new StatesMeta into the LRU.
 
@@ -140,6 +183,29 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         for entity_id, db_states_meta in self._pending.items():
             self._id_map[entity_id] = db_states_meta.metadata_id
         self._pending.clear()
+        for entity_id, (_, continuous) in self._pending_continuous.items():
+            self._continuous[entity_id] = continuous
+        self._pending_continuous.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._continuous.clear()
+        self._pending_continuous.clear()
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache size.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().adjust_lru_size(new_size)
+        if new_size > self._continuous.get_size():
+            self._continuous.set_size(new_size)
 
     def evict_purged(self, entity_ids: Iterable[str]) -> None:
         """Evict purged event_types from the cache when they are no longer used.
@@ -149,6 +215,7 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         """
         for entity_id in entity_ids:
             self._id_map.pop(entity_id, None)
+            self._continuous.pop(entity_id, None)
 
     def update_metadata(
         self,
@@ -165,4 +232,5 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
             {StatesMeta.entity_id: new_entity_id}
         )
         self._id_map.pop(entity_id, None)
+        self._continuous.pop(entity_id, None)
         return True
@@ -15,7 +15,8 @@ from homeassistant.helpers.recorder import DATA_RECORDER
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
-from . import entity_registry, purge, statistics
+from . import downsample, entity_registry, purge, repack, statistics
+from .const import SupportedDialect
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -124,6 +125,12 @@ class PurgeTask(RecorderTask):
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
             periodic_db_cleanups(instance)
+            if (
+                not self.repack
+                and instance.dialect_name == SupportedDialect.POSTGRESQL
+                and (purged_tables := instance.purge_progress.purged_tables)
+            ):
+                instance.queue_task(VacuumPurgedTablesTask(purged_tables))
             return
         # Schedule a new purge task if this one didn't finish
         instance.queue_task(
@@ -131,6 +138,17 @@ class PurgeTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class VacuumPurgedTablesTask(RecorderTask):
+    """An object to insert into the recorder queue to vacuum purged tables."""
+
+    tables: list[str]
+
+    def run(self, instance: Recorder) -> None:
+        """Vacuum the tables."""
+        repack.vacuum_purged_tables(instance, self.tables)
+
+
 @dataclass(slots=True)
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
@@ -185,6 +203,26 @@ class CompileMissingStatisticsTask(RecorderTask):
         instance.queue_task(CompileMissingStatisticsTask())
 
 
+@dataclass(slots=True)
+class DownsampleStatesTask(RecorderTask):
+    """An object to insert into the recorder queue to compile downsampled states."""
+
+    end: datetime
+
+    def run(self, instance: Recorder) -> None:
+        """Run downsampled states task."""
+        caught_up = True
+        try:
+            caught_up = downsample.compile_downsampled_states(instance, self.end)
+        finally:
+            if caught_up:
+                instance.downsample_task_queued = False
+        if not caught_up:
+            # Schedule a new downsampled states task if this one didn't catch
+            # up, it stays the only one queued until the tiers have caught up
+            instance.queue_task(DownsampleStatesTask(self.end))
+
+
 @dataclass(slots=True)
 class ImportStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an import statistics task."""
@@ -169,6 +169,7 @@ def execute_stmt_lambda_element(
     end_time: datetime | None = None,
     yield_per: int = DEFAULT_YIELD_STATES_ROWS,
     orm_rows: bool = True,
+    stream: bool = False,
 ) -> Sequence[Row] | Result:
     """Execute a StatementLambdaElement.
 
@@ -180,14 +181,24 @@ def execute_stmt_lambda_element(
     when selecting non-ranged rows (ie selecting
     specific entities) since they are usually faster
     with .all().
+
+    If stream is set the rows are always read yield_per
+    at a time with a server side cursor, where the database
+    supports them. The session must not be used for other
+    queries until all rows are read.
     """
-    use_all = not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
+    use_all = not stream and (
+        not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
+    )
+    kwargs: dict[str, Any] = (
+        {"execution_options": {"stream_results": True}} if stream else {}
+    )
     for tryno in range(RETRIES):
         try:
             if orm_rows:
-                executed = session.execute(stmt)
+                executed = session.execute(stmt, **kwargs)
             else:
-                executed = session.connection().execute(stmt)
+                executed = session.connection().execute(stmt, **kwargs)
             if use_all:
                 return executed.all()
             return executed.yield_per(yield_per)
@@ -13,6 +13,7 @@ from homeassistant.components.websocket_api import messages
 from homeassistant.core import HomeAssistant, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.unit_conversion import (
@@ -41,6 +42,7 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
+from .const import SIGNAL_PURGE_PROGRESS
 from .models import StatisticMeanType, StatisticPeriod
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
@@ -103,6 +105,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_import_statistics)
+    websocket_api.async_register_command(hass, ws_subscribe_purge_progress)
     websocket_api.async_register_command(hass, ws_update_statistics_issues)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
     websocket_api.async_register_command(hass, ws_validate_statistics)
@@ -334,6 +337,29 @@ async def ws_update_statistics_issues(
     connection.send_result(msg["id"])
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/subscribe_purge_progress",
+    }
+)
+@callback
+def ws_subscribe_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to the progress of the running or last finished purge."""
+
+    @callback
+    def _async_send_progress(progress: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], progress))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_PURGE_PROGRESS, _async_send_progress
+    )
+    connection.send_result(msg["id"])
+    _async_send_progress(get_instance(hass).async_purge_progress_data)
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
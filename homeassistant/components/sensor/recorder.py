@@ -7,10 +7,9 @@ from collections.abc import Callable, Iterable
 from contextlib import suppress
 from dataclasses import dataclass
 import datetime
-import itertools
 import logging
 import math
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -28,6 +27,9 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
@@ -121,78 +123,73 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
 
 
 def _time_weighted_arithmetic_mean(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    values: list[tuple[float, float]], start_ts: float, end_ts: float
 ) -> float:
     """Calculate a time weighted average.
 
-    The average is calculated by weighting the states by duration in seconds between
+    The values are tuples of the value and the timestamp it was last updated.
+    The average is calculated by weighting the values by duration in seconds between
     state changes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    old_value: float | None = None
+    old_start_ts: float | None = None
     accumulated = 0.0
 
-    for fstate, state in fstates:
+    for value, last_updated_ts in values:
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
-        if old_start_time is None:
+        start_time_ts = max(last_updated_ts, start_ts)
+        if old_start_ts is None:
             # Adjust start time, if there was no last known state
-            start = start_time
+            start_ts = start_time_ts
         else:
-            duration = start_time - old_start_time
             # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
+            assert old_value is not None
+            accumulated += old_value * (start_time_ts - old_start_ts)
 
-        old_fstate = fstate
-        old_start_time = start_time
+        old_value = value
+        old_start_ts = start_time_ts
 
-    if old_fstate is not None:
+    if old_value is not None:
         # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+        assert old_start_ts is not None
+        accumulated += old_value * (end_ts - old_start_ts)
 
-    return accumulated / (end - start).total_seconds()
+    return accumulated / (end_ts - start_ts)
 
 
 def _time_weighted_circular_mean(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    values: list[tuple[float, float]], start_ts: float, end_ts: float
 ) -> tuple[float, float]:
     """Calculate a time weighted circular mean.
 
-    The circular mean is calculated by weighting the states by duration in seconds between
-    state changes.
+    The values are tuples of the value and the timestamp it was last updated.
+    The circular mean is calculated by weighting the values by duration in seconds
+    between state changes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    values: list[tuple[float, float]] = []
+    old_value: float | None = None
+    old_start_ts: float | None = None
+    weighted_values: list[tuple[float, float]] = []
 
-    for fstate, state in fstates:
+    for value, last_updated_ts in values:
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = (start_time - old_start_time).total_seconds()
-            assert old_fstate is not None
-            values.append((old_fstate, duration))
+        start_time_ts = max(last_updated_ts, start_ts)
+        if old_start_ts is not None:
+            assert old_value is not None
+            weighted_values.append((old_value, start_time_ts - old_start_ts))
 
-        old_fstate = fstate
-        old_start_time = start_time
+        old_value = value
+        old_start_ts = start_time_ts
 
-    if old_fstate is not None:
+    if old_value is not None:
         # Add last value weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = (end - old_start_time).total_seconds()
-        values.append((old_fstate, duration))
+        assert old_start_ts is not None
+        weighted_values.append((old_value, end_ts - old_start_ts))
 
-    return statistics.weighted_circular_mean(values)
+    return statistics.weighted_circular_mean(weighted_values)
 
 
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
@@ -229,6 +226,66 @@ def _entity_history_to_float_and_state(
     return float_states
 
 
+def _state_to_compressed_state(state: State) -> dict[str, Any]:
+    """Return a state in the compressed format of the history."""
+    return {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: state.attributes,
+        COMPRESSED_STATE_LAST_UPDATED: state.last_updated_timestamp,
+    }
+
+
+def _compressed_history_to_float_values(
+    entity_history: Iterable[dict[str, Any]],
+) -> list[tuple[float, float, str | None]]:
+    """Return a list of (float, last updated timestamp, unit) tuples for the entity."""
+    float_values: list[tuple[float, float, str | None]] = []
+    append = float_values.append
+    isfinite = math.isfinite
+    for comp_state in entity_history:
+        try:
+            if (
+                float_state := float(comp_state[COMPRESSED_STATE_STATE])
+            ) is not None and isfinite(float_state):
+                append(
+                    (
+                        float_state,
+                        comp_state[COMPRESSED_STATE_LAST_UPDATED],
+                        comp_state[COMPRESSED_STATE_ATTRIBUTES].get(
+                            ATTR_UNIT_OF_MEASUREMENT
+                        ),
+                    )
+                )
+        except (ValueError, TypeError):
+            pass
+    return float_values
+
+
+def _values_without_normalization(
+    old_metadatas: dict[str, tuple[int, StatisticMetaData]],
+    float_values: list[tuple[float, float, str | None]],
+    entity_id: str,
+) -> tuple[str | None, list[tuple[float, float]]] | None:
+    """Return the unit and the values if the units need no normalization.
+
+    Returns None if the states have to be normalized by _normalize_states,
+    because a unit has to be converted or is not supported.
+    """
+    state_unit = float_values[0][2]
+    if entity_id in old_metadatas:
+        statistics_unit = old_metadatas[entity_id][1]["unit_of_measurement"]
+    else:
+        statistics_unit = state_unit
+    if statistics_unit in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER:
+        if any(unit != statistics_unit for _, _, unit in float_values):
+            return None
+    elif not _equivalent_units({unit for _, _, unit in float_values}):
+        return None
+    else:
+        statistics_unit = state_unit
+    return statistics_unit, [(value, ts) for value, ts, _ in float_values]
+
+
 def _is_numeric(state: State) -> bool:
     """Return if the state is numeric."""
     with suppress(ValueError, TypeError):
@@ -478,24 +535,43 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_full_history,
             significant_changes_only=False,
         )
+    # The states of sensors without a sum are read in the compressed format,
+    # which is much cheaper to build than State objects
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id].types
     ]
+    compressed_history_list: dict[str, list[dict[str, Any]]] = {}
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        compressed_history_list = cast(
+            dict[str, list[dict[str, Any]]],
+            history.get_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_significant_history,
+                compressed_state_format=True,
+            ),
         )
-        history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    entities_with_float_values: dict[str, list[tuple[float, float, str | None]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if "sum" not in wanted_statistics[entity_id].types:
+            try:
+                compressed_history = compressed_history_list[entity_id]
+            except KeyError:
+                compressed_history = (
+                    [_state_to_compressed_state(_state)]
+                    if _state.last_changed < end
+                    else []
+                )
+            if float_values := _compressed_history_to_float_values(compressed_history):
+                entities_with_float_values[entity_id] = float_values
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         try:
@@ -513,12 +589,64 @@ def compile_statistics(  # noqa: C901
     # that are not in the metadata table and we are not working
     # with them anyway.
     old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+        get_instance(hass),
+        session,
+        statistic_ids=set(entities_with_float_states) | set(entities_with_float_values),
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+
+    # The values of sensors without a sum which need their units normalized,
+    # or a warning about them, are built from State objects like the values
+    # of sensors with a sum
+    entities_values: dict[str, tuple[str | None, list[tuple[float, float]]]] = {}
+    entities_to_normalize: list[str] = []
+    for entity_id, float_values in entities_with_float_values.items():
+        if (
+            unit_and_values := _values_without_normalization(
+                old_metadatas, float_values, entity_id
+            )
+        ) is None:
+            entities_to_normalize.append(entity_id)
+        else:
+            entities_values[entity_id] = unit_and_values
+    if entities_to_normalize:
+        normalize_history_list = history.get_full_significant_states_with_session(
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=entities_to_normalize,
+        )
+        sensor_states_by_entity_id = {state.entity_id: state for state in sensor_states}
+        for entity_id in entities_to_normalize:
+            try:
+                entity_history = normalize_history_list[entity_id]
+            except KeyError:
+                _state = sensor_states_by_entity_id[entity_id]
+                entity_history = [_state] if _state.last_changed < end else []
+            if entity_history and (
+                float_states := _entity_history_to_float_and_state(entity_history)
+            ):
+                entities_with_float_states[entity_id] = float_states
+
+    # Sensors with a sum need the State objects of their float states, the
+    # other sensors only need their (value, last updated timestamp) pairs
+    to_process: list[
+        tuple[
+            str,
+            str | None,
+            str,
+            bool,
+            list[tuple[float, State]] | list[tuple[float, float]],
+        ]
+    ] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
+        state_class: str = _state.attributes[ATTR_STATE_CLASS]
+        if entity_id in entities_values:
+            statistics_unit, values = entities_values[entity_id]
+            to_process.append((entity_id, statistics_unit, state_class, False, values))
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -529,19 +657,36 @@ def compile_statistics(  # noqa: C901
         )
         if not valid_float_states:
             continue
-        state_class: str = _state.attributes[ATTR_STATE_CLASS]
-        to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
         if "sum" in wanted_statistics[entity_id].types:
             to_query.add(entity_id)
+            to_process.append(
+                (entity_id, statistics_unit, state_class, True, valid_float_states)
+            )
+        else:
+            to_process.append(
+                (
+                    entity_id,
+                    statistics_unit,
+                    state_class,
+                    False,
+                    [
+                        (fstate, state.last_updated_timestamp)
+                        for fstate, state in valid_float_states
+                    ],
+                )
+            )
 
     last_stats = statistics.get_latest_short_term_statistics_with_session(
         hass, session, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
     for (  # pylint: disable=too-many-nested-blocks
         entity_id,
         statistics_unit,
         state_class,
-        valid_float_states,
+        has_sum,
+        float_states,
     ) in to_process:
         mean_type = StatisticMeanType.NONE
         if "mean" in wanted_statistics[entity_id].types:
@@ -599,7 +744,7 @@ def compile_statistics(  # noqa: C901
         # Set meta data
         meta: StatisticMetaData = {
             "mean_type": mean_type,
-            "has_sum": "sum" in wanted_statistics[entity_id].types,
+            "has_sum": has_sum,
             "name": None,
             "source": RECORDER_DOMAIN,
             "statistic_id": entity_id,
@@ -608,26 +753,23 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id].types:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id].types:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-
-        match mean_type:
-            case StatisticMeanType.ARITHMETIC:
-                stat["mean"] = _time_weighted_arithmetic_mean(
-                    valid_float_states, start, end
-                )
-            case StatisticMeanType.CIRCULAR:
-                stat["mean"], stat["mean_weight"] = _time_weighted_circular_mean(
-                    valid_float_states, start, end
-                )
-
-        if "sum" in wanted_statistics[entity_id].types:
+        if not has_sum:
+            values = cast(list[tuple[float, float]], float_states)
+            if "max" in wanted_statistics[entity_id].types:
+                stat["max"] = max(value for value, _ in values)
+            if "min" in wanted_statistics[entity_id].types:
+                stat["min"] = min(value for value, _ in values)
+
+            match mean_type:
+                case StatisticMeanType.ARITHMETIC:
+                    stat["mean"] = _time_weighted_arithmetic_mean(
+                        values, start_ts, end_ts
+                    )
+                case StatisticMeanType.CIRCULAR:
+                    stat["mean"], stat["mean_weight"] = _time_weighted_circular_mean(
+                        values, start_ts, end_ts
+                    )
+        else:
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0.0
@@ -643,7 +785,7 @@ def compile_statistics(  # noqa: C901
                 new_state = old_state = last_stat.get("state")
                 _sum = last_stat.get("sum") or 0.0
 
-            for fstate, state in valid_float_states:
+            for fstate, state in cast(list[tuple[float, State]], float_states):
                 reset = False
                 if (
                     state_class != SensorStateClass.TOTAL_INCREASING
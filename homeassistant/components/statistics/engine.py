@@ -0,0 +1,545 @@
+"""Incremental engines for the characteristics of the statistics sensor."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from itertools import islice
+import math
+
+from homeassistant.util import dt as dt_util
+
+type CharacteristicFn = Callable[
+    [deque[bool | float], deque[float], int], float | int | datetime | None
+]
+
+
+class StatisticEngine(ABC):
+    """Keep a characteristic up to date while samples enter and leave the buffer.
+
+    add is called after a sample was appended to the buffer and remove right
+    before the oldest sample leaves it, so each update only looks at the
+    samples next to the one that moved. While the buffer holds a non-finite
+    sample the characteristic is computed over the whole buffer instead,
+    since it would poison the running values until the engine is rebuilt.
+    """
+
+    # Engines with running float values are rebuilt from the buffer after
+    # as many removals as there are samples, this bounds the rounding errors
+    # of the subtractions at an amortized O(1) cost
+    rebuild_after_removals = True
+
+    def __init__(self, fallback: CharacteristicFn) -> None:
+        """Initialize the engine."""
+        self._fallback = fallback
+        self._non_finite = 0
+        self._removals = 0
+        self._reset()
+
+    def add(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Add the newest sample of the buffer."""
+        if not math.isfinite(states[-1]):
+            self._non_finite += 1
+        elif not self._non_finite:
+            self._add(states, ages)
+
+    def remove(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Remove the oldest sample of the buffer."""
+        if not self._non_finite:
+            self._removals += 1
+            if self.rebuild_after_removals and self._removals >= len(states):
+                self._rebuild(states, ages)
+            else:
+                self._remove(states, ages)
+            return
+        if math.isfinite(states[0]):
+            return
+        self._non_finite -= 1
+        if not self._non_finite:
+            # The last non-finite sample is leaving
+            self._rebuild(states, ages)
+
+    def _rebuild(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Rebuild the running values from the buffer without its oldest sample."""
+        self._removals = 0
+        self._reset()
+        rebuilt_states: deque[bool | float] = deque()
+        rebuilt_ages: deque[float] = deque()
+        for state, age in islice(zip(states, ages, strict=True), 1, None):
+            rebuilt_states.append(state)
+            rebuilt_ages.append(age)
+            self._add(rebuilt_states, rebuilt_ages)
+
+    def value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | int | datetime | None:
+        """Return the characteristic of the buffer."""
+        if self._non_finite:
+            return self._fallback(states, ages, percentile)
+        return self._value(states, ages, percentile)
+
+    @abstractmethod
+    def _reset(self) -> None:
+        """Reset the running values for an empty buffer."""
+
+    @abstractmethod
+    def _add(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Add the newest sample to the running values."""
+
+    @abstractmethod
+    def _remove(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Remove the oldest sample from the running values."""
+
+    @abstractmethod
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | int | datetime | None:
+        """Return the characteristic from the running values."""
+
+
+class SumEngine(StatisticEngine):
+    """Running sum of the samples."""
+
+    _sum: float
+
+    def _reset(self) -> None:
+        self._sum = 0.0
+
+    def _add(self, states: deque[bool | float], ages: deque[float]) -> None:
+        self._sum += states[-1]
+
+    def _remove(self, states: deque[bool | float], ages: deque[float]) -> None:
+        if len(states) == 1:
+            self._sum = 0.0
+        else:
+            self._sum -= states[0]
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) > 0:
+            return self._sum
+        return None
+
+
+class MeanEngine(SumEngine):
+    """Running mean of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) > 0:
+            return self._sum / len(states)
+        return None
+
+
+class VarianceEngine(StatisticEngine):
+    """Running sample variance of the samples with Welford's algorithm."""
+
+    _count: int
+    _mean: float
+    _m2: float
+
+    def _reset(self) -> None:
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _add(self, states: deque[bool | float], ages: deque[float]) -> None:
+        value = states[-1]
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def _remove(self, states: deque[bool | float], ages: deque[float]) -> None:
+        if self._count == 1:
+            self._reset()
+            return
+        value = states[0]
+        count = self._count - 1
+        delta = value - self._mean
+        mean = self._mean - delta / count
+        m2 = self._m2 - delta * (value - mean)
+        if m2 < self._m2 / 1024:
+            # Removing an outlier cancels most of the sum of squares along
+            # with its precision
+            self._rebuild(states, ages)
+            return
+        self._count = count
+        self._mean = mean
+        self._m2 = m2
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) == 1:
+            return 0.0
+        if len(states) >= 2:
+            return self._m2 / (self._count - 1)
+        return None
+
+
+class StandardDeviationEngine(VarianceEngine):
+    """Running sample standard deviation of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if (variance := super()._value(states, ages, percentile)) is None:
+            return None
+        return math.sqrt(variance)
+
+
+class Distance95PercentEngine(StandardDeviationEngine):
+    """Running distance 95% of the samples fall within."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if (deviation := super()._value(states, ages, percentile)) is None:
+            return None
+        return 2 * 1.96 * deviation
+
+
+class Distance99PercentEngine(StandardDeviationEngine):
+    """Running distance 99% of the samples fall within."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if (deviation := super()._value(states, ages, percentile)) is None:
+            return None
+        return 2 * 2.58 * deviation
+
+
+class ExtremesEngine(StatisticEngine):
+    """Running minimum and maximum of the samples with monotonic deques.
+
+    The deques hold (value, sequence number) of the samples that can still
+    become the extreme. Equal values keep the oldest first, like
+    states.index() does for the full computation.
+    """
+
+    rebuild_after_removals = False
+
+    _added: int
+    _removed: int
+    _max: deque[tuple[float, int]]
+    _min: deque[tuple[float, int]]
+
+    def _reset(self) -> None:
+        self._added = 0
+        self._removed = 0
+        self._max = deque()
+        self._min = deque()
+
+    def _add(self, states: deque[bool | float], ages: deque[float]) -> None:
+        value = states[-1]
+        while self._max and self._max[-1][0] < value:
+            self._max.pop()
+        self._max.append((value, self._added))
+        while self._min and self._min[-1][0] > value:
+            self._min.pop()
+        self._min.append((value, self._added))
+        self._added += 1
+
+    def _remove(self, states: deque[bool | float], ages: deque[float]) -> None:
+        if self._max[0][1] == self._removed:
+            self._max.popleft()
+        if self._min[0][1] == self._removed:
+            self._min.popleft()
+        self._removed += 1
+
+    def _age(self, ages: deque[float], extreme: tuple[float, int]) -> datetime:
+        """Return the age of an extreme sample."""
+        return dt_util.utc_from_timestamp(ages[extreme[1] - self._removed])
+
+
+class ValueMaxEngine(ExtremesEngine):
+    """Running maximum of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) > 0:
+            return self._max[0][0]
+        return None
+
+
+class ValueMinEngine(ExtremesEngine):
+    """Running minimum of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) > 0:
+            return self._min[0][0]
+        return None
+
+
+class DistanceAbsoluteEngine(ExtremesEngine):
+    """Running distance between the minimum and the maximum of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) > 0:
+            return self._max[0][0] - self._min[0][0]
+        return None
+
+
+class DatetimeValueMaxEngine(ExtremesEngine):
+    """Running age of the maximum of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> datetime | None:
+        if len(states) > 0:
+            return self._age(ages, self._max[0])
+        return None
+
+
+class DatetimeValueMinEngine(ExtremesEngine):
+    """Running age of the minimum of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> datetime | None:
+        if len(states) > 0:
+            return self._age(ages, self._min[0])
+        return None
+
+
+class MedianEngine(StatisticEngine):
+    """Running median of the samples kept in a sorted list."""
+
+    rebuild_after_removals = False
+
+    _sorted: list[bool | float]
+
+    def _reset(self) -> None:
+        self._sorted = []
+
+    def _add(self, states: deque[bool | float], ages: deque[float]) -> None:
+        insort(self._sorted, states[-1])
+
+    def _remove(self, states: deque[bool | float], ages: deque[float]) -> None:
+        del self._sorted[bisect_left(self._sorted, states[0])]
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        data = self._sorted
+        if not (length := len(data)):
+            return None
+        middle = length // 2
+        if length % 2:
+            return data[middle]
+        return (data[middle - 1] + data[middle]) / 2
+
+
+class PercentileEngine(MedianEngine):
+    """Running percentile of the samples kept in a sorted list."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        data = self._sorted
+        length = len(data)
+        if length == 1:
+            return data[0]
+        if length >= 2:
+            # The exclusive method of statistics.quantiles for one cut point
+            scaled = percentile * (length + 1)
+            index = min(max(scaled // 100, 1), length - 1)
+            delta = scaled - index * 100
+            return (data[index - 1] * (100 - delta) + data[index] * delta) / 100
+        return None
+
+
+class LinearAreaEngine(StatisticEngine):
+    """Running time weighted average with linear interpolation of the samples."""
+
+    _area: float
+
+    def _reset(self) -> None:
+        self._area = 0.0
+
+    def _add(self, states: deque[bool | float], ages: deque[float]) -> None:
+        if len(states) >= 2:
+            self._area += 0.5 * (states[-1] + states[-2]) * (ages[-1] - ages[-2])
+
+    def _remove(self, states: deque[bool | float], ages: deque[float]) -> None:
+        if len(states) <= 2:
+            self._area = 0.0
+        else:
+            self._area -= 0.5 * (states[0] + states[1]) * (ages[1] - ages[0])
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) == 1:
+            return states[0]
+        if len(states) >= 2:
+            return self._area / (ages[-1] - ages[0])
+        return None
+
+
+class StepAreaEngine(LinearAreaEngine):
+    """Running time weighted average with step interpolation of the samples."""
+
+    def _add(self, states: deque[bool | float], ages: deque[float]) -> None:
+        if len(states) >= 2:
+            self._area += states[-2] * (ages[-1] - ages[-2])
+
+    def _remove(self, states: deque[bool | float], ages: deque[float]) -> None:
+        if len(states) <= 2:
+            self._area = 0.0
+        else:
+            self._area -= states[0] * (ages[1] - ages[0])
+
+
+class BinaryStepAreaEngine(StepAreaEngine):
+    """Running percentage of time a binary source was on."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) == 1:
+            return 100.0 * int(states[0] is True)
+        if len(states) >= 2:
+            return 100 / (ages[-1] - ages[0]) * self._area
+        return None
+
+
+class SumDifferencesEngine(StatisticEngine):
+    """Running sum of the absolute differences between consecutive samples."""
+
+    _sum: float
+
+    def _reset(self) -> None:
+        self._sum = 0.0
+
+    @staticmethod
+    def _difference(previous: float, value: float) -> float:
+        return abs(value - previous)
+
+    def _add(self, states: deque[bool | float], ages: deque[float]) -> None:
+        if len(states) >= 2:
+            self._sum += self._difference(states[-2], states[-1])
+
+    def _remove(self, states: deque[bool | float], ages: deque[float]) -> None:
+        if len(states) <= 2:
+            self._sum = 0.0
+        else:
+            self._sum -= self._difference(states[0], states[1])
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) == 1:
+            return 0.0
+        if len(states) >= 2:
+            return self._sum
+        return None
+
+
+class SumDifferencesNonnegativeEngine(SumDifferencesEngine):
+    """Running sum of the increases between consecutive samples.
+
+    A decrease counts as a reset of the source to zero.
+    """
+
+    @staticmethod
+    def _difference(previous: float, value: float) -> float:
+        return value - previous if value >= previous else value
+
+
+class NoisinessEngine(SumDifferencesEngine):
+    """Running mean absolute difference between consecutive samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) == 1:
+            return 0.0
+        if len(states) >= 2:
+            return self._sum / (len(states) - 1)
+        return None
+
+
+class MeanCircularEngine(StatisticEngine):
+    """Running circular mean of samples in degrees."""
+
+    _sin_sum: float
+    _cos_sum: float
+
+    def _reset(self) -> None:
+        self._sin_sum = 0.0
+        self._cos_sum = 0.0
+
+    def _add(self, states: deque[bool | float], ages: deque[float]) -> None:
+        radians = math.radians(states[-1])
+        self._sin_sum += math.sin(radians)
+        self._cos_sum += math.cos(radians)
+
+    def _remove(self, states: deque[bool | float], ages: deque[float]) -> None:
+        if len(states) == 1:
+            self._reset()
+            return
+        radians = math.radians(states[0])
+        self._sin_sum -= math.sin(radians)
+        self._cos_sum -= math.cos(radians)
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) > 0:
+            return (math.degrees(math.atan2(self._sin_sum, self._cos_sum)) + 360) % 360
+        return None
+
+
+class BinaryCountEngine(StatisticEngine):
+    """Running count of the on samples of a binary source."""
+
+    rebuild_after_removals = False
+
+    _on: int
+
+    def _reset(self) -> None:
+        self._on = 0
+
+    def _add(self, states: deque[bool | float], ages: deque[float]) -> None:
+        self._on += states[-1] is True
+
+    def _remove(self, states: deque[bool | float], ages: deque[float]) -> None:
+        self._on -= states[0] is True
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> int | None:
+        return self._on
+
+
+class BinaryCountOffEngine(BinaryCountEngine):
+    """Running count of the off samples of a binary source."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> int | None:
+        return len(states) - self._on
+
+
+class BinaryMeanEngine(BinaryCountEngine):
+    """Running percentage of on samples of a binary source."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) > 0:
+            return 100.0 / len(states) * self._on
+        return None
@@ -15,7 +15,7 @@ from typing import Any, cast
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import history
 from homeassistant.components.sensor import (
     DEVICE_CLASS_STATE_CLASSES,
     DEVICE_CLASS_UNITS,
@@ -62,6 +62,32 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .engine import (
+    BinaryCountEngine,
+    BinaryCountOffEngine,
+    BinaryMeanEngine,
+    BinaryStepAreaEngine,
+    DatetimeValueMaxEngine,
+    DatetimeValueMinEngine,
+    Distance95PercentEngine,
+    Distance99PercentEngine,
+    DistanceAbsoluteEngine,
+    LinearAreaEngine,
+    MeanCircularEngine,
+    MeanEngine,
+    MedianEngine,
+    NoisinessEngine,
+    PercentileEngine,
+    StandardDeviationEngine,
+    StatisticEngine,
+    StepAreaEngine,
+    SumDifferencesEngine,
+    SumDifferencesNonnegativeEngine,
+    SumEngine,
+    ValueMaxEngine,
+    ValueMinEngine,
+    VarianceEngine,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -112,6 +138,16 @@ def _callable_characteristic_fn(
     return STATS_NUMERIC_SUPPORT[characteristic]
 
 
+def _create_characteristic_engine(
+    characteristic: str, binary: bool
+) -> StatisticEngine | None:
+    """Return the incremental engine of one characteristic if it has one."""
+    engines = STATS_BINARY_ENGINES if binary else STATS_NUMERIC_ENGINES
+    if (engine := engines.get(characteristic)) is None:
+        return None
+    return engine(_callable_characteristic_fn(characteristic, binary))
+
+
 # Statistics for numeric sensor
 
 
@@ -470,6 +506,41 @@ STATS_BINARY_SUPPORT = {
     STAT_MEAN: _stat_binary_mean,
 }
 
+# Engines updating a characteristic incrementally instead of computing it over
+# the whole buffer, characteristics that only look at the ends of the buffer
+# do not need one
+STATS_NUMERIC_ENGINES: dict[str, type[StatisticEngine]] = {
+    STAT_AVERAGE_LINEAR: LinearAreaEngine,
+    STAT_AVERAGE_STEP: StepAreaEngine,
+    STAT_AVERAGE_TIMELESS: MeanEngine,
+    STAT_DATETIME_VALUE_MAX: DatetimeValueMaxEngine,
+    STAT_DATETIME_VALUE_MIN: DatetimeValueMinEngine,
+    STAT_DISTANCE_95P: Distance95PercentEngine,
+    STAT_DISTANCE_99P: Distance99PercentEngine,
+    STAT_DISTANCE_ABSOLUTE: DistanceAbsoluteEngine,
+    STAT_MEAN: MeanEngine,
+    STAT_MEAN_CIRCULAR: MeanCircularEngine,
+    STAT_MEDIAN: MedianEngine,
+    STAT_NOISINESS: NoisinessEngine,
+    STAT_PERCENTILE: PercentileEngine,
+    STAT_STANDARD_DEVIATION: StandardDeviationEngine,
+    STAT_SUM: SumEngine,
+    STAT_SUM_DIFFERENCES: SumDifferencesEngine,
+    STAT_SUM_DIFFERENCES_NONNEGATIVE: SumDifferencesNonnegativeEngine,
+    STAT_TOTAL: SumEngine,
+    STAT_VALUE_MAX: ValueMaxEngine,
+    STAT_VALUE_MIN: ValueMinEngine,
+    STAT_VARIANCE: VarianceEngine,
+}
+
+STATS_BINARY_ENGINES: dict[str, type[StatisticEngine]] = {
+    STAT_AVERAGE_STEP: BinaryStepAreaEngine,
+    STAT_AVERAGE_TIMELESS: BinaryMeanEngine,
+    STAT_COUNT_BINARY_ON: BinaryCountEngine,
+    STAT_COUNT_BINARY_OFF: BinaryCountOffEngine,
+    STAT_MEAN: BinaryMeanEngine,
+}
+
 STATS_NOT_A_NUMBER = {
     STAT_DATETIME_NEWEST,
     STAT_DATETIME_OLDEST,
@@ -700,6 +771,11 @@ class StatisticsSensor(SensorEntity):
             [deque[bool | float], deque[float], int],
             float | int | datetime | None,
         ] = _callable_characteristic_fn(state_characteristic, self.is_binary)
+        self._engine = _create_characteristic_engine(
+            state_characteristic, self.is_binary
+        )
+        if self._engine:
+            self._state_characteristic_fn = self._engine.value
 
         self._update_listener: CALLBACK_TYPE | None = None
         self._preview_callback: Callable[[str, Mapping[str, Any]], None] | None = None
@@ -805,12 +881,13 @@ class StatisticsSensor(SensorEntity):
             return
 
         try:
+            value: bool | float
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(last_reported_timestamp)
+                value = float(new_state.state)
+            self._append_sample(value, last_reported_timestamp)
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -823,6 +900,15 @@ class StatisticsSensor(SensorEntity):
 
         self._calculate_state_attributes(new_state)
 
+    def _append_sample(self, value: bool | float, timestamp: float) -> None:
+        """Append a sample to the buffer, dropping the oldest if it is full."""
+        if self._engine and len(self.states) == self.states.maxlen:
+            self._engine.remove(self.states, self.ages)
+        self.states.append(value)
+        self.ages.append(timestamp)
+        if self._engine:
+            self._engine.add(self.states, self.ages)
+
     def _calculate_state_attributes(self, new_state: State) -> None:
         """Set the entity state attributes."""
 
@@ -954,6 +1040,8 @@ class StatisticsSensor(SensorEntity):
                     dt_util.as_local(dt_util.utc_from_timestamp(self.ages[0])),
                     dt_util.utc_from_timestamp(now_timestamp - self.ages[0]),
                 )
+            if self._engine:
+                self._engine.remove(self.states, self.ages)
             self.ages.popleft()
             self.states.popleft()
 
@@ -1026,10 +1114,9 @@ class StatisticsSensor(SensorEntity):
         if not self._preview_callback:
             self.async_write_ha_state()
 
-    def _fetch_states_from_database(self) -> list[State]:
+    async def _async_fetch_states_from_database(self) -> list[State]:
         """Fetch the states from the database."""
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
-        lower_entity_id = self._source_entity_id.lower()
         if (max_age := self._samples_max_age) is not None:
             start_date = (
                 dt_util.utcnow()
@@ -1044,14 +1131,14 @@ class StatisticsSensor(SensorEntity):
         else:
             start_date = datetime.fromtimestamp(0, tz=dt_util.UTC)
             _LOGGER.debug("%s: retrieving all records", self.entity_id)
-        return history.state_changes_during_period(
+        return await history.async_state_changes_during_period(
             self.hass,
             start_date,
-            entity_id=lower_entity_id,
+            entity_id=self._source_entity_id,
             descending=True,
             limit=self._samples_max_buffer_size,
             include_start_time_state=False,
-        ).get(lower_entity_id, [])
+        )
 
     async def _initialize_from_database(self) -> None:
         """Initialize the list of states from the database.
@@ -1062,10 +1149,11 @@ class StatisticsSensor(SensorEntity):
 
         If MaxAge is provided then query will restrict to entries younger then
         current datetime - MaxAge.
+
+        While Home Assistant starts the query is shared with the other
+        helpers loading their history.
         """
-        if states := await get_instance(self.hass).async_add_executor_job(
-            self._fetch_states_from_database
-        ):
+        if states := await self._async_fetch_states_from_database():
             for state in reversed(states):
                 self._add_state_to_queue(state, state.last_reported_timestamp)
                 self._calculate_state_attributes(state)
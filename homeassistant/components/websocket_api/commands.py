@@ -105,6 +105,7 @@ def async_register_commands(
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_template_profile)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_condition_platforms)
     async_reg(hass, handle_subscribe_events)
@@ -798,6 +799,36 @@ async def handle_render_template(
     hass.loop.call_soon_threadsafe(info.async_refresh)
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "template/profile",
+        vol.Optional("enabled"): bool,
+    }
+)
+@decorators.require_admin
+def handle_template_profile(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle template profile command.
+
+    Enables or disables profiling of template renders if requested and
+    returns the compiled template cache info and the collected render
+    statistics, the most expensive templates first.
+    """
+    if (enabled := msg.get("enabled")) is not None:
+        template.async_set_template_profiling(hass, enabled)
+    profiler = template.async_get_template_profiler(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "enabled": profiler is not None,
+            "cache": template.compiled_template_cache_info(),
+            "templates": profiler.async_stats() if profiler else [],
+        },
+    )
+
+
 def _serialize_entity_sources(
     entity_infos: dict[str, entity.EntityInfo],
 ) -> dict[str, Any]:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Coroutine, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -40,6 +40,7 @@ class ActiveConnection:
     """Handle an active websocket client connection."""
 
     __slots__ = (
+        "_wait_for_drain",
         "binary_handlers",
         "can_coalesce",
         "handlers",
@@ -60,8 +61,10 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        wait_for_drain: Callable[[int], Coroutine[Any, Any, None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
+        self._wait_for_drain = wait_for_drain
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
@@ -129,6 +132,17 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    async def async_wait_for_drain(self, max_pending: int) -> None:
+        """Wait until at most max_pending messages are waiting to be written.
+
+        Commands that send a large response as successive messages await
+        this between messages so a slow client cannot make the write
+        queue grow without bound. Returns right away if the connection
+        is closing.
+        """
+        if self._wait_for_drain is not None:
+            await self._wait_for_drain(max_pending)
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
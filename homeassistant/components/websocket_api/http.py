@@ -74,6 +74,7 @@ class WebSocketHandler:
         "_closing",
         "_connection",
         "_debug",
+        "_drain_future",
         "_handle_task",
         "_hass",
         "_logger",
@@ -108,6 +109,7 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        self._drain_future: asyncio.Future[None] | None = None
         self._async_logging_changed()
 
     @callback
@@ -166,13 +168,17 @@ class WebSocketHandler:
                     if self._debug:
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
-                    continue
+                else:
+                    coalesced_messages = b"".join(
+                        (b"[", b",".join(message_queue), b"]")
+                    )
+                    message_queue.clear()
+                    if self._debug:
+                        debug("%s: Sending %s", self.description, coalesced_messages)
+                    await send_bytes_text(coalesced_messages)
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
-                if self._debug:
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                if self._drain_future is not None:
+                    self._release_drain_future()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -182,6 +188,7 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drain_future()
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -190,6 +197,25 @@ class WebSocketHandler:
             self._peak_checker_unsub()
             self._peak_checker_unsub = None
 
+    @callback
+    def _release_drain_future(self) -> None:
+        """Wake up the command waiting for the queue to drain."""
+        if (drain_future := self._drain_future) is not None:
+            self._drain_future = None
+            if not drain_future.done():
+                drain_future.set_result(None)
+
+    async def _async_wait_for_drain(self, max_pending: int) -> None:
+        """Wait until at most max_pending messages are in the queue.
+
+        The writer releases the waiter every time it wrote to the
+        socket, it stops waiting when the connection is closing.
+        """
+        while not self._closing and len(self._message_queue) > max_pending:
+            if self._drain_future is None:
+                self._drain_future = self._loop.create_future()
+            await self._drain_future
+
     @callback
     def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
         """Queue sending a message to the client.
@@ -294,6 +320,7 @@ class WebSocketHandler:
         """Cancel the connection."""
         self._closing = True
         self._cancel_peak_checker()
+        self._release_drain_future()
         if self._handle_task is not None:
             self._handle_task.cancel()
         if self._writer_task is not None:
@@ -341,7 +368,13 @@ class WebSocketHandler:
 
         send_bytes_text = partial(writer.send_frame, opcode=WSMsgType.TEXT)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._async_wait_for_drain,
         )
         connection: ActiveConnection | None = None
         disconnect_warn: str | None = None
@@ -374,6 +407,7 @@ class WebSocketHandler:
             self._closing = True
             if self._ready_future and not self._ready_future.done():
                 self._ready_future.set_result(len(self._message_queue))
+            self._release_drain_future()
 
             await self._async_cleanup_writer_and_close(disconnect_warn, connection)
 
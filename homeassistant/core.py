@@ -12,17 +12,20 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 import datetime
 import enum
 import functools
 import inspect
+from itertools import islice
 import logging
 import re
 import threading
@@ -1443,6 +1446,62 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+type _IndexJobs = dict[str, list[HassJob[[Event[Any]], Any]]]
+
+
+@dataclass(slots=True)
+class _EventIndexes:
+    """Jobs of an event type indexed by the entity_id or domain of the event data.
+
+    The indexes are looked up by the event bus when the event is fired,
+    the domain indexes are kept per event filter.
+    """
+
+    entity_ids: _IndexJobs = field(default_factory=dict)
+    domains: dict[Callable[[Any], bool] | None, _IndexJobs] = field(
+        default_factory=dict
+    )
+
+    @property
+    def listeners(self) -> int:
+        """Return the number of indexes, each counts as one listener."""
+        return bool(self.entity_ids) + len(self.domains)
+
+    @property
+    def jobs(self) -> int:
+        """Return the number of jobs in the indexes."""
+        return len(
+            {
+                job
+                for index in (self.entity_ids, *self.domains.values())
+                for jobs in index.values()
+                for job in jobs
+            }
+        )
+
+
+@dataclass(slots=True)
+class EventListenerStatistics:
+    """Statistics of dispatching an event type to its listeners."""
+
+    fired: int = 0
+    dispatched: int = 0
+    dispatch_time: float = 0.0
+    slowest_listener: str | None = None
+    slowest_listener_time: float = 0.0
+
+    def as_dict(self, listeners: int) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "listeners": listeners,
+            "fired": self.fired,
+            "dispatched": self.dispatched,
+            "dispatch_time": self.dispatch_time,
+            "slowest_listener": self.slowest_listener,
+            "slowest_listener_time": self.slowest_listener_time,
+        }
+
+
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
@@ -1457,14 +1516,28 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_indexes",
+        "_listener_statistics",
+        "_listeners",
+        "_listeners_generation",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
+        # Changes whenever a listener is added or removed
+        self._listeners_generation = 0
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
+        self._indexes: dict[EventType[Any] | str, _EventIndexes] = {}
+        self._listener_statistics: (
+            defaultdict[EventType[Any] | str, EventListenerStatistics] | None
+        ) = None
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
         self._async_logging_changed()
@@ -1481,7 +1554,234 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, indexes in self._indexes.items():
+            listeners[event_type] = listeners.get(event_type, 0) + indexes.listeners
+        return listeners
+
+    @callback
+    def async_enable_listener_statistics(self) -> None:
+        """Start collecting dispatch statistics per event type.
+
+        Collecting statistics adds overhead to every event fired, so
+        it should only be enabled while investigating performance.
+
+        This method must be run in the event loop.
+        """
+        if self._listener_statistics is None:
+            self._listener_statistics = defaultdict(EventListenerStatistics)
+
+    @callback
+    def async_disable_listener_statistics(self) -> None:
+        """Stop collecting and discard dispatch statistics.
+
+        This method must be run in the event loop.
+        """
+        self._listener_statistics = None
+
+    @callback
+    def async_listener_statistics(self) -> dict[EventType[Any] | str, dict[str, Any]]:
+        """Return the dispatch statistics per event type.
+
+        This method must be run in the event loop.
+        """
+        if self._listener_statistics is None:
+            return {}
+        return {
+            event_type: statistics.as_dict(
+                len(self._listeners.get(event_type, EMPTY_LIST))
+                + (indexes.jobs if (indexes := self._indexes.get(event_type)) else 0)
+            )
+            for event_type, statistics in self._listener_statistics.items()
+        }
+
+    @callback
+    def _async_run_job_with_statistics(
+        self,
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event: Event[_DataT],
+        statistics: EventListenerStatistics,
+    ) -> None:
+        """Run a listener job, recording how long it took."""
+        start = time.perf_counter()
+        try:
+            self._hass.async_run_hass_job(job, event)
+        except Exception:
+            _LOGGER.exception("Error running job: %s", job)
+        duration = time.perf_counter() - start
+        statistics.dispatched += 1
+        statistics.dispatch_time += duration
+        if duration > statistics.slowest_listener_time:
+            statistics.slowest_listener_time = duration
+            statistics.slowest_listener = str(job)
+
+    @callback
+    def _async_dispatch(
+        self,
+        listeners: list[_FilterableJobType[_DataT]],
+        type_listeners: int,
+        event_type: EventType[_DataT] | str,
+        event_data: _DataT | None,
+        origin: EventOrigin,
+        time_fired: float | None,
+        context: Context | None,
+    ) -> None:
+        """Dispatch an event to the listeners and the indexes of its type.
+
+        The listeners start with the listeners of the event type, followed
+        by the MATCH_ALL listeners. The jobs of the indexes of the event
+        type run in between.
+        """
+        statistics: EventListenerStatistics | None = None
+        if self._listener_statistics is not None:
+            statistics = self._listener_statistics[event_type]
+            statistics.fired += 1
+
+        if (
+            (indexes := self._indexes.get(event_type)) is None
+            or event_data is None
+            or (entity_id := event_data.get("entity_id")) is None
+        ):
+            self._async_run_listeners(
+                listeners,
+                event_type,
+                event_data,
+                origin,
+                time_fired,
+                context,
+                None,
+                statistics,
+            )
+            return
+
+        event = self._async_run_listeners(
+            islice(listeners, type_listeners),
+            event_type,
+            event_data,
+            origin,
+            time_fired,
+            context,
+            None,
+            statistics,
+        )
+        if not event:
+            event = Event(event_type, event_data, origin, time_fired, context)
+        self._async_dispatch_indexes(indexes, entity_id, event, statistics)
+        if len(listeners) > type_listeners:
+            self._async_run_listeners(
+                islice(listeners, type_listeners, None),
+                event_type,
+                event_data,
+                origin,
+                time_fired,
+                context,
+                event,
+                statistics,
+            )
+
+    @callback
+    def _async_run_listeners(
+        self,
+        listeners: Iterable[_FilterableJobType[_DataT]],
+        event_type: EventType[_DataT] | str,
+        event_data: _DataT | None,
+        origin: EventOrigin,
+        time_fired: float | None,
+        context: Context | None,
+        event: Event[_DataT] | None,
+        statistics: EventListenerStatistics | None,
+    ) -> Event[_DataT] | None:
+        """Run the listeners whose filter accepts an event.
+
+        The event is created for the first listener which runs and returned.
+        """
+        for job, event_filter in listeners:
+            if event_filter is not None:
+                try:
+                    if event_data is None or not event_filter(event_data):
+                        continue
+                except Exception:
+                    _LOGGER.exception("Error in event filter")
+                    continue
+
+            if not event:
+                event = Event(
+                    event_type,
+                    event_data,
+                    origin,
+                    time_fired,
+                    context,
+                )
+
+            if statistics is not None:
+                self._async_run_job_with_statistics(job, event, statistics)
+                continue
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+        return event
+
+    @callback
+    def _async_dispatch_indexes(
+        self,
+        indexes: _EventIndexes,
+        entity_id: str,
+        event: Event[_DataT],
+        statistics: EventListenerStatistics | None,
+    ) -> None:
+        """Dispatch an event to the jobs of its entity_id and domain."""
+        if entity_id in indexes.entity_ids:
+            # One event loop iteration runs before the jobs of an entity_id
+            self._hass.loop.call_soon(
+                self._async_dispatch_entity_id, indexes.entity_ids, event
+            )
+        if not indexes.domains:
+            return
+        domain = entity_id.partition(".")[0]
+        for index_filter, jobs in list(indexes.domains.items()):
+            if not (
+                domain_jobs := jobs.get(domain, EMPTY_LIST)
+                + jobs.get(MATCH_ALL, EMPTY_LIST)
+            ):
+                continue
+            if index_filter is not None:
+                try:
+                    if not index_filter(event.data):
+                        continue
+                except Exception:
+                    _LOGGER.exception("Error in event filter")
+                    continue
+            self._async_run_indexed_jobs(domain_jobs, event, statistics)
+
+    @callback
+    def _async_run_indexed_jobs(
+        self,
+        jobs: list[HassJob[[Event[_DataT]], Any]],
+        event: Event[_DataT],
+        statistics: EventListenerStatistics | None,
+    ) -> None:
+        """Run the jobs of an index."""
+        for job in jobs:
+            if statistics is not None:
+                self._async_run_job_with_statistics(job, event, statistics)
+                continue
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
+    @callback
+    def _async_dispatch_entity_id(
+        self, jobs: _IndexJobs, event: Event[Mapping[str, Any]]
+    ) -> None:
+        """Dispatch an event to the jobs of its entity_id."""
+        if not (entity_id_jobs := jobs.get(event.data["entity_id"])):
+            return
+        statistics: EventListenerStatistics | None = None
+        if self._listener_statistics is not None:
+            statistics = self._listener_statistics[event.event_type]
+        self._async_run_indexed_jobs(entity_id_jobs.copy(), event, statistics)
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1552,29 +1852,72 @@ class EventBus:
         else:
             match_all_listeners = EMPTY_LIST
 
-        event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
-            if event_filter is not None:
-                try:
-                    if event_data is None or not event_filter(event_data):
-                        continue
-                except Exception:
-                    _LOGGER.exception("Error in event filter")
-                    continue
+        self._async_dispatch(
+            listeners + match_all_listeners,
+            len(listeners),
+            event_type,
+            event_data,
+            origin,
+            time_fired,
+            context,
+        )
 
-            if not event:
-                event = Event(
-                    event_type,
-                    event_data,
-                    origin,
-                    time_fired,
-                    context,
+    @callback
+    def async_fire_many_internal(
+        self,
+        events: Iterable[tuple[EventType[Any] | str, Any, Context | None]],
+        time_fired: float,
+    ) -> None:
+        """Fire events in order, for internal use only.
+
+        The events are given as tuples of event type, event data and
+        context. They are fired like async_fire_internal fires them, while
+        the listeners of an event type are only looked up again when
+        listeners were added or removed. The events may be generated while
+        they are fired.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API.
+
+        This method must be run in the event loop.
+        """
+        origin = EventOrigin.local
+        listeners_by_type: dict[
+            EventType[Any] | str,
+            tuple[list[_FilterableJobType[Any]], int],
+        ] = {}
+        generation = self._listeners_generation
+
+        for event_type, event_data, context in events:
+            if self._debug:
+                _LOGGER.debug(
+                    "Bus:Handling %s", _event_repr(event_type, origin, event_data)
                 )
 
+            if generation != self._listeners_generation:
+                generation = self._listeners_generation
+                listeners_by_type.clear()
             try:
-                self._hass.async_run_hass_job(job, event)
-            except Exception:
-                _LOGGER.exception("Error running job: %s", job)
+                listeners, type_listeners = listeners_by_type[event_type]
+            except KeyError:
+                listeners = self._listeners.get(event_type, EMPTY_LIST)
+                type_listeners = len(listeners)
+                listeners = listeners + (
+                    self._match_all_listeners
+                    if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL
+                    else EMPTY_LIST
+                )
+                listeners_by_type[event_type] = (listeners, type_listeners)
+
+            self._async_dispatch(
+                listeners,
+                type_listeners,
+                event_type,
+                event_data,
+                origin,
+                time_fired,
+                context,
+            )
 
     def listen(
         self,
@@ -1647,10 +1990,106 @@ class EventBus:
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
         self._listeners[event_type].append(filterable_job)
+        self._listeners_generation += 1
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_entity_ids_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        entity_ids: Iterable[str],
+        job: HassJob[[Event[_DataT]], Any],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for specific entity_ids.
+
+        The event data must contain an entity_id. When the event is fired,
+        the jobs are looked up in an index by entity_id and run in the next
+        event loop iteration.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API.
+
+        This method must be run in the event loop.
+        """
+        if (indexes := self._indexes.get(event_type)) is None:
+            indexes = self._indexes[event_type] = _EventIndexes()
+        return self._async_add_indexed_job(
+            event_type, indexes.entity_ids, entity_ids, job
+        )
+
+    @callback
+    def async_listen_domains_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        domains: Iterable[str],
+        job: HassJob[[Event[_DataT]], Any],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for entities of specific domains.
+
+        The event data must contain an entity_id. When the event is fired,
+        the jobs are looked up in an index by the domain of the entity_id
+        and run after the listeners of the event type. MATCH_ALL listens
+        for all domains. Jobs with the same event filter share an index.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API.
+
+        This method must be run in the event loop.
+        """
+        if (indexes := self._indexes.get(event_type)) is None:
+            indexes = self._indexes[event_type] = _EventIndexes()
+        if (jobs := indexes.domains.get(event_filter)) is None:
+            jobs = indexes.domains[event_filter] = {}
+        return self._async_add_indexed_job(event_type, jobs, domains, job)
+
+    @callback
+    def _async_add_indexed_job(
+        self,
+        event_type: EventType[_DataT] | str,
+        index_jobs: _IndexJobs,
+        keys: Iterable[str],
+        job: HassJob[[Event[_DataT]], Any],
+    ) -> CALLBACK_TYPE:
+        """Add a job to an index for some keys."""
+        keys = tuple(keys)
+        for key in keys:
+            if (jobs := index_jobs.get(key)) is None:
+                index_jobs[key] = [job]
+            else:
+                jobs.append(job)
+        return functools.partial(
+            self._async_remove_indexed_job, event_type, index_jobs, keys, job
+        )
+
+    @callback
+    def _async_remove_indexed_job(
+        self,
+        event_type: EventType[Any] | str,
+        index_jobs: _IndexJobs,
+        keys: Iterable[str],
+        job: HassJob[..., Any],
+    ) -> None:
+        """Remove a job from an index, removing the index when it is empty.
+
+        This method must be run in the event loop.
+        """
+        for key in keys:
+            jobs = index_jobs[key]
+            jobs.remove(job)
+            if not jobs:
+                del index_jobs[key]
+        if index_jobs:
+            return
+        indexes = self._indexes[event_type]
+        for index_filter, jobs_by_domain in list(indexes.domains.items()):
+            if jobs_by_domain is index_jobs:
+                del indexes.domains[index_filter]
+        if not indexes.entity_ids and not indexes.domains:
+            del self._indexes[event_type]
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1726,6 +2165,7 @@ class EventBus:
 
         This method must be run in the event loop.
         """
+        self._listeners_generation += 1
         try:
             self._listeners[event_type].remove(filterable_job)
 
@@ -2090,10 +2530,23 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+# The arguments of a state set while a batch of state writes is open
+type _StateWrite = tuple[
+    str, str, Mapping[str, Any] | None, bool, Context | None, StateInfo | None
+]
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_bus", "_loop", "_reservations", "_states", "_states_data")
+    __slots__ = (
+        "_batch",
+        "_bus",
+        "_loop",
+        "_reservations",
+        "_states",
+        "_states_data",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2104,6 +2557,8 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # The arguments of the states set while a batch is open
+        self._batch: list[_StateWrite] | None = None
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2330,8 +2785,104 @@ class StateMachine:
 
         Callers are responsible for ensuring the entity_id is lower case.
 
+        While a batch is open the state is set when the batch is closed.
+
         This method must be run in the event loop.
         """
+        if (batch := self._batch) is not None:
+            batch.append(
+                (entity_id, new_state, attributes, force_update, context, state_info)
+            )
+            return
+
+        # It is much faster to convert a timestamp to a utc datetime object
+        # than converting a utc datetime object to a timestamp since cpython
+        # does not have a fast path for handling the UTC timezone and has to do
+        # multiple local timezone conversions.
+        #
+        # from_timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
+        #
+        # timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+        now = dt_util.utc_from_timestamp(timestamp)
+        event_type, event_data, context = self._async_set_state(
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+            timestamp,
+            now,
+        )
+        self._bus.async_fire_internal(
+            event_type,
+            event_data,
+            # The event creates the context on demand if there is none
+            context=context,
+            time_fired=timestamp,
+        )
+
+    @contextmanager
+    def async_batch_internal(self) -> Generator[None]:
+        """Open a batch of state writes.
+
+        The states set while the batch is open are set when it is closed,
+        in order and with the time the batch was opened. Their events
+        are fired together with async_fire_many_internal. A batch opened
+        while another batch is open joins the open batch.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API.
+
+        This method must be run in the event loop.
+        """
+        if self._batch is not None:
+            yield
+            return
+        batch: list[_StateWrite] = []
+        timestamp = time.time()
+        self._batch = batch
+        try:
+            yield
+        finally:
+            self._batch = None
+            if batch:
+                now = dt_util.utc_from_timestamp(timestamp)
+                self._bus.async_fire_many_internal(
+                    self._async_set_batch_states(batch, timestamp, now), timestamp
+                )
+
+    def _async_set_batch_states(
+        self, batch: list[_StateWrite], timestamp: float, now: datetime.datetime
+    ) -> Generator[tuple[EventType[Any], Mapping[str, Any], Context | None]]:
+        """Set the states of a batch and yield the events to fire.
+
+        A write that fails is logged and does not stop the other writes.
+        """
+        for write in batch:
+            try:
+                event = self._async_set_state(*write, timestamp, now)
+            except Exception:
+                _LOGGER.exception("Error setting the state of %s", write[0])
+                continue
+            yield event
+
+    @callback
+    def _async_set_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        state_info: StateInfo | None,
+        timestamp: float,
+        now: datetime.datetime,
+    ) -> tuple[EventType[Any], Mapping[str, Any], Context | None]:
+        """Set the state of an entity and return the event to fire."""
         # Most cases the key will be in the dict
         # so we optimize for the happy path as
         # python 3.11+ has near zero overhead for
@@ -2346,32 +2897,18 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            same_attr = (
+                attributes is old_state.attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
-        #
-        # from_timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-        #
-        # timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
-
-        if context is None:
-            context = Context(id=ulid_at_time(timestamp))
-
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
             old_state.last_reported = now  # type: ignore[union-attr]
             old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
             # Avoid creating an EventStateReportedData
-            self._bus.async_fire_internal(  # type: ignore[misc]
+            return (
                 EVENT_STATE_REPORTED,
                 {
                     "entity_id": entity_id,
@@ -2379,10 +2916,11 @@ class StateMachine:
                     "old_last_reported": old_last_reported,
                     "new_state": old_state,
                 },
-                context=context,
-                time_fired=timestamp,
+                context,
             )
-            return
+
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
 
         if same_attr:
             if TYPE_CHECKING:
@@ -2421,12 +2959,7 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
-        self._bus.async_fire_internal(
-            EVENT_STATE_CHANGED,
-            state_changed_data,
-            context=context,
-            time_fired=timestamp,
-        )
+        return (EVENT_STATE_CHANGED, state_changed_data, context)
 
 
 class SupportsResponse(enum.StrEnum):
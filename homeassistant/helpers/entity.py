@@ -53,6 +53,7 @@ from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import device_registry as dr, entity_registry as er, singleton
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -67,6 +68,7 @@ timer = time.time
 
 if TYPE_CHECKING:
     from .entity_platform import EntityPlatform, PlatformData
+    from .update_executor import UpdateExecutor
 
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
@@ -267,6 +269,66 @@ class CalculatedState:
     capability_attributes: Mapping[str, Any] | None
 
 
+# Indexes of the mappings and of the customization in the values the
+# attributes are built from
+_MAPPING_VALUES = frozenset((0, 1, 2, 11))
+_CUSTOMIZE_VALUE = 11
+
+
+def _build_attributes(values: list[Any]) -> dict[str, Any]:
+    """Build the attribute dictionary from the values read from an entity."""
+    (
+        capability_attr,
+        state_attributes,
+        extra_state_attributes,
+        unit_of_measurement,
+        assumed_state,
+        attribution,
+        device_class,
+        entity_picture,
+        icon,
+        name,
+        supported_features,
+        custom,
+    ) = values
+    attr = capability_attr.copy() if capability_attr else {}
+
+    if state_attributes:
+        attr |= state_attributes
+    if extra_state_attributes:
+        attr |= extra_state_attributes
+
+    if unit_of_measurement is not None:
+        attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+    if assumed_state:
+        attr[ATTR_ASSUMED_STATE] = assumed_state
+
+    if attribution is not None:
+        attr[ATTR_ATTRIBUTION] = attribution
+
+    if device_class is not None:
+        attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+    if entity_picture is not None:
+        attr[ATTR_ENTITY_PICTURE] = entity_picture
+
+    if icon is not None:
+        attr[ATTR_ICON] = icon
+
+    if name is not None:
+        attr[ATTR_FRIENDLY_NAME] = name
+
+    if supported_features is not None:
+        attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+    # Overwrite properties that have been set in the config file
+    if custom:
+        attr |= custom
+
+    return attr
+
+
 class CachedProperties(type):
     """Metaclass which invalidates cached entity properties on write to _attr_.
 
@@ -483,6 +545,9 @@ class Entity(
     # Process updates in parallel
     parallel_updates: asyncio.Semaphore | None = None
 
+    # Executor running the sync update
+    update_executor: UpdateExecutor | None = None
+
     # Entry in the entity registry
     registry_entry: er.RegistryEntry | None = None
 
@@ -526,6 +591,12 @@ class Entity(
     __capabilities_updated_at_reported: bool = False
     __remove_future: asyncio.Future[None] | None = None
 
+    # The attributes of the last state write and a snapshot of the values they
+    # were built from, the attributes are reused while the values are unchanged.
+    # The values are still read from the properties on every write.
+    __attributes: ReadOnlyDict[str, Any] | None = None
+    __attributes_values: tuple[Any, ...] | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -1061,17 +1132,17 @@ class Entity(
     @callback
     def _async_calculate_state(self) -> CalculatedState:
         """Calculate state string and attribute mapping."""
-        state, attr, capabilities, _, _ = self.__async_calculate_state()
-        return CalculatedState(state, attr, capabilities)
+        state, values, capabilities, _, _ = self.__async_read_state()
+        return CalculatedState(state, _build_attributes(values), capabilities)
 
-    def __async_calculate_state(
+    def __async_read_state(
         self,
-    ) -> tuple[str, dict[str, Any], Mapping[str, Any] | None, str | None, int | None]:
-        """Calculate state string and attribute mapping.
+    ) -> tuple[str, list[Any], Mapping[str, Any] | None, str | None, int | None]:
+        """Read state string and the values the attributes are built from.
 
         Returns a tuple:
         state - the stringified state
-        attr - the attribute dictionary
+        values - the values passed to _build_attributes
         capability_attr - a mapping with capability attributes
         original_device_class - the device class which may be overridden
         supported_features - the supported features
@@ -1082,46 +1153,61 @@ class Entity(
         entry = self.registry_entry
 
         capability_attr = self.capability_attributes
-        attr = capability_attr.copy() if capability_attr else {}
 
         available = self.available  # only call self.available once per update cycle
         state = self._stringify_state(available)
         if available:
-            if state_attributes := self.state_attributes:
-                attr |= state_attributes
-            if extra_state_attributes := self.extra_state_attributes:
-                attr |= extra_state_attributes
-
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        if assumed_state := self.assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
-        if (attribution := self.attribution) is not None:
-            attr[ATTR_ATTRIBUTION] = attribution
+            state_attributes = self.state_attributes
+            extra_state_attributes = self.extra_state_attributes
+        else:
+            state_attributes = extra_state_attributes = None
 
         original_device_class = self.device_class
-        if (
-            device_class := (entry and entry.device_class) or original_device_class
-        ) is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
-
-        if (entity_picture := self.entity_picture) is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
-        if (icon := (entry and entry.icon) or self.icon) is not None:
-            attr[ATTR_ICON] = icon
+        supported_features = self.supported_features
+        values = [
+            capability_attr,
+            state_attributes,
+            extra_state_attributes,
+            self.unit_of_measurement,
+            self.assumed_state,
+            self.attribution,
+            (entry and entry.device_class) or original_device_class,
+            self.entity_picture,
+            (entry and entry.icon) or self.icon,
+            (entry and entry.name) or self._friendly_name_internal(),
+            supported_features,
+            None,
+        ]
+        return (
+            state,
+            values,
+            capability_attr,
+            original_device_class,
+            supported_features,
+        )
 
-        if (
-            name := (entry and entry.name) or self._friendly_name_internal()
-        ) is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
+    def __async_attributes(self, values: list[Any]) -> ReadOnlyDict[str, Any]:
+        """Return the attributes to write, built from the values.
 
-        if (supported_features := self.supported_features) is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+        The attributes of the last write are reused if the values are equal to
+        a snapshot of the values they were built from. The snapshot holds copies
+        of the mappings to notice mappings which are changed in place.
 
-        return (state, attr, capability_attr, original_device_class, supported_features)
+        This only saves building and comparing the attributes, the values are
+        read from the properties on every write. Only the properties backed by
+        _attr_ are cached, properties overridden by the integrations can't
+        tell when their value changes.
+        """
+        if (attributes := self.__attributes) is not None and (
+            self.__attributes_values == tuple(values)
+        ):
+            return attributes
+        attributes = self.__attributes = ReadOnlyDict(_build_attributes(values))
+        self.__attributes_values = tuple(
+            dict(value) if idx in _MAPPING_VALUES and value is not None else value
+            for idx, value in enumerate(values)
+        )
+        return attributes
 
     @callback
     def _async_write_ha_state(self) -> None:
@@ -1147,8 +1233,8 @@ class Entity(
             return
 
         state_calculate_start = timer()
-        state, attr, capabilities, original_device_class, supported_features = (
-            self.__async_calculate_state()
+        state, values, capabilities, original_device_class, supported_features = (
+            self.__async_read_state()
         )
         time_now = timer()
 
@@ -1215,9 +1301,7 @@ class Entity(
         except KeyError:
             pass
         else:
-            # Overwrite properties that have been set in the config file.
-            if custom:
-                attr |= custom
+            values[_CUSTOMIZE_VALUE] = custom
 
         if (
             self._context_set is not None
@@ -1230,7 +1314,7 @@ class Entity(
         self.hass.states.async_set_internal(
             self.entity_id,
             state,
-            attr,
+            self.__async_attributes(values),
             self.force_update,
             self._context,
             self._state_info,
@@ -1313,7 +1397,10 @@ class Entity(
             if hasattr(self, "async_update"):
                 await self.async_update()
             elif hasattr(self, "update"):
-                await hass.async_add_executor_job(self.update)
+                if self.update_executor is not None:
+                    await self.update_executor.async_add_job(self.update)
+                else:
+                    await hass.async_add_executor_job(self.update)
             else:
                 return
         finally:
@@ -1354,6 +1441,7 @@ class Entity(
         self.platform = platform
         self.platform_data = platform.platform_data
         self.parallel_updates = parallel_updates
+        self.update_executor = platform.update_executor
         self._platform_state = EntityPlatformState.ADDING
 
     def _call_on_remove_callbacks(self) -> None:
@@ -1373,6 +1461,7 @@ class Entity(
         self.hass = None  # type: ignore[assignment]
         self.platform = None  # type: ignore[assignment]
         self.parallel_updates = None
+        self.update_executor = None
 
     async def add_to_platform_finish(self) -> None:
         """Finish adding an entity to a platform."""
@@ -7,6 +7,7 @@ from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import timedelta
 from logging import Logger, getLogger
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Protocol
 
 from homeassistant import config_entries
@@ -48,7 +49,9 @@ from .deprecation import deprecated_function
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .poll_scheduler import Poller
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
+from .update_executor import UpdateExecutor, async_get_update_executor
 
 if TYPE_CHECKING:
     from .entity import Entity
@@ -230,14 +233,16 @@ class EntityPlatform:
         self._tasks: list[asyncio.Task[None]] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
-        # Method to cancel the state change listener
-        self._async_polling_timer: asyncio.TimerHandle | None = None
+        # Polls of the entities which should poll
+        self._poller: Poller | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
+        # Executor of the integration running the sync updates
+        self.update_executor: UpdateExecutor | None = None
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -727,7 +732,7 @@ class EntityPlatform:
 
         if (
             (self.config_entry and self.config_entry.pref_disable_polling)
-            or self._async_polling_timer is not None
+            or self._poller is not None
             or not any(
                 # Entity may have failed to add or called `add_to_platform_abort`
                 # so we check if the entity is in self.entities before
@@ -741,28 +746,40 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
+        max_scan_interval: timedelta | None = getattr(
+            self.platform, "MAX_SCAN_INTERVAL", None
+        )
+        self._poller = Poller(
+            self.hass,
+            f"{self.domain}.{self.platform_name}",
             self._async_handle_interval_callback,
+            self.scan_interval_seconds,
+            max_interval=(
+                max_scan_interval.total_seconds() if max_scan_interval else None
+            ),
+            config_entry=self.config_entry,
+            host_concurrency=getattr(self.platform, "HOST_CONCURRENCY", None),
+            executor=self.update_executor,
         )
+        self._poller.async_schedule(self.hass.loop.time() + self.scan_interval_seconds)
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
+        if TYPE_CHECKING:
+            assert self._poller is not None
+        poller = self._poller
+        poller.async_schedule(self.hass.loop.time() + poller.interval)
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
-                self._async_update_entity_states(),
+                self._async_poll_entity_states(poller),
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
         else:
             self.hass.async_create_background_task(
-                self._async_update_entity_states(),
+                self._async_poll_entity_states(poller),
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
@@ -794,11 +811,13 @@ class EntityPlatform:
         if entity is None:
             raise ValueError("Entity cannot be None")
 
-        entity.add_to_platform_start(
-            self.hass,
-            self,
-            self._get_parallel_updates_semaphore(hasattr(entity, "update")),
-        )
+        entity_has_sync_update = hasattr(entity, "update")
+        parallel_updates = self._get_parallel_updates_semaphore(entity_has_sync_update)
+        if entity_has_sync_update and self.update_executor is None:
+            self.update_executor = async_get_update_executor(
+                self.hass, self.platform_name
+            )
+        entity.add_to_platform_start(self.hass, self, parallel_updates)
 
         # Update properties before we generate the entity_id. This will happen
         # also for disabled entities.
@@ -1029,9 +1048,9 @@ class EntityPlatform:
     @callback
     def async_unsub_polling(self) -> None:
         """Stop polling."""
-        if self._async_polling_timer is not None:
-            self._async_polling_timer.cancel()
-            self._async_polling_timer = None
+        if self._poller is not None:
+            self._poller.async_cancel()
+            self._poller = None
 
     @callback
     def async_prepare(self) -> None:
@@ -1053,7 +1072,7 @@ class EntityPlatform:
         await self.entities[entity_id].async_remove()
 
         # Clean up polling job if no longer needed
-        if self._async_polling_timer is not None and not any(
+        if self._poller is not None and not any(
             entity.should_poll for entity in self.entities.values()
         ):
             self.async_unsub_polling()
@@ -1099,6 +1118,32 @@ class EntityPlatform:
             supports_response=supports_response,
         )
 
+    async def _async_poll_entity_states(self, poller: Poller) -> None:
+        """Poll the states of the entities and record the poll.
+
+        With adaptive polling the poll records if a state changed, unchanged
+        states are written without replacing the state object.
+        """
+        async with poller.limit:
+            if not poller.adaptive:
+                start = monotonic()
+                await self._async_update_entity_states()
+                poller.async_record_poll(monotonic() - start, None)
+                return
+            states = self.hass.states
+            old_states = {
+                entity_id: states.get(entity_id) for entity_id in self.entities
+            }
+            start = monotonic()
+            await self._async_update_entity_states()
+            poller.async_record_poll(
+                monotonic() - start,
+                any(
+                    states.get(entity_id) is not state
+                    for entity_id, state in old_states.items()
+                ),
+            )
+
     async def _async_update_entity_states(self) -> None:
         """Update the states of all the polling entities.
 
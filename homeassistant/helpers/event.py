@@ -34,7 +34,6 @@ from homeassistant.core import (
     HomeAssistant,
     State,
     callback,
-    split_entity_id,
 )
 from homeassistant.exceptions import TemplateError
 from homeassistant.loader import bind_hass
@@ -54,21 +53,15 @@ from .entity_registry import (
 )
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
-from .template import RenderInfo, Template, result_as_boolean
+from .template import (
+    RenderInfo,
+    Template,
+    async_get_template_profiler,
+    render_trigger_cv,
+    result_as_boolean,
+)
 from .typing import TemplateVarsType
 
-_TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
-    "track_state_change_data"
-)
-_TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
-    "track_state_report_data"
-)
-_TRACK_STATE_ADDED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_added_domain_data")
-)
-_TRACK_STATE_REMOVED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_removed_domain_data")
-)
 _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventEntityRegistryUpdatedData]
 ] = HassKey("track_entity_registry_updated_data")
@@ -335,52 +328,25 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action, job_type)
 
 
-@callback
-def _async_dispatch_entity_id_event_soon[_StateEventDataT: EventStateEventData](
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
-
-
-@callback
-def _async_dispatch_entity_id_event[_StateEventDataT: EventStateEventData](
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_filter[_StateEventDataT: EventStateEventData](
+# event_type, not hass is intentionally the first argument here since its
+# constant and may be used in a partial in the future
+def _async_track_entity_id_event[_StateEventDataT: EventStateEventData](
+    event_type: EventType[_StateEventDataT],
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
+    entity_ids: str | Iterable[str],
+    action: Callable[[Event[_StateEventDataT]], Any],
+    job_type: HassJobType | None,
+) -> CALLBACK_TYPE:
+    """Track an event by entity_id through the index of the event bus.
 
-_KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
-    key=_TRACK_STATE_CHANGE_DATA,
-    event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
-)
+    The event bus runs the job in the next event loop iteration.
+    """
+    if not entity_ids:
+        return _remove_empty_listener
+    if isinstance(entity_ids, str):
+        entity_ids = (entity_ids,)
+    job = HassJob(action, f"track {event_type} event {entity_ids}", job_type=job_type)
+    return hass.bus.async_listen_entity_ids_internal(event_type, entity_ids, job)
 
 
 @bind_hass
@@ -394,19 +360,11 @@ def _async_track_state_change_event(
 
     The passed in entity_ids will not be automatically lower cased.
     """
-    return _async_track_event(
-        _KEYED_TRACK_STATE_CHANGE, hass, entity_ids, action, job_type
+    return _async_track_entity_id_event(
+        EVENT_STATE_CHANGED, hass, entity_ids, action, job_type
     )
 
 
-_KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
-    key=_TRACK_STATE_REPORT_DATA,
-    event_type=EVENT_STATE_REPORTED,
-    dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
-)
-
-
 def async_track_state_report_event(
     hass: HomeAssistant,
     entity_ids: str | Iterable[str],
@@ -418,8 +376,8 @@ def async_track_state_report_event(
     EVENT_STATE_REPORTED is fired on each occasion the state is updated
     but not changed, opposite of EVENT_STATE_CHANGED.
     """
-    return _async_track_event(
-        _KEYED_TRACK_STATE_REPORT, hass, entity_ids, action, job_type
+    return _async_track_entity_id_event(
+        EVENT_STATE_REPORTED, hass, entity_ids, action, job_type
     )
 
 
@@ -616,36 +574,9 @@ def async_track_device_registry_updated_event(
 
 
 @callback
-def _async_dispatch_domain_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event: Event[EventStateChangedData],
-) -> None:
-    """Dispatch domain event listeners."""
-    domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while processing event %s for domain %s", event, domain
-            )
-
-
-@callback
-def _async_domain_added_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["old_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If old_state is None, new_state must be set but
-        # mypy doesn't know that
-        event_data["new_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_added_filter(event_data: EventStateChangedData) -> bool:
+    """Filter state changes to entities being added."""
+    return event_data["old_state"] is None
 
 
 @bind_hass
@@ -661,14 +592,6 @@ def async_track_state_added_domain(
     return _async_track_state_added_domain(hass, domains, action, job_type)
 
 
-_KEYED_TRACK_STATE_ADDED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_ADDED_DOMAIN_DATA,
-    event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_added_filter,
-)
-
-
 @bind_hass
 def _async_track_state_added_domain(
     hass: HomeAssistant,
@@ -677,33 +600,36 @@ def _async_track_state_added_domain(
     job_type: HassJobType | None,
 ) -> CALLBACK_TYPE:
     """Track state change events when an entity is added to domains."""
-    return _async_track_event(
-        _KEYED_TRACK_STATE_ADDED_DOMAIN, hass, domains, action, job_type
+    return _async_track_domain_event(
+        hass, domains, action, job_type, _async_domain_added_filter
     )
 
 
 @callback
-def _async_domain_removed_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["new_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If new_state is None, old_state must be set but
-        # mypy doesn't know that
-        event_data["old_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_removed_filter(event_data: EventStateChangedData) -> bool:
+    """Filter state changes to entities being removed."""
+    return event_data["new_state"] is None
 
 
-_KEYED_TRACK_STATE_REMOVED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_REMOVED_DOMAIN_DATA,
-    event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_removed_filter,
-)
+@callback
+def _async_track_domain_event(
+    hass: HomeAssistant,
+    domains: str | Iterable[str],
+    action: Callable[[Event[EventStateChangedData]], Any],
+    job_type: HassJobType | None,
+    event_filter: Callable[[EventStateChangedData], bool],
+) -> CALLBACK_TYPE:
+    """Track state change events by domain through the index of the event bus."""
+    if not domains:
+        return _remove_empty_listener
+    if isinstance(domains, str):
+        domains = (domains,)
+    job = HassJob(
+        action, f"track {EVENT_STATE_CHANGED} event {domains}", job_type=job_type
+    )
+    return hass.bus.async_listen_domains_internal(
+        EVENT_STATE_CHANGED, domains, job, event_filter
+    )
 
 
 @bind_hass
@@ -714,8 +640,8 @@ def async_track_state_removed_domain(
     job_type: HassJobType | None = None,
 ) -> CALLBACK_TYPE:
     """Track state change events when an entity is removed from domains."""
-    return _async_track_event(
-        _KEYED_TRACK_STATE_REMOVED_DOMAIN, hass, domains, action, job_type
+    return _async_track_domain_event(
+        hass, domains, action, job_type, _async_domain_removed_filter
     )
 
 
@@ -1178,9 +1104,18 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        if async_get_template_profiler(self.hass) is None:
+            info = template.async_render_to_info(track_template_.variables)
+        else:
+            # Record what caused the render, refreshes have no event
+            token = render_trigger_cv.set(
+                event.data["entity_id"] if event else "refresh"
+            )
+            try:
+                info = template.async_render_to_info(track_template_.variables)
+            finally:
+                render_trigger_cv.reset(token)
+        self._info[template] = info
 
         try:
             result: str | TemplateError = info.result()
@@ -1979,11 +1914,13 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
 
     if info.filter(entity_id):
-        return True
+        return info.fields_changed(entity_id, old_state, new_state)
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
@@ -0,0 +1,299 @@
+"""Schedule the polls of coordinators and entity platforms in shared ticks."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass, field
+from random import randrange
+from typing import TYPE_CHECKING, Any
+import weakref
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .event import RANDOM_MICROSECOND_MAX, RANDOM_MICROSECOND_MIN
+from .singleton import singleton
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+
+    from .update_executor import UpdateExecutor
+
+DATA_POLL_SCHEDULER: HassKey[PollScheduler] = HassKey("poll_scheduler")
+
+# Each poller is delayed by one of these many jitter slots, spread from
+# RANDOM_MICROSECOND_MIN to RANDOM_MICROSECOND_MAX, so polls due at the same
+# time run in a few ticks instead of all in one loop iteration
+JITTER_SLOTS = 4
+JITTER_SLOT_MICROSECONDS = (RANDOM_MICROSECOND_MAX - RANDOM_MICROSECOND_MIN) // (
+    JITTER_SLOTS - 1
+)
+
+# A poll is moved forward by up to this many seconds, and by up to this share
+# of its interval, to run in a tick that is already scheduled. The window is
+# shorter than a jitter slot, so the polls of different slots are not aligned.
+ALIGN_WINDOW = 0.1
+ALIGN_WINDOW_INTERVAL_SHARE = 0.1
+
+# Polls in a row which changed nothing before the interval is increased
+BACKOFF_AFTER = 3
+BACKOFF_FACTOR = 1.5
+
+_NO_LIMIT: AbstractAsyncContextManager[Any] = nullcontext()
+
+
+@dataclass(slots=True)
+class PollStatistics:
+    """Statistics of the polls of a poller."""
+
+    polls: int = 0
+    # Polls which were checked for changes
+    compared_polls: int = 0
+    changed_polls: int = 0
+    last_duration: float | None = None
+    total_duration: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "polls": self.polls,
+            "change_ratio": (
+                self.changed_polls / self.compared_polls
+                if self.compared_polls
+                else None
+            ),
+            "last_duration": self.last_duration,
+            "average_duration": (
+                self.total_duration / self.polls if self.polls else None
+            ),
+        }
+
+
+@dataclass(slots=True)
+class _Tick:
+    """Polls run at the same time."""
+
+    when: float
+    handle: asyncio.TimerHandle
+    pollers: dict[Poller, None] = field(default_factory=dict)
+
+
+class Poller:
+    """The polls of a coordinator or an entity platform.
+
+    The job is called when a poll is due and starts the poll. Every poll of
+    the poller is delayed by the same jitter. With a maximum interval the polling is adaptive: the interval is increased after polls
+    which changed nothing, up to the maximum, and reset to the minimum by a
+    poll which changed something.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        job: Callable[[], None],
+        interval: float,
+        *,
+        max_interval: float | None = None,
+        config_entry: ConfigEntry | None = None,
+        host_concurrency: int | None = None,
+        executor: UpdateExecutor | None = None,
+    ) -> None:
+        """Initialize the poller.
+
+        With host_concurrency, at most that many polls of config entries
+        with the same host run at the same time. The executor running the
+        polls is included in the diagnostics.
+        """
+        self.name = name
+        self.job = job
+        self.executor = executor
+        self.config_entry_id = config_entry and config_entry.entry_id
+        host = config_entry and config_entry.data.get(CONF_HOST)
+        self.statistics = PollStatistics()
+        self.jitter = (
+            RANDOM_MICROSECOND_MIN + randrange(JITTER_SLOTS) * JITTER_SLOT_MICROSECONDS
+        ) / 10**6
+        self.min_interval = self.max_interval = self.interval = interval
+        self.async_set_interval(interval, max_interval)
+        self._scheduler = async_get_poll_scheduler(hass)
+        self._scheduler.pollers.add(self)
+        self._limit = (
+            self._scheduler.async_get_host_limit(host, host_concurrency)
+            if host_concurrency is not None and isinstance(host, str)
+            else _NO_LIMIT
+        )
+        self._tick: _Tick | None = None
+        self._unchanged_polls = 0
+
+    @property
+    def scheduled(self) -> bool:
+        """Return if a poll is scheduled."""
+        return self._tick is not None
+
+    @property
+    def adaptive(self) -> bool:
+        """Return if the interval adapts to the changes of the polls."""
+        return self.max_interval > self.min_interval
+
+    @property
+    def limit(self) -> AbstractAsyncContextManager[Any]:
+        """Return the limit of the polls of the host to hold while polling."""
+        return self._limit
+
+    @callback
+    def async_set_interval(
+        self, interval: float, max_interval: float | None = None
+    ) -> None:
+        """Set the bounds of the interval."""
+        max_interval = max(max_interval or interval, interval)
+        if interval == self.min_interval and max_interval == self.max_interval:
+            return
+        self.min_interval = self.interval = interval
+        self.max_interval = max_interval
+        self._unchanged_polls = 0
+
+    @callback
+    def async_schedule(self, when: float) -> None:
+        """Schedule the next poll at a loop time, replacing a scheduled poll.
+
+        The poll runs the jitter of the poller after the loop time.
+        """
+        self.async_cancel()
+        self._tick = self._scheduler.async_add(self, when + self.jitter)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the scheduled poll."""
+        if (tick := self._tick) is not None:
+            self._tick = None
+            self._scheduler.async_remove(self, tick)
+
+    @callback
+    def async_run(self) -> None:
+        """Run the job of a scheduled poll."""
+        self._tick = None
+        self.job()
+
+    @callback
+    def async_record_poll(self, duration: float, changed: bool | None) -> None:
+        """Record a finished poll and adapt the interval.
+
+        changed is None if the poll was not checked for changes.
+        """
+        statistics = self.statistics
+        statistics.polls += 1
+        statistics.last_duration = duration
+        statistics.total_duration += duration
+        if changed is None:
+            return
+        statistics.compared_polls += 1
+        if changed:
+            statistics.changed_polls += 1
+            self._unchanged_polls = 0
+            self.interval = self.min_interval
+            return
+        self._unchanged_polls += 1
+        if self._unchanged_polls >= BACKOFF_AFTER:
+            self._unchanged_polls = 0
+            self.interval = min(self.interval * BACKOFF_FACTOR, self.max_interval)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the poller as a dictionary for the diagnostics."""
+        data = {
+            "name": self.name,
+            "interval": self.interval,
+            "min_interval": self.min_interval,
+            "max_interval": self.max_interval,
+            "jitter": self.jitter,
+            "scheduled": self.scheduled,
+            **self.statistics.as_dict(),
+        }
+        if self.executor is not None:
+            data["executor"] = self.executor.as_dict()
+        return data
+
+
+class PollScheduler:
+    """Run the polls which are due around the same time in one tick.
+
+    A poll joins a tick which is scheduled a little before the poll is due,
+    so the event loop wakes up once for all of them. The jitter of the
+    pollers spreads the polls due at the same time over a few ticks.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._ticks: dict[float, _Tick] = {}
+        # Sorted loop times of the ticks
+        self._times: list[float] = []
+        self._host_limits: dict[tuple[str, int], asyncio.Semaphore] = {}
+        self.pollers: weakref.WeakSet[Poller] = weakref.WeakSet()
+
+    @callback
+    def async_get_host_limit(self, host: str, concurrency: int) -> asyncio.Semaphore:
+        """Return the limit of the polls of a host."""
+        key = (host, concurrency)
+        if (limit := self._host_limits.get(key)) is None:
+            limit = self._host_limits[key] = asyncio.Semaphore(concurrency)
+        return limit
+
+    @callback
+    def async_add(self, poller: Poller, when: float) -> _Tick:
+        """Add a poll to the tick it runs in."""
+        window = min(ALIGN_WINDOW, poller.interval * ALIGN_WINDOW_INTERVAL_SHARE)
+        index = bisect_right(self._times, when)
+        if index and (tick_when := self._times[index - 1]) >= when - window:
+            tick = self._ticks[tick_when]
+        else:
+            tick = self._ticks[when] = _Tick(
+                when, self._hass.loop.call_at(when, self._async_run_tick, when)
+            )
+            insort(self._times, when)
+        tick.pollers[poller] = None
+        return tick
+
+    @callback
+    def async_remove(self, poller: Poller, tick: _Tick) -> None:
+        """Remove a poll from its tick."""
+        del tick.pollers[poller]
+        # The tick may be running
+        if tick.pollers or self._ticks.get(tick.when) is not tick:
+            return
+        tick.handle.cancel()
+        del self._ticks[tick.when]
+        del self._times[bisect_left(self._times, tick.when)]
+
+    @callback
+    def _async_run_tick(self, when: float) -> None:
+        """Run the polls of a tick."""
+        tick = self._ticks.pop(when)
+        del self._times[bisect_left(self._times, when)]
+        for poller in list(tick.pollers):
+            # A poll may be cancelled by a poll run before it
+            if poller in tick.pollers:
+                poller.async_run()
+
+
+@callback
+@singleton(DATA_POLL_SCHEDULER)
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Get the poll scheduler."""
+    return PollScheduler(hass)
+
+
+@callback
+def async_get_config_entry_polls(
+    hass: HomeAssistant, entry_id: str
+) -> list[dict[str, Any]]:
+    """Return the pollers of a config entry for the diagnostics."""
+    return [
+        poller.as_dict()
+        for poller in async_get_poll_scheduler(hass).pollers
+        if poller.config_entry_id == entry_id
+    ]
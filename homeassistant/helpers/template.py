@@ -5,6 +5,7 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import defaultdict, deque
 import collections.abc
 from collections.abc import Callable, Generator, Iterable, MutableSequence
 from contextlib import AbstractContextManager
@@ -23,6 +24,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+from time import perf_counter
 from types import CodeType, TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -50,6 +52,7 @@ import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_PERSONS,
@@ -114,6 +117,7 @@ _ENVIRONMENT_LIMITED: HassKey[TemplateEnvironment] = HassKey(
 _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
+_TEMPLATE_PROFILER: HassKey[TemplateProfiler] = HassKey("template.profiler")
 _HASS_LOADER = "template.hass_loader"
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -126,6 +130,9 @@ _RESERVED_NAMES = {
     "jinja_pass_arg",
 }
 
+# Methods of strings that look up attributes by name at runtime
+_FORMAT_METHODS = {"format", "format_map"}
+
 _COLLECTABLE_STATE_ATTRIBUTES = {
     "state",
     "attributes",
@@ -147,6 +154,11 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "template_cv", default=None
 )
 
+# What caused a template to re-render, only set while profiling
+render_trigger_cv: ContextVar[str | None] = ContextVar(
+    "render_trigger_cv", default=None
+)
+
 #
 # CACHED_TEMPLATE_STATES is a rough estimate of the number of entities
 # on a typical system. It is used as the initial size of the LRU cache
@@ -170,6 +182,26 @@ MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
+
+#
+# Compiled template code is shared by all templates with the same source
+# that are compiled for the same kind of environment, regardless of the
+# hass instance or the entity they belong to. Templates keep a reference
+# to their own code so eviction only means the next template with that
+# source has to be compiled again.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 2048
+COMPILED_TEMPLATE_LRU: LRU[tuple[tuple[bool, bool, bool], str], CodeType] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
+
+# Compiled code of templates that only read state attributes by key, renders of
+# these collect the attribute keys instead of all the attributes of the state.
+_ATTRIBUTES_BY_KEY_CODE: weakref.WeakSet[CodeType] = weakref.WeakSet()
+
+# Number of templates and render times per template kept while profiling
+PROFILE_MAX_TEMPLATES = 1024
+PROFILE_RENDER_SAMPLES = 1000
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
 ORJSON_PASSTHROUGH_OPTIONS = (
@@ -220,6 +252,95 @@ def async_setup(hass: HomeAssistant) -> bool:
     return True
 
 
+def compiled_template_cache_info() -> dict[str, int]:
+    """Return the size and the hit and miss counts of the compiled template cache."""
+    hits, misses = COMPILED_TEMPLATE_LRU.get_stats()
+    return {
+        "size": len(COMPILED_TEMPLATE_LRU),
+        "max_size": COMPILED_TEMPLATE_LRU.get_size(),
+        "hits": hits,
+        "misses": misses,
+    }
+
+
+class TemplateRenderProfile:
+    """Render statistics of a template source."""
+
+    __slots__ = ("durations", "renders", "total_time", "triggers")
+
+    def __init__(self) -> None:
+        """Initialize the render statistics."""
+        self.renders = 0
+        self.total_time = 0.0
+        self.durations: deque[float] = deque(maxlen=PROFILE_RENDER_SAMPLES)
+        self.triggers: dict[str, int] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict.
+
+        The 99th percentile is calculated from the most recent renders.
+        """
+        durations = sorted(self.durations)
+        return {
+            "renders": self.renders,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.renders,
+            "p99_time": durations[math.ceil(len(durations) * 0.99) - 1],
+            "triggers": self.triggers,
+        }
+
+
+class TemplateProfiler:
+    """Collect the render statistics of templates while profiling is enabled."""
+
+    __slots__ = ("profiles",)
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self.profiles: LRU[str, TemplateRenderProfile] = LRU(PROFILE_MAX_TEMPLATES)
+
+    @callback
+    def async_record(self, template: str, duration: float) -> None:
+        """Record a render of a template."""
+        if (profile := self.profiles.get(template)) is None:
+            profile = self.profiles[template] = TemplateRenderProfile()
+        profile.renders += 1
+        profile.total_time += duration
+        profile.durations.append(duration)
+        trigger = render_trigger_cv.get() or "direct"
+        profile.triggers[trigger] = profile.triggers.get(trigger, 0) + 1
+
+    @callback
+    def async_stats(self) -> list[dict[str, Any]]:
+        """Return the statistics of each template, the most expensive first."""
+        return sorted(
+            (
+                {"template": template, **profile.as_dict()}
+                for template, profile in self.profiles.items()
+            ),
+            key=lambda stats: stats["total_time"],
+            reverse=True,
+        )
+
+
+@callback
+def async_set_template_profiling(hass: HomeAssistant, enabled: bool) -> None:
+    """Enable or disable profiling of template renders.
+
+    Disabling profiling discards the collected statistics.
+    """
+    if not enabled:
+        hass.data.pop(_TEMPLATE_PROFILER, None)
+    elif _TEMPLATE_PROFILER not in hass.data:
+        hass.data[_TEMPLATE_PROFILER] = TemplateProfiler()
+
+
+@callback
+def async_get_template_profiler(hass: HomeAssistant) -> TemplateProfiler | None:
+    """Return the template profiler if profiling is enabled."""
+    return hass.data.get(_TEMPLATE_PROFILER)
+
+
 @bind_hass
 @deprecated_function(
     "automatic setting of Template.hass introduced by HA Core PR #89242",
@@ -391,6 +512,8 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_attributes",
+        "entity_fields",
         "exception",
         "filter",
         "filter_lifecycle",
@@ -414,6 +537,10 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities the template only read some fields or attribute keys of,
+        # the entities read as a whole are in entities instead.
+        self.entity_fields: dict[str, collections.abc.Set[str]] = defaultdict(set)
+        self.entity_attributes: dict[str, collections.abc.Set[Any]] = defaultdict(set)
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -426,6 +553,8 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" entity_fields={self.entity_fields}"
+            f" entity_attributes={self.entity_attributes}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -456,6 +585,29 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def fields_changed(
+        self, entity_id: str, old_state: State | None, new_state: State | None
+    ) -> bool:
+        """Return if a state change changed anything the template read.
+
+        Always True for entities that were read as a whole.
+        """
+        if (
+            old_state is None
+            or new_state is None
+            or (fields := self.entity_fields.get(entity_id)) is None
+        ):
+            return True
+        for field in fields:
+            if getattr(old_state, field) != getattr(new_state, field):
+                return True
+        old_attributes = old_state.attributes
+        new_attributes = new_state.attributes
+        return any(
+            old_attributes.get(key, _SENTINEL) != new_attributes.get(key, _SENTINEL)
+            for key in self.entity_attributes[entity_id]
+        )
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -467,7 +619,28 @@ class RenderInfo:
         self._freeze_sets()
         self.all_states = False
 
+    def _freeze_fields(self) -> None:
+        entity_ids = self.entity_fields.keys() | self.entity_attributes.keys()
+        entity_fields: dict[str, collections.abc.Set[str]] = {}
+        entity_attributes: dict[str, collections.abc.Set[Any]] = {}
+        if not (self.exception or self.all_states):
+            # Entities also read as a whole or through their domain
+            # re-render on any change
+            for entity_id in entity_ids - self.entities:
+                if split_entity_id(entity_id)[0] in self.domains:
+                    continue
+                entity_fields[entity_id] = frozenset(
+                    self.entity_fields.get(entity_id, ())
+                )
+                entity_attributes[entity_id] = frozenset(
+                    self.entity_attributes.get(entity_id, ())
+                )
+        self.entities = {*self.entities, *entity_ids}
+        self.entity_fields = entity_fields
+        self.entity_attributes = entity_attributes
+
     def _freeze_sets(self) -> None:
+        self._freeze_fields()
         self.entities = frozenset(self.entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
@@ -506,6 +679,7 @@ class Template:
 
     __slots__ = (
         "__weakref__",
+        "_attributes_by_key",
         "_compiled",
         "_compiled_code",
         "_exc_info",
@@ -540,6 +714,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._attributes_by_key = False
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: OptExcInfo | None = None
@@ -575,7 +750,7 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
+        if compiled := self._env.get_cached_code(self.template):
             self._compiled_code = compiled
             return
 
@@ -637,10 +812,16 @@ class Template:
         if variables is not None:
             kwargs.update(variables)
 
+        profiler = self.hass.data.get(_TEMPLATE_PROFILER) if self.hass else None
+        if profiler is not None:
+            start = perf_counter()
         try:
             render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
+        finally:
+            if profiler is not None:
+                profiler.async_record(self.template, perf_counter() - start)
 
         if len(render_result) > MAX_TEMPLATE_OUTPUT:
             raise TemplateError(
@@ -810,6 +991,9 @@ class Template:
         except JSON_DECODE_EXCEPTIONS:
             pass
 
+        profiler = self.hass.data.get(_TEMPLATE_PROFILER) if self.hass else None
+        if profiler is not None:
+            start = perf_counter()
         try:
             render_result = _render_with_context(
                 self.template, compiled, **variables
@@ -823,6 +1007,9 @@ class Template:
                     self.template,
                 )
             return value if error_value is _SENTINEL else error_value
+        finally:
+            if profiler is not None:
+                profiler.async_record(self.template, perf_counter() - start)
 
         if not parse_result or (self.hass and self.hass.config.legacy_templates):
             return render_result
@@ -856,11 +1043,14 @@ class Template:
         self._log_fn = log_fn
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        if (compiled := env.bound_templates.get(self.template)) is None:
+            compiled = env.bound_templates[self.template] = jinja2.Template.from_code(
+                env, self._compiled_code, env.globals, None
+            )
+        self._compiled = compiled
+        self._attributes_by_key = self._compiled_code in _ATTRIBUTES_BY_KEY_CODE
 
-        return self._compiled
+        return compiled
 
     def __eq__(self, other):
         """Compare template with another."""
@@ -1053,15 +1243,37 @@ class TemplateStateBase(State):
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
+    def _collect_state_fields(self, *fields: str) -> None:
+        if self._collect and (render_info := _render_info.get()):
+            render_info.entity_fields[self._entity_id].update(fields)  # type: ignore[attr-defined]
+
+    def _collect_state_attribute(self, key: Any) -> None:
+        if self._collect and (render_info := _render_info.get()):
+            render_info.entity_attributes[self._entity_id].add(key)  # type: ignore[attr-defined]
+
+    def _template_attributes(self) -> ReadOnlyDict[str, Any] | TemplateStateAttributes:
+        """Return the attributes for a lookup in the template code.
+
+        Templates that only read the attributes by key collect the keys
+        they read instead of the whole state.
+        """
+        if (
+            self._collect
+            and (render_info := _render_info.get())
+            and render_info.template._attributes_by_key  # noqa: SLF001
+        ):
+            return TemplateStateAttributes(
+                self._state.attributes,
+                render_info.entity_attributes[self._entity_id],  # type: ignore[arg-type]
+            )
+        return self.attributes
+
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
-            return getattr(self._state, item)
+            return getattr(self, item)
         if item == "entity_id":
             return self._entity_id
         if item == "state_with_unit":
@@ -1079,7 +1291,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_fields("state")
         return self._state.state
 
     @property
@@ -1091,7 +1303,7 @@ class TemplateStateBase(State):
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state_fields("last_changed")
         return self._state.last_changed
 
     @property
@@ -1115,19 +1327,19 @@ class TemplateStateBase(State):
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state_fields()
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state_fields()
         return self._state.object_id
 
     @property
     def name(self) -> str:
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state_attribute(ATTR_FRIENDLY_NAME)
         return self._state.name
 
     @property
@@ -1158,6 +1370,39 @@ class TemplateStateBase(State):
         return self._state.__eq__(other)
 
 
+class TemplateStateAttributes:
+    """Attributes of a template state that collect the keys a template reads.
+
+    Only handed to templates that never use the attributes as a mapping.
+    """
+
+    __slots__ = ("_attributes", "_keys")
+
+    def __init__(self, attributes: ReadOnlyDict[str, Any], keys: set[Any]) -> None:
+        """Initialize template state attributes."""
+        self._attributes = attributes
+        self._keys = keys
+
+    def __getitem__(self, key: Any) -> Any:
+        """Return an attribute and collect its key."""
+        self._keys.add(key)
+        return self._attributes[key]
+
+    def __contains__(self, key: Any) -> bool:
+        """Test if an attribute exists and collect its key."""
+        self._keys.add(key)
+        return key in self._attributes
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return an attribute or the default and collect its key."""
+        self._keys.add(key)
+        return self._attributes.get(key, default)
+
+    def __repr__(self) -> str:
+        """Representation of Template State Attributes."""
+        return f"<template TemplateStateAttributes({self._attributes!r})>"
+
+
 class TemplateState(TemplateStateBase):
     """Class to represent a state object in a template."""
 
@@ -1238,6 +1483,16 @@ def _get_state(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
     return _get_template_state_from_state(hass, entity_id, hass.states.get(entity_id))
 
 
+def _get_state_attribute(hass: HomeAssistant, entity_id: str, key: Any) -> State | None:
+    """Return the state to read an attribute of and collect the attribute key."""
+    if (state := hass.states.get(entity_id)) is None:
+        _collect_state(hass, entity_id)
+        return None
+    if (render_info := _render_info.get()) is not None:
+        render_info.entity_attributes[entity_id].add(key)  # type: ignore[attr-defined]
+    return state
+
+
 def _get_template_state_from_state(
     hass: HomeAssistant, entity_id: str, state: State | None
 ) -> TemplateState | None:
@@ -1929,7 +2184,7 @@ def is_state(hass: HomeAssistant, entity_id: str, state: str | list[str]) -> boo
 
 def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) -> bool:
     """Test if a state's attribute is a specific value."""
-    if (state_obj := _get_state(hass, entity_id)) is not None:
+    if (state_obj := _get_state_attribute(hass, entity_id, name)) is not None:
         attr = state_obj.attributes.get(name, _SENTINEL)
         if attr is _SENTINEL:
             return False
@@ -1939,7 +2194,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
-    if (state_obj := _get_state(hass, entity_id)) is not None:
+    if (state_obj := _get_state_attribute(hass, entity_id, name)) is not None:
         return state_obj.attributes.get(name)
     return None
 
@@ -3083,6 +3338,80 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+def _is_attributes_lookup(node: jinja2.nodes.Node) -> bool:
+    """Return if a node looks up the attributes of an object."""
+    return isinstance(node, jinja2.nodes.Getattr) and node.attr == "attributes"
+
+
+def _reads_attributes_by_key(template: jinja2.nodes.Template) -> bool:
+    """Return if a template only reads state attributes by key.
+
+    Every attributes lookup must be subscripted, tested with in or have
+    get called on it, so the attributes are never used as a mapping.
+    Templates which import, include or extend other templates are not
+    checked, since the code of the other templates is not known.
+    """
+    if any(
+        template.find_all(
+            (
+                jinja2.nodes.Import,
+                jinja2.nodes.FromImport,
+                jinja2.nodes.Include,
+                jinja2.nodes.Extends,
+            )
+        )
+    ):
+        return False
+    if any(
+        (isinstance(node, jinja2.nodes.Filter) and node.name == "attr")
+        or (isinstance(node, jinja2.nodes.Getattr) and node.attr in _FORMAT_METHODS)
+        for node in template.find_all((jinja2.nodes.Filter, jinja2.nodes.Getattr))
+    ):
+        # Both look up attributes by name at runtime
+        return False
+    by_key: set[int] = set()
+    for node in template.find_all(
+        (
+            jinja2.nodes.Getattr,
+            jinja2.nodes.Getitem,
+            jinja2.nodes.Call,
+            jinja2.nodes.Compare,
+        )
+    ):
+        if isinstance(node, jinja2.nodes.Getitem):
+            if _is_attributes_lookup(node.node):
+                by_key.add(id(node.node))
+        elif isinstance(node, jinja2.nodes.Getattr):
+            if (
+                _is_attributes_lookup(node.node)
+                and not hasattr(ReadOnlyDict, node.attr)
+                and not hasattr(TemplateStateAttributes, node.attr)
+            ):
+                by_key.add(id(node.node))
+        elif isinstance(node, jinja2.nodes.Call):
+            if (
+                isinstance(node.node, jinja2.nodes.Getattr)
+                and node.node.attr == "get"
+                and _is_attributes_lookup(node.node.node)
+                and 1 <= len(node.args) <= 2
+                and not node.kwargs
+                and node.dyn_args is None
+                and node.dyn_kwargs is None
+            ):
+                by_key.add(id(node.node.node))
+        else:
+            by_key.update(
+                id(operand.expr)
+                for operand in node.ops
+                if operand.op in ("in", "notin") and _is_attributes_lookup(operand.expr)
+            )
+    return all(
+        id(node) in by_key
+        for node in template.find_all(jinja2.nodes.Getattr)
+        if node.attr == "attributes"
+    )
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -3096,9 +3425,14 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | None
-        ] = weakref.WeakValueDictionary()
+        # The key of the environment in COMPILED_TEMPLATE_LRU, environments
+        # with the same key have the same globals, filters and tests.
+        self.template_cache_kind = (hass is not None, bool(limited), bool(strict))
+        # Templates bound to this environment, shared by the Template
+        # objects with the same source
+        self.bound_templates: weakref.WeakValueDictionary[str, jinja2.Template] = (
+            weakref.WeakValueDictionary()
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.add_extension("jinja2.ext.do")
 
@@ -3514,9 +3848,28 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
-        self.template_cache[source] = compiled
+        if not isinstance(source, str):
+            return super().compile(source)
+
+        try:
+            node = self._parse(source, None, None)
+        except jinja2.TemplateSyntaxError:
+            self.handle_exception(source=source)
+        compiled = super().compile(node)
+        if _reads_attributes_by_key(node):
+            _ATTRIBUTES_BY_KEY_CODE.add(compiled)
+        COMPILED_TEMPLATE_LRU[(self.template_cache_kind, source)] = compiled
         return compiled
 
+    def getattr(self, obj: Any, attribute: str) -> Any:
+        """Get an attribute of an object for the template code."""
+        if attribute == "attributes" and isinstance(obj, TemplateStateBase):
+            return obj._template_attributes()  # noqa: SLF001
+        return super().getattr(obj, attribute)
+
+    def get_cached_code(self, source: str) -> CodeType | None:
+        """Return the cached code of a source compiled for this kind of environment."""
+        return COMPILED_TEMPLATE_LRU.get((self.template_cache_kind, source))
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
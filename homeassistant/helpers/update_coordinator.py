@@ -8,9 +8,8 @@ from collections.abc import Awaitable, Callable, Coroutine, Generator
 from datetime import datetime, timedelta
 from functools import partial
 import logging
-from random import randint
 from time import monotonic
-from typing import Any, Generic, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar
 import urllib.error
 
 import aiohttp
@@ -28,9 +27,10 @@ from homeassistant.exceptions import (
 )
 from homeassistant.util.dt import utcnow
 
-from . import entity, event
+from . import entity
 from .debounce import Debouncer
 from .frame import report_usage
+from .poll_scheduler import Poller
 from .typing import UNDEFINED, UndefinedType
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
@@ -59,6 +59,18 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting :attr:`max_update_interval` will cause the update interval to be
+    increased up to it while refreshes do not change the data, a refresh that
+    changes the data resets the interval to :attr:`update_interval`.
+
+    Setting :attr:`host_concurrency` will limit the scheduled refreshes of
+    config entries with the same ``host`` running at the same time.
+
+    Setting :attr:`batch_writes` to ``True`` will cause the states written by
+    the listeners to be set together once all listeners were called, firing
+    their events in one go. Listeners will not see the states written by the
+    listeners called before them.
     """
 
     def __init__(
@@ -73,6 +85,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        batch_writes: bool = False,
+        max_update_interval: timedelta | None = None,
+        host_concurrency: int | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -82,6 +97,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.setup_method = setup_method
         self._update_interval_seconds: float | None = None
         self.update_interval = update_interval
+        self.max_update_interval = max_update_interval
+        self.host_concurrency = host_concurrency
         self._shutdown_requested = False
         if config_entry is UNDEFINED:
             # late import to avoid circular imports
@@ -100,6 +117,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         else:
             self.config_entry = config_entry
         self.always_update = always_update
+        self.batch_writes = batch_writes
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -108,15 +126,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # when it was already checked during setup.
         self.data: _DataT = None  # type: ignore[assignment]
 
-        # Pick a random microsecond in range 0.05..0.50 to stagger the refreshes
-        # and avoid a thundering herd.
-        self._microsecond = (
-            randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
-        )
-
         self._listeners: dict[int, tuple[CALLBACK_TYPE, object | None]] = {}
         self._last_listener_id: int = 0
         self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._poller: Poller | None = None
         self._unsub_shutdown: CALLBACK_TYPE | None = None
         self._request_refresh_task: asyncio.TimerHandle | None = None
         self.last_update_success = True
@@ -186,8 +199,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        if not self.batch_writes:
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+            return
+        with self.hass.states.async_batch_internal():
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
@@ -244,18 +262,33 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # than the debouncer cooldown, this would cause the debounce to never be called
         self._async_unsub_refresh()
 
-        # We use loop.call_at because DataUpdateCoordinator does
+        # We use loop time because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
         # calling dt_util.utcnow() on every update.
         hass = self.hass
-        loop = hass.loop
+        max_interval = (
+            self.max_update_interval.total_seconds()
+            if self.max_update_interval
+            else None
+        )
+        if (poller := self._poller) is None:
+            poller = self._poller = Poller(
+                hass,
+                self.name,
+                self.__wrap_handle_refresh_interval,
+                self._update_interval_seconds,
+                max_interval=max_interval,
+                config_entry=self.config_entry,
+                host_concurrency=self.host_concurrency,
+            )
+        else:
+            poller.async_set_interval(self._update_interval_seconds, max_interval)
 
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+        poller.async_schedule(
+            # The jitter of the poller staggers the refreshes
+            int(hass.loop.time()) + poller.interval
         )
-        self._unsub_refresh = loop.call_at(
-            next_refresh, self.__wrap_handle_refresh_interval
-        ).cancel
+        self._unsub_refresh = poller.async_cancel
 
     @callback
     def __wrap_handle_refresh_interval(self) -> None:
@@ -277,7 +310,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        if TYPE_CHECKING:
+            assert self._poller is not None
+        async with self._poller.limit:
+            await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
@@ -381,7 +417,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or (scheduled and self.hass.is_stopping):
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
+        log_timing = self.logger.isEnabledFor(logging.DEBUG)
+        if log_timing or scheduled:
             start = monotonic()
 
         auth_failed = False
@@ -481,15 +518,47 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_refresh_finished()
 
         if not self.last_update_success and not previous_update_success:
+            if scheduled:
+                self._async_record_poll(monotonic() - start, False)
             return
 
-        if (
-            self.always_update
-            or self.last_update_success != previous_update_success
-            or previous_data != self.data
-        ):
+        changed: bool | None = self.last_update_success != previous_update_success
+        if not changed:
+            if not self.always_update or (
+                scheduled and self._poller is not None and self._poller.adaptive
+            ):
+                changed = self._async_data_changed(previous_data)
+            elif scheduled:
+                # The data of an always updating coordinator is only
+                # compared when it may slow down the refreshes
+                changed = None
+        if scheduled:
+            self._async_record_poll(monotonic() - start, changed)
+
+        if self.always_update or changed:
             self.async_update_listeners()
 
+    @callback
+    def _async_data_changed(self, previous_data: _DataT | None) -> bool:
+        """Return if the data changed.
+
+        Data which can't be compared counts as changed.
+        """
+        try:
+            return bool(previous_data != self.data)
+        except (TypeError, ValueError):
+            return True
+
+    @callback
+    def _async_record_poll(self, duration: float, changed: bool | None) -> None:
+        """Record a scheduled refresh, rescheduling if the interval changed."""
+        if (poller := self._poller) is None:
+            return
+        interval = poller.interval
+        poller.async_record_poll(duration, changed)
+        if poller.interval != interval and self._unsub_refresh is not None:
+            self._schedule_refresh()
+
     @callback
     def _async_refresh_finished(self) -> None:
         """Handle when a refresh has finished.
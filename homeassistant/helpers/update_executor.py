@@ -0,0 +1,164 @@
+"""Run the updates of sync entities in the executor with per-integration quotas."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+DATA_UPDATE_POOL: HassKey[UpdatePool] = HassKey("update_pool")
+
+# Threads of the default executor the updates of all integrations may hold,
+# half of its threads are left to the other executor jobs
+MAX_UPDATE_POOL_WORKERS = 32
+
+# Threads of the pool the updates of one integration may hold
+DEFAULT_UPDATE_QUOTA = 8
+
+
+class UpdateExecutor:
+    """Executor running the updates of the sync entities of an integration.
+
+    The updates run in the pool shared by all integrations. Every integration
+    has the same quota, so an integration with stalled updates holds at most
+    that many threads of the pool. The parallel updates of the platforms
+    still limit the updates of each platform. Updates of an integration run
+    in the order they were added.
+    """
+
+    def __init__(self, pool: UpdatePool, integration: str) -> None:
+        """Initialize the executor."""
+        self.integration = integration
+        self._pool = pool
+        self.quota = DEFAULT_UPDATE_QUOTA
+        self._queue: deque[tuple[Callable[[], Any], asyncio.Future[Any]]] = deque()
+        self.running = 0
+        self.max_pending = 0
+        self.jobs = 0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of jobs added and not done yet."""
+        return self.running + len(self._queue)
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of jobs waiting for a thread."""
+        return len(self._queue)
+
+    @property
+    def can_start(self) -> bool:
+        """Return if a job is waiting and the quota allows it to start."""
+        return bool(self._queue) and self.running < self.quota
+
+    @callback
+    def async_add_job[_T](self, target: Callable[[], _T]) -> asyncio.Future[_T]:
+        """Add a job to the executor."""
+        future: asyncio.Future[_T] = self._pool.hass.loop.create_future()
+        self._queue.append((target, future))
+        self.jobs += 1
+        self.max_pending = max(self.pending, self.max_pending)
+        self._pool.async_schedule(self)
+        return future
+
+    @callback
+    def async_start_job(self) -> None:
+        """Start the next job in the pool."""
+        target, future = self._queue.popleft()
+        self.running += 1
+        self._pool.async_run(self, target, future)
+
+    @callback
+    def async_job_done(self) -> None:
+        """Count a done job."""
+        self.running -= 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the executor as a dictionary for the diagnostics."""
+        return {
+            "jobs": self.jobs,
+            "pending": self.pending,
+            "queue_depth": self.queue_depth,
+            "max_pending": self.max_pending,
+            "quota": self.quota,
+        }
+
+
+class UpdatePool:
+    """Pool of threads of the default executor running the update jobs.
+
+    When the pool is busy, the executors which can start a job take turns,
+    so every integration gets a thread in order.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self.executors: dict[str, UpdateExecutor] = {}
+        self._waiting: deque[UpdateExecutor] = deque()
+        self.running = 0
+
+    @callback
+    def async_schedule(self, executor: UpdateExecutor) -> None:
+        """Schedule the jobs of an executor which can start."""
+        if executor.can_start and executor not in self._waiting:
+            self._waiting.append(executor)
+        self._async_dispatch()
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Start jobs while the pool has free threads, one executor at a time."""
+        while self.running < MAX_UPDATE_POOL_WORKERS and self._waiting:
+            executor = self._waiting.popleft()
+            executor.async_start_job()
+            if executor.can_start:
+                self._waiting.append(executor)
+
+    @callback
+    def async_run(
+        self,
+        executor: UpdateExecutor,
+        target: Callable[[], Any],
+        future: asyncio.Future[Any],
+    ) -> None:
+        """Run a job of an executor in a thread of the pool."""
+        self.running += 1
+        job = self.hass.loop.run_in_executor(None, target)
+
+        @callback
+        def _async_job_done(job: asyncio.Future[Any]) -> None:
+            """Pass the result of the job and start the next jobs."""
+            self.running -= 1
+            executor.async_job_done()
+            if not future.done():
+                if job.cancelled():
+                    future.cancel()
+                elif (exc := job.exception()) is not None:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(job.result())
+            self.async_schedule(executor)
+
+        job.add_done_callback(_async_job_done)
+
+
+@callback
+@singleton(DATA_UPDATE_POOL)
+def _async_get_update_pool(hass: HomeAssistant) -> UpdatePool:
+    """Get the update pool."""
+    return UpdatePool(hass)
+
+
+@callback
+def async_get_update_executor(hass: HomeAssistant, integration: str) -> UpdateExecutor:
+    """Get the update executor of an integration."""
+    pool = _async_get_update_pool(hass)
+    if (executor := pool.executors.get(integration)) is None:
+        executor = pool.executors[integration] = UpdateExecutor(pool, integration)
+    return executor
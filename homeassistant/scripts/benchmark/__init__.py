@@ -7,6 +7,9 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import os
+import tempfile
+import threading
 from timeit import default_timer as timer
 
 from homeassistant import core
@@ -308,3 +311,396 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_subscriptions(hass: core.HomeAssistant) -> float:
+    """Match 10k MQTT messages against 1k wildcard subscriptions.
+
+    A runtime below 1s means the dispatch keeps up with 10k messages/s.
+    """
+    from homeassistant.components.mqtt.util import TopicTrie  # noqa: PLC0415
+
+    subscriptions: TopicTrie[int] = TopicTrie()
+    for idx in range(1000):
+        if idx % 2:
+            subscriptions.add(f"zigbee2mqtt/device_{idx}/+", idx)
+        else:
+            subscriptions.add(f"tasmota/discovery/device_{idx}/#", idx)
+    topics = [
+        f"zigbee2mqtt/device_{idx % 1000}/state"
+        if idx % 2
+        else f"tasmota/discovery/device_{idx % 1000}/config/sensors"
+        for idx in range(10**4)
+    ]
+    count = 0
+
+    start = timer()
+    for topic in topics:
+        count += len(subscriptions.match(topic))
+    runtime = timer() - start
+
+    assert count == 10**4
+    return runtime
+
+
+def _benchmark_db_url(tmp_dir: str) -> str:
+    """Return the database URL of the recorder benchmarks.
+
+    The database is a SQLite file in tmp_dir unless BENCHMARK_RECORDER_DB_URL
+    points to a MariaDB or PostgreSQL database.
+    """
+    return os.environ.get(
+        "BENCHMARK_RECORDER_DB_URL", f"sqlite:///{tmp_dir}/benchmark.db"
+    )
+
+
+def _start_benchmark_recorder(hass: core.HomeAssistant, db_url: str):
+    """Return a recorder writing to db_url from the calling thread.
+
+    The recorder thread is not started, the caller processes the events
+    and closes the connection.
+    """
+    from homeassistant.components.recorder import Recorder  # noqa: PLC0415
+    from homeassistant.components.recorder.db_schema import (  # noqa: PLC0415
+        SCHEMA_VERSION,
+    )
+
+    recorder = Recorder(hass, False, False, False, 1, 5, db_url, 1, 0, None, set())
+    recorder.recorder_and_worker_thread_ids.add(threading.get_ident())
+    recorder._setup_connection()  # noqa: SLF001
+    recorder.schema_version = SCHEMA_VERSION
+    recorder.states_meta_manager.active = True
+    recorder._open_event_session()  # noqa: SLF001
+    return recorder
+
+
+async def _recorder_writes(hass: core.HomeAssistant, bulk_writes: bool) -> float:
+    """Record 30k state changes of 500 sensors.
+
+    The recorder runs in its thread and the states are set in windows of
+    1500, which is 300 state changes/s with the default commit interval.
+    The runtime ends when the last window is committed.
+    """
+    from homeassistant.components.recorder import Recorder  # noqa: PLC0415
+    from homeassistant.helpers.recorder import (  # noqa: PLC0415
+        DATA_INSTANCE,
+        DATA_RECORDER,
+        RecorderData,
+    )
+
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(500)]
+    attributes = {"unit_of_measurement": "W"}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.data[DATA_RECORDER] = RecorderData()
+        recorder = hass.data[DATA_INSTANCE] = Recorder(
+            hass,
+            auto_purge=False,
+            auto_repack=False,
+            bulk_writes=bulk_writes,
+            keep_days=1,
+            commit_interval=5,
+            uri=_benchmark_db_url(tmp_dir),
+            db_max_retries=1,
+            db_retry_wait=0,
+            entity_filter=None,
+            exclude_event_types=set(),
+        )
+        hass.set_state(core.CoreState.running)
+        recorder.async_initialize()
+        recorder.async_register()
+        recorder.start()
+        assert await recorder.async_db_ready
+
+        start = timer()
+        for idx in range(30000):
+            round_, sensor = divmod(idx, len(entity_ids))
+            hass.states.async_set(entity_ids[sensor], str(round_ % 100), attributes)
+            if idx % 1500 == 1499:
+                await recorder.async_block_till_done()
+        runtime = timer() - start
+
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def recorder_bulk_writes(hass: core.HomeAssistant) -> float:
+    """Replay 30k state changes into the recorder database with bulk writes."""
+    return await _recorder_writes(hass, True)
+
+
+@benchmark
+async def recorder_writes(hass: core.HomeAssistant) -> float:
+    """Replay 30k state changes into the recorder database without bulk writes."""
+    return await _recorder_writes(hass, False)
+
+
+def _statistics_characteristics(incremental: bool) -> float:
+    """Feed 20k samples into statistics buffers of 5k samples.
+
+    Each characteristic is computed after every sample, with its
+    incremental engine or over the whole buffer.
+    """
+    from collections import deque  # noqa: PLC0415
+    import random  # noqa: PLC0415
+
+    from homeassistant.components.statistics.sensor import (  # noqa: PLC0415
+        STATS_NUMERIC_SUPPORT,
+        _create_characteristic_engine,
+    )
+
+    rng = random.Random(0)
+    samples = [(rng.uniform(0, 100), float(idx)) for idx in range(20000)]
+    runtime = 0.0
+    for characteristic in (
+        "mean",
+        "standard_deviation",
+        "median",
+        "percentile",
+        "value_max",
+        "average_linear",
+    ):
+        states: deque[bool | float] = deque(maxlen=5000)
+        ages: deque[float] = deque(maxlen=5000)
+        engine = _create_characteristic_engine(characteristic, False)
+        assert engine is not None
+        compute = engine.value if incremental else STATS_NUMERIC_SUPPORT[characteristic]
+        start = timer()
+        for value, age in samples:
+            if incremental and len(states) == 5000:
+                engine.remove(states, ages)
+            states.append(value)
+            ages.append(age)
+            if incremental:
+                engine.add(states, ages)
+            compute(states, ages, 95)
+        runtime += timer() - start
+    return runtime
+
+
+@benchmark
+async def statistics_characteristics(hass: core.HomeAssistant) -> float:
+    """Update statistics characteristics with their incremental engines."""
+    return _statistics_characteristics(True)
+
+
+@benchmark
+async def statistics_characteristics_full(hass: core.HomeAssistant) -> float:
+    """Compute statistics characteristics over the whole buffer."""
+    return _statistics_characteristics(False)
+
+
+async def _entity_write_ha_state(hass: core.HomeAssistant, changing: bool) -> float:
+    """Write the state of 500 entities 200 times each.
+
+    Half of the entities set _attr_ properties, the other half are sensors
+    with a native value. With changing a new value is set before every
+    write.
+    """
+    from homeassistant.components.sensor import (  # noqa: PLC0415
+        SensorDeviceClass,
+        SensorEntity,
+        SensorStateClass,
+    )
+    from homeassistant.core_config import DATA_CUSTOMIZE  # noqa: PLC0415
+    from homeassistant.helpers.entity import Entity  # noqa: PLC0415
+    from homeassistant.helpers.entity_values import EntityValues  # noqa: PLC0415
+
+    class BenchmarkEntity(Entity):
+        _attr_should_poll = False
+
+    class BenchmarkSensor(SensorEntity):
+        _attr_should_poll = False
+        _attr_device_class = SensorDeviceClass.POWER
+        _attr_native_unit_of_measurement = "W"
+        _attr_state_class = SensorStateClass.MEASUREMENT
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues()
+    entities: list[Entity] = []
+    for idx in range(500):
+        entity: Entity = BenchmarkEntity() if idx % 2 else BenchmarkSensor()
+        entity.hass = hass
+        entity.entity_id = f"sensor.benchmark_{idx}"
+        entity._attr_name = f"Benchmark {idx}"  # noqa: SLF001
+        entity._attr_extra_state_attributes = {  # noqa: SLF001
+            "voltage": 230,
+            "current": 1.5,
+            "power_factor": 0.98,
+            "firmware": "1.2.3",
+        }
+        entity.async_write_ha_state()
+        entities.append(entity)
+
+    start = timer()
+    for value in range(200):
+        for entity in entities:
+            if changing:
+                if isinstance(entity, SensorEntity):
+                    entity._attr_native_value = value  # noqa: SLF001
+                else:
+                    entity._attr_state = value  # noqa: SLF001
+            entity.async_write_ha_state()
+    return timer() - start
+
+
+@benchmark
+async def entity_write_ha_state(hass: core.HomeAssistant) -> float:
+    """Write the unchanged state of 500 entities 200 times each."""
+    return await _entity_write_ha_state(hass, False)
+
+
+@benchmark
+async def entity_write_ha_state_changing(hass: core.HomeAssistant) -> float:
+    """Write a new state of 500 entities 200 times each."""
+    return await _entity_write_ha_state(hass, True)
+
+
+async def _coordinator_writes(hass: core.HomeAssistant, batch_writes: bool) -> float:
+    """Update 500 coordinator entities 200 times.
+
+    Every entity state is tracked by a state change listener and all
+    state_changed events are listened to.
+    """
+    from homeassistant.helpers.update_coordinator import (  # noqa: PLC0415
+        CoordinatorEntity,
+        DataUpdateCoordinator,
+    )
+
+    class BenchmarkEntity(CoordinatorEntity):
+        @property
+        def state(self):
+            return self.coordinator.data
+
+    coordinator = DataUpdateCoordinator[int](
+        hass, logging.getLogger(__name__), config_entry=None, name="benchmark"
+    )
+    coordinator.batch_writes = batch_writes
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(500)]
+    for entity_id in entity_ids:
+        entity = BenchmarkEntity(coordinator)
+        entity.hass = hass
+        entity.entity_id = entity_id
+        coordinator.async_add_listener(entity._handle_coordinator_update)  # noqa: SLF001
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    async_track_state_change_event(hass, entity_ids, listener)
+
+    coordinator.data = -1
+    coordinator.async_update_listeners()
+    start = timer()
+    for value in range(200):
+        coordinator.data = value
+        coordinator.async_update_listeners()
+        # Run the listeners of the tracked entities
+        await asyncio.sleep(0)
+    return timer() - start
+
+
+@benchmark
+async def coordinator_batch_writes(hass: core.HomeAssistant) -> float:
+    """Update 500 coordinator entities 200 times with batched writes."""
+    return await _coordinator_writes(hass, True)
+
+
+@benchmark
+async def coordinator_writes(hass: core.HomeAssistant) -> float:
+    """Update 500 coordinator entities 200 times without batched writes."""
+    return await _coordinator_writes(hass, False)
+
+
+async def _sensor_compile_statistics(
+    hass: core.HomeAssistant, mixed_units: bool
+) -> float:
+    """Compile the 5-minute statistics of 5k measurement sensors.
+
+    Every sensor has a state at the start of the period and 10 changes
+    during it. With mixed_units every other state is in kW instead of W,
+    so the states of all sensors have to be normalized.
+    """
+    from datetime import timedelta  # noqa: PLC0415
+
+    from homeassistant.components.recorder.util import session_scope  # noqa: PLC0415
+    from homeassistant.components.sensor import (  # noqa: PLC0415
+        recorder as sensor_recorder,
+    )
+    from homeassistant.helpers.recorder import (  # noqa: PLC0415
+        DATA_INSTANCE,
+        DATA_RECORDER,
+        RecorderData,
+    )
+    from homeassistant.util import dt as dt_util  # noqa: PLC0415
+
+    hass.data[DATA_RECORDER] = RecorderData()
+    sensors = 5000
+    end = dt_util.utcnow().replace(second=0, microsecond=0)
+    start = end - timedelta(minutes=5)
+    watt = {
+        "unit_of_measurement": "W",
+        "state_class": "measurement",
+        "device_class": "power",
+    }
+    kilowatt = {**watt, "unit_of_measurement": "kW"}
+    events: list[core.Event] = []
+    for idx in range(sensors):
+        entity_id = f"sensor.benchmark_{idx}"
+        old_state: core.State | None = None
+        for change in range(11):
+            value = (idx + change) % 100
+            if mixed_units and change % 2:
+                state, attributes = str(value / 1000), kilowatt
+            else:
+                state, attributes = str(value), watt
+            new_state = core.State(
+                entity_id,
+                state,
+                attributes,
+                last_updated=start + timedelta(seconds=27 * change - 1),
+            )
+            events.append(
+                core.Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_state,
+                        "new_state": new_state,
+                    },
+                )
+            )
+            old_state = new_state
+        hass.states.async_set(entity_id, new_state.state, new_state.attributes)
+
+    def _compile(db_url: str) -> float:
+        recorder = _start_benchmark_recorder(hass, db_url)
+        hass.data[DATA_INSTANCE] = recorder
+        for event in events:
+            recorder._process_one_event(event)  # noqa: SLF001
+        recorder._commit_event_session_or_retry()  # noqa: SLF001
+        recorder._close_event_session()  # noqa: SLF001
+        with session_scope(session=recorder.get_session()) as session:
+            compile_start = timer()
+            compiled = sensor_recorder.compile_statistics(hass, session, start, end)
+            runtime = timer() - compile_start
+        recorder._close_connection()  # noqa: SLF001
+        assert len(compiled.platform_stats) == sensors
+        return runtime
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        return await hass.async_add_executor_job(_compile, _benchmark_db_url(tmp_dir))
+
+
+@benchmark
+async def sensor_compile_statistics(hass: core.HomeAssistant) -> float:
+    """Compile the statistics of 5k sensors with states in a single unit."""
+    return await _sensor_compile_statistics(hass, False)
+
+
+@benchmark
+async def sensor_compile_statistics_mixed_units(hass: core.HomeAssistant) -> float:
+    """Compile the statistics of 5k sensors with states in W and kW."""
+    return await _sensor_compile_statistics(hass, True)
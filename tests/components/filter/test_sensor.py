@@ -545,6 +545,42 @@ def test_time_sma(values: list[State]) -> None:
     assert filtered.state == 21.5
 
 
+def test_time_sma_many_samples() -> None:
+    """Test the time_sma filter keeps all the samples of its window."""
+    filt = TimeSMAFilter(
+        window_size=timedelta(minutes=30), precision=2, entity=None, type="last"
+    )
+    timestamp = dt_util.utcnow()
+    samples: list[tuple[float, float]] = []
+    for minute in range(60):
+        value = float(minute % 7)
+        filtered = filt.filter_state(
+            State("sensor.test_monitored", str(value), last_updated=timestamp)
+        )
+        samples.append((timestamp.timestamp(), value))
+        timestamp += timedelta(minutes=1)
+
+    # The last 30 samples span the window, each weighted by one minute
+    assert filtered.state == round(sum(value for _, value in samples[-31:-1]) / 30, 2)
+
+
+def test_filter_chain_values(values: list[State]) -> None:
+    """Test passing values through a chain of filters."""
+    chain = [
+        OutlierFilter(window_size=3, precision=2, entity=None, radius=4.0),
+        LowPassFilter(window_size=10, precision=2, entity=None, time_constant=10),
+    ]
+    filtered = []
+    for state in values:
+        value: float | str = float(state.state)
+        for filt in chain:
+            value = filt.filter_value(state.last_updated_timestamp, value)
+        filtered.append(value)
+    # The outlier filter replaces the last value 0 by the median 21 of its
+    # window, the low pass filter then weighs each value with 1/10
+    assert filtered == [20, 19.9, 19.71, 19.84, 20.06, 20.15]
+
+
 async def test_reload(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Verify we can reload filter sensors."""
     hass.states.async_set("sensor.test_monitored", 12345)
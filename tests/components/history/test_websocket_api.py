@@ -1,7 +1,7 @@
 """The tests the History component websocket_api."""
 
 import asyncio
-from datetime import timedelta
+from datetime import datetime, timedelta
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
@@ -9,7 +9,8 @@ import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.tasks import DownsampleStatesTask
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -2154,3 +2155,138 @@ async def test_history_stream_live_chained_events(
         "id": 1,
         "type": "event",
     }
+
+
+async def _async_record_downsampled_power(hass: HomeAssistant) -> datetime:
+    """Record five minutes of a power sensor and compile the downsampled tiers."""
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow().replace(second=0, microsecond=0) - timedelta(hours=1)
+    with freeze_time(start) as freezer:
+        for idx in range(30):
+            freezer.move_to(start + timedelta(seconds=idx * 10))
+            hass.states.async_set("sensor.power", str(idx))
+        await async_wait_recording_done(hass)
+    get_instance(hass).queue_task(DownsampleStatesTask(dt_util.utcnow()))
+    await async_wait_recording_done(hass)
+    return start
+
+
+@pytest.mark.parametrize("resolution", [None, 30])
+async def test_history_during_period_resolution(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    resolution: int | None,
+) -> None:
+    """Test history_during_period only reads downsampled states with a resolution."""
+    start = await _async_record_downsampled_power(hass)
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.recorder.history.modern.DOWNSAMPLE_MIN_SPAN", 0
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(minutes=5)).isoformat(),
+                "entity_ids": ["sensor.power"],
+                "minimal_response": True,
+                "no_attributes": True,
+                "resolution": 60 if resolution else 30,
+            }
+        )
+        response = await client.receive_json()
+    assert response["success"]
+    states = response["result"]["sensor.power"]
+    if not resolution:
+        assert len(states) == 29
+        return
+    assert len(states) == 5
+    assert states[1] == {
+        "s": "11",
+        "lu": start.timestamp() + 110,
+        "min": 6.0,
+        "max": 11.0,
+    }
+
+
+async def test_history_stream_resolution(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream reads downsampled states with a resolution."""
+    start = await _async_record_downsampled_power(hass)
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.recorder.history.modern.DOWNSAMPLE_MIN_SPAN", 0
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "history/stream",
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(minutes=5)).isoformat(),
+                "entity_ids": ["sensor.power"],
+                "minimal_response": True,
+                "no_attributes": True,
+                "resolution": 60,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+    states = response["event"]["states"]["sensor.power"]
+    assert [state.get("max") for state in states] == [5.0, 11.0, 17.0, 23.0, 29.0]
+
+
+async def test_history_stream_long_period_in_chunks(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends long periods in chunks, oldest first."""
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        days=4
+    )
+    state_times = [
+        start + timedelta(hours=1),
+        # Exactly at the start of the second chunk
+        start + timedelta(days=1),
+        start + timedelta(days=1, hours=1),
+        start + timedelta(days=2, hours=5),
+    ]
+    with freeze_time(start) as freezer:
+        for idx, state_time in enumerate(state_times):
+            freezer.move_to(state_time)
+            hass.states.async_set("sensor.power", str(idx))
+        await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "history/stream",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(days=3)).isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "no_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    chunks = []
+    for _ in range(3):
+        response = await client.receive_json()
+        event = response["event"]
+        chunks.append(
+            (
+                event["start_time"],
+                [state["s"] for state in event["states"]["sensor.power"]],
+            )
+        )
+    assert chunks == [
+        (start.timestamp(), ["0"]),
+        ((start + timedelta(days=1)).timestamp(), ["1", "2"]),
+        ((start + timedelta(days=2)).timestamp(), ["3"]),
+    ]
+    assert event["end_time"] == state_times[-1].timestamp()
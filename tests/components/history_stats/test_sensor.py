@@ -14,6 +14,7 @@ from homeassistant.components.history_stats.const import (
     DEFAULT_NAME,
     DOMAIN,
 )
+from homeassistant.components.history_stats.data import HistoryIntervals
 from homeassistant.components.history_stats.sensor import (
     PLATFORM_SCHEMA as SENSOR_SCHEMA,
 )
@@ -2099,3 +2100,31 @@ async def test_device_id(
     history_stats_entity = entity_registry.async_get("sensor.history_stats")
     assert history_stats_entity is not None
     assert history_stats_entity.device_id == source_entity.device_id
+
+
+def test_history_intervals() -> None:
+    """Test the seconds and changes of the history intervals."""
+    intervals = HistoryIntervals({"on"})
+    for state, last_changed in (
+        ("off", 100.0),
+        ("on", 110.0),
+        ("off", 130.0),
+        ("on", 160.0),
+        ("on", 170.0),
+        ("off", 200.0),
+    ):
+        intervals.append(state, last_changed)
+
+    assert intervals.compute(300, 100, 300) == (60.0, 2)
+    # Changes after now or the end are not counted
+    assert intervals.compute(180, 100, 300) == (40.0, 2)
+    assert intervals.compute(300, 100, 165) == (25.0, 2)
+
+    # The state before the start counts from the start
+    intervals.prune(120)
+    assert intervals.compute(300, 120, 300) == (50.0, 2)
+    intervals.prune(165)
+    assert intervals.compute(300, 165, 300) == (35.0, 1)
+
+    intervals.clear()
+    assert intervals.compute(300, 165, 300) == (0.0, 0)
@@ -7,10 +7,13 @@ from http import HTTPStatus
 import logging
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import influxdb
+from homeassistant.components.influxdb.buffer import EventBuffer
 from homeassistant.components.influxdb.const import DEFAULT_BUCKET
+from homeassistant.components.influxdb.line_protocol import EPOCH, LineProtocolEncoder
 from homeassistant.const import PERCENTAGE, STATE_OFF, STATE_ON, STATE_STANDBY
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.setup import async_setup_component
@@ -65,12 +68,36 @@ def mock_client_fixture(
         yield client
 
 
+class _Lines:
+    """Match the lines written for points, whatever their time."""
+
+    def __init__(self, body: list[dict], precision: str | None) -> None:
+        """Encode the points without their time."""
+        encode = LineProtocolEncoder(precision).encode
+        self.lines = [
+            line.rsplit(" ", 1)[0]
+            for point in body
+            if (line := encode({**point, "time": EPOCH})) is not None
+        ]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the written lines without their time."""
+        return (
+            isinstance(other, list)
+            and [line.rsplit(" ", 1)[0] for line in other] == self.lines
+        )
+
+    def __repr__(self) -> str:
+        """Return the lines for the assertion messages."""
+        return repr(self.lines)
+
+
 @pytest.fixture(name="get_mock_call")
 def get_mock_call_fixture(request: pytest.FixtureRequest):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": _Lines(body, precision)}
 
         if precision is not None:
             data["write_precision"] = precision
@@ -79,7 +106,9 @@ def get_mock_call_fixture(request: pytest.FixtureRequest):
 
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: call(
+        _Lines(body, precision), time_precision=precision, protocol="line"
+    )
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -378,10 +407,10 @@ async def test_event_listener(
 
     # map of HA State to valid influxdb [state, value] fields
     valid = {
-        "1": [None, 1],
+        "1": [None, 1.0],
         "1.0": [None, 1.0],
-        STATE_ON: [STATE_ON, 1],
-        STATE_OFF: [STATE_OFF, 0],
+        STATE_ON: [STATE_ON, 1.0],
+        STATE_OFF: [STATE_OFF, 0.0],
         STATE_STANDBY: [STATE_STANDBY, None],
         "foo": ["foo", None],
     }
@@ -411,15 +440,13 @@ async def test_event_listener(
                     "last_seen_str": "Last seen 23 minutes ago",
                     "last_seen": 23.0,
                     "updated_at_str": "2017-01-01 00:00:00",
-                    "updated_at": 20170101000000,
+                    "updated_at": 20170101000000.0,
                     "multi_periods_str": "0.120.240.2023873",
                 },
             }
         ]
-        if out[0] is not None:
-            body[0]["fields"]["state"] = out[0]
-        if out[1] is not None:
-            body[0]["fields"]["value"] = out[1]
+        # The state and value are written first, missing ones are not written
+        body[0]["fields"] = {"state": out[0], "value": out[1], **body[0]["fields"]}
 
         hass.states.async_set("fake.entity_id", in_, attrs)
         await hass.async_block_till_done()
@@ -465,7 +492,7 @@ async def test_event_listener_no_units(
                 "measurement": "fake.entity_id",
                 "tags": {"domain": "fake", "entity_id": "entity_id"},
                 "time": ANY,
-                "fields": {"value": 1},
+                "fields": {"value": 1.0},
             }
         ]
         hass.states.async_set("fake.entity_id", 1, attrs)
@@ -508,7 +535,7 @@ async def test_event_listener_inf(
             "measurement": "fake.entity_id",
             "tags": {"domain": "fake", "entity_id": "entity_id"},
             "time": ANY,
-            "fields": {"value": 8},
+            "fields": {"value": 8.0},
         }
     ]
     hass.states.async_set("fake.entity_id", 8, attrs)
@@ -550,7 +577,7 @@ async def test_event_listener_states(
                 "measurement": "fake.entity_id",
                 "tags": {"domain": "fake", "entity_id": "entity_id"},
                 "time": ANY,
-                "fields": {"value": 1},
+                "fields": {"value": 1.0},
             }
         ]
         hass.states.async_set("fake.entity_id", state_state)
@@ -575,7 +602,7 @@ async def execute_filter_test(hass: HomeAssistant, tests, write_api, get_mock_ca
                 "measurement": test.id,
                 "tags": {"domain": domain, "entity_id": entity_id},
                 "time": ANY,
-                "fields": {"value": 1},
+                "fields": {"value": 1.0},
             }
         ]
         hass.states.async_set(test.id, 1)
@@ -910,10 +937,10 @@ async def test_event_listener_invalid_type(
 
     # map of HA State to valid influxdb [state, value] fields
     valid = {
-        "1": [None, 1],
+        "1": [None, 1.0],
         "1.0": [None, 1.0],
-        STATE_ON: [STATE_ON, 1],
-        STATE_OFF: [STATE_OFF, 0],
+        STATE_ON: [STATE_ON, 1.0],
+        STATE_OFF: [STATE_OFF, 0.0],
         STATE_STANDBY: [STATE_STANDBY, None],
         "foo": ["foo", None],
     }
@@ -936,10 +963,8 @@ async def test_event_listener_invalid_type(
                 },
             }
         ]
-        if out[0] is not None:
-            body[0]["fields"]["state"] = out[0]
-        if out[1] is not None:
-            body[0]["fields"]["value"] = out[1]
+        # The state and value are written first, missing ones are not written
+        body[0]["fields"] = {"state": out[0], "value": out[1], **body[0]["fields"]}
 
         hass.states.async_set("fake.entity_id", in_, attrs)
         await hass.async_block_till_done()
@@ -981,7 +1006,7 @@ async def test_event_listener_default_measurement(
             "measurement": "state",
             "tags": {"domain": "fake", "entity_id": "ok"},
             "time": ANY,
-            "fields": {"value": 1},
+            "fields": {"value": 1.0},
         }
     ]
     hass.states.async_set("fake.ok", 1)
@@ -1073,7 +1098,7 @@ async def test_event_listener_tags_attributes(
                 "friendly_fake": "tag_str",
             },
             "time": ANY,
-            "fields": {"value": 1, "field_fake_str": "field_str"},
+            "fields": {"value": 1.0, "field_fake_str": "field_str"},
         }
     ]
     hass.states.async_set("fake.something", 1, attrs)
@@ -1131,7 +1156,7 @@ async def test_event_listener_component_override_measurement(
                 "measurement": comp["res"],
                 "tags": {"domain": comp["domain"], "entity_id": comp["id"]},
                 "time": ANY,
-                "fields": {"value": 1},
+                "fields": {"value": 1.0},
             }
         ]
         hass.states.async_set(f"{comp['domain']}.{comp['id']}", 1)
@@ -1197,7 +1222,7 @@ async def test_event_listener_component_measurement_attr(
                 "measurement": comp["res"],
                 "tags": {"domain": comp["domain"], "entity_id": comp["id"]},
                 "time": ANY,
-                "fields": {"value": 1},
+                "fields": {"value": 1.0},
             }
         ]
         hass.states.async_set(f"{comp['domain']}.{comp['id']}", 1, comp["attrs"])
@@ -1251,22 +1276,22 @@ async def test_event_listener_ignore_attributes(
         {
             "domain": "sensor",
             "id": "fake_humidity",
-            "attrs": {"glob_ignore": 1, "domain_ignore": 1},
+            "attrs": {"glob_ignore": 1.0, "domain_ignore": 1.0},
         },
         {
             "domain": "binary_sensor",
             "id": "fake_motion",
-            "attrs": {"id_ignore": 1, "domain_ignore": 1},
+            "attrs": {"id_ignore": 1.0, "domain_ignore": 1.0},
         },
         {
             "domain": "climate",
             "id": "fake_thermostat",
-            "attrs": {"id_ignore": 1, "glob_ignore": 1},
+            "attrs": {"id_ignore": 1.0, "glob_ignore": 1.0},
         },
     ]
     for comp in test_components:
         entity_id = f"{comp['domain']}.{comp['id']}"
-        fields = {"value": 1}
+        fields = {"value": 1.0}
         fields.update(comp["attrs"])
         body = [
             {
@@ -1328,7 +1353,7 @@ async def test_event_listener_ignore_attributes_overlapping_entities(
             "measurement": "units",
             "tags": {"domain": "sensor", "entity_id": "fake"},
             "time": ANY,
-            "fields": {"value": 1},
+            "fields": {"value": 1.0},
         }
     ]
     hass.states.async_set("sensor.fake", 1, {"ignore": 1})
@@ -1455,7 +1480,7 @@ async def test_event_listener_attribute_name_conflict(
             "measurement": "fake.something",
             "tags": {"domain": "fake", "entity_id": "something"},
             "time": ANY,
-            "fields": {"value": 1, "value__str": "value_str"},
+            "fields": {"value": 1.0, "value__str": "value_str"},
         }
     ]
     hass.states.async_set("fake.something", 1, {"value": "value_str"})
@@ -1706,3 +1731,79 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_line_call", "gzip_arg"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            lambda lines: call(lines, time_precision="s", protocol="line"),
+            "gzip",
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            lambda lines: call(
+                bucket=DEFAULT_BUCKET, record=lines, write_precision="s"
+            ),
+            "enable_gzip",
+        ),
+    ],
+    indirect=["mock_client"],
+)
+async def test_event_listener_line_protocol(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_line_call,
+    gzip_arg,
+) -> None:
+    """Test the event listener writes compressed line protocol lines."""
+    config = {"precision": "s"}
+    config.update(config_ext)
+    await _setup(hass, mock_client, config, get_write_api)
+    assert mock_client.call_args.kwargs[gzip_arg] is True
+
+    freezer.move_to("2024-05-06 07:08:09+00:00")
+    hass.states.async_set(
+        "fake.entity_id",
+        "1.9",
+        {"unit_of_measurement": "foo bars", "friendly_name": 'My "fake" entity'},
+    )
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    assert write_api.call_args == get_line_call(
+        [
+            "foo\\ bars,domain=fake,entity_id=entity_id value=1.9,"
+            'friendly_name_str="My \\"fake\\" entity" 1714979289'
+        ]
+    )
+
+
+def test_event_buffer_drops_oldest() -> None:
+    """Test the event buffer keeps its size by dropping the oldest events."""
+    event_buffer = EventBuffer(4)
+    marker = influxdb.threading.Event()
+    event_buffer.put((0, Mock(value=0)))
+    event_buffer.put(marker)
+    for value in range(1, 10):
+        event_buffer.put((value, Mock(value=value)))
+
+    assert event_buffer.depth == 4
+    assert event_buffer.pop_dropped() == 6
+    assert event_buffer.pop_dropped() == 0
+
+    items = [event_buffer.get(timeout=0) for _ in range(5)]
+    assert marker in items
+    assert [item[0] for item in items if item is not marker] == [6, 7, 8, 9]
+    with pytest.raises(influxdb.queue.Empty):
+        event_buffer.get(timeout=0)
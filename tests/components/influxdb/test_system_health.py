@@ -0,0 +1,55 @@
+"""Test InfluxDB system health."""
+
+from unittest.mock import Mock, patch
+
+from homeassistant.components.influxdb.const import DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_influxdb_system_health(hass: HomeAssistant) -> None:
+    """Test InfluxDB system health."""
+    with patch("homeassistant.components.influxdb.InfluxDBClient"):
+        assert await async_setup_component(hass, DOMAIN, {DOMAIN: {"host": "host"}})
+        assert await async_setup_component(hass, "system_health", {})
+        await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, DOMAIN)
+
+    assert info == {
+        "last_write": None,
+        "queue_depth": 0,
+        "dropped_events": 0,
+        "write_latency": None,
+    }
+
+    instance = hass.data[DOMAIN]
+    instance.write_to_influxdb(["line"])
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info["last_write"] == "ok"
+    assert info["write_latency"] is not None
+
+    instance.influx.write = Mock(side_effect=ValueError("invalid line"))
+    instance.write_to_influxdb(["line"])
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info["last_write"] == {"type": "failed", "error": "invalid line"}
+
+
+async def test_influxdb_system_health_not_connected(hass: HomeAssistant) -> None:
+    """Test InfluxDB system health while the connection is retried."""
+    with (
+        patch(
+            "homeassistant.components.influxdb.get_influx_connection",
+            side_effect=ConnectionError("fail"),
+        ),
+        patch("homeassistant.components.influxdb.event_helper"),
+    ):
+        assert await async_setup_component(hass, DOMAIN, {DOMAIN: {"host": "host"}})
+        assert await async_setup_component(hass, "system_health", {})
+        await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, DOMAIN)
+
+    assert info == {"last_write": {"type": "failed", "error": "not connected"}}
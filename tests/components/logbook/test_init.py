@@ -19,7 +19,9 @@ from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook.models import EventAsRow, LazyEventPartialState
 from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.db_schema import StatesMeta
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import (
@@ -824,6 +826,52 @@ async def test_filter_continuous_sensor_values(
     assert response_json[1]["entity_id"] == entity_id_third
 
 
+@pytest.mark.usefixtures("recorder_mock", "set_utc")
+async def test_filter_continuous_sensor_values_unknown_flag(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test continuous sensors are matched by attributes if their flag is unknown."""
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+
+    entity_id_test = "switch.test"
+    hass.states.async_set(entity_id_test, STATE_OFF)
+    hass.states.async_set(entity_id_test, STATE_ON)
+    entity_id_continuous = "sensor.continuous"
+    hass.states.async_set(
+        entity_id_continuous, STATE_OFF, {"unit_of_measurement": "foo"}
+    )
+    hass.states.async_set(
+        entity_id_continuous, STATE_ON, {"unit_of_measurement": "foo"}
+    )
+    entity_id_text = "sensor.text"
+    hass.states.async_set(entity_id_text, STATE_OFF)
+    hass.states.async_set(entity_id_text, STATE_ON)
+    await async_wait_recording_done(hass)
+
+    # Sensors migrated from an older schema are classified on their next write
+    def _clear_flags() -> None:
+        with session_scope(hass=hass) as session:
+            session.query(StatesMeta).filter(
+                StatesMeta.entity_id.like("sensor.%")
+            ).update({StatesMeta.continuous: None}, synchronize_session=False)
+
+    await get_instance(hass).async_add_executor_job(_clear_flags)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day, tzinfo=dt_util.UTC)
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}")
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+
+    assert [entry["entity_id"] for entry in response_json] == [
+        entity_id_test,
+        entity_id_text,
+    ]
+
+
 @pytest.mark.usefixtures("recorder_mock", "set_utc")
 async def test_exclude_new_entities(
     hass: HomeAssistant,
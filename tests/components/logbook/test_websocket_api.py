@@ -2,9 +2,9 @@
 
 import asyncio
 from collections.abc import Callable
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -1843,6 +1843,236 @@ async def test_subscribe_unsubscribe_logbook_stream_big_query(
     ) == listeners_without_writes(init_listeners)
 
 
+async def _async_set_states_in_windows(hass: HomeAssistant) -> datetime:
+    """Change a state in each of the last three hours and return the time."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await hass.async_block_till_done()
+
+    for age, states in (
+        (timedelta(minutes=150), (STATE_OFF, STATE_ON)),
+        (timedelta(minutes=90), (STATE_OFF,)),
+        (timedelta(minutes=30), (STATE_ON,)),
+    ):
+        with freeze_time(now - age):
+            for state in states:
+                hass.states.async_set("binary_sensor.is_light", state)
+            await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+    return now
+
+
+async def test_logbook_stream_events_in_windows(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test historical events are read and sent in windows, oldest first."""
+    now = await _async_set_states_in_windows(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": (now - timedelta(hours=3)).isoformat(),
+            "end_time": now.isoformat(),
+        }
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    received: list[tuple[list[str], bool]] = []
+    for _ in range(3):
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        received.append(
+            (
+                [event["state"] for event in msg["event"]["events"]],
+                msg["event"].get("partial", False),
+            )
+        )
+    assert received == [
+        ([STATE_ON], True),
+        ([STATE_OFF], True),
+        ([STATE_ON], False),
+    ]
+
+
+async def test_logbook_stream_waits_for_drain(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the next window is only read once the client drained the messages."""
+    now = await _async_set_states_in_windows(hass)
+
+    websocket_client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.websocket_api.connection.ActiveConnection.async_wait_for_drain",
+        autospec=True,
+    ) as mock_wait_for_drain:
+        await websocket_client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": (now - timedelta(hours=3)).isoformat(),
+                "end_time": now.isoformat(),
+            }
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+        for _ in range(3):
+            msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+            assert msg["type"] == "event"
+
+    # Once before each window after the first one
+    assert [call.args[1] for call in mock_wait_for_drain.await_args_list] == [
+        websocket_api.STREAM_MAX_PENDING_MESSAGES,
+        websocket_api.STREAM_MAX_PENDING_MESSAGES,
+    ]
+
+
+async def test_stream_events_stop_when_unsubscribed(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the next windows are no longer read once the stream was unsubscribed."""
+    end_time = dt_util.utcnow()
+    event_processor = Mock(
+        get_events=Mock(return_value=[{"when": end_time.timestamp()}])
+    )
+    connection = Mock(subscriptions={}, async_wait_for_drain=AsyncMock())
+
+    last_event_time = await websocket_api._async_send_ws_stream_events(
+        hass,
+        connection,
+        7,
+        end_time - timedelta(hours=3),
+        end_time,
+        event_processor,
+        False,
+        False,
+    )
+    assert event_processor.get_events.call_count == 1
+    assert connection.send_message.call_count == 1
+    assert last_event_time == dt_util.utc_from_timestamp(end_time.timestamp())
+
+
+async def test_get_events_streamed(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the events are all returned in one result while they are streamed."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await hass.async_block_till_done()
+
+    for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("binary_sensor.is_light", state)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "logbook/get_events", "start_time": now.isoformat()}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert [event["state"] for event in response["result"]] == [
+        STATE_ON,
+        STATE_OFF,
+        STATE_ON,
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["binary_sensor.other"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == []
+
+
+async def test_logbook_stream_big_query_in_daily_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a big historical query is sent in daily chunks, newest first."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await hass.async_block_till_done()
+
+    when_by_entity_id: dict[str, float] = {}
+    for entity_id, age in (
+        ("binary_sensor.two_days_ago", timedelta(hours=50)),
+        ("binary_sensor.one_day_ago", timedelta(hours=26)),
+    ):
+        with freeze_time(now - age):
+            hass.states.async_set(entity_id, STATE_ON)
+            hass.states.async_set(entity_id, STATE_OFF)
+            when_by_entity_id[entity_id] = hass.states.get(
+                entity_id
+            ).last_updated_timestamp
+            await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": (now - timedelta(hours=60)).isoformat(),
+            "end_time": now.isoformat(),
+        }
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["success"]
+
+    # The most recent day has no events so the first chunk is yesterday
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["event"]["partial"] is True
+    assert msg["event"]["events"] == [
+        {
+            "entity_id": "binary_sensor.one_day_ago",
+            "state": "off",
+            "when": when_by_entity_id["binary_sensor.one_day_ago"],
+        }
+    ]
+
+    # The oldest chunk is the last one
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["event"]["partial"] is True
+    assert msg["event"]["events"] == [
+        {
+            "entity_id": "binary_sensor.two_days_ago",
+            "state": "off",
+            "when": when_by_entity_id["binary_sensor.two_days_ago"],
+        }
+    ]
+
+    # The last window of the oldest chunk has no events
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert "partial" not in msg["event"]
+    assert msg["event"]["events"] == []
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_device(
     recorder_mock: Recorder,
@@ -1102,6 +1102,67 @@ async def test_restore_all_active_subscriptions_on_reconnect(
         assert mqtt_client_mock.subscribe.hass_call(expected_call)
 
 
+@pytest.mark.parametrize(
+    ("mqtt_config_entry_data", "mqtt_config_entry_options"),
+    [({mqtt.CONF_BROKER: "mock-broker"}, {mqtt.CONF_DISCOVERY: False})],
+)
+async def test_resubscribe_skips_topics_covered_by_wildcard(
+    hass: HomeAssistant,
+    mock_debouncer: asyncio.Event,
+    setup_with_birth_msg_client_mock: MqttMockPahoClient,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test topics covered by a wildcard subscription are not resubscribed."""
+    mqtt_client_mock = setup_with_birth_msg_client_mock
+    mock_debouncer.clear()
+    unsub_wildcard = await mqtt.async_subscribe(hass, "test/#", record_calls, qos=1)
+    await mqtt.async_subscribe(hass, "test/state", record_calls, qos=1)
+    unsub_covered = await mqtt.async_subscribe(hass, "test/other", record_calls)
+    await mqtt.async_subscribe(hass, "test/qos", record_calls, qos=2)
+    await mqtt.async_subscribe(hass, "other/state", record_calls)
+    await mock_debouncer.wait()
+
+    mqtt_client_mock.on_disconnect(None, None, 0, MockMqttReasonCode())
+    mqtt_client_mock.reset_mock()
+    mock_debouncer.clear()
+    mqtt_client_mock.on_connect(None, None, None, MockMqttReasonCode())
+    await mock_debouncer.wait()
+
+    subscribe_calls = help_all_subscribe_calls(mqtt_client_mock)
+    assert ("test/#", 1) in subscribe_calls
+    # A higher qos is requested than the wildcard subscription provides
+    assert ("test/qos", 2) in subscribe_calls
+    assert ("other/state", 0) in subscribe_calls
+    assert ("test/state", 1) not in subscribe_calls
+    assert ("test/other", 0) not in subscribe_calls
+
+    diagnostics = hass.data["mqtt"].client.async_resubscribe_diagnostics()
+    assert diagnostics["covered_subscriptions"] == 2
+    assert diagnostics["resubscribe_duration"] is not None
+
+    # Messages on covered topics are still dispatched
+    async_fire_mqtt_message(hass, "test/state", "test-payload", retain=True)
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 2
+
+    # Unsubscribing a covered topic does not unsubscribe at the broker
+    mock_debouncer.clear()
+    unsub_covered()
+    await hass.async_block_till_done()
+    assert not mock_debouncer.is_set()
+
+    # Covered topics are subscribed when the wildcard subscription is removed
+    mqtt_client_mock.reset_mock()
+    mock_debouncer.clear()
+    unsub_wildcard()
+    await mock_debouncer.wait()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=3))  # cooldown
+    await hass.async_block_till_done()
+    assert help_all_subscribe_calls(mqtt_client_mock) == [("test/state", 1)]
+    assert mqtt_client_mock.unsubscribe.mock_calls == [call(["test/#"])]
+
+
 @pytest.mark.parametrize(
     ("mqtt_config_entry_data", "mqtt_config_entry_options"),
     [({mqtt.CONF_BROKER: "mock-broker"}, {mqtt.CONF_DISCOVERY: False})],
@@ -2143,6 +2204,57 @@ async def test_server_sock_connect_and_disconnect(
     assert len(recorded_calls) == 0
 
 
+@patch("homeassistant.components.mqtt.client.RETAINED_MESSAGES_BUDGET", 0)
+async def test_retained_messages_budget_pauses_reading(
+    hass: HomeAssistant,
+    setup_with_birth_msg_client_mock: MqttMockPahoClient,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test reading is paused when retained messages exceed the budget."""
+    mqtt_client_mock = setup_with_birth_msg_client_mock
+    mqtt_client_mock.loop_misc.return_value = paho_mqtt.MQTT_ERR_SUCCESS
+
+    client, server = socket.socketpair(
+        family=socket.AF_UNIX, type=socket.SOCK_STREAM, proto=0
+    )
+    client.setblocking(False)
+    server.setblocking(False)
+    mqtt_client_mock.on_socket_open(mqtt_client_mock, None, client)
+    await hass.async_block_till_done()
+    await mqtt.async_subscribe(hass, "test/state", record_calls)
+
+    with (
+        patch.object(hass.loop, "remove_reader") as mock_remove_reader,
+        patch.object(hass.loop, "add_reader") as mock_add_reader,
+    ):
+        # Non retained messages are not limited
+        async_fire_mqtt_message(hass, "test/state", "on")
+        assert not mock_remove_reader.called
+
+        async_fire_mqtt_message(hass, "test/state", "off", retain=True)
+        async_fire_mqtt_message(hass, "test/state", "on", retain=True)
+        assert mock_remove_reader.mock_calls == [call(client)]
+        assert len(recorded_calls) == 2
+
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+        assert len(mock_add_reader.mock_calls) == 1
+        assert mock_add_reader.mock_calls[0][1][0] is client
+
+    mqtt_client = hass.data["mqtt"].client
+    assert mqtt_client.async_resubscribe_diagnostics()["retained_burst_size"] == 2
+
+    # A retained message after a pause starts a new burst
+    mqtt_client._last_retained_message -= 1
+    async_fire_mqtt_message(hass, "test/state", "off", retain=True)
+    assert mqtt_client.async_resubscribe_diagnostics()["retained_burst_size"] == 1
+
+    mqtt_client_mock.on_socket_close(mqtt_client_mock, None, client)
+    client.close()
+    server.close()
+
+
 async def test_server_sock_buffer_size(
     hass: HomeAssistant,
     setup_with_birth_msg_client_mock: MqttMockPahoClient,
@@ -23,6 +23,11 @@ default_entry_data = {
 default_entry_options = {
     "birth_message": {},
 }
+expected_resubscribe = {
+    "covered_subscriptions": 0,
+    "resubscribe_duration": ANY,
+    "retained_burst_size": 0,
+}
 
 
 async def test_entry_diagnostics(
@@ -41,6 +46,7 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [],
         "mqtt_config": {"data": default_entry_data, "options": default_entry_options},
+        "resubscribe": expected_resubscribe,
         "mqtt_debug_info": {"entities": [], "triggers": []},
     }
 
@@ -126,6 +132,7 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": {"data": default_entry_data, "options": default_entry_options},
+        "resubscribe": expected_resubscribe,
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -135,6 +142,7 @@ async def test_entry_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": {"data": default_entry_data, "options": default_entry_options},
+        "resubscribe": expected_resubscribe,
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -262,6 +270,7 @@ async def test_redact_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": expected_config,
+        "resubscribe": expected_resubscribe,
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -271,6 +280,7 @@ async def test_redact_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": expected_config,
+        "resubscribe": expected_resubscribe,
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -297,5 +307,6 @@ async def test_redact_diagnostics(
             "entities": [],
         },
         "mqtt_config": expected_config,
+        "resubscribe": expected_resubscribe,
         "mqtt_debug_info": {"entities": [], "triggers": []},
     }
@@ -12,7 +12,7 @@ import pytest
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.models import MessageCallbackType
-from homeassistant.components.mqtt.util import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.util import EnsureJobAfterCooldown, TopicTrie
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant
@@ -376,3 +376,66 @@ async def test_waiting_for_client_with_disabled_entry(
 
     # returns False because entry is disabled
     assert not await mqtt.async_wait_for_mqtt_client(hass)
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("a/b/c", "a/b/c", True),
+        ("a/b/c", "a/b", False),
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a/b/d", False),
+        ("a/+", "a/b/c", False),
+        ("+/+", "a/b", True),
+        ("+/+", "/b", True),
+        ("a/#", "a", True),
+        ("a/#", "a/b/c", True),
+        ("a/#", "b/c", False),
+        ("#", "a/b/c", True),
+        ("+/b/#", "a/b", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_topic_trie_match(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching topics against topic filters with a topic trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add(topic_filter, "value")
+    assert trie.match(topic) == (["value"] if matches else [])
+
+
+def test_topic_trie_order_and_remove() -> None:
+    """Test the topic trie preserves insertion order and prunes on remove."""
+    trie: TopicTrie[int] = TopicTrie()
+    trie.add("a/#", 1)
+    trie.add("a/+/c", 2)
+    trie.add("#", 3)
+    trie.add("a/b/+", 4)
+    trie.add("a/+/c", 5)
+
+    assert len(trie) == 5
+    assert list(trie) == [1, 2, 3, 4, 5]
+    assert trie.match("a/b/c") == [1, 2, 3, 4, 5]
+    assert trie.match("a/x/c") == [1, 2, 3, 5]
+    assert "a/+/c" in trie
+    assert "a/+" not in trie
+    assert "x/y" not in trie
+
+    trie.remove("a/+/c", 2)
+    assert trie.match("a/b/c") == [1, 3, 4, 5]
+    trie.remove("a/+/c", 5)
+    assert "a/+/c" not in trie
+    trie.add("a/+/c", 2)
+    assert trie.match("a/b/c") == [1, 3, 4, 2]
+
+    with pytest.raises(KeyError):
+        trie.remove("a/+/c", 5)
+    with pytest.raises(KeyError):
+        trie.remove("x/y/z", 1)
+
+    for topic_filter, value in (("a/#", 1), ("#", 3), ("a/b/+", 4), ("a/+/c", 2)):
+        trie.remove(topic_filter, value)
+    assert len(trie) == 0
+    assert trie.match("a/b/c") == []
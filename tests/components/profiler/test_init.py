@@ -19,6 +19,7 @@ from homeassistant.components.profiler import (
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_LOG_EVENT_LISTENER_STATISTICS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
@@ -32,7 +33,7 @@ from homeassistant.components.profiler import (
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util import dt as dt_util
 
@@ -223,6 +224,46 @@ async def test_log_thread_frames(
     await hass.async_block_till_done()
 
 
+async def test_log_event_listener_statistics(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test we can log the event listener statistics."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_EVENT_LISTENER_STATISTICS)
+
+    @callback
+    def _listener(event: Event) -> None:
+        """Mock listener."""
+
+    hass.bus.async_listen("test_event", _listener)
+
+    async def _mock_sleep(seconds: float) -> None:
+        hass.bus.async_fire("test_event")
+
+    with patch("homeassistant.components.profiler.asyncio.sleep", _mock_sleep):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_LOG_EVENT_LISTENER_STATISTICS,
+            {CONF_SECONDS: 1},
+            blocking=True,
+        )
+
+    assert "Event listener statistics for test_event" in caplog.text
+    assert "'fired': 1" in caplog.text
+    assert "_listener" in caplog.text
+    assert hass.bus.async_listener_statistics() == {}
+    caplog.clear()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_log_current_tasks(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -2,12 +2,14 @@
 
 from dataclasses import dataclass
 import datetime
+import gzip
 from http import HTTPStatus
 from typing import Any, Self
 from unittest import mock
 
 from freezegun import freeze_time
 import prometheus_client
+from prometheus_client.openmetrics import exposition as openmetrics
 from prometheus_client.utils import floatToGoString
 import pytest
 
@@ -53,6 +55,7 @@ from homeassistant.components.fan import (
 )
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES
 from homeassistant.components.lock import LockState
+from homeassistant.components.prometheus.exposition import ExpositionCache
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import (
     ATTR_BATTERY_LEVEL,
@@ -579,6 +582,83 @@ async def test_view_default_namespace(
     ).withValue(15.6).assert_in_metrics(body)
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics_gzip(
+    client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
+) -> None:
+    """Test prometheus metrics view negotiating OpenMetrics and gzip."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={
+            "Accept": "application/openmetrics-text; version=1.0.0",
+            "Accept-Encoding": "gzip",
+        },
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"].startswith("application/openmetrics-text")
+    assert resp.headers["content-encoding"] == "gzip"
+    body = await resp.text()
+    assert body.endswith("# EOF\n")
+    assert body.count("# EOF") == 1
+
+    body = body.split("\n")
+    assert "# HELP python_info Python platform information" in body
+    EntityMetric(
+        metric_name="sensor_temperature_celsius",
+        domain="sensor",
+        friendly_name="Outside Temperature",
+        entity="sensor.outside_temperature",
+    ).withValue(15.6).assert_in_metrics(body)
+
+
+@pytest.mark.parametrize("openmetrics_format", [False, True])
+def test_exposition_cache_matches_encoder(openmetrics_format: bool) -> None:
+    """Test the exposition cache renders the metrics like the encoders."""
+    registry = prometheus_client.CollectorRegistry()
+    gauge = prometheus_client.Gauge(
+        "homeassistant_gauge",
+        'A "quoted"\\documentation',
+        ["entity", "friendly_name"],
+        registry=registry,
+    )
+    counter = prometheus_client.Counter(
+        "homeassistant_counter",
+        "A counter",
+        ["entity", "friendly_name"],
+        registry=registry,
+    )
+    gauge.labels(entity="sensor.one", friendly_name='One "1"\n').set(1.5)
+    gauge.labels(entity="sensor.two", friendly_name="Two").set(float("nan"))
+    counter.labels(entity="sensor.one", friendly_name='One "1"\n').inc()
+    encoder = (
+        openmetrics.generate_latest
+        if openmetrics_format
+        else prometheus_client.generate_latest
+    )
+    cache = ExpositionCache()
+    empty_registry = prometheus_client.CollectorRegistry()
+
+    def render() -> bytes:
+        return cache.render(
+            [gauge, counter], empty_registry, openmetrics_format, compress=False
+        )
+
+    assert render() == encoder(registry)
+
+    # The values are updated in place, the label strings are reused
+    gauge.labels(entity="sensor.one", friendly_name='One "1"\n').set(2.5)
+    counter.labels(entity="sensor.one", friendly_name='One "1"\n').inc()
+    assert render() == encoder(registry)
+
+    gauge.remove("sensor.two", "Two")
+    gauge.labels(entity="sensor.two", friendly_name="Renamed").set(3)
+    cache.forget_entities(["sensor.two"])
+    assert render() == encoder(registry)
+    assert gzip.decompress(
+        cache.render([gauge, counter], empty_registry, openmetrics_format, True)
+    ) == encoder(registry)
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(
     client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
@@ -0,0 +1,190 @@
+"""Test the downsampled states tiers of the recorder."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import StatesDownsampled, StatesMeta
+from homeassistant.components.recorder.purge import purge_entity_data, purge_old_data
+from homeassistant.components.recorder.tasks import DownsampleStatesTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceContextManager
+
+START = datetime(2026, 1, 1, tzinfo=dt_util.UTC)
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceContextManager,
+) -> None:
+    """Set up recorder."""
+
+
+async def _async_record_power_and_door(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Record 30 minutes of a power sensor every 10 seconds and a door."""
+    for idx in range(180):
+        freezer.move_to(START + timedelta(seconds=idx * 10))
+        if idx == 7:
+            hass.states.async_set("sensor.power", "unavailable")
+        else:
+            hass.states.async_set("sensor.power", str(idx))
+        if idx % 30 == 0:
+            hass.states.async_set("binary_sensor.door", "on" if idx % 60 else "off")
+    await async_wait_recording_done(hass)
+
+
+def _get_buckets(
+    hass: HomeAssistant, entity_id: str, resolution: int
+) -> list[tuple[float, str, float | None, float | None]]:
+    """Return the buckets of an entity in a tier."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return [
+            tuple(row)
+            for row in session.query(
+                StatesDownsampled.start_ts,
+                StatesDownsampled.state,
+                StatesDownsampled.min,
+                StatesDownsampled.max,
+            )
+            .join(StatesMeta, StatesDownsampled.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == entity_id)
+            .filter(StatesDownsampled.resolution == resolution)
+            .order_by(StatesDownsampled.start_ts)
+        ]
+
+
+async def test_compile_downsampled_states(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test compiling the tiers in multiple runs from the oldest state."""
+    await _async_record_power_and_door(hass, freezer)
+    start_ts = START.timestamp()
+
+    # Each run compiles at most 15 minutes and requeues itself
+    recorder_mock.queue_task(
+        DownsampleStatesTask(START + timedelta(minutes=29, seconds=30))
+    )
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    # The last minute is still open and is not compiled
+    assert recorder_mock.states_downsampled_manager.compiled_until(60) == (
+        start_ts + 29 * 60
+    )
+    assert recorder_mock.states_downsampled_manager.compiled_until(900) == (
+        start_ts + 900
+    )
+    power_buckets = _get_buckets(hass, "sensor.power", 60)
+    assert len(power_buckets) == 29
+    # The unavailable state is skipped for min and max
+    assert power_buckets[1] == (start_ts + 60, "11", 6.0, 11.0)
+    assert power_buckets[28] == (start_ts + 28 * 60, "173", 168.0, 173.0)
+    assert _get_buckets(hass, "sensor.power", 900) == [(start_ts, "89", 0.0, 89.0)]
+    assert _get_buckets(hass, "binary_sensor.door", 900) == [
+        (start_ts, "off", None, None)
+    ]
+
+    recorder_mock.queue_task(DownsampleStatesTask(START + timedelta(minutes=30)))
+    await async_wait_recording_done(hass)
+
+    assert len(_get_buckets(hass, "sensor.power", 60)) == 30
+    assert _get_buckets(hass, "sensor.power", 900) == [
+        (start_ts, "89", 0.0, 89.0),
+        (start_ts + 900, "179", 90.0, 179.0),
+    ]
+
+    # The compiled timestamps are restored from the newest buckets
+    recorder_mock.states_downsampled_manager.reset()
+    recorder_mock.queue_task(DownsampleStatesTask(START + timedelta(minutes=30)))
+    await async_wait_recording_done(hass)
+    assert recorder_mock.states_downsampled_manager.compiled_until(900) == (
+        start_ts + 1800
+    )
+    assert len(_get_buckets(hass, "sensor.power", 900)) == 2
+
+
+async def test_carried_in_state_seeds_min_max(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the state held from before a bucket seeds its min and max."""
+    for seconds, state in ((30, "10"), (150, "5"), (890, "20"), (950, "15")):
+        freezer.move_to(START + timedelta(seconds=seconds))
+        hass.states.async_set("sensor.power", state)
+    await async_wait_recording_done(hass)
+    start_ts = START.timestamp()
+
+    # The first run compiles the first 15 minutes, the second run carries
+    # the state in from the last bucket of the first run
+    recorder_mock.queue_task(DownsampleStatesTask(START + timedelta(minutes=17)))
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    assert _get_buckets(hass, "sensor.power", 60) == [
+        (start_ts, "10", 10.0, 10.0),
+        (start_ts + 120, "5", 5.0, 10.0),
+        (start_ts + 840, "20", 5.0, 20.0),
+        (start_ts + 900, "15", 15.0, 20.0),
+    ]
+    assert _get_buckets(hass, "sensor.power", 900) == [(start_ts, "20", 5.0, 20.0)]
+
+
+async def test_single_downsample_task(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test only one downsampled states task is queued until it caught up."""
+    with patch(
+        "homeassistant.components.recorder.downsample.compile_downsampled_states",
+        side_effect=[False, True, True],
+    ) as compile_mock:
+        recorder_mock._async_five_minute_tasks(dt_util.utcnow())
+        assert recorder_mock.downsample_task_queued
+        recorder_mock._async_five_minute_tasks(dt_util.utcnow())
+        await async_wait_recording_done(hass)
+        await async_wait_recording_done(hass)
+        # The first task requeued itself once before it caught up
+        assert compile_mock.call_count == 2
+        assert not recorder_mock.downsample_task_queued
+
+        recorder_mock._async_five_minute_tasks(dt_util.utcnow())
+        await async_wait_recording_done(hass)
+        assert compile_mock.call_count == 3
+
+
+async def test_purge_downsampled_states(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the buckets are purged with the states and entities."""
+    await _async_record_power_and_door(hass, freezer)
+    recorder_mock.queue_task(DownsampleStatesTask(START + timedelta(minutes=30)))
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    while not purge_old_data(
+        recorder_mock, START + timedelta(minutes=20), repack=False
+    ):
+        pass
+
+    assert len(_get_buckets(hass, "sensor.power", 60)) == 10
+    assert _get_buckets(hass, "sensor.power", 900) == []
+
+    while not purge_entity_data(
+        recorder_mock,
+        lambda entity_id: entity_id == "binary_sensor.door",
+        START + timedelta(hours=1),
+    ):
+        pass
+    assert _get_buckets(hass, "binary_sensor.door", 60) == []
+    with session_scope(hass=hass, read_only=True) as session:
+        assert [entity_id for (entity_id,) in session.query(StatesMeta.entity_id)] == [
+            "sensor.power"
+        ]
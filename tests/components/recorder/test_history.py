@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Generator
 from copy import copy
 from datetime import datetime, timedelta
 import json
+from typing import Any
 from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
@@ -20,8 +22,9 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.tasks import DownsampleStatesTask
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
 
@@ -1039,3 +1042,215 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+@pytest.mark.usefixtures("multiple_start_time_chunk_sizes")
+@pytest.mark.parametrize(
+    ("no_attributes", "limit"), [(False, None), (True, None), (False, 2)]
+)
+async def test_state_changes_during_period_for_entities(
+    hass: HomeAssistant, no_attributes: bool, limit: int | None
+) -> None:
+    """Test the state changes of many entities match the single entity query."""
+    entity_ids = ["sensor.one", "sensor.two", "sensor.three"]
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+    end = point + timedelta(seconds=5)
+
+    with freeze_time(start) as freezer:
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, "0", {"attr": True})
+        for value in range(1, 4):
+            freezer.move_to(point + timedelta(seconds=value))
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, str(value), {"attr": True})
+    await async_wait_recording_done(hass)
+
+    start_times = dict.fromkeys(entity_ids, point)
+    start_times["sensor.three"] = point + timedelta(seconds=2)
+    hist = history.state_changes_during_period_for_entities(
+        hass,
+        start_times,
+        end,
+        no_attributes,
+        limit,
+        include_start_time_state=False,
+    )
+
+    assert list(hist) == entity_ids
+    for entity_id, start_time in start_times.items():
+        expected = history.state_changes_during_period(
+            hass,
+            start_time,
+            end,
+            entity_id,
+            no_attributes,
+            limit=limit,
+            include_start_time_state=False,
+        )
+        assert_multiple_states_equal_without_context(
+            expected[entity_id], hist[entity_id]
+        )
+
+
+@pytest.mark.usefixtures("multiple_start_time_chunk_sizes")
+async def test_state_changes_during_period_for_entities_start_time_state(
+    hass: HomeAssistant,
+) -> None:
+    """Test the start time state of many entities is included."""
+    entity_ids = ["sensor.one", "sensor.two", "sensor.three"]
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+    end = point + timedelta(seconds=2)
+
+    with freeze_time(start) as freezer:
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, "0")
+        freezer.move_to(point + timedelta(seconds=1))
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, "1")
+    await async_wait_recording_done(hass)
+
+    hist = history.state_changes_during_period_for_entities(
+        hass, dict.fromkeys(entity_ids, point), end, no_attributes=True
+    )
+
+    assert {
+        entity_id: [state.state for state in states]
+        for entity_id, states in hist.items()
+    } == {entity_id: ["0", "1"] for entity_id in entity_ids}
+
+    with pytest.raises(ValueError):
+        history.state_changes_during_period_for_entities(
+            hass, {"sensor.one": point, "sensor.two": start}
+        )
+
+
+@pytest.mark.usefixtures("multiple_start_time_chunk_sizes")
+async def test_get_last_state_changes_for_entities(hass: HomeAssistant) -> None:
+    """Test the last state changes of many entities match the single entity query."""
+    entity_ids = ["sensor.one", "sensor.two", "sensor.three"]
+    start = dt_util.utcnow() - timedelta(minutes=5)
+
+    with freeze_time(start) as freezer:
+        for value in range(4):
+            freezer.move_to(start + timedelta(minutes=value))
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, str(value))
+    await async_wait_recording_done(hass)
+
+    hist = history.get_last_state_changes_for_entities(hass, 2, entity_ids)
+
+    assert list(hist) == entity_ids
+    for entity_id in entity_ids:
+        assert_multiple_states_equal_without_context(
+            history.get_last_state_changes(hass, 2, entity_id)[entity_id],
+            hist[entity_id],
+        )
+
+
+async def test_history_preloaded_while_starting(hass: HomeAssistant) -> None:
+    """Test history requests issued while starting are read with one query."""
+    entity_ids = ["sensor.one", "sensor.two", "sensor.three"]
+    start = dt_util.utcnow() - timedelta(minutes=5)
+
+    with freeze_time(start) as freezer:
+        for value in range(4):
+            freezer.move_to(start + timedelta(minutes=value))
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, str(value))
+    await async_wait_recording_done(hass)
+
+    real_state_changes = history.modern.state_changes_during_period_for_entities
+    real_last_state_changes = history.modern.get_last_state_changes_for_entities
+    hass.set_state(CoreState.starting)
+    with (
+        patch(
+            "homeassistant.components.recorder.history.preload.state_changes_during_period_for_entities",
+            side_effect=real_state_changes,
+        ) as state_changes_mock,
+        patch(
+            "homeassistant.components.recorder.history.preload.get_last_state_changes_for_entities",
+            side_effect=real_last_state_changes,
+        ) as last_state_changes_mock,
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period"
+        ) as single_state_changes_mock,
+    ):
+        results = await asyncio.gather(
+            *(
+                history.async_state_changes_during_period(
+                    hass,
+                    start,
+                    entity_id=entity_id,
+                    descending=True,
+                    include_start_time_state=False,
+                )
+                for entity_id in entity_ids
+            ),
+            *(
+                history.async_get_last_state_changes(hass, 2, entity_id)
+                for entity_id in entity_ids
+            ),
+        )
+    hass.set_state(CoreState.running)
+
+    assert state_changes_mock.call_count == 1
+    assert last_state_changes_mock.call_count == 1
+    assert single_state_changes_mock.call_count == 0
+    for states in results[: len(entity_ids)]:
+        assert [state.state for state in states] == ["3", "2", "1"]
+    for states in results[len(entity_ids) :]:
+        assert [state.state for state in states] == ["2", "3"]
+
+
+async def test_get_significant_states_downsampled(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test long ranges of numeric entities are read from a downsampled tier."""
+    start = datetime(2026, 1, 1, tzinfo=dt_util.UTC)
+    start_ts = start.timestamp()
+    with freeze_time(start) as freezer:
+        for idx in range(180):
+            freezer.move_to(start + timedelta(seconds=idx * 10))
+            hass.states.async_set("sensor.power", str(idx))
+            if idx % 30 == 0:
+                hass.states.async_set("binary_sensor.door", "on" if idx % 60 else "off")
+        await async_wait_recording_done(hass)
+
+    recorder_mock.queue_task(DownsampleStatesTask(start + timedelta(minutes=20)))
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    def _get_states(resolution: float) -> dict[str, list[dict[str, Any]]]:
+        return history.get_significant_states(
+            hass,
+            start + timedelta(seconds=25),
+            start + timedelta(minutes=30),
+            ["sensor.power", "binary_sensor.door"],
+            minimal_response=True,
+            compressed_state_format=True,
+            resolution=resolution,
+        )
+
+    with patch(
+        "homeassistant.components.recorder.history.modern.DOWNSAMPLE_MIN_SPAN", 0
+    ):
+        raw_states = _get_states(30)
+        downsampled_states = _get_states(60)
+
+    assert len(raw_states["sensor.power"]) == 178
+    assert downsampled_states["binary_sensor.door"] == raw_states["binary_sensor.door"]
+    power = downsampled_states["sensor.power"]
+    # The raw states up to the first bucket, 19 buckets and the
+    # raw states after the last compiled bucket
+    assert len(power) == 4 + 19 + 60
+    assert [state["s"] for state in power[:4]] == ["2", "3", "4", "5"]
+    assert power[4] == {"s": "11", "lu": start_ts + 110, "min": 6.0, "max": 11.0}
+    assert power[22] == {"s": "119", "lu": start_ts + 1190, "min": 114.0, "max": 119.0}
+    assert power[23]["s"] == "120"
+    assert power[23]["lu"] == start_ts + 1200
+    assert power[-1]["s"] == "179"
+
+    # Short ranges are always read from the states table
+    assert _get_states(60) == raw_states
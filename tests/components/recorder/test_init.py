@@ -21,6 +21,7 @@ from homeassistant.components.lock import LockState
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_WRITES,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -64,6 +65,7 @@ from homeassistant.components.recorder.table_managers import (
 )
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
     EVENT_COMPONENT_LOADED,
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -131,6 +133,7 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         hass,
         auto_purge=True,
         auto_repack=True,
+        bulk_writes=False,
         keep_days=7,
         commit_interval=1,
         uri="sqlite://",
@@ -856,6 +859,40 @@ async def test_saving_state_and_removing_entity(
         assert states[2].state is None
 
 
+async def test_saving_continuous_flag(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test the continuous flag of the entities is saved in states_meta."""
+    hass.states.async_set("counter.mine", "1")
+    hass.states.async_set("sensor.text", "on")
+    hass.states.async_set("sensor.power", "5", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    hass.states.async_set("light.kitchen", "on")
+    await async_wait_recording_done(hass)
+
+    def _get_flags() -> dict[str, int | None]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return dict(session.query(StatesMeta.entity_id, StatesMeta.continuous))
+
+    assert _get_flags() == {
+        "counter.mine": 1,
+        "sensor.text": 0,
+        "sensor.power": 1,
+        "light.kitchen": 0,
+    }
+
+    # A sensor is continuous while it has a unit of measurement
+    hass.states.async_set("sensor.text", "5", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    hass.states.async_set("sensor.power", "unknown")
+    await async_wait_recording_done(hass)
+    assert _get_flags() == {
+        "counter.mine": 1,
+        "sensor.text": 1,
+        "sensor.power": 0,
+        "light.kitchen": 0,
+    }
+
+
 async def test_saving_state_with_oversized_attributes(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -1447,6 +1484,9 @@ async def test_compile_missing_statistics(
         await hass.async_stop()
 
 
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_BULK_WRITES: True}, {CONF_BULK_WRITES: False}]
+)
 async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test saving sets old state."""
     hass.states.async_set("test.one", "s1", {})
@@ -1474,6 +1514,18 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
+    # States committed earlier are linked by their state_id
+    hass.states.async_set("test.one", "s5", {})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        s3, s5 = (
+            session.query(States.state_id, States.old_state_id)
+            .filter(States.state.in_(["s3", "s5"]))
+            .order_by(States.state_id)
+        )
+        assert s5.old_state_id == s3.state_id
+
 
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
@@ -315,9 +315,12 @@ async def test_migrate_events_context_ids(
                 await hass.async_stop()
                 await hass.async_block_till_done()
 
-    # Check the index we removed was recreated
+    # Check the index we removed was recreated, together with the index added
+    # by the schema migration
     index_names = [call[1][0].name for call in wrapped_idx_create.mock_calls]
-    assert index_names == [index for _, index in indices_to_drop]
+    assert sorted(index_names) == sorted(
+        ["ix_states_meta_continuous", *(index for _, index in indices_to_drop)]
+    )
 
     old_uuid_context_id_event = events_by_type["old_uuid_context_id_event"]
     assert old_uuid_context_id_event["context_id"] is None
@@ -675,9 +678,12 @@ async def test_migrate_states_context_ids(
                 await hass.async_stop()
                 await hass.async_block_till_done()
 
-    # Check the index we removed was recreated
+    # Check the index we removed was recreated, together with the index added
+    # by the schema migration
     index_names = [call[1][0].name for call in wrapped_idx_create.mock_calls]
-    assert index_names == [index for _, index in indices_to_drop]
+    assert sorted(index_names) == sorted(
+        ["ix_states_meta_continuous", *(index for _, index in indices_to_drop)]
+    )
 
     old_uuid_context_id = states_by_entity_id["state.old_uuid_context_id"]
     assert old_uuid_context_id["context_id"] is None
@@ -1194,9 +1200,12 @@ async def test_post_migrate_entity_ids(
             await hass.async_stop()
             await hass.async_block_till_done()
 
-    # Check the index we removed was recreated
+    # Check the index we removed was recreated, together with the index added
+    # by the schema migration
     index_names = [call[1][0].name for call in wrapped_idx_create.mock_calls]
-    assert index_names == [index for _, index in indices_to_drop]
+    assert sorted(index_names) == sorted(
+        ["ix_states_meta_continuous", *(index for _, index in indices_to_drop)]
+    )
 
     assert states_by_state["one_1"] is None
     assert states_by_state["two_2"] is None
@@ -4,7 +4,8 @@ from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 import sqlite3
-from unittest.mock import patch
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -12,7 +13,7 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
 
-from homeassistant.components.recorder import DOMAIN, Recorder
+from homeassistant.components.recorder import DOMAIN, Recorder, purge
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
     Events,
@@ -25,13 +26,14 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import PurgeProgress, purge_old_data
 from homeassistant.components.recorder.queries import select_event_type_ids
+from homeassistant.components.recorder.repack import vacuum_purged_tables
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
 )
-from homeassistant.components.recorder.tasks import PurgeTask
+from homeassistant.components.recorder.tasks import PurgeTask, VacuumPurgedTablesTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_THEMES_UPDATED, STATE_ON
 from homeassistant.core import HomeAssistant
@@ -45,7 +47,7 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
-from tests.typing import RecorderInstanceContextManager
+from tests.typing import RecorderInstanceContextManager, RecorderInstanceGenerator
 
 TEST_EVENT_TYPES = (
     "EVENT_TEST_AUTOPURGE",
@@ -313,6 +315,104 @@ async def test_purge_old_states_encounters_operational_error(
     assert "Error executing purge" in caplog.text
 
 
+async def test_purge_releases_attributes_references(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test purging in time budgeted runs releases the attributes references."""
+    utcnow = dt_util.utcnow()
+    five_days_ago = utcnow - timedelta(days=5)
+    shared_attributes = {"shared": True}
+
+    with freeze_time(five_days_ago) as freezer:
+        for idx in range(4):
+            hass.states.async_set(f"test.old_{idx}", "on", shared_attributes)
+        hass.states.async_set("test.old_only", "on", {"old_only": True})
+        await async_wait_recording_done(hass)
+        freezer.move_to(utcnow)
+        hass.states.async_set("test.new", "on", shared_attributes)
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        shared_attributes_id = (
+            session.query(States.attributes_id)
+            .filter(States.last_updated_ts == utcnow.timestamp())
+            .scalar()
+        )
+
+    purge_before = utcnow - timedelta(days=4)
+    runs = 0
+    with (
+        patch.object(purge, "PURGE_TIME_BUDGET", 0),
+        patch.object(recorder_mock, "max_bind_vars", 2),
+    ):
+        while not purge_old_data(recorder_mock, purge_before, repack=False):
+            runs += 1
+            assert recorder_mock.purge_progress.in_progress
+
+    # Each run purged a single batch of two states
+    assert runs == 3
+    progress = recorder_mock.purge_progress
+    assert not progress.in_progress
+    assert progress.runs == 4
+    assert progress.states == 5
+    assert progress.state_attributes == 1
+    # The shared attributes are still used by the new state
+    assert recorder_mock.attributes_reference_counts._counts == {
+        shared_attributes_id: 1
+    }
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 1
+        assert [
+            attributes_id
+            for (attributes_id,) in session.query(StateAttributes.attributes_id)
+        ] == [shared_attributes_id]
+
+    # New states linked to tracked attributes ids are counted
+    hass.states.async_set("test.new_2", "on", shared_attributes)
+    await async_wait_recording_done(hass)
+    assert recorder_mock.attributes_reference_counts._counts == {
+        shared_attributes_id: 2
+    }
+
+    assert purge_old_data(
+        recorder_mock, dt_util.utcnow() + timedelta(days=1), repack=False
+    )
+    assert len(recorder_mock.attributes_reference_counts) == 0
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 0
+        assert session.query(StateAttributes).count() == 0
+
+
+async def test_purge_resumes_after_restart(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test an unfinished purge is resumed when the recorder starts."""
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    hass_storage["recorder.purge"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "recorder.purge",
+        "data": PurgeProgress(
+            purge_before,
+            started=dt_util.utcnow() - timedelta(hours=1),
+            runs=3,
+            states=4000,
+        ).as_dict(),
+    }
+
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_purge_done(hass)
+
+    progress = instance.purge_progress
+    assert progress.purge_before == purge_before
+    assert progress.finished is not None
+    assert progress.runs == 4
+    assert progress.states == 4000
+
+
 async def test_purge_old_events(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old events."""
     await _add_test_events(hass)
@@ -548,6 +648,54 @@ async def test_purge_method(
     )
 
 
+@pytest.mark.parametrize(
+    ("dialect_name", "repack", "vacuumed"),
+    [
+        (SupportedDialect.POSTGRESQL, False, True),
+        (SupportedDialect.POSTGRESQL, True, False),
+        (SupportedDialect.SQLITE, False, False),
+    ],
+)
+async def test_purge_task_vacuums_purged_tables(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    dialect_name: SupportedDialect,
+    repack: bool,
+    vacuumed: bool,
+) -> None:
+    """Test a finished purge queues a vacuum of the purged tables on PostgreSQL."""
+    with freeze_time(dt_util.utcnow() - timedelta(days=5)):
+        hass.states.async_set("test.recorder", "on", {"index": 1})
+        await async_wait_recording_done(hass)
+
+    with (
+        patch.object(recorder_mock, "dialect_name", dialect_name),
+        patch.object(purge, "repack_database"),
+        patch.object(recorder_mock, "queue_task") as queue_task,
+    ):
+        PurgeTask(
+            dt_util.utcnow() - timedelta(days=1), repack=repack, apply_filter=False
+        ).run(recorder_mock)
+
+    if vacuumed:
+        # Only the tables rows were purged from
+        queue_task.assert_called_once_with(
+            VacuumPurgedTablesTask(["states", "state_attributes"])
+        )
+    else:
+        assert not queue_task.called
+
+
+def test_vacuum_purged_tables() -> None:
+    """Test only the tables rows were purged from are vacuumed."""
+    instance = MagicMock()
+    vacuum_purged_tables(instance, ["states", "state_attributes"])
+
+    conn = instance.engine.connect.return_value.execution_options.return_value
+    execute = conn.__enter__.return_value.execute
+    assert str(execute.call_args[0][0]) == "VACUUM (ANALYZE) states,state_attributes"
+
+
 @pytest.mark.parametrize("use_sqlite", [True, False], indirect=True)
 async def test_purge_edge_case(
     hass: HomeAssistant,
@@ -1,7 +1,7 @@
 """The tests for sensor recorder platform."""
 
 from collections.abc import Generator
-from datetime import timedelta
+from datetime import datetime, timedelta
 import re
 from typing import Any
 from unittest.mock import ANY, Mock, patch
@@ -35,6 +35,7 @@ from homeassistant.components.recorder.statistics import (
     get_metadata,
     get_metadata_with_session,
     get_short_term_statistics_run_cache,
+    get_statistics_query_cache,
     list_statistic_ids,
     validate_statistics,
 )
@@ -838,6 +839,125 @@ async def test_statistics_duplicated(
         caplog.clear()
 
 
+async def test_statistics_query_cache(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the results of closed periods are cached until they are modified."""
+    query_cache = get_statistics_query_cache(hass)
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    period1 = zero - timedelta(hours=3)
+    period2 = zero - timedelta(hours=2)
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        metadata,
+        ({"start": period1, "state": 0, "sum": 2}, {"start": period2, "sum": 3}),
+    )
+    async_add_external_statistics(
+        hass,
+        metadata | {"statistic_id": "test:other"},
+        ({"start": period1, "sum": 1},),
+    )
+    await async_wait_recording_done(hass)
+
+    def _get_sums(end_time: datetime | None = zero) -> list[float]:
+        stats = statistics_during_period(
+            hass,
+            period1,
+            end_time,
+            statistic_ids={"test:total_energy_import"},
+            types={"sum"},
+        )
+        return [row["sum"] for row in stats["test:total_energy_import"]]
+
+    assert _get_sums() == [2, 3]
+    assert (query_cache.hits, query_cache.misses) == (0, 1)
+    # The rows of a cached result can be modified
+    statistics_during_period(
+        hass, period1, zero, statistic_ids={"test:total_energy_import"}, types={"sum"}
+    )["test:total_energy_import"][0]["sum"] = 10
+    assert _get_sums() == [2, 3]
+    assert (query_cache.hits, query_cache.misses) == (2, 1)
+    # Open periods are not cached
+    assert _get_sums(None) == [2, 3]
+    assert (query_cache.hits, query_cache.misses) == (2, 1)
+
+    # Statistics of other metadata ids or after the period keep the result
+    async_add_external_statistics(
+        hass,
+        metadata | {"statistic_id": "test:other"},
+        ({"start": period2, "sum": 4},),
+    )
+    async_add_external_statistics(hass, metadata, ({"start": zero, "sum": 5},))
+    await async_wait_recording_done(hass)
+    assert _get_sums() == [2, 3]
+    assert (query_cache.hits, query_cache.misses) == (3, 1)
+
+    async_add_external_statistics(hass, metadata, ({"start": period2, "sum": 6},))
+    await async_wait_recording_done(hass)
+    assert _get_sums() == [2, 6]
+    assert (query_cache.hits, query_cache.misses) == (3, 2)
+
+    recorder_mock.async_adjust_statistics("test:total_energy_import", period2, 1, "kWh")
+    await async_wait_recording_done(hass)
+    assert _get_sums() == [2, 7]
+    assert (query_cache.hits, query_cache.misses) == (3, 3)
+    assert query_cache.hit_rate == 0.5
+
+
+async def test_statistics_query_cache_missing_metadata(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test results of statistic ids without metadata are not cached."""
+    query_cache = get_statistics_query_cache(hass)
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    period1 = zero - timedelta(hours=3)
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, metadata, ({"start": period1, "sum": 2},))
+    await async_wait_recording_done(hass)
+
+    def _get_sums() -> dict[str, list[float]]:
+        stats = statistics_during_period(
+            hass,
+            period1,
+            zero,
+            statistic_ids={"test:total_energy_import", "test:new"},
+            types={"sum"},
+        )
+        return {
+            statistic_id: [row["sum"] for row in rows]
+            for statistic_id, rows in stats.items()
+        }
+
+    assert _get_sums() == {"test:total_energy_import": [2]}
+    assert _get_sums() == {"test:total_energy_import": [2]}
+    assert (query_cache.hits, query_cache.misses) == (0, 0)
+
+    async_add_external_statistics(
+        hass,
+        metadata | {"statistic_id": "test:new"},
+        ({"start": period1, "sum": 1},),
+    )
+    await async_wait_recording_done(hass)
+    assert _get_sums() == {"test:total_energy_import": [2], "test:new": [1]}
+    assert _get_sums() == {"test:total_energy_import": [2], "test:new": [1]}
+    assert (query_cache.hits, query_cache.misses) == (1, 1)
+
+
 @pytest.mark.parametrize("last_reset_str", ["2022-01-01T00:00:00+02:00", None])
 @pytest.mark.parametrize(
     ("source", "statistic_id", "import_fn"),
@@ -6,6 +6,7 @@ import pytest
 
 from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.statistics import get_statistics_query_cache
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -38,6 +39,21 @@ async def test_recorder_system_health(
     }
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_recorder_system_health_statistics_cache(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health with statistics cache lookups."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    query_cache = get_statistics_query_cache(hass)
+    query_cache.hits = 3
+    query_cache.misses = 1
+    info = await get_system_health_info(hass, "recorder")
+    assert info["statistics_cache_hit_rate"] == "75%"
+
+
 @pytest.mark.parametrize(
     "db_engine", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
@@ -999,6 +999,15 @@ async def test_execute_stmt_lambda_element(
         assert rows[0].state == new_state.state
         assert rows[0].metadata_id == metadata_id
 
+        # Streamed rows are never fetched all at once
+        rows = util.execute_stmt_lambda_element(
+            session, stmt, now, tomorrow, orm_rows=False, stream=True
+        )
+        assert not isinstance(rows, list)
+        row = next(rows)
+        assert row.state == new_state.state
+        assert row.metadata_id == metadata_id
+
         with patch.object(session, "execute", MockExecutor):
             rows = util.execute_stmt_lambda_element(session, stmt, now, tomorrow)
             assert rows == ["mock_row"]
@@ -43,6 +43,7 @@ from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
 from .common import (
     async_recorder_block_till_done,
+    async_wait_purge_done,
     async_wait_recorder,
     async_wait_recording_done,
     create_engine_test,
@@ -3122,6 +3123,42 @@ async def test_recorder_info(
     }
 
 
+async def test_subscribe_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test subscribing to the purge progress."""
+    client = await hass_ws_client()
+
+    await client.send_json_auto_id({"type": "recorder/subscribe_purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"]["started"] is None
+    assert response["event"]["finished"] is None
+
+    await hass.services.async_call(
+        recorder.DOMAIN, "purge", {"keep_days": 1}, blocking=True
+    )
+    await async_wait_purge_done(hass)
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    assert response["event"] == {
+        "purge_before": ANY,
+        "repack": False,
+        "apply_filter": False,
+        "started": ANY,
+        "finished": ANY,
+        "runs": 1,
+        "states": 0,
+        "events": 0,
+        "state_attributes": 0,
+        "event_data": 0,
+        "last_run_duration": ANY,
+    }
+    assert response["event"]["finished"] is not None
+
+
 @pytest.mark.parametrize(
     ("db_url", "db_in_default_location"),
     [
@@ -49,6 +49,8 @@ from homeassistant.components.sensor.recorder import (
     MEAN_TYPE_CHANGED_ISSUE,
     STATE_CLASS_REMOVED_ISSUE,
     UNITS_CHANGED_ISSUE,
+    _compressed_history_to_float_values,
+    _values_without_normalization,
 )
 from homeassistant.const import ATTR_FRIENDLY_NAME, DEGREE, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
@@ -881,6 +883,106 @@ async def test_compile_hourly_statistics_only_state_is_at_end_of_period(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compressed_history_to_float_values() -> None:
+    """Test the float values are read from the compressed history."""
+    history_states = [
+        {"s": "10", "a": {"unit_of_measurement": "W"}, "lu": 1.0},
+        {"s": STATE_UNAVAILABLE, "a": {"unit_of_measurement": "W"}, "lu": 2.0},
+        {"s": "nan", "a": {"unit_of_measurement": "W"}, "lu": 3.0},
+        {"s": "inf", "a": {"unit_of_measurement": "W"}, "lu": 4.0},
+        {"s": "1.5", "a": {"unit_of_measurement": "kW"}, "lu": 5.0},
+        {"s": "-3", "a": {}, "lu": 6.0},
+    ]
+    assert _compressed_history_to_float_values(history_states) == [
+        (10.0, 1.0, "W"),
+        (1.5, 5.0, "kW"),
+        (-3.0, 6.0, None),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("metadata_unit", "units", "expected_unit"),
+    [
+        # The unit of the states is used if there is no metadata
+        (None, ["W", "W"], "W"),
+        (None, ["items", "items"], "items"),
+        (None, ["RPM", "rpm"], "RPM"),
+        ("kW", ["kW", "kW"], "kW"),
+        # Units which are not converted are checked against the metadata later
+        ("items", ["beats", "beats"], "beats"),
+        # Units which need to be converted or are not equivalent
+        (None, ["W", "kW"], None),
+        ("kW", ["W", "W"], None),
+        (None, ["items", "beats"], None),
+    ],
+)
+def test_values_without_normalization(
+    metadata_unit: str | None, units: list[str], expected_unit: str | None
+) -> None:
+    """Test the values are only used as is if no unit needs to be normalized."""
+    old_metadatas = {}
+    if metadata_unit is not None:
+        old_metadatas["sensor.test1"] = (1, {"unit_of_measurement": metadata_unit})
+    float_values = [(10.0, 1.0, units[0]), (20.0, 2.0, units[1])]
+    result = _values_without_normalization(old_metadatas, float_values, "sensor.test1")
+    if expected_unit is None:
+        assert result is None
+    else:
+        assert result == (expected_unit, [(10.0, 1.0), (20.0, 2.0)])
+
+
+async def test_compile_hourly_statistics_normalization_fallback(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test only sensors with states in different units read the full history."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    watt = {
+        "device_class": "power",
+        "state_class": "measurement",
+        "unit_of_measurement": "W",
+    }
+    kilowatt = {**watt, "unit_of_measurement": "kW"}
+    with freeze_time(zero) as freezer:
+        for seconds, same, mixed in (
+            (5, ("10", watt), ("10", watt)),
+            (55, ("15", watt), ("0.015", kilowatt)),
+            (255, ("30", watt), ("30", watt)),
+        ):
+            freezer.move_to(zero + timedelta(seconds=seconds))
+            hass.states.async_set("sensor.same", same[0], same[1])
+            hass.states.async_set("sensor.mixed", mixed[0], mixed[1])
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_full_significant_states:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    assert get_full_significant_states.call_count == 1
+    assert get_full_significant_states.call_args.kwargs["entity_ids"] == [
+        "sensor.mixed"
+    ]
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    expected = {
+        "start": process_timestamp(zero).timestamp(),
+        "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+        "mean": pytest.approx((10 * 50 + 15 * 200 + 30 * 45) / 295),
+        "min": pytest.approx(10.0),
+        "max": pytest.approx(30.0),
+        "last_reset": None,
+        "state": None,
+        "sum": None,
+    }
+    assert stats == {"sensor.mixed": [expected], "sensor.same": [expected]}
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 @pytest.mark.parametrize(
     ("device_class", "state_unit", "display_unit", "statistics_unit", "unit_class"),
     [
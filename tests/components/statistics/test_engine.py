@@ -0,0 +1,81 @@
+"""Test the incremental engines of the statistics sensor."""
+
+from collections import deque
+import math
+import random
+
+import pytest
+
+from homeassistant.components.statistics.sensor import (
+    STATS_BINARY_ENGINES,
+    STATS_BINARY_SUPPORT,
+    STATS_NUMERIC_ENGINES,
+    STATS_NUMERIC_SUPPORT,
+    _create_characteristic_engine,
+)
+
+
+def _assert_engine_matches_full_computation(
+    characteristic: str, binary: bool, samples: list[bool | float]
+) -> None:
+    """Feed samples through a buffer and compare the engine after each change."""
+    engine = _create_characteristic_engine(characteristic, binary)
+    assert engine is not None
+    full_computation = (STATS_BINARY_SUPPORT if binary else STATS_NUMERIC_SUPPORT)[
+        characteristic
+    ]
+    states: deque[bool | float] = deque(maxlen=20)
+    ages: deque[float] = deque(maxlen=20)
+    rng = random.Random(characteristic)
+
+    def assert_matches(percentile: int) -> None:
+        try:
+            expected = full_computation(states, ages, percentile)
+        except (AttributeError, ValueError) as err:
+            # The full computation fails on some non-finite samples
+            with pytest.raises(type(err)):
+                engine.value(states, ages, percentile)
+            return
+        value = engine.value(states, ages, percentile)
+        if isinstance(expected, float) and math.isnan(expected):
+            assert math.isnan(value)
+        else:
+            assert value == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+    for idx, sample in enumerate(samples):
+        if len(states) == states.maxlen:
+            engine.remove(states, ages)
+        states.append(sample)
+        ages.append(1000.0 + idx * 1.5 + rng.random())
+        engine.add(states, ages)
+        assert_matches(rng.randint(1, 99))
+        if idx % 7 == 6:
+            # Purge by age down to a few samples
+            while len(states) > 3:
+                engine.remove(states, ages)
+                states.popleft()
+                ages.popleft()
+                assert_matches(50)
+
+
+@pytest.mark.parametrize("characteristic", sorted(STATS_NUMERIC_ENGINES))
+def test_numeric_engines(characteristic: str) -> None:
+    """Test the numeric engines match the full computation."""
+    rng = random.Random(0)
+    samples: list[bool | float] = [
+        round(rng.uniform(-50, 400), rng.randint(0, 3)) for _ in range(300)
+    ]
+    # Repeated values, extremes and a non-finite sample leaving the buffer
+    samples[40:45] = [7.0] * 5
+    samples[100] = 1e6
+    samples[150] = math.inf
+    samples[160] = math.nan
+    _assert_engine_matches_full_computation(characteristic, False, samples)
+
+
+@pytest.mark.parametrize("characteristic", sorted(STATS_BINARY_ENGINES))
+def test_binary_engines(characteristic: str) -> None:
+    """Test the binary engines match the full computation."""
+    rng = random.Random(0)
+    samples: list[bool | float] = [rng.random() < 0.3 for _ in range(300)]
+    _assert_engine_matches_full_computation(characteristic, True, samples)
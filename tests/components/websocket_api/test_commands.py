@@ -1528,6 +1528,70 @@ async def test_render_template_renders_template(
     }
 
 
+async def test_template_profile(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test profiling the renders of templates."""
+    hass.states.async_set("light.profiled", "on")
+
+    await websocket_client.send_json_auto_id(
+        {"type": "template/profile", "enabled": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "enabled": True,
+        "cache": {"size": ANY, "max_size": ANY, "hits": ANY, "misses": ANY},
+        "templates": [],
+    }
+
+    await websocket_client.send_json_auto_id(
+        {"type": "render_template", "template": "{{ states('light.profiled') }}"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["result"] == "on"
+    hass.states.async_set("light.profiled", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["result"] == "off"
+
+    await websocket_client.send_json_auto_id({"type": "template/profile"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["templates"] == [
+        {
+            "template": "{{ states('light.profiled') }}",
+            "renders": 3,
+            "total_time": ANY,
+            "mean_time": ANY,
+            "p99_time": ANY,
+            # The template is rendered once when tracking is set up
+            "triggers": {"direct": 1, "refresh": 1, "light.profiled": 1},
+        }
+    ]
+
+    await websocket_client.send_json_auto_id(
+        {"type": "template/profile", "enabled": False}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["enabled"] is False
+    assert msg["result"]["templates"] == []
+
+
+async def test_template_profile_requires_admin(
+    websocket_client: MockHAClientWebSocket, hass_admin_user: MockUser
+) -> None:
+    """Test profiling templates requires an admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json_auto_id({"type": "template/profile"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_render_template_with_timeout_and_variables(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -10,6 +10,7 @@ import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    async_response,
     const,
     http,
     websocket_command,
@@ -186,6 +187,66 @@ async def test_delayed_response_handler(
     assert "on closed connection" in caplog.text
 
 
+async def test_wait_for_drain(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test a handler waiting for the queue to drain between messages."""
+    sent_all = asyncio.Event()
+
+    @websocket_command({"type": "drain_sender"})
+    @async_response
+    async def async_drain_sender(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        connection.send_result(msg["id"])
+        for idx in range(10):
+            connection.send_event(msg["id"], {"idx": idx})
+            await connection.async_wait_for_drain(0)
+        sent_all.set()
+
+    async_register_command(hass, async_drain_sender)
+
+    await websocket_client.send_json({"id": 1, "type": "drain_sender"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["type"] == "result"
+    for idx in range(10):
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {"idx": idx}
+    await sent_all.wait()
+
+
+async def test_wait_for_drain_released_on_close(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test a handler waiting for the queue to drain is released on close."""
+    waiting = asyncio.Event()
+    released = asyncio.Event()
+
+    @websocket_command({"type": "drain_waiter"})
+    @async_response
+    async def async_drain_waiter(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        connection.send_result(msg["id"])
+        waiting.set()
+        # The queue can never drain below zero messages
+        await connection.async_wait_for_drain(-1)
+        released.set()
+
+    async_register_command(hass, async_drain_waiter)
+
+    await websocket_client.send_json({"id": 1, "type": "drain_waiter"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    await waiting.wait()
+    assert not released.is_set()
+
+    await websocket_client.close()
+    await hass.async_block_till_done()
+    assert released.is_set()
+
+
 async def test_ensure_disconnect_invalid_json(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -21,12 +21,14 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_REPORTED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
@@ -774,6 +776,49 @@ async def test_capability_attrs(hass: HomeAssistant) -> None:
     assert state.attributes["always"] == "there"
 
 
+async def test_unchanged_attributes_reused(hass: HomeAssistant) -> None:
+    """Test the attributes are reused while the entity is unchanged."""
+    reported: list[Event] = []
+
+    @callback
+    def _listener(event: Event) -> None:
+        reported.append(event)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, _listener, event_filter=callback(lambda _: True)
+    )
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_name = "Hello"
+    ent._attr_extra_state_attributes = {"voltage": 230}
+    ent.async_write_ha_state()
+    attributes = hass.states.get("hello.world").attributes
+    assert attributes == {ATTR_FRIENDLY_NAME: "Hello", "voltage": 230}
+
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert hass.states.get("hello.world").attributes is attributes
+    assert len(reported) == 1
+
+    # Changes made in place to the attribute mappings are noticed
+    ent._attr_extra_state_attributes["voltage"] = 231
+    ent.async_write_ha_state()
+    attributes = hass.states.get("hello.world").attributes
+    assert attributes == {ATTR_FRIENDLY_NAME: "Hello", "voltage": 231}
+
+    ent._attr_name = "World"
+    ent.async_write_ha_state()
+    attributes = hass.states.get("hello.world").attributes
+    assert attributes == {ATTR_FRIENDLY_NAME: "World", "voltage": 231}
+
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.state == "on"
+    assert state.attributes is attributes
+
+
 async def test_warn_slow_write_state(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
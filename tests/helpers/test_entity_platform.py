@@ -7,6 +7,7 @@ import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from syrupy.assertion import SnapshotAssertion
 import voluptuous as vol
@@ -126,7 +127,7 @@ async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     poll_ent = MockEntity(should_poll=True)
 
     await entity_platform.async_add_entities([poll_ent])
-    assert entity_platform._async_polling_timer is None
+    assert entity_platform._poller is None
 
 
 async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> None:
@@ -239,12 +240,66 @@ async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    with patch.object(hass.loop, "call_later") as mock_track:
+    with patch.object(hass.loop, "call_at") as mock_track:
         await component.async_setup({DOMAIN: {"platform": "platform"}})
 
         await hass.async_block_till_done()
     assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    assert mock_track.call_args[0][0] == pytest.approx(hass.loop.time() + 30, abs=1)
+
+
+async def test_max_scan_interval_via_platform(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the scan interval is increased while the polls change nothing."""
+    poll_ent = MockEntity(should_poll=True)
+    poll_ent.async_update = AsyncMock()
+    platform = MockPlatform()
+    platform.SCAN_INTERVAL = timedelta(seconds=20)
+    platform.MAX_SCAN_INTERVAL = timedelta(seconds=60)
+    entity_platform = MockEntityPlatform(
+        hass, platform=platform, scan_interval=timedelta(seconds=20)
+    )
+    await entity_platform.async_add_entities([poll_ent])
+
+    for _ in range(3):
+        freezer.tick(timedelta(seconds=20))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert poll_ent.async_update.call_count == 3
+    poller = entity_platform._poller
+    assert poller.interval == 30
+    assert poller.statistics.polls == 3
+    assert poller.statistics.changed_polls == 0
+
+    poll_ent._attr_state = "changed"
+    freezer.tick(timedelta(seconds=20))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert poll_ent.async_update.call_count == 4
+    assert poller.interval == 20
+    assert poller.statistics.changed_polls == 1
+
+
+async def test_polls_without_max_scan_interval(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the polls are not checked for changes without a maximum interval."""
+    poll_ent = MockEntity(should_poll=True)
+    poll_ent.async_update = AsyncMock()
+    entity_platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=20))
+    await entity_platform.async_add_entities([poll_ent])
+
+    freezer.tick(timedelta(seconds=20))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert poll_ent.async_update.call_count == 1
+    poller = entity_platform._poller
+    assert not poller.adaptive
+    assert poller.statistics.polls == 1
+    assert poller.statistics.compared_polls == 0
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -1047,7 +1102,7 @@ async def test_stop_shutdown_cancels_retry_setup_and_interval_listener(
     ent_platform.async_shutdown()
 
     assert len(mock_call_later.return_value.mock_calls) == 1
-    assert ent_platform._async_polling_timer is None
+    assert ent_platform._poller is None
     assert ent_platform._async_cancel_retry_setup is None
 
 
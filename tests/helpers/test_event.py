@@ -1960,6 +1960,51 @@ async def test_track_template_result_with_wildcard(hass: HomeAssistant) -> None:
     assert "cover.office_skylight=open" in specific_runs[0]
 
 
+async def test_track_template_result_only_fields_read(hass: HomeAssistant) -> None:
+    """Test tracking a template only re-renders when the fields it reads change."""
+    specific_runs = []
+    hass.states.async_set("media_player.tv", "playing", {"media_position": 1})
+    hass.states.async_set("climate.hall", "heat", {"temperature": 21})
+    template_str = (
+        "{{ states.media_player.tv.state }}"
+        " {{ states.climate.hall.attributes.temperature }}"
+    )
+    template_obj = Template(template_str, hass)
+
+    def specific_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        specific_runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_obj, None)], specific_run_callback
+    )
+    await hass.async_block_till_done()
+    assert info.listeners["entities"] == {"media_player.tv", "climate.hall"}
+    renders = template_obj._renders
+
+    hass.states.async_set("media_player.tv", "playing", {"media_position": 2})
+    hass.states.async_set(
+        "climate.hall", "heat", {"temperature": 21, "current_temperature": 19}
+    )
+    await hass.async_block_till_done()
+    assert template_obj._renders == renders
+    assert specific_runs == []
+
+    hass.states.async_set("climate.hall", "heat", {"temperature": 22})
+    await hass.async_block_till_done()
+    assert specific_runs == ["playing 22"]
+
+    hass.states.async_set("media_player.tv", "paused", {"media_position": 2})
+    await hass.async_block_till_done()
+    assert specific_runs == ["playing 22", "paused 22"]
+
+    hass.states.async_remove("media_player.tv")
+    await hass.async_block_till_done()
+    assert specific_runs == ["playing 22", "paused 22", 22]
+
+
 async def test_track_template_result_with_group(hass: HomeAssistant) -> None:
     """Test tracking template with a group."""
     hass.states.async_set("sensor.power_1", 0)
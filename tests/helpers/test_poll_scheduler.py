@@ -0,0 +1,267 @@
+"""Tests for the poll scheduler."""
+
+import asyncio
+from datetime import timedelta
+import logging
+from unittest.mock import Mock
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import update_coordinator
+from homeassistant.helpers.poll_scheduler import (
+    Poller,
+    async_get_config_entry_polls,
+    async_get_poll_scheduler,
+)
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def test_polls_share_ticks(hass: HomeAssistant) -> None:
+    """Test polls due around the same time run in one tick."""
+    scheduler = async_get_poll_scheduler(hass)
+    first_job = Mock()
+    second_job = Mock()
+    third_job = Mock()
+    first = Poller(hass, "first", first_job, 30)
+    second = Poller(hass, "second", second_job, 30)
+    third = Poller(hass, "third", third_job, 30)
+    first.jitter = second.jitter = third.jitter = 0
+
+    now = hass.loop.time()
+    first.async_schedule(now + 30)
+    second.async_schedule(now + 30.08)
+    third.async_schedule(now + 31)
+    assert len(scheduler._ticks) == 2
+
+    # The tick of a cancelled poll is kept while it has other polls
+    first.async_cancel()
+    assert len(scheduler._ticks) == 2
+    first.async_schedule(now + 30)
+    assert first.scheduled
+
+    scheduler._ticks[now + 30].handle._run()
+    assert first_job.call_count == 1
+    assert second_job.call_count == 1
+    assert not third_job.called
+    assert not first.scheduled
+    assert third.scheduled
+
+    third.async_cancel()
+    assert not scheduler._ticks
+    assert not scheduler._times
+
+
+async def test_poller_jitter(hass: HomeAssistant) -> None:
+    """Test the jitter spreads polls due at the same time over a few ticks."""
+    scheduler = async_get_poll_scheduler(hass)
+    pollers = [Poller(hass, f"poller_{idx}", Mock(), 30) for idx in range(40)]
+    jitters = {poller.jitter for poller in pollers}
+    assert len(jitters) > 1
+    assert jitters <= {0.05, 0.2, 0.35, 0.5}
+
+    now = hass.loop.time()
+    for poller in pollers:
+        poller.async_schedule(now + 30)
+    assert len(scheduler._ticks) == len(jitters)
+    for poller in pollers:
+        assert poller._tick.when == now + 30 + poller.jitter
+
+    # A poll joins a tick a little after it
+    pollers[0].async_schedule(now + 30.05)
+    assert len(scheduler._ticks) == len(jitters)
+
+    for poller in pollers:
+        poller.async_cancel()
+    assert not scheduler._ticks
+
+
+async def test_poller_backoff(hass: HomeAssistant) -> None:
+    """Test the interval is increased while polls change nothing."""
+    poller = Poller(hass, "test", Mock(), 10, max_interval=20)
+    poller.jitter = 0.2
+
+    for _ in range(3):
+        poller.async_record_poll(0.1, False)
+    assert poller.interval == 15
+    for _ in range(3):
+        poller.async_record_poll(0.1, False)
+    assert poller.interval == 20
+    for _ in range(3):
+        poller.async_record_poll(0.1, False)
+    assert poller.interval == 20
+
+    poller.async_record_poll(0.4, True)
+    assert poller.interval == 10
+    assert poller.as_dict() == {
+        "name": "test",
+        "interval": 10,
+        "min_interval": 10,
+        "max_interval": 20,
+        "jitter": 0.2,
+        "scheduled": False,
+        "polls": 10,
+        "change_ratio": 0.1,
+        "last_duration": 0.4,
+        "average_duration": pytest.approx(0.13),
+    }
+
+    # Without a maximum the interval is kept
+    poller = Poller(hass, "test", Mock(), 10)
+    assert not poller.adaptive
+    for _ in range(3):
+        poller.async_record_poll(0.1, False)
+    assert poller.interval == 10
+
+    # Polls which were not checked for changes are left out of the ratio
+    poller.async_record_poll(0.1, None)
+    assert poller.as_dict()["polls"] == 4
+    assert poller.as_dict()["change_ratio"] == 0
+
+
+async def test_host_limit(hass: HomeAssistant) -> None:
+    """Test the polls of config entries with the same host can share a limit."""
+    first = MockConfigEntry(data={CONF_HOST: "1.2.3.4"})
+    second = MockConfigEntry(data={CONF_HOST: "1.2.3.4"})
+    other = MockConfigEntry(data={CONF_HOST: "5.6.7.8"})
+
+    limit = Poller(hass, "first", Mock(), 10, config_entry=first, host_concurrency=2)
+    assert isinstance(limit.limit, asyncio.Semaphore)
+    assert (
+        Poller(
+            hass, "second", Mock(), 10, config_entry=second, host_concurrency=2
+        ).limit
+        is limit.limit
+    )
+    assert (
+        Poller(hass, "other", Mock(), 10, config_entry=other, host_concurrency=2).limit
+        is not limit.limit
+    )
+    assert (
+        Poller(
+            hass,
+            "no_host",
+            Mock(),
+            10,
+            config_entry=MockConfigEntry(),
+            host_concurrency=2,
+        ).limit
+        is not limit.limit
+    )
+
+    # The limit is opt-in
+    assert not isinstance(
+        Poller(hass, "default", Mock(), 10, config_entry=first).limit,
+        asyncio.Semaphore,
+    )
+
+
+async def test_coordinator_backoff(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a coordinator backs off while its data does not change."""
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    update_method = Mock(return_value=1)
+
+    async def _update() -> int:
+        return update_method()
+
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        config_entry=config_entry,
+        name="test",
+        update_method=_update,
+        update_interval=timedelta(seconds=10),
+        max_update_interval=timedelta(seconds=15),
+    )
+    crd.async_add_listener(Mock())
+    await crd.async_refresh()
+
+    for _ in range(3):
+        freezer.tick(timedelta(seconds=11))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert update_method.call_count == 4
+
+    # The interval was increased after three unchanged refreshes
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert update_method.call_count == 4
+    freezer.tick(timedelta(seconds=5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert update_method.call_count == 5
+
+    [polls] = async_get_config_entry_polls(hass, config_entry.entry_id)
+    assert polls["name"] == "test"
+    assert polls["interval"] == 15
+    assert polls["polls"] == 4
+    assert polls["change_ratio"] == 0
+
+    update_method.return_value = 2
+    freezer.tick(timedelta(seconds=16))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert update_method.call_count == 6
+    [polls] = async_get_config_entry_polls(hass, config_entry.entry_id)
+    assert polls["interval"] == 10
+    assert polls["change_ratio"] == 1 / 5
+
+    await crd.async_shutdown()
+
+
+@pytest.mark.parametrize("max_update_interval", [None, timedelta(seconds=15)])
+async def test_coordinator_data_not_comparable(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    max_update_interval: timedelta | None,
+) -> None:
+    """Test refreshes are rescheduled when the data can't be compared."""
+
+    class Uncomparable:
+        """Data like an array which can't be compared to a bool."""
+
+        def __ne__(self, other: object) -> bool:
+            raise ValueError("The truth value is ambiguous")
+
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    update_method = Mock(side_effect=Uncomparable)
+
+    async def _update() -> Uncomparable:
+        return update_method()
+
+    crd = update_coordinator.DataUpdateCoordinator[Uncomparable](
+        hass,
+        _LOGGER,
+        config_entry=config_entry,
+        name="test",
+        update_method=_update,
+        update_interval=timedelta(seconds=10),
+        max_update_interval=max_update_interval,
+    )
+    listener = Mock()
+    crd.async_add_listener(listener)
+    await crd.async_refresh()
+
+    for _ in range(4):
+        freezer.tick(timedelta(seconds=11))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert update_method.call_count == 5
+    assert listener.call_count == 5
+
+    [polls] = async_get_config_entry_polls(hass, config_entry.entry_id)
+    assert polls["interval"] == 10
+    # The data is only compared when the interval may be increased
+    assert polls["change_ratio"] == (1 if max_update_interval else None)
+
+    await crd.async_shutdown()
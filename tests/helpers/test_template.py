@@ -10,9 +10,10 @@ import math
 import random
 from types import MappingProxyType
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from lru import LRU
 import orjson
 import pytest
 from pytest_unordered import unordered
@@ -5340,28 +5341,81 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-@pytest.mark.usefixtures("hass")
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
-    template_string = (
-        "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
-    )
-    tpl = template.Template(
-        (template_string),
-    )
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared and evicted least recently used first."""
+    template_string = "{{ 'compiled' ~ 'cache' }}"
+    hits, misses = template.COMPILED_TEMPLATE_LRU.get_stats()
+    tpl = template.Template(template_string, hass)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string, hass)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert tpl2._compiled_code is tpl._compiled_code
+    assert template.compiled_template_cache_info()["hits"] == hits + 1
+    assert template.compiled_template_cache_info()["misses"] == misses + 1
+
+    # Templates with the same source also share the bound template
+    assert tpl.async_render() == "compiledcache"
+    assert tpl2.async_render() == "compiledcache"
+    assert tpl2._compiled is tpl._compiled
+
+    # The compiled code outlives the templates
+    code = tpl._compiled_code
+    del tpl, tpl2
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    assert tpl._compiled_code is code
+    assert template.compiled_template_cache_info()["hits"] == hits + 2
+
+    # Templates without hass are compiled for their own environment
+    tpl_no_hass = template.Template(template_string)
+    tpl_no_hass.ensure_valid()
+    assert tpl_no_hass._compiled_code is not code
+
+    with patch.object(template, "COMPILED_TEMPLATE_LRU", LRU(1)):
+        template.Template(template_string, hass).ensure_valid()
+        template.Template("{{ 'evicts' }}", hass).ensure_valid()
+        assert template.compiled_template_cache_info() == {
+            "size": 1,
+            "max_size": 1,
+            "hits": 0,
+            "misses": 2,
+        }
+
+
+async def test_template_profiling(hass: HomeAssistant) -> None:
+    """Test profiling template renders."""
+    hass.states.async_set("sensor.profiled", "1")
+    tpl = template.Template("{{ states('sensor.profiled') }}", hass)
+    tpl.async_render()
+    assert template.async_get_template_profiler(hass) is None
+
+    template.async_set_template_profiling(hass, True)
+    profiler = template.async_get_template_profiler(hass)
+    assert profiler is not None
+    tpl.async_render()
+    token = template.render_trigger_cv.set("sensor.profiled")
+    try:
+        tpl.async_render()
+    finally:
+        template.render_trigger_cv.reset(token)
+    template.Template("{{ 'other' }}", hass).async_render_with_possible_json_value("1")
+
+    stats = {stat["template"]: stat for stat in profiler.async_stats()}
+    assert stats["{{ states('sensor.profiled') }}"] == {
+        "template": "{{ states('sensor.profiled') }}",
+        "renders": 2,
+        "total_time": ANY,
+        "mean_time": ANY,
+        "p99_time": ANY,
+        "triggers": {"direct": 1, "sensor.profiled": 1},
+    }
+    assert stats["{{ 'other' }}"]["renders"] == 1
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    # Enabling again keeps the statistics, disabling discards them
+    template.async_set_template_profiling(hass, True)
+    assert template.async_get_template_profiler(hass) is profiler
+    template.async_set_template_profiling(hass, False)
+    assert template.async_get_template_profiler(hass) is None
 
 
 def test_is_template_string() -> None:
@@ -5608,6 +5662,123 @@ async def test_state_attributes(hass: HomeAssistant) -> None:
         tpl.async_render()
 
 
+@pytest.mark.parametrize(
+    ("template_str", "fields", "attributes"),
+    [
+        ("{{ states.climate.test.state }}", {"state"}, set()),
+        ("{{ states('climate.test') }}", {"state"}, set()),
+        ("{{ is_state('climate.test', 'heat') }}", {"state"}, set()),
+        ("{{ states.climate.test.domain }}", set(), set()),
+        ("{{ states.climate.test.name }}", set(), {"friendly_name"}),
+        ("{{ state_attr('climate.test', 'temperature') }}", set(), {"temperature"}),
+        (
+            "{{ is_state_attr('climate.test', 'hvac_action', 'idle') }}",
+            set(),
+            {"hvac_action"},
+        ),
+        (
+            "{{ states.climate.test.attributes.temperature }}"
+            "{{ states.climate.test.attributes['hvac_action'] }}"
+            "{{ states.climate.test.attributes.get('preset', 'none') }}"
+            "{{ 'fan_mode' in states.climate.test.attributes }}"
+            "{{ states.climate.test.last_changed }}",
+            {"last_changed"},
+            {"temperature", "hvac_action", "preset", "fan_mode"},
+        ),
+        ("{{ states.climate.test.attributes }}", None, None),
+        ("{{ states.climate.test.attributes.items() | list }}", None, None),
+        (
+            "{% set attrs = states.climate.test.attributes %}{{ attrs.temperature }}",
+            None,
+            None,
+        ),
+        ("{{ (states.climate.test | attr('attributes')).temperature }}", None, None),
+        ("{{ states.climate.test['attributes'].temperature }}", None, None),
+        ("{{ states.climate.test.last_updated }}", None, None),
+        (
+            "{{ states.climate.test.state }}{{ states.climate.test.context.id }}",
+            None,
+            None,
+        ),
+        (
+            "{{ states.climate.test.state }}"
+            "{{ states.climate | map(attribute='state') | list }}",
+            None,
+            None,
+        ),
+    ],
+)
+async def test_render_info_collects_fields(
+    hass: HomeAssistant,
+    template_str: str,
+    fields: set[str] | None,
+    attributes: set[str] | None,
+) -> None:
+    """Test collecting the fields and attribute keys a template reads."""
+    hass.states.async_set(
+        "climate.test",
+        "heat",
+        {"temperature": 21, "hvac_action": "idle", "friendly_name": "Test"},
+    )
+    info = render_to_info(hass, template_str)
+
+    assert "climate.test" in info.entities
+    assert info.entity_fields.get("climate.test") == fields
+    assert info.entity_attributes.get("climate.test") == attributes
+    assert info.fields_changed("climate.test", None, hass.states.get("climate.test"))
+
+
+async def test_render_info_imported_macro_reads_attributes(
+    hass: HomeAssistant,
+) -> None:
+    """Test an imported macro can use the attributes as a mapping."""
+    hass.states.async_set("sensor.x", "on", {"a": 1, "b": 2})
+    await template.async_load_custom_templates(hass)
+    template._get_hass_loader(hass).sources = {
+        "m.jinja": "{% macro f(s) %}{{ s.attributes | count }}{% endmacro %}"
+    }
+
+    info = render_to_info(
+        hass,
+        "{% from 'm.jinja' import f %}{{ f(states.sensor.x) }}"
+        "{{ states.sensor.x.attributes.a }}",
+    )
+
+    assert info.result() == 21
+    assert info.entity_attributes.get("sensor.x") is None
+
+
+async def test_render_info_fields_changed(hass: HomeAssistant) -> None:
+    """Test detecting the changes to the fields a template reads."""
+    hass.states.async_set("climate.test", "heat", {"temperature": 21})
+    old_state = hass.states.get("climate.test")
+    info = render_to_info(
+        hass,
+        "{{ states('climate.test') }}{{ state_attr('climate.test', 'temperature') }}",
+    )
+
+    hass.states.async_set(
+        "climate.test", "heat", {"temperature": 21, "current_temperature": 19}
+    )
+    assert not info.fields_changed(
+        "climate.test", old_state, hass.states.get("climate.test")
+    )
+    hass.states.async_set("climate.test", "heat", {"temperature": 22})
+    assert info.fields_changed(
+        "climate.test", old_state, hass.states.get("climate.test")
+    )
+    hass.states.async_set("climate.test", "off", {"temperature": 21})
+    assert info.fields_changed(
+        "climate.test", old_state, hass.states.get("climate.test")
+    )
+    hass.states.async_set("climate.test", "heat", {})
+    assert info.fields_changed(
+        "climate.test", old_state, hass.states.get("climate.test")
+    )
+    # Entities read as a whole always re-render
+    assert info.fields_changed("climate.other", old_state, old_state)
+
+
 async def test_unavailable_states(hass: HomeAssistant) -> None:
     """Test watching unavailable states."""
 
@@ -12,7 +12,7 @@ import pytest
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
@@ -22,7 +22,7 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import frame, update_coordinator
 from homeassistant.util.dt import utcnow
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import MockConfigEntry, async_capture_events, async_fire_time_changed
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -866,6 +866,49 @@ async def test_timestamp_date_update_coordinator(hass: HomeAssistant) -> None:
     assert len(last_update_success_times) == 1
 
 
+async def test_batch_writes(
+    hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
+) -> None:
+    """Test the states written by the listeners are set together."""
+    crd.batch_writes = True
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    seen_states: list[str | None] = []
+
+    class BatchEntity(update_coordinator.CoordinatorEntity):
+        """Entity writing the coordinator data as its state."""
+
+        def __init__(self, entity_id: str) -> None:
+            super().__init__(crd)
+            self.hass = hass
+            self.entity_id = entity_id
+
+        @property
+        def state(self) -> int:
+            return self.coordinator.data
+
+        @callback
+        def _handle_coordinator_update(self) -> None:
+            state = hass.states.get("sensor.first")
+            seen_states.append(state and state.state)
+            super()._handle_coordinator_update()
+
+    for entity_id in ("sensor.first", "sensor.second"):
+        crd.async_add_listener(BatchEntity(entity_id)._handle_coordinator_update)
+
+    await crd.async_refresh()
+    assert seen_states == [None, None]
+    assert [event.data["entity_id"] for event in events] == [
+        "sensor.first",
+        "sensor.second",
+    ]
+    assert hass.states.get("sensor.second").state == "1"
+
+    await crd.async_refresh()
+    assert seen_states == [None, None, "1", "1"]
+    assert hass.states.get("sensor.first").state == "2"
+    assert len(events) == 4
+
+
 @pytest.mark.parametrize(
     "integration_frame_path", ["homeassistant/components/my_integration"]
 )
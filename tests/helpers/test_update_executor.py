@@ -0,0 +1,135 @@
+"""Tests for the update executor."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_executor import (
+    DEFAULT_UPDATE_QUOTA,
+    async_get_update_executor,
+)
+
+from tests.common import MockEntity, MockEntityPlatform, MockPlatform
+
+
+async def test_quota(hass: HomeAssistant) -> None:
+    """Test the jobs of an integration beyond its quota wait for a thread."""
+    executor = async_get_update_executor(hass, "integration")
+    assert async_get_update_executor(hass, "integration") is executor
+    assert executor.quota == DEFAULT_UPDATE_QUOTA
+
+    release = threading.Event()
+    jobs = [
+        executor.async_add_job(release.wait) for _ in range(DEFAULT_UPDATE_QUOTA + 2)
+    ]
+    assert executor.as_dict() == {
+        "jobs": DEFAULT_UPDATE_QUOTA + 2,
+        "pending": DEFAULT_UPDATE_QUOTA + 2,
+        "queue_depth": 2,
+        "max_pending": DEFAULT_UPDATE_QUOTA + 2,
+        "quota": DEFAULT_UPDATE_QUOTA,
+    }
+
+    release.set()
+    for job in jobs:
+        assert await job is True
+    assert executor.pending == 0
+
+
+async def test_stalled_integration(hass: HomeAssistant) -> None:
+    """Test a stalled integration only holds the threads of its quota."""
+    stalled = async_get_update_executor(hass, "stalled")
+    other = async_get_update_executor(hass, "other")
+    assert other is not stalled
+
+    release = threading.Event()
+    stalled_jobs = [
+        stalled.async_add_job(release.wait) for _ in range(DEFAULT_UPDATE_QUOTA * 2)
+    ]
+    assert stalled.running == DEFAULT_UPDATE_QUOTA
+    assert stalled.queue_depth == DEFAULT_UPDATE_QUOTA
+
+    assert await other.async_add_job(threading.current_thread) is not (
+        threading.current_thread()
+    )
+    assert other.as_dict() == {
+        "jobs": 1,
+        "pending": 0,
+        "queue_depth": 0,
+        "max_pending": 1,
+        "quota": DEFAULT_UPDATE_QUOTA,
+    }
+
+    release.set()
+    for job in stalled_jobs:
+        assert await job is True
+    assert stalled.max_pending == DEFAULT_UPDATE_QUOTA * 2
+
+
+async def test_integrations_take_turns(hass: HomeAssistant) -> None:
+    """Test the integrations take turns when the pool is busy."""
+    first = async_get_update_executor(hass, "first")
+    second = async_get_update_executor(hass, "second")
+
+    order: list[str] = []
+    release = threading.Event()
+
+    def _job(name: str) -> None:
+        release.wait()
+        order.append(name)
+
+    with patch("homeassistant.helpers.update_executor.MAX_UPDATE_POOL_WORKERS", 1):
+        jobs = [
+            first.async_add_job(lambda: _job("first 1")),
+            first.async_add_job(lambda: _job("first 2")),
+            first.async_add_job(lambda: _job("first 3")),
+            second.async_add_job(lambda: _job("second 1")),
+        ]
+        release.set()
+        await asyncio.gather(*jobs)
+
+    assert order == ["first 1", "first 2", "second 1", "first 3"]
+
+
+async def test_job_exception(hass: HomeAssistant) -> None:
+    """Test the exception of a job is raised to the caller."""
+    executor = async_get_update_executor(hass, "integration")
+
+    def _fail() -> None:
+        raise ValueError("Update failed")
+
+    with pytest.raises(ValueError, match="Update failed"):
+        await executor.async_add_job(_fail)
+    assert executor.pending == 0
+    assert await executor.async_add_job(lambda: 1) == 1
+
+
+async def test_sync_entity_update(hass: HomeAssistant) -> None:
+    """Test the sync entities update in the executor of their integration."""
+    threads: list[threading.Thread] = []
+
+    class SyncEntity(MockEntity):
+        """Entity with a sync update."""
+
+        def update(self) -> None:
+            """Update the entity."""
+            threads.append(threading.current_thread())
+
+    mock_platform = MockPlatform()
+    mock_platform.PARALLEL_UPDATES = 3
+    platform = MockEntityPlatform(
+        hass, platform_name="sync_integration", platform=mock_platform
+    )
+    platform.async_prepare()
+    await platform.async_add_entities([SyncEntity(), MockEntity()], True)
+
+    executor = async_get_update_executor(hass, "sync_integration")
+    assert platform.update_executor is executor
+    assert len(threads) == 1
+    assert threads[0] is not threading.current_thread()
+    assert executor.jobs == 1
+
+    await platform.async_destroy()
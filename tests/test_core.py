@@ -1181,6 +1181,129 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_indexed_listeners(hass: HomeAssistant) -> None:
+    """Test listening for events by entity_id and domain."""
+    entity_calls: list[ha.Event] = []
+    domain_calls: list[ha.Event] = []
+    match_all_calls: list[ha.Event] = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def entity_listener(event: ha.Event) -> None:
+        entity_calls.append(event)
+
+    @ha.callback
+    def domain_listener(event: ha.Event) -> None:
+        domain_calls.append(event)
+
+    @ha.callback
+    def match_all_listener(event: ha.Event) -> None:
+        match_all_calls.append(event)
+
+    @ha.callback
+    def enabled_filter(event_data: dict[str, Any]) -> bool:
+        return event_data["enabled"]
+
+    unsub_entity = hass.bus.async_listen_entity_ids_internal(
+        "test", ["light.kitchen", "light.bed"], ha.HassJob(entity_listener)
+    )
+    unsub_domain = hass.bus.async_listen_domains_internal(
+        "test", ["switch"], ha.HassJob(domain_listener), enabled_filter
+    )
+    unsub_match_all = hass.bus.async_listen_domains_internal(
+        "test", [MATCH_ALL], ha.HassJob(match_all_listener)
+    )
+    # Each index counts as one listener
+    assert hass.bus.async_listeners()["test"] == old_count + 3
+    unsub_other_entity = hass.bus.async_listen_entity_ids_internal(
+        "test", ["light.other"], ha.HassJob(entity_listener)
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 3
+    unsub_other_entity()
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    # Entity_id listeners run in the next event loop iteration
+    assert not entity_calls
+    await hass.async_block_till_done()
+    assert [event.data for event in entity_calls] == [{"entity_id": "light.kitchen"}]
+
+    hass.bus.async_fire("test", {"entity_id": "switch.fan", "enabled": False})
+    hass.bus.async_fire("test", {"entity_id": "switch.fan", "enabled": True})
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"no_entity_id": True})
+    await hass.async_block_till_done()
+    assert len(entity_calls) == 1
+    assert [event.data for event in domain_calls] == [
+        {"entity_id": "switch.fan", "enabled": True}
+    ]
+    assert len(match_all_calls) == 4
+
+    # Listeners removed before the event is dispatched are not called
+    hass.bus.async_fire("test", {"entity_id": "light.bed"})
+    unsub_entity()
+    await hass.async_block_till_done()
+    assert len(entity_calls) == 1
+
+    unsub_domain()
+    unsub_match_all()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+
+async def test_eventbus_indexed_listeners_order(hass: HomeAssistant) -> None:
+    """Test indexed listeners run after the listeners of the event type."""
+    calls: list[str] = []
+
+    hass.bus.async_listen(MATCH_ALL, ha.callback(lambda event: calls.append("all")))
+    hass.bus.async_listen("test", ha.callback(lambda event: calls.append("first")))
+    hass.bus.async_listen_domains_internal(
+        "test", ["light"], ha.HassJob(ha.callback(lambda event: calls.append("domain")))
+    )
+    hass.bus.async_listen("test", ha.callback(lambda event: calls.append("last")))
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert calls == ["first", "last", "domain", "all"]
+
+
+async def test_eventbus_listener_statistics(hass: HomeAssistant) -> None:
+    """Test collecting event listener dispatch statistics."""
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        """Mock listener."""
+
+    @ha.callback
+    def slow_listener(event: ha.Event) -> None:
+        """Mock slow listener."""
+        time.sleep(0.01)
+
+    hass.bus.async_listen("test", listener)
+    hass.bus.async_listen_entity_ids_internal(
+        "test", ["light.kitchen"], ha.HassJob(slow_listener)
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert hass.bus.async_listener_statistics() == {}
+
+    hass.bus.async_enable_listener_statistics()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    await hass.async_block_till_done()
+
+    statistics = hass.bus.async_listener_statistics()["test"]
+    assert statistics["listeners"] == 2
+    assert statistics["fired"] == 2
+    assert statistics["dispatched"] == 3
+    assert statistics["dispatch_time"] >= 0.01
+    assert statistics["slowest_listener_time"] >= 0.01
+    assert "slow_listener" in statistics["slowest_listener"]
+
+    hass.bus.async_disable_listener_statistics()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert hass.bus.async_listener_statistics() == {}
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1605,6 +1728,103 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_batch(hass: HomeAssistant) -> None:
+    """Test the states of a batch are set when it is closed."""
+    hass.states.async_set("light.bowl", "off")
+    changed = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported: list[ha.Event] = []
+    entity_calls: list[ha.Event] = []
+
+    @ha.callback
+    def reported_listener(event: ha.Event) -> None:
+        reported.append(event)
+
+    @ha.callback
+    def entity_listener(event: ha.Event) -> None:
+        entity_calls.append(event)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED,
+        reported_listener,
+        event_filter=ha.callback(lambda _: True),
+    )
+    hass.bus.async_listen_entity_ids_internal(
+        EVENT_STATE_CHANGED, ["light.bowl"], ha.HassJob(entity_listener)
+    )
+
+    with hass.states.async_batch_internal():
+        hass.states.async_set("light.bowl", "on")
+        # A nested batch joins the open batch
+        with hass.states.async_batch_internal():
+            hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.bowl", "on")
+        hass.states.async_set("light.bowl", "off", {"brightness": 10})
+        assert hass.states.get("light.bowl").state == "off"
+        assert hass.states.get("light.kitchen") is None
+        assert not changed
+
+    assert [
+        (event.data["entity_id"], event.data["new_state"].state) for event in changed
+    ] == [("light.bowl", "on"), ("light.kitchen", "on"), ("light.bowl", "off")]
+    assert [event.data["entity_id"] for event in reported] == ["light.bowl"]
+    assert changed[0].time_fired_timestamp == changed[2].time_fired_timestamp
+    assert changed[0].context != changed[1].context
+    assert hass.states.get("light.bowl").attributes == {"brightness": 10}
+
+    # Entity_id listeners run in the next event loop iteration
+    assert not entity_calls
+    await hass.async_block_till_done()
+    assert [event.data["new_state"].state for event in entity_calls] == ["on", "off"]
+
+
+async def test_statemachine_batch_write_fails(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a write of a batch that fails does not drop the other writes."""
+    hass.states.async_set("light.bowl", "off")
+    changed = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    class BrokenState(str):
+        """State which can't be compared."""
+
+        __slots__ = ()
+
+        def __eq__(self, other: object) -> bool:
+            raise ValueError("Broken state")
+
+        __hash__ = str.__hash__
+
+    with hass.states.async_batch_internal():
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set_internal(
+            "light.bowl", BrokenState("on"), {}, False, None, None, time.time()
+        )
+        hass.states.async_set("light.porch", "on")
+
+    assert [event.data["entity_id"] for event in changed] == [
+        "light.kitchen",
+        "light.porch",
+    ]
+    assert hass.states.get("light.bowl").state == "off"
+    assert "Error setting the state of light.bowl" in caplog.text
+
+
+async def test_eventbus_fire_many_listener_removed(hass: HomeAssistant) -> None:
+    """Test listeners removed while firing many events are not called again."""
+    calls: list[ha.Event] = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        calls.append(event)
+        unsub()
+
+    unsub = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire_many_internal(
+        [("test", {"index": 1}, None), ("test", {"index": 2}, None)], time.time()
+    )
+    assert [event.data for event in calls] == [{"index": 1}]
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")